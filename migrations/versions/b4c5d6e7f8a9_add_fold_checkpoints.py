@@ -0,0 +1,39 @@
+"""add fold_checkpoints table for incremental fold views
+
+Revision ID: b4c5d6e7f8a9
+Revises: cda001a0003
+Create Date: 2026-10-18
+"""
+from __future__ import annotations
+
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+# revision identifiers, used by Alembic.
+revision: str = "b4c5d6e7f8a9"
+down_revision: Union[str, None] = "cda001a0003"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.create_table(
+        "fold_checkpoints",
+        sa.Column("id", sa.Integer(), primary_key=True, autoincrement=True),
+        sa.Column("scene_id", sa.Integer(), nullable=False),
+        sa.Column("view", sa.String(length=32), nullable=False),
+        sa.Column("replay_ordinal", sa.Integer(), nullable=False, server_default="-1"),
+        sa.Column("event_count", sa.Integer(), nullable=False, server_default="0"),
+        sa.Column("state", sa.JSON(), nullable=False),
+        sa.Column("updated_at", sa.DateTime(timezone=True), nullable=False, server_default=sa.func.now()),
+        sa.ForeignKeyConstraint(["scene_id"], ["scenes.id"], ondelete="CASCADE"),
+        sa.UniqueConstraint("scene_id", "view", name="ux_fold_checkpoints_scene_view"),
+    )
+    op.create_index("ix_fold_checkpoints_scene_id", "fold_checkpoints", ["scene_id"])
+
+
+def downgrade() -> None:
+    op.drop_index("ix_fold_checkpoints_scene_id", table_name="fold_checkpoints")
+    op.drop_table("fold_checkpoints")
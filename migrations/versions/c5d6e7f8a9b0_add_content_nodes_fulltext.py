@@ -0,0 +1,93 @@
+"""add ranked full-text search structures for content_nodes
+
+Postgres: weighted generated tsvector column + GIN index.
+SQLite: FTS5 shadow table kept in sync by triggers.
+
+Revision ID: c5d6e7f8a9b0
+Revises: b4c5d6e7f8a9
+Create Date: 2026-10-18
+"""
+from __future__ import annotations
+
+from typing import Sequence, Union
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "c5d6e7f8a9b0"
+down_revision: Union[str, None] = "b4c5d6e7f8a9"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+_PG_UPGRADE = (
+    """
+ALTER TABLE content_nodes ADD COLUMN search_tsv tsvector GENERATED ALWAYS AS (
+    setweight(to_tsvector('english'::regconfig, coalesce(title, '')), 'A')
+    || setweight(to_tsvector('english'::regconfig, coalesce(player_text, '')), 'B')
+    || setweight(to_tsvector('english'::regconfig, coalesce(gm_text, '')), 'C')
+) STORED
+    """,
+    "CREATE INDEX ix_content_nodes_search_tsv ON content_nodes USING GIN (search_tsv)",
+)
+
+_SQLITE_UPGRADE = (
+    """
+CREATE VIRTUAL TABLE IF NOT EXISTS content_nodes_fts USING fts5(
+    title, player_text, gm_text, tokenize = 'porter unicode61'
+)
+    """,
+    """
+CREATE TRIGGER content_nodes_fts_insert
+AFTER INSERT ON content_nodes
+BEGIN
+    INSERT INTO content_nodes_fts (rowid, title, player_text, gm_text)
+    VALUES (NEW.id, NEW.title, NEW.player_text, coalesce(NEW.gm_text, ''));
+END
+    """,
+    """
+CREATE TRIGGER content_nodes_fts_update
+AFTER UPDATE OF title, player_text, gm_text ON content_nodes
+BEGIN
+    UPDATE content_nodes_fts
+    SET title = NEW.title, player_text = NEW.player_text, gm_text = coalesce(NEW.gm_text, '')
+    WHERE rowid = NEW.id;
+END
+    """,
+    """
+CREATE TRIGGER content_nodes_fts_delete
+AFTER DELETE ON content_nodes
+BEGIN
+    DELETE FROM content_nodes_fts WHERE rowid = OLD.id;
+END
+    """,
+    # Backfill rows that existed before the triggers
+    """
+INSERT INTO content_nodes_fts (rowid, title, player_text, gm_text)
+SELECT id, title, player_text, coalesce(gm_text, '') FROM content_nodes
+    """,
+)
+
+
+def upgrade() -> None:
+    dialect = op.get_bind().dialect.name
+    if dialect == "postgresql":
+        statements = _PG_UPGRADE
+    elif dialect == "sqlite":
+        statements = _SQLITE_UPGRADE
+    else:
+        return
+    for stmt in statements:
+        op.execute(stmt)
+
+
+def downgrade() -> None:
+    dialect = op.get_bind().dialect.name
+    if dialect == "postgresql":
+        op.execute("DROP INDEX IF EXISTS ix_content_nodes_search_tsv")
+        op.execute("ALTER TABLE content_nodes DROP COLUMN IF EXISTS search_tsv")
+    elif dialect == "sqlite":
+        op.execute("DROP TRIGGER IF EXISTS content_nodes_fts_delete")
+        op.execute("DROP TRIGGER IF EXISTS content_nodes_fts_update")
+        op.execute("DROP TRIGGER IF EXISTS content_nodes_fts_insert")
+        op.execute("DROP TABLE IF EXISTS content_nodes_fts")
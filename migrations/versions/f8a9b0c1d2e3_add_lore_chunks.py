@@ -0,0 +1,43 @@
+"""add lore_chunks table so imported lore text is available to retrieval
+
+Revision ID: f8a9b0c1d2e3
+Revises: e7f8a9b0c1d2
+Create Date: 2026-10-18
+"""
+from __future__ import annotations
+
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+# revision identifiers, used by Alembic.
+revision: str = "f8a9b0c1d2e3"
+down_revision: Union[str, None] = "e7f8a9b0c1d2"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.create_table(
+        "lore_chunks",
+        sa.Column("id", sa.Integer(), primary_key=True, autoincrement=True),
+        sa.Column("campaign_id", sa.Integer(), nullable=False),
+        sa.Column("chunk_id", sa.String(length=64), nullable=False),
+        sa.Column("title", sa.String(length=256), nullable=False),
+        sa.Column("audience", sa.String(length=16), nullable=False),
+        sa.Column("tags", sa.JSON(), nullable=True),
+        sa.Column("content", sa.Text(), nullable=False),
+        sa.Column("content_hash", sa.String(length=64), nullable=False),
+        sa.Column("source_path", sa.Text(), nullable=False),
+        sa.Column("chunk_index", sa.Integer(), nullable=False),
+        sa.Column("created_at", sa.DateTime(timezone=True), nullable=False, server_default=sa.func.now()),
+        sa.ForeignKeyConstraint(["campaign_id"], ["campaigns.id"], ondelete="CASCADE"),
+        sa.UniqueConstraint("campaign_id", "chunk_id", name="ux_lore_chunks_campaign_chunk"),
+    )
+    op.create_index("ix_lore_chunks_campaign_id", "lore_chunks", ["campaign_id"])
+
+
+def downgrade() -> None:
+    op.drop_index("ix_lore_chunks_campaign_id", table_name="lore_chunks")
+    op.drop_table("lore_chunks")
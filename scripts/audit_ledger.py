@@ -0,0 +1,194 @@
+#!/usr/bin/env python
+"""Audit every campaign's event hash chain concurrently and write a JSON report.
+
+Usage examples:
+
+  PYTHONPATH=./src python scripts/audit_ledger.py --output ledger-audit.json
+  PYTHONPATH=./src python scripts/audit_ledger.py --concurrency 8 --workers 4
+  PYTHONPATH=./src python scripts/audit_ledger.py --campaign 12 --campaign 14 --workers 0
+
+Campaigns are audited in parallel with a bounded number of DB sessions
+(--concurrency); SHA-256 envelope hashing is fanned out to a process pool
+(--workers, 0 hashes inline). Unlike verify_hash_chain the audit does not stop
+at the first mismatch: it keeps walking the chain and reports every mismatch
+and ordinal gap per campaign. Exit code is 1 when any campaign fails.
+"""
+
+from __future__ import annotations
+
+import argparse
+import asyncio
+import json
+import multiprocessing
+import os
+import sys
+import time
+from concurrent.futures import Executor, ProcessPoolExecutor
+from datetime import datetime, timezone
+from typing import Any
+
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker
+
+from Adventorator import models, repos
+from Adventorator.db import get_sessionmaker
+from Adventorator.events import envelope as event_envelope
+
+# Cap per-campaign detail so a badly corrupted ledger cannot blow up the report.
+MAX_FINDINGS_PER_CAMPAIGN = 100
+
+
+async def audit_campaign(
+    sm: async_sessionmaker[AsyncSession],
+    campaign_id: int,
+    *,
+    page_size: int = 5000,
+    pool: Executor | None = None,
+) -> dict[str, Any]:
+    """Walk one campaign's chain and collect mismatches, gaps and timings."""
+    start = time.perf_counter()
+    loop = asyncio.get_running_loop()
+    expected_prev = event_envelope.GENESIS_PREV_EVENT_HASH
+    next_ordinal = 0
+    count = 0
+    mismatches: list[dict[str, Any]] = []
+    gaps: list[dict[str, int]] = []
+    try:
+        async with sm() as s:
+            async for page in repos.iter_campaign_envelopes(
+                s, campaign_id=campaign_id, page_size=page_size
+            ):
+                rows = [tuple(r) for r in page]
+                if pool is not None:
+                    hashes = await loop.run_in_executor(
+                        pool, event_envelope.compute_envelope_hashes, rows
+                    )
+                else:
+                    hashes = event_envelope.compute_envelope_hashes(rows)
+                for row, envelope_hash in zip(rows, hashes, strict=True):
+                    ordinal, prev_hash = row[2], row[7]
+                    if ordinal != next_ordinal and len(gaps) < MAX_FINDINGS_PER_CAMPAIGN:
+                        gaps.append({"expected": next_ordinal, "actual": ordinal})
+                    if prev_hash != expected_prev and len(mismatches) < MAX_FINDINGS_PER_CAMPAIGN:
+                        mismatches.append(
+                            {
+                                "ordinal": ordinal,
+                                "expected_hash": expected_prev.hex(),
+                                "actual_hash": bytes(prev_hash).hex(),
+                            }
+                        )
+                    # Continue from the stored row so later breaks are reported too
+                    expected_prev = envelope_hash
+                    next_ordinal = ordinal + 1
+                    count += 1
+    except Exception as exc:  # report and keep auditing other campaigns
+        status, error = "error", f"{type(exc).__name__}: {exc}"
+    else:
+        status = "ok" if not mismatches and not gaps else "failed"
+        error = None
+    elapsed_s = time.perf_counter() - start
+    out: dict[str, Any] = {
+        "campaign_id": campaign_id,
+        "status": status,
+        "event_count": count,
+        "mismatches": mismatches,
+        "gaps": gaps,
+        "elapsed_ms": round(elapsed_s * 1000, 3),
+        "events_per_sec": round(count / elapsed_s, 1) if elapsed_s > 0 else 0.0,
+    }
+    if error is not None:
+        out["error"] = error
+    return out
+
+
+async def run_audit(
+    *,
+    campaign_ids: list[int] | None = None,
+    concurrency: int = 4,
+    workers: int | None = 0,
+    page_size: int = 5000,
+    sm: async_sessionmaker[AsyncSession] | None = None,
+) -> dict[str, Any]:
+    """Audit campaigns concurrently and return the report document.
+
+    ``workers=None`` uses one hashing process per CPU, capped at the number
+    of campaigns (each campaign hashes one page at a time).
+    """
+    sm = sm or get_sessionmaker()
+    started = time.perf_counter()
+    if campaign_ids is None:
+        async with sm() as s:
+            q = await s.execute(select(models.Campaign.id).order_by(models.Campaign.id))
+            campaign_ids = [row[0] for row in q.all()]
+
+    if workers is None:
+        workers = min(os.cpu_count() or 1, len(campaign_ids))
+    sem = asyncio.Semaphore(max(1, concurrency))
+    # Spawn, not fork: this process already holds SQLAlchemy's engine and loop state
+    pool = (
+        ProcessPoolExecutor(max_workers=workers, mp_context=multiprocessing.get_context("spawn"))
+        if workers > 0
+        else None
+    )
+
+    async def _one(cid: int) -> dict[str, Any]:
+        async with sem:
+            return await audit_campaign(sm, cid, page_size=page_size, pool=pool)
+
+    try:
+        results = await asyncio.gather(*(_one(cid) for cid in campaign_ids))
+    finally:
+        if pool is not None:
+            pool.shutdown(wait=True)
+    elapsed_ms = round((time.perf_counter() - started) * 1000, 3)
+    return {
+        "generated_at": datetime.now(timezone.utc).isoformat(),
+        "summary": {
+            "campaigns": len(results),
+            "failed": sum(1 for r in results if r["status"] != "ok"),
+            "events": sum(r["event_count"] for r in results),
+            "elapsed_ms": elapsed_ms,
+            "concurrency": concurrency,
+            "workers": workers,
+        },
+        "campaigns": results,
+    }
+
+
+async def main(argv: list[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--campaign", type=int, action="append", help="Campaign id (repeatable)")
+    parser.add_argument("--concurrency", type=int, default=4, help="Concurrent DB sessions")
+    parser.add_argument(
+        "--workers",
+        type=int,
+        default=None,
+        help="Hashing processes (default: CPUs, at most one per campaign; 0 = hash inline)",
+    )
+    parser.add_argument("--page-size", type=int, default=5000)
+    parser.add_argument("--output", help="Write the JSON report here instead of stdout")
+    args = parser.parse_args(argv)
+
+    report = await run_audit(
+        campaign_ids=args.campaign,
+        concurrency=args.concurrency,
+        workers=args.workers,
+        page_size=args.page_size,
+    )
+    doc = json.dumps(report, indent=2)
+    if args.output:
+        with open(args.output, "w", encoding="utf-8") as fh:
+            fh.write(doc + "\n")
+    else:
+        sys.stdout.write(doc + "\n")
+    summary = report["summary"]
+    print(
+        f"campaigns={summary['campaigns']} failed={summary['failed']} "
+        f"events={summary['events']} elapsed_ms={summary['elapsed_ms']}",
+        file=sys.stderr,
+    )
+    return 1 if summary["failed"] else 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(asyncio.run(main()))
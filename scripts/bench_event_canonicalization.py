@@ -0,0 +1,82 @@
+#!/usr/bin/env python
+"""Micro-benchmark: payload canonicalization cost per event append.
+
+Compares the per-append hashing work of ``repos.append_event`` /
+``importer.persist_import_event`` before and after the shared
+``CanonicalPayload`` context:
+
+- before: ``compute_payload_hash`` and the idempotency key each encode the payload;
+- shared: one ``canonicalize_payload`` feeds both.
+
+Usage:
+
+  PYTHONPATH=./src python scripts/bench_event_canonicalization.py
+  PYTHONPATH=./src python scripts/bench_event_canonicalization.py --number 20000
+"""
+
+from __future__ import annotations
+
+import argparse
+import timeit
+from typing import Any
+
+from Adventorator.events import envelope
+
+
+def _sample_payload() -> dict[str, Any]:
+    # Shape of a seed.entity_created payload
+    return {
+        "stable_id": "01JA6Z7F8NPC00000000000000",
+        "kind": "npc",
+        "name": "Aria the Innkeeper",
+        "tags": ["npc", "innkeeper", "friendly"],
+        "affordances": ["talk", "trade"],
+        "traits": {"mood": "cheerful", "secret": None},
+        "provenance": {
+            "package_id": "01JA6Z7F8PACKAGE0000000000",
+            "source_path": "entities/aria.json",
+            "file_hash": "a" * 64,
+        },
+    }
+
+
+def _v2_key(args_json: Any) -> bytes:
+    return envelope.compute_idempotency_key_v2(
+        plan_id=None,
+        campaign_id=1,
+        event_type="seed.entity_created",
+        tool_name="importer",
+        ruleset_version="dnd5e-srd-v1",
+        args_json=args_json,
+    )
+
+
+def main(argv: list[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--number", type=int, default=10000, help="Appends per run")
+    parser.add_argument("--repeat", type=int, default=5, help="Runs (best is reported)")
+    args = parser.parse_args(argv)
+
+    payload = _sample_payload()
+
+    def before() -> None:
+        envelope.compute_payload_hash(payload)
+        _v2_key(payload)
+
+    def shared() -> None:
+        canonical = envelope.canonicalize_payload(payload)
+        _v2_key(canonical)
+
+    results = {}
+    for name, fn in (("before", before), ("shared", shared)):
+        best = min(timeit.repeat(fn, number=args.number, repeat=args.repeat))
+        results[name] = best / args.number * 1e6
+
+    base = results["before"]
+    for name, us in results.items():
+        print(f"{name:>7}: {us:7.2f} us/append  ({base - us:+.2f} us saved vs before)")
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
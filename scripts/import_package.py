@@ -3,7 +3,8 @@
 
 Usage:
   python scripts/import_package.py --package-root campaigns/sample-campaign --campaign-id 1 \
-      [--no-embeddings] [--no-importer] [--skip-preflight] [--no-hash-update]
+      [--no-embeddings] [--no-importer] [--skip-preflight] [--no-hash-update] \
+      [--bulk [--batch-size 500]] [--workers 4]
 """
 from __future__ import annotations
 
@@ -20,6 +21,10 @@ from Adventorator.tools.package_utils import update_content_index  # type: ignor
 from Adventorator.importer import run_full_import_with_database, ImporterError  # type: ignore
 
 
+def _print_progress(stage: str, done: int, total: int) -> None:
+    print(f"  {stage}: {done}/{total}")
+
+
 def main() -> int:
     ap = argparse.ArgumentParser(description="Import a package end-to-end")
     ap.add_argument("--package-root", type=Path, required=True)
@@ -28,6 +33,11 @@ def main() -> int:
     ap.add_argument("--no-hash-update", action="store_true")
     ap.add_argument("--no-importer", action="store_true")
     ap.add_argument("--no-embeddings", action="store_true")
+    ap.add_argument("--bulk", action="store_true", help="Batched inserts for large packages")
+    ap.add_argument("--batch-size", type=int, default=500)
+    ap.add_argument(
+        "--workers", type=int, default=0, help="Processes for file parsing (0 parses inline)"
+    )
     args = ap.parse_args()
 
     pkg = args.package_root
@@ -64,6 +74,10 @@ def main() -> int:
                 campaign_id=args.campaign_id,
                 features_importer=features_importer,
                 features_importer_embeddings=features_importer_embeddings,
+                bulk=args.bulk,
+                batch_size=args.batch_size,
+                progress=_print_progress if args.bulk else None,
+                parse_workers=args.workers,
             )
         )
     except ImporterError as exc:
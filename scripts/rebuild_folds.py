@@ -0,0 +1,68 @@
+#!/usr/bin/env python
+"""Rebuild and/or verify incremental fold checkpoints (HP, conditions, initiative).
+
+Usage examples:
+
+  PYTHONPATH=./src python scripts/rebuild_folds.py --all
+  PYTHONPATH=./src python scripts/rebuild_folds.py --scene 3 --scene 4 --view hp
+  PYTHONPATH=./src python scripts/rebuild_folds.py --all --verify-only
+
+Requires database + migrations applied. Exit code is 1 when verification finds
+a checkpoint whose incremental result differs from a full replay.
+"""
+
+from __future__ import annotations
+
+import argparse
+import asyncio
+
+from sqlalchemy import select
+
+from Adventorator import models, repos
+from Adventorator.db import session_scope
+
+
+async def main(argv: list[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--scene", type=int, action="append", default=[], help="Scene id")
+    parser.add_argument("--all", action="store_true", help="Process every scene")
+    parser.add_argument(
+        "--view",
+        action="append",
+        choices=sorted(repos.FOLD_VIEWS),
+        help="Limit to a view (repeatable); default all views",
+    )
+    parser.add_argument(
+        "--verify-only",
+        action="store_true",
+        help="Read-only: compare checkpoint-backed views against a full replay without "
+        "rebuilding or advancing any checkpoint",
+    )
+    args = parser.parse_args(argv)
+    if not args.all and not args.scene:
+        parser.error("pass --scene ID (repeatable) or --all")
+
+    views = args.view or sorted(repos.FOLD_VIEWS)
+    mismatches = 0
+    async with session_scope() as s:
+        scene_ids = list(args.scene)
+        if args.all:
+            q = await s.execute(select(models.Scene.id).order_by(models.Scene.id))
+            scene_ids = [row[0] for row in q.all()]
+        for scene_id in scene_ids:
+            if not args.verify_only:
+                counts = await repos.rebuild_fold_checkpoints(s, scene_id=scene_id, views=views)
+                print(
+                    f"scene={scene_id} rebuilt " + " ".join(f"{v}={n}" for v, n in counts.items())
+                )
+            for view in views:
+                ok = await repos.verify_fold_checkpoint(s, scene_id=scene_id, view=view)
+                if not ok:
+                    mismatches += 1
+                    print(f"scene={scene_id} view={view} MISMATCH")
+    print(f"scenes={len(scene_ids)} mismatches={mismatches}")
+    return 1 if mismatches else 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(asyncio.run(main()))
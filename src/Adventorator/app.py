@@ -1,6 +1,5 @@
 """FastAPI app entrypoint for Adventorator."""
 
-import asyncio
 import contextvars
 import time
 import uuid
@@ -8,19 +7,31 @@ from typing import Any
 
 import structlog
 from fastapi import FastAPI, HTTPException, Request
+from structlog.contextvars import bind_contextvars, get_contextvars
 
 from Adventorator import repos
+from Adventorator.bounded_cache import start_sweeper, stop_sweeper
 from Adventorator.command_loader import load_all_commands
 from Adventorator.commanding import Invocation, Responder, find_command
 from Adventorator.config import Settings, load_settings
 from Adventorator.crypto import verify_ed25519
 from Adventorator.db import session_scope
 from Adventorator.discord_schemas import Interaction
+from Adventorator.jobs import JobRunner
 from Adventorator.llm import LLMClient
+from Adventorator.llm_scheduler import LLMScheduler, llm_request_scope
 from Adventorator.logging import redact_settings, setup_logging
 from Adventorator.metrics import get_counters
-from Adventorator.responder import followup_message, respond_deferred, respond_pong
+from Adventorator.responder import (
+    close_webhook_client,
+    followup_message,
+    orjson_response,
+    respond_deferred,
+    respond_pong,
+    start_webhook_client,
+)
 from Adventorator.rules.dice import DiceRNG
+from Adventorator.speculation import start_speculation
 
 rng = DiceRNG()  # TODO: Seed per-scene later
 
@@ -34,7 +45,17 @@ _current_request_var: contextvars.ContextVar | None = None
 
 llm_client = None
 if settings.features_llm:
-    llm_client = LLMClient(settings)
+    llm_client = LLMScheduler(LLMClient(settings), max_concurrency=settings.llm_max_concurrency)
+
+# Slash commands run here after the deferred ack (bounded, ordered per guild)
+command_runner = JobRunner(
+    "jobs.commands",
+    max_workers=settings.jobs_max_workers,
+    max_queue=settings.jobs_max_queue,
+    durable=settings.jobs_durable,
+)
+
+BUSY_TEXT = "⏳ The bot is handling a lot of commands right now. Please try again in a moment."
 
 
 @app.on_event("startup")
@@ -46,10 +67,17 @@ async def startup():
         # Avoid crashing startup due to logging issues
         pass
     load_all_commands()
+    start_sweeper()
+    start_webhook_client()
+    command_runner.start()
+    await command_runner.resume()
 
 
 @app.on_event("shutdown")
 async def shutdown_event():
+    await command_runner.drain(getattr(settings, "jobs_drain_seconds", 20.0))
+    await stop_sweeper()
+    await close_webhook_client()
     if llm_client:
         await llm_client.close()
 
@@ -116,10 +144,10 @@ async def interactions(request: Request):
         raise HTTPException(status_code=400, detail="invalid interaction payload") from err
     log.info("discord.request.validated", interaction=inter.model_dump())
 
+    guild_id, channel_id, user_id, username = _infer_ids_from_interaction(inter)
+
     async with session_scope() as s:
-        guild_id, channel_id, user_id, username = _infer_ids_from_interaction(inter)
-        campaign = await repos.get_or_create_campaign(s, guild_id)
-        await repos.ensure_scene(s, campaign.id, channel_id)
+        scene = await repos.resolve_scene(s, guild_id, channel_id)
 
     # Ping = 1
     if inter.type == 1:
@@ -130,10 +158,46 @@ async def interactions(request: Request):
     if inter.type == 2 and inter.data is not None and inter.data.name is not None:
         # dev_request True only when the dev public key was used (local CLI),
         # ensuring settings-based webhook override is ignored for real Discord traffic.
-        asyncio.create_task(_dispatch_command(inter, dev_request=use_dev_pub))
+        payload = {
+            "interaction": inter.model_dump(mode="json"),
+            "dev_request": use_dev_pub,
+            "webhook_base_url": request_header_override(),
+            "scene": [scene.campaign_id, scene.scene_id],
+            "request_id": get_contextvars().get("request_id"),
+        }
+        # Commands for one guild run in order; DMs are keyed by user
+        key = f"guild:{guild_id}" if guild_id else f"user:{user_id}"
+        if not await command_runner.submit("interaction", payload, key=key):
+            return orjson_response({"type": 4, "data": {"content": BUSY_TEXT, "flags": 64}})
+        if getattr(settings, "llm_speculative", False):
+            # Only for accepted jobs: a rejected one must not hold an LLM slot.
+            # Builds the prompt and starts the narrator call alongside the job's writes.
+            start_speculation(
+                inter.data.name,
+                str(_options(inter).get("message") or ""),
+                guild_id=guild_id,
+                channel_id=channel_id,
+                user_id=user_id,
+                settings=settings,
+                llm_client=llm_client,
+            )
     return respond_deferred()
 
 
+async def _run_interaction_job(payload: dict[str, Any]) -> None:
+    bind_contextvars(request_id=payload.get("request_id"))
+    scene = payload.get("scene")
+    await _dispatch_command(
+        Interaction.model_validate(payload["interaction"]),
+        dev_request=bool(payload.get("dev_request")),
+        scene=repos.SceneRef(*scene) if scene else None,
+        webhook_base_url=payload.get("webhook_base_url"),
+    )
+
+
+command_runner.register("interaction", _run_interaction_job)
+
+
 @app.middleware("http")
 async def request_id_middleware(request: Request, call_next):
     """Assign a request_id, bind it to structlog context, and measure duration."""
@@ -173,21 +237,20 @@ async def request_id_middleware(request: Request, call_next):
         clear_contextvars()
 
 
-async def _dispatch_command(inter: Interaction, *, dev_request: bool = False):
+async def _dispatch_command(
+    inter: Interaction,
+    *,
+    dev_request: bool = False,
+    scene: repos.SceneRef | None = None,
+    webhook_base_url: str | None = None,
+):
     # Safe: _dispatch_command only called when inter.data and name are present
     assert inter.data is not None and inter.data.name is not None
     name = inter.data.name
     sub = _subcommand(inter)
     cmd = find_command(name, sub)
     if cmd is not None:
-        options: dict[str, Any] = {}
-        opts: list[dict[str, Any]] = inter.data.options or [] if inter.data is not None else []
-        if opts and isinstance(opts[0], dict) and opts[0].get("type") == 1:
-            opts = opts[0].get("options", []) or []
-        for o in opts:
-            n = o.get("name")
-            if isinstance(n, str):
-                options[n] = o.get("value")
+        options = _options(inter)
 
         class DiscordResponder(Responder):  # type: ignore[misc]
             def __init__(
@@ -230,7 +293,7 @@ async def _dispatch_command(inter: Interaction, *, dev_request: bool = False):
 
         guild_id, channel_id, user_id, username = _infer_ids_from_interaction(inter)
         # Allow a trusted caller to provide a one-off webhook base via header
-        webhook_base_url = request_header_override()
+        webhook_base_url = webhook_base_url or request_header_override()
         from Adventorator.rules.engine import Dnd5eRuleset
 
         inv = Invocation(
@@ -250,6 +313,7 @@ async def _dispatch_command(inter: Interaction, *, dev_request: bool = False):
             settings=settings,
             llm_client=llm_client,
             ruleset=Dnd5eRuleset(),
+            scene=scene,
         )
         start = time.perf_counter()
         status = "success"
@@ -275,7 +339,10 @@ async def _dispatch_command(inter: Interaction, *, dev_request: bool = False):
                 user_id=str(user_id),
                 guild_id=str(guild_id) if guild_id else None,
             )
-            await cmd.handler(inv, opts_obj)
+            with llm_request_scope(
+                guild_id=inv.guild_id, deadline_s=getattr(settings, "llm_deadline_seconds", None)
+            ):
+                await cmd.handler(inv, opts_obj)
         except Exception:
             status = "error"
             log.error(
@@ -333,6 +400,19 @@ def _subcommand(inter: Interaction) -> str | None:
     return None
 
 
+def _options(inter: Interaction) -> dict[str, Any]:
+    """Flatten the invoked command's options (descending into a subcommand)."""
+    options: dict[str, Any] = {}
+    opts: list[dict[str, Any]] = inter.data.options or [] if inter.data is not None else []
+    if opts and isinstance(opts[0], dict) and opts[0].get("type") == 1:
+        opts = opts[0].get("options", []) or []
+    for o in opts:
+        n = o.get("name")
+        if isinstance(n, str):
+            options[n] = o.get("value")
+    return options
+
+
 def _infer_ids_from_interaction(inter):
     guild_id = int(inter.guild.id) if inter.guild and inter.guild.id else 0
     channel_id = int(inter.channel.id) if inter.channel and inter.channel.id else 0
@@ -0,0 +1,196 @@
+# src/Adventorator/bounded_cache.py
+"""Bounded in-process LRU+TTL cache shared by the planner and orchestrator.
+
+Entries expire ``ttl_s`` after they are stored and the least recently used
+entries are evicted once ``max_entries`` or ``max_bytes`` (approximate, via
+``sizeof``; 0 disables) is exceeded, so caches keyed on free-form user input
+cannot grow without bound. Expired entries are dropped when read, when they
+reach the LRU end during a store, and by ``sweep`` — which
+``start_sweeper`` runs periodically for every live cache.
+
+Every lookup counts exactly one of ``<name>.hit``, ``<name>.miss`` or
+``<name>.expired``; evictions count ``<name>.evicted``. Gauges
+``gauge.<name>.entries`` and ``gauge.<name>.bytes`` are exported through
+``metrics.get_counters``.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import dataclasses
+import time
+import weakref
+from collections import OrderedDict
+from collections.abc import Callable, Hashable
+from typing import Any, Generic, TypeVar
+
+import structlog
+
+from Adventorator.metrics import inc_counter, register_gauge
+
+K = TypeVar("K", bound=Hashable)
+V = TypeVar("V")
+
+log = structlog.get_logger()
+
+_CACHES: weakref.WeakSet[BoundedCache[Any, Any]] = weakref.WeakSet()
+
+
+def approx_sizeof(value: Any) -> int:
+    """Cheap recursive size estimate (string/bytes payload dominated)."""
+    if value is None or isinstance(value, bool | int | float):
+        return 8
+    if isinstance(value, str | bytes):
+        return len(value)
+    if isinstance(value, dict):
+        return sum(approx_sizeof(k) + approx_sizeof(v) for k, v in value.items())
+    if isinstance(value, list | tuple | set | frozenset):
+        return sum(approx_sizeof(v) for v in value)
+    if dataclasses.is_dataclass(value) and not isinstance(value, type):
+        return sum(approx_sizeof(getattr(value, f.name)) for f in dataclasses.fields(value))
+    dump = getattr(value, "model_dump", None)
+    if callable(dump):
+        return approx_sizeof(dump())
+    return 64
+
+
+class BoundedCache(Generic[K, V]):
+    """LRU+TTL cache bounded by entry count and approximate bytes."""
+
+    def __init__(
+        self,
+        name: str,
+        *,
+        ttl_s: float,
+        max_entries: int = 1024,
+        max_bytes: int = 0,
+        sizeof: Callable[[K, V], int] | None = None,
+    ) -> None:
+        self.name = name
+        self.ttl_s = ttl_s
+        self.max_entries = max_entries
+        self.max_bytes = max_bytes
+        self._sizeof = sizeof or (lambda k, v: approx_sizeof(k) + approx_sizeof(v))
+        # key -> (stored_at, value, size); stored_at uses the monotonic clock
+        self._entries: OrderedDict[K, tuple[float, V, int]] = OrderedDict()
+        self.nbytes = 0
+        _CACHES.add(self)
+        ref = weakref.ref(self)
+        register_gauge(f"{name}.entries", lambda: len(c) if (c := ref()) is not None else 0)
+        register_gauge(f"{name}.bytes", lambda: c.nbytes if (c := ref()) is not None else 0)
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def get(self, key: K) -> V | None:
+        found = self.get_with_age(key)
+        return None if found is None else found[0]
+
+    def get_with_age(self, key: K) -> tuple[V, float] | None:
+        """Return ``(value, age_seconds)`` for a live entry, else None."""
+        entry = self._entries.get(key)
+        if entry is None:
+            inc_counter(f"{self.name}.miss")
+            return None
+        age = time.monotonic() - entry[0]
+        if age > self.ttl_s:
+            self._discard(key)
+            inc_counter(f"{self.name}.expired")
+            return None
+        self._entries.move_to_end(key)
+        inc_counter(f"{self.name}.hit")
+        return entry[1], age
+
+    def set(self, key: K, value: V) -> None:
+        self._discard(key)
+        size = self._sizeof(key, value)
+        now = time.monotonic()
+        self._entries[key] = (now, value, size)
+        self.nbytes += size
+        evicted = 0
+        while self._entries:
+            oldest_key, (stored_at, _v, _size) = next(iter(self._entries.items()))
+            over = len(self._entries) > self.max_entries or (
+                self.max_bytes and self.nbytes > self.max_bytes
+            )
+            if not over and now - stored_at <= self.ttl_s:
+                break
+            self._discard(oldest_key)
+            evicted += 1
+        if evicted:
+            inc_counter(f"{self.name}.evicted", evicted)
+
+    def pop(self, key: K) -> V | None:
+        entry = self._discard(key)
+        return None if entry is None else entry[1]
+
+    def discard_where(self, predicate: Callable[[K, V], bool]) -> int:
+        """Drop entries for which ``predicate(key, value)`` holds; returns the count."""
+        doomed = [k for k, (_at, v, _s) in self._entries.items() if predicate(k, v)]
+        for key in doomed:
+            self._discard(key)
+        return len(doomed)
+
+    def clear(self) -> None:
+        self._entries.clear()
+        self.nbytes = 0
+
+    def sweep(self) -> int:
+        """Drop every expired entry; returns how many were removed."""
+        cutoff = time.monotonic() - self.ttl_s
+        stale = [k for k, (stored_at, _v, _s) in self._entries.items() if stored_at < cutoff]
+        for key in stale:
+            self._discard(key)
+        if stale:
+            inc_counter(f"{self.name}.evicted", len(stale))
+        return len(stale)
+
+    def _discard(self, key: K) -> tuple[float, V, int] | None:
+        entry = self._entries.pop(key, None)
+        if entry is not None:
+            self.nbytes -= entry[2]
+        return entry
+
+
+def clear_all() -> None:
+    """Empty every live ``BoundedCache`` (used by ``metrics.reset_counters``)."""
+    for cache in list(_CACHES):
+        cache.clear()
+
+
+def sweep_all() -> int:
+    """Sweep every live ``BoundedCache``; returns the total entries removed."""
+    return sum(cache.sweep() for cache in list(_CACHES))
+
+
+_sweeper: asyncio.Task[None] | None = None
+
+
+async def _sweep_forever(interval_s: float) -> None:
+    while True:
+        await asyncio.sleep(interval_s)
+        try:
+            removed = sweep_all()
+            if removed:
+                log.debug("bounded_cache.swept", removed=removed)
+        except Exception:
+            log.warning("bounded_cache.sweep_failed", exc_info=True)
+
+
+def start_sweeper(interval_s: float = 30.0) -> asyncio.Task[None]:
+    """Start (once) the background task that sweeps expired entries."""
+    global _sweeper
+    if _sweeper is None or _sweeper.done():
+        _sweeper = asyncio.get_running_loop().create_task(_sweep_forever(interval_s))
+    return _sweeper
+
+
+async def stop_sweeper() -> None:
+    global _sweeper
+    task, _sweeper = _sweeper, None
+    if task is not None and not task.done():
+        task.cancel()
+        try:
+            await task
+        except asyncio.CancelledError:
+            pass
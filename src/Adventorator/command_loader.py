@@ -8,3 +8,7 @@ import Adventorator.commands as commands_pkg  # package
 def load_all_commands() -> None:
     for m in pkgutil.iter_modules(commands_pkg.__path__, commands_pkg.__name__ + "."):
         importlib.import_module(m.name)
+    # Prebuild the planner tool catalog/prompt prefix once the registry is complete
+    from Adventorator.planner import get_planner_prefix
+
+    get_planner_prefix(load_if_empty=False)
@@ -3,10 +3,13 @@ from __future__ import annotations
 
 from collections.abc import Awaitable, Callable
 from dataclasses import dataclass, field
-from typing import Any, Protocol
+from typing import TYPE_CHECKING, Any, Protocol
 
 from pydantic import BaseModel, ConfigDict
 
+if TYPE_CHECKING:
+    from Adventorator.repos import SceneRef
+
 
 # --- Transport-agnostic context the handler receives ---
 class Responder(Protocol):
@@ -26,6 +29,8 @@ class Invocation:
     settings: Any | None = None
     llm_client: Any | None = None
     ruleset: Any | None = None  # Injected ruleset object
+    # (campaign_id, scene_id) resolved at the edge; handlers fall back to repos.resolve_scene
+    scene: SceneRef | None = None
     # you can add: seed, feature flags, request_id, etc.
 
 
@@ -52,6 +57,9 @@ class Command:
 
 # --- Global registry (populated by decorator) ---
 _REGISTRY: dict[str, Command] = {}
+# Bumped on every registration so derived artifacts (e.g. the planner tool
+# catalog) can tell when they are stale without re-walking the registry.
+_REGISTRY_VERSION = 0
 
 
 def slash_command(
@@ -62,8 +70,10 @@ def slash_command(
     **metadata: Any,
 ):
     def wrap(func: Callable[[Invocation, Option], Awaitable[None]]):
+        global _REGISTRY_VERSION
         key = name + (f":{subcommand}" if subcommand else "")
         _REGISTRY[key] = Command(name, description, option_model, func, subcommand, metadata)
+        _REGISTRY_VERSION += 1
         return func
 
     return wrap
@@ -73,6 +83,10 @@ def all_commands() -> dict[str, Command]:
     return dict(_REGISTRY)
 
 
+def registry_version() -> int:
+    return _REGISTRY_VERSION
+
+
 def find_command(name: str, subcommand: str | None) -> Command | None:
     key = name + (f":{subcommand}" if subcommand else "")
     cmd = _REGISTRY.get(key)
@@ -2,6 +2,7 @@ from __future__ import annotations
 
 import re
 from time import perf_counter
+from typing import Any
 
 import structlog
 from pydantic import Field
@@ -155,13 +156,15 @@ async def ask_cmd(inv: Invocation, opts: AskOpts):
             if entity_terms:
                 # Get KB adapter with settings
                 kb_config = getattr(settings, "ask_kb", None)
-                kb_kwargs = {}
+                kb_kwargs: dict[str, Any] = {}
                 if kb_config:
                     kb_kwargs = {
                         "timeout_s": getattr(kb_config, "timeout_s", 0.05),
                         "max_candidates": getattr(kb_config, "max_candidates", 5),
                         "cache_ttl_s": getattr(kb_config, "cache_ttl_s", 60.0),
                         "cache_max_size": getattr(kb_config, "cache_max_size", 1024),
+                        "cache_max_bytes": getattr(kb_config, "cache_max_bytes", 0),
+                        "cache_backend_path": getattr(kb_config, "cache_backend_path", None),
                         "max_terms_per_call": getattr(kb_config, "max_terms_per_call", 20),
                     }
 
@@ -31,8 +31,7 @@ async def cancel(inv: Invocation, opts: CancelOpts):
     guild_id = int(inv.guild_id or 0)
 
     async with session_scope() as s:
-        campaign = await repos.get_or_create_campaign(s, guild_id)
-        scene = await repos.ensure_scene(s, campaign.id, channel_id)
+        ref = inv.scene or await repos.resolve_scene(s, guild_id, channel_id)
         pa = None
         if opts.id is not None:
             q = await s.execute(
@@ -40,7 +39,7 @@ async def cancel(inv: Invocation, opts: CancelOpts):
             )
             pa = q.scalar_one_or_none()
         if pa is None:
-            pa = await repos.get_latest_pending_for_user(s, scene_id=scene.id, user_id=user_id)
+            pa = await repos.get_latest_pending_for_user(s, scene_id=ref.scene_id, user_id=user_id)
         if pa is None or pa.status != "pending":
             await inv.responder.send("No pending action to cancel.", ephemeral=True)
             inc_counter("pending.cancel.none")
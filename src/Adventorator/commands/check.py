@@ -93,8 +93,7 @@ async def check_command(inv: Invocation, opts: CheckOpts):
             channel_id = int(inv.channel_id or 0)
             user_id = str(inv.user_id)
             async with session_scope() as s:
-                campaign = await repos.get_or_create_campaign(s, guild_id)
-                scene = await repos.ensure_scene(s, campaign.id, channel_id)
+                ref = inv.scene or await repos.resolve_scene(s, guild_id, channel_id)
                 payload = {
                     "ability": ability,
                     "score": int(score),
@@ -111,7 +110,7 @@ async def check_command(inv: Invocation, opts: CheckOpts):
                 }
                 await repos.append_event(
                     s,
-                    scene_id=scene.id,
+                    scene_id=ref.scene_id,
                     actor_id=user_id,
                     type="check.performed",
                     payload=payload,
@@ -146,8 +145,7 @@ async def check_command(inv: Invocation, opts: CheckOpts):
                 )
                 return
             async with session_scope() as s:
-                campaign = await repos.get_or_create_campaign(s, guild_id)
-                scene = await repos.ensure_scene(s, campaign.id, channel_id)
+                ref = inv.scene or await repos.resolve_scene(s, guild_id, channel_id)
                 payload = {
                     "ability": ability,
                     "score": int(score),
@@ -166,8 +164,8 @@ async def check_command(inv: Invocation, opts: CheckOpts):
                 }
                 await repos.create_activity_log(
                     s,
-                    campaign_id=campaign.id,
-                    scene_id=scene.id,
+                    campaign_id=ref.campaign_id,
+                    scene_id=ref.scene_id,
                     actor_ref=str(inv.user_id) if inv.user_id is not None else None,
                     event_type="mechanics.check",
                     summary=f"{ability} check vs DC {opts.dc}",
@@ -32,8 +32,7 @@ async def confirm(inv: Invocation, opts: ConfirmOpts):
 
     # Resolve latest pending in this scene for the user
     async with session_scope() as s:
-        campaign = await repos.get_or_create_campaign(s, guild_id)
-        scene = await repos.ensure_scene(s, campaign.id, channel_id)
+        ref = inv.scene or await repos.resolve_scene(s, guild_id, channel_id)
         pa = None
         if opts.id is not None:
             # Fetch specific id if provided
@@ -42,7 +41,7 @@ async def confirm(inv: Invocation, opts: ConfirmOpts):
             )
             pa = q.scalar_one_or_none()
         if pa is None:
-            pa = await repos.get_latest_pending_for_user(s, scene_id=scene.id, user_id=user_id)
+            pa = await repos.get_latest_pending_for_user(s, scene_id=ref.scene_id, user_id=user_id)
             if pa is None or pa.status != "pending":
                 await inv.responder.send("No pending action to confirm.", ephemeral=True)
                 inc_counter("pending.confirm.none")
@@ -65,8 +64,8 @@ async def confirm(inv: Invocation, opts: ConfirmOpts):
             # Write bot transcript and mark complete
             await repos.write_transcript(
                 s,
-                campaign.id,
-                scene.id,
+                ref.campaign_id,
+                ref.scene_id,
                 channel_id,
                 "bot",
                 pa.narration,
@@ -17,6 +17,20 @@ class DoOpts(Option):
     message: str = Field(description="Your action or narration message")
 
 
+def character_summary(sheet: Any) -> str:
+    """Compact character summary for narrator prompts."""
+    parts = [sheet.name]
+    if sheet.class_name:
+        parts.append(str(sheet.class_name))
+    if sheet.level:
+        parts.append(f"Lv {sheet.level}")
+    # Include two key stats for brevity
+    dex = sheet.abilities.get("DEX", 10)
+    str_ = sheet.abilities.get("STR", 10)
+    parts.append(f"STR {str_}, DEX {dex}, PB {sheet.proficiency_bonus}")
+    return " ".join(str(p) for p in parts if p)
+
+
 async def _handle_do_like(inv: Invocation, opts: DoOpts):
     settings = inv.settings
     llm = inv.llm_client if (settings and getattr(settings, "features_llm", False)) else None
@@ -50,12 +64,11 @@ async def _handle_do_like(inv: Invocation, opts: DoOpts):
     char_summary_provider = None
     # Resolve scene and write the player transcript within the same session
     async with session_scope() as s:
-        campaign = await repos.get_or_create_campaign(s, guild_id)
-        scene = await repos.ensure_scene(s, campaign.id, channel_id)
+        ref = inv.scene or await repos.resolve_scene(s, guild_id, channel_id)
         player_tx = await repos.write_transcript(
             s,
-            campaign.id,
-            scene.id,
+            ref.campaign_id,
+            ref.scene_id,
             channel_id,
             "player",
             message,
@@ -63,10 +76,10 @@ async def _handle_do_like(inv: Invocation, opts: DoOpts):
             status="pending",
         )
         player_tx_id = getattr(player_tx, "id", None)
-        scene_id = scene.id
+        scene_id = ref.scene_id
         # Derive allowed actors from characters in this campaign
         # Allowed actors: include full names and their capitalized word tokens
-        names = await repos.list_character_names(s, campaign.id)
+        names = await repos.list_character_names(s, ref.campaign_id)
         allowed = list(names)
         extra_tokens: set[str] = set()
         for nm in names:
@@ -136,20 +149,8 @@ async def _handle_do_like(inv: Invocation, opts: DoOpts):
 
             sheet_provider = _provider
 
-            # Build a compact character summary for prompts
-            def _summary() -> str:
-                parts = [sheet.name]
-                if sheet.class_name:
-                    parts.append(str(sheet.class_name))
-                if sheet.level:
-                    parts.append(f"Lv {sheet.level}")
-                # Include two key stats for brevity
-                dex = sheet.abilities.get("DEX", 10)
-                str_ = sheet.abilities.get("STR", 10)
-                parts.append(f"STR {str_}, DEX {dex}, PB {sheet.proficiency_bonus}")
-                return " ".join(str(p) for p in parts if p)
-
-            char_summary_provider = _summary
+            summary = character_summary(sheet)
+            char_summary_provider = lambda: summary  # noqa: E731
 
     # Orchestrate
     try:
@@ -210,26 +211,26 @@ async def _handle_do_like(inv: Invocation, opts: DoOpts):
             )
         else:
             readable = {
-            "llm_invalid_or_empty": (
-                "🛑 The narrator couldn't produce a structured preview. "
-                "Try a simpler action or rephrase."
-            ),
-            "unsafe_verb": (
-                "🛑 Action rejected for unsafe content. "
-                "Describe what you attempt, not direct state changes."
-            ),
-            "unsupported action": "🛑 That action type isn't supported yet.",
-            "unknown ability": "🛑 Unknown ability; use STR/DEX/CON/INT/WIS/CHA.",
-            "dc out of acceptable range": "🛑 DC must be between 5 and 30.",
-            "attacker/target required": "🛑 Attack needs both attacker and target.",
-            "attack_bonus/target_ac required": "🛑 Provide attack_bonus and target_ac.",
-            "attack_bonus out of range": "🛑 attack_bonus must be between -5 and 15.",
-            "target_ac out of range": "🛑 target_ac must be between 5 and 30.",
-            "damage spec required": "🛑 Missing damage dice (e.g., 1d6+2).",
-            "damage.mod out of range": "🛑 Damage modifier must be between -5 and +10.",
-            "damage.mod invalid": "🛑 Damage modifier must be a number.",
-            "duration out of range": "🛑 Duration must be between 0 and 100.",
-            "duration invalid": "🛑 Duration must be a number.",
+                "llm_invalid_or_empty": (
+                    "🛑 The narrator couldn't produce a structured preview. "
+                    "Try a simpler action or rephrase."
+                ),
+                "unsafe_verb": (
+                    "🛑 Action rejected for unsafe content. "
+                    "Describe what you attempt, not direct state changes."
+                ),
+                "unsupported action": "🛑 That action type isn't supported yet.",
+                "unknown ability": "🛑 Unknown ability; use STR/DEX/CON/INT/WIS/CHA.",
+                "dc out of acceptable range": "🛑 DC must be between 5 and 30.",
+                "attacker/target required": "🛑 Attack needs both attacker and target.",
+                "attack_bonus/target_ac required": "🛑 Provide attack_bonus and target_ac.",
+                "attack_bonus out of range": "🛑 attack_bonus must be between -5 and 15.",
+                "target_ac out of range": "🛑 target_ac must be between 5 and 30.",
+                "damage spec required": "🛑 Missing damage dice (e.g., 1d6+2).",
+                "damage.mod out of range": "🛑 Damage modifier must be between -5 and +10.",
+                "damage.mod invalid": "🛑 Damage modifier must be a number.",
+                "duration out of range": "🛑 Duration must be between 0 and 100.",
+                "duration invalid": "🛑 Duration must be a number.",
             }.get(reason_key, f"🛑 Proposal rejected: {res.reason or 'invalid'}")
         await inv.responder.send(readable, ephemeral=True)
         inc_counter("pending.rejected")
@@ -248,14 +249,12 @@ async def _handle_do_like(inv: Invocation, opts: DoOpts):
             pending_enabled = False
     if pending_enabled and getattr(res, "chain_json", None):
         async with session_scope() as s:
-            campaign = await repos.get_or_create_campaign(s, guild_id)
-            scene = await repos.ensure_scene(s, campaign.id, channel_id)
             # Do not create bot transcript yet; we'll confirm it upon /confirm
             chain_json = cast(dict[str, Any], res.chain_json)
             pa = await repos.create_pending_action(
                 s,
-                campaign_id=campaign.id,
-                scene_id=scene.id,
+                campaign_id=ref.campaign_id,
+                scene_id=ref.scene_id,
                 channel_id=channel_id,
                 user_id=str(user_id),
                 request_id=chain_json.get("request_id", f"orc-{scene_id}"),
@@ -290,12 +289,10 @@ async def _handle_do_like(inv: Invocation, opts: DoOpts):
 
     # Otherwise: legacy immediate output path
     async with session_scope() as s:
-        campaign = await repos.get_or_create_campaign(s, guild_id)
-        scene = await repos.ensure_scene(s, campaign.id, channel_id)
         bot_tx = await repos.write_transcript(
             s,
-            campaign.id,
-            scene.id,
+            ref.campaign_id,
+            ref.scene_id,
             channel_id,
             "bot",
             res.narration,
@@ -61,10 +61,9 @@ async def encounter_status(inv: Invocation, opts: EncounterStatusOpts):
 
     async with session_scope() as s:
         # Resolve scene for this channel
-        campaign = await repos.get_or_create_campaign(s, guild_id)
-        scene = await repos.ensure_scene(s, campaign.id, channel_id)
+        ref = inv.scene or await repos.resolve_scene(s, guild_id, channel_id)
 
-        enc = await repos.get_active_or_setup_encounter_for_scene(s, scene_id=scene.id)
+        enc = await repos.get_active_or_setup_encounter_for_scene(s, scene_id=ref.scene_id)
         if not enc:
             await inv.responder.send("No encounter in this scene.")
             return
@@ -57,9 +57,8 @@ async def map_show(inv: Invocation, opts: MapShowOpts):
         channel_id = int(inv.channel_id or 0)
         # Defaults before DB remain
         async with session_scope() as s:
-            campaign = await repos.get_or_create_campaign(s, guild_id)
-            scene = await repos.ensure_scene(s, campaign.id, channel_id)
-            enc = await repos.get_active_or_setup_encounter_for_scene(s, scene_id=scene.id)
+            ref = inv.scene or await repos.resolve_scene(s, guild_id, channel_id)
+            enc = await repos.get_active_or_setup_encounter_for_scene(s, scene_id=ref.scene_id)
             # Require an active encounter for non-demo rendering
             if not enc or getattr(enc, "status", None) != EncounterStatus.active:
                 await inv.responder.send(
@@ -96,7 +95,7 @@ async def map_show(inv: Invocation, opts: MapShowOpts):
                         active=is_active,
                     )
                 )
-            last_event_id = await repos.get_latest_event_id_for_scene(s, scene_id=scene.id)
+            last_event_id = await repos.get_latest_event_id_for_scene(s, scene_id=ref.scene_id)
             rinp = RenderInput(
                 encounter_id=int(getattr(enc, "id", 0) or 0),
                 last_event_id=last_event_id,
@@ -1,3 +1,5 @@
+from typing import Any
+
 from pydantic import Field
 
 from Adventorator import repos
@@ -17,6 +19,20 @@ class OocOpts(Option):
     message: str = Field(description="Your out-of-character message")
 
 
+def build_ooc_prompt(txs: list[Any], message: str, settings: Any | None) -> list[dict[str, Any]]:
+    """OOC narration messages from recent transcripts (oldest first)."""
+    max_tokens = getattr(settings, "llm_max_prompt_tokens", None) if settings else None
+    clerk_msgs = build_clerk_messages(txs, player_msg=message, max_tokens=max_tokens)
+    # Convert clerk messages to facts (exclude system, keep content)
+    facts: list[str] = []
+    for m in clerk_msgs:
+        if m.get("role") == "system":
+            continue
+        facts.append(str(m.get("content", "")).strip())
+    facts = [f for f in facts if f]
+    return build_ooc_narration_messages(facts, player_msg=message, max_tokens=max_tokens)
+
+
 @slash_command(
     name="ooc",
     description="Out-of-character narration (no dice).",
@@ -46,12 +62,11 @@ async def ooc_command(inv: Invocation, opts: OocOpts):
     player_tx_id = None
     bot_tx_id = None
     async with session_scope() as s:
-        campaign = await repos.get_or_create_campaign(s, guild_id)
-        scene = await repos.ensure_scene(s, campaign.id, channel_id)
+        ref = inv.scene or await repos.resolve_scene(s, guild_id, channel_id)
         player_tx = await repos.write_transcript(
             s,
-            campaign.id,
-            scene.id,
+            ref.campaign_id,
+            ref.scene_id,
             channel_id,
             "player",
             message,
@@ -61,27 +76,10 @@ async def ooc_command(inv: Invocation, opts: OocOpts):
         player_tx_id = player_tx.id
 
         # Build facts from recent transcripts for context
-        txs = await repos.get_recent_transcripts(s, scene_id=scene.id, limit=15)
-        clerk_msgs = build_clerk_messages(
-            txs,
-            player_msg=message,
-            max_tokens=(getattr(settings, "llm_max_prompt_tokens", None) if settings else None),
-        )
-
-    # Convert clerk messages to facts (exclude system, keep content)
-    facts: list[str] = []
-    for m in clerk_msgs:
-        if m.get("role") == "system":
-            continue
-        facts.append(str(m.get("content", "")).strip())
-    facts = [f for f in facts if f]
+        txs = await repos.get_recent_transcripts(s, scene_id=ref.scene_id, limit=15)
 
     # Build OOC narration-only prompt and call LLM for plain text
-    ooc_msgs = build_ooc_narration_messages(
-        facts,
-        player_msg=message,
-        max_tokens=(getattr(settings, "llm_max_prompt_tokens", None) if settings else None),
-    )
+    ooc_msgs = build_ooc_prompt(txs, message, settings)
     narration = await llm.generate_response(ooc_msgs)
     if narration is None:
         async with session_scope() as s:
@@ -92,12 +90,10 @@ async def ooc_command(inv: Invocation, opts: OocOpts):
 
     # Persist bot transcript and send narration only (no dice)
     async with session_scope() as s:
-        campaign = await repos.get_or_create_campaign(s, guild_id)
-        scene = await repos.ensure_scene(s, campaign.id, channel_id)
         bot_tx = await repos.write_transcript(
             s,
-            campaign.id,
-            scene.id,
+            ref.campaign_id,
+            ref.scene_id,
             channel_id,
             "bot",
             narration,
@@ -35,10 +35,9 @@ async def pending(inv: Invocation):
         return
 
     async with session_scope() as s:
-        campaign = await repos.get_or_create_campaign(s, guild_id)
-        scene = await repos.ensure_scene(s, campaign.id, channel_id)
+        ref = inv.scene or await repos.resolve_scene(s, guild_id, channel_id)
         # For now, just get the latest pending; can be expanded to list many
-        pa = await repos.get_latest_pending_for_user(s, scene_id=scene.id, user_id=user_id)
+        pa = await repos.get_latest_pending_for_user(s, scene_id=ref.scene_id, user_id=user_id)
 
     if not pa:
         await inv.responder.send("No pending action found.", ephemeral=True)
@@ -90,12 +90,11 @@ async def plan_cmd(inv: Invocation, opts: PlanOpts):
     allowed_actor_names: list[str] = []
     campaign_id = 0
     async with session_scope() as s:
-        campaign = await repos.get_or_create_campaign(s, guild_id)
-        scene = await repos.ensure_scene(s, campaign.id, channel_id)
+        ref = inv.scene or await repos.resolve_scene(s, guild_id, channel_id)
         player_tx = await repos.write_transcript(
             s,
-            campaign.id,
-            scene.id,
+            ref.campaign_id,
+            ref.scene_id,
             channel_id,
             "player",
             user_msg,
@@ -103,20 +102,20 @@ async def plan_cmd(inv: Invocation, opts: PlanOpts):
         )
         # player_tx_id retained for future auditing if needed; not currently used.
         getattr(player_tx, "id", None)
-        scene_id = scene.id
+        scene_id = ref.scene_id
         log_event(
             "planner",
             "context_ready",
             scene_id=scene_id,
-            campaign_id=campaign.id,
+            campaign_id=ref.campaign_id,
             user_id=user_id,
             action_validation=use_action_validation,
             predicate_gate=use_predicate_gate,
         )
-        campaign_id = campaign.id
+        campaign_id = ref.campaign_id
         if use_action_validation and use_predicate_gate:
             try:
-                allowed_actor_names = await repos.list_character_names(s, campaign.id)
+                allowed_actor_names = await repos.list_character_names(s, ref.campaign_id)
             except Exception:
                 allowed_actor_names = []
 
@@ -48,8 +48,7 @@ async def roll(inv: Invocation, opts: RollOpts):
             channel_id = int(inv.channel_id or 0)
             user_id = str(inv.user_id)
             async with session_scope() as s:
-                campaign = await repos.get_or_create_campaign(s, guild_id)
-                scene = await repos.ensure_scene(s, campaign.id, channel_id)
+                ref = inv.scene or await repos.resolve_scene(s, guild_id, channel_id)
                 payload = {
                     "expr": opts.expr or "1d20",
                     "rolls": list(res.rolls),
@@ -60,7 +59,7 @@ async def roll(inv: Invocation, opts: RollOpts):
                 }
                 await repos.append_event(
                     s,
-                    scene_id=scene.id,
+                    scene_id=ref.scene_id,
                     actor_id=user_id,
                     type="roll.performed",
                     payload=payload,
@@ -95,8 +94,7 @@ async def roll(inv: Invocation, opts: RollOpts):
                 )
                 return
             async with session_scope() as s:
-                campaign = await repos.get_or_create_campaign(s, guild_id)
-                scene = await repos.ensure_scene(s, campaign.id, channel_id)
+                ref = inv.scene or await repos.resolve_scene(s, guild_id, channel_id)
                 payload = {
                     "expression": opts.expr or "1d20",
                     "rolls": list(res.rolls),
@@ -107,8 +105,8 @@ async def roll(inv: Invocation, opts: RollOpts):
                 }
                 await repos.create_activity_log(
                     s,
-                    campaign_id=campaign.id,
-                    scene_id=scene.id,
+                    campaign_id=ref.campaign_id,
+                    scene_id=ref.scene_id,
                     actor_ref=str(inv.user_id) if inv.user_id is not None else None,
                     event_type="mechanics.roll",
                     summary=f"Roll {opts.expr or '1d20'}",
@@ -127,18 +127,39 @@ def _toml_settings_source() -> dict[str, Any]:
         out["llm_max_prompt_tokens"] = llm_cfg["max_prompt_tokens"]
     if "max_response_chars" in llm_cfg and llm_cfg.get("max_response_chars") is not None:
         out["llm_max_response_chars"] = llm_cfg["max_response_chars"]
+    if "stream" in llm_cfg:
+        out["llm_stream"] = bool(llm_cfg["stream"])
+    if llm_cfg.get("max_concurrency") is not None:
+        out["llm_max_concurrency"] = int(llm_cfg["max_concurrency"])
+    if "deadline_seconds" in llm_cfg:
+        out["llm_deadline_seconds"] = llm_cfg["deadline_seconds"]
+    if "speculative" in llm_cfg:
+        out["llm_speculative"] = bool(llm_cfg["speculative"])
 
     # Planner
     planner_cfg = t.get("planner", {}) or {}
     out["planner_timeout_seconds"] = int(planner_cfg.get("timeout_seconds", 12))
     out["planner_max_level"] = int(planner_cfg.get("max_level", 1))
 
+    # Background command runner
+    jobs_cfg = t.get("jobs", {}) or {}
+    if jobs_cfg.get("max_workers") is not None:
+        out["jobs_max_workers"] = int(jobs_cfg["max_workers"])
+    if jobs_cfg.get("max_queue") is not None:
+        out["jobs_max_queue"] = int(jobs_cfg["max_queue"])
+    if "durable" in jobs_cfg:
+        out["jobs_durable"] = bool(jobs_cfg["durable"])
+    if jobs_cfg.get("drain_seconds") is not None:
+        out["jobs_drain_seconds"] = float(jobs_cfg["drain_seconds"])
+
     # Retrieval (Phase 6)
     # Example TOML:
     # [features.retrieval]
     # enabled = true
-    # provider = "none" # future: pgvector|qdrant
+    # provider = "none" # fts|bm25|vector|pgvector; future: qdrant
     # top_k = 4
+    # budget_ms = 250  # drop retrieval from the prompt when it runs past this
+    # bm25_max_campaigns = 64  # bm25 only: resident campaign indexes (LRU)
     retrieval_cfg = t.get("features", {}).get("retrieval", {}) or {}
     if retrieval_cfg:
         out["retrieval"] = {
@@ -146,6 +167,17 @@ def _toml_settings_source() -> dict[str, Any]:
             "provider": retrieval_cfg.get("provider", "none"),
             "top_k": int(retrieval_cfg.get("top_k", 4)),
         }
+        for key in (
+            "budget_ms",
+            "bm25_max_campaigns",
+            "bm25_max_bytes",
+            "bm25_refresh_seconds",
+            "vector_dim",
+            "vector_max_campaigns",
+            "vector_refresh_seconds",
+        ):
+            if key in retrieval_cfg:
+                out["retrieval"][key] = retrieval_cfg[key]
 
     # KB Configuration (Phase 3)
     # Example TOML:
@@ -154,6 +186,8 @@ def _toml_settings_source() -> dict[str, Any]:
     # max_candidates = 5
     # cache_ttl_s = 60
     # cache_max_size = 1024
+    # cache_max_bytes = 1048576  # 0 = no byte bound
+    # cache_backend_path = "kb_cache.sqlite3"  # optional cache shared by workers
     # max_terms_per_call = 20
     kb_cfg = t.get("ask", {}).get("kb", {}) or {}
     if kb_cfg:
@@ -162,9 +196,31 @@ def _toml_settings_source() -> dict[str, Any]:
             "max_candidates": int(kb_cfg.get("max_candidates", 5)),
             "cache_ttl_s": float(kb_cfg.get("cache_ttl_s", 60.0)),
             "cache_max_size": int(kb_cfg.get("cache_max_size", 1024)),
+            "cache_max_bytes": int(kb_cfg.get("cache_max_bytes", 1024 * 1024)),
+            "cache_backend_path": kb_cfg.get("cache_backend_path") or None,
             "max_terms_per_call": int(kb_cfg.get("max_terms_per_call", 20)),
         }
 
+    # LLM response cache
+    # Example TOML:
+    # [llm.cache]
+    # backend = "sqlite"  # none|memory|sqlite|redis
+    # path = "llm_cache.sqlite3"  # sqlite only
+    # url = "redis://127.0.0.1:6379/0"  # redis only
+    # ttl_s = 86400
+    # max_entries = 1024
+    # max_bytes = 16777216
+    llm_cache_cfg = llm_cfg.get("cache", {}) or {}
+    if llm_cache_cfg:
+        out["llm_cache"] = {
+            "backend": llm_cache_cfg.get("backend", "none"),
+            "path": llm_cache_cfg.get("path", "llm_cache.sqlite3"),
+            "url": llm_cache_cfg.get("url", "redis://127.0.0.1:6379/0"),
+            "ttl_s": float(llm_cache_cfg.get("ttl_s", 86_400.0)),
+            "max_entries": int(llm_cache_cfg.get("max_entries", 1024)),
+            "max_bytes": int(llm_cache_cfg.get("max_bytes", 16 * 1024 * 1024)),
+        }
+
     # Ops toggles
     ops_cfg = t.get("ops", {}) or {}
     out["metrics_endpoint_enabled"] = ops_cfg.get("metrics_endpoint_enabled", False)
@@ -206,6 +262,12 @@ class Settings(BaseSettings):
     app_port: int = 18000
     planner_timeout_seconds: int = 12
     planner_max_level: int = 1
+    # Background command runner: worker bound, queue cap (excess interactions get a
+    # "busy" reply), durable command_jobs table for resume, shutdown drain budget
+    jobs_max_workers: int = 8
+    jobs_max_queue: int = 1000
+    jobs_durable: bool = False
+    jobs_drain_seconds: float = 20.0
 
     # --- ImprobabilityDrive and /ask feature flags ---
     features_improbability_drive: bool = False
@@ -222,6 +284,8 @@ class Settings(BaseSettings):
         max_candidates: int = 5
         cache_ttl_s: float = 60.0
         cache_max_size: int = 1024
+        cache_max_bytes: int = 1024 * 1024
+        cache_backend_path: str | None = None
         max_terms_per_call: int = 20
 
     ask_kb: AskKBConfig = AskKBConfig()
@@ -229,8 +293,19 @@ class Settings(BaseSettings):
     # --- Retrieval (Phase 6) ---
     class RetrievalConfig(BaseModel):
         enabled: bool = False
-        provider: Literal["none", "pgvector", "qdrant"] = "none"
+        provider: Literal["none", "fts", "bm25", "vector", "pgvector", "qdrant"] = "none"
         top_k: int = 4
+        # Orchestrator prefetch: retrieval still running this long after the prefetch
+        # stage started is dropped from the prompt (0 = always wait)
+        budget_ms: int = 250
+        # In-process BM25 index bounds (provider = "bm25")
+        bm25_max_campaigns: int = 64
+        bm25_max_bytes: int = 64 * 1024 * 1024
+        bm25_refresh_seconds: float = 30.0
+        # Local embedding index (provider = "vector" | "pgvector")
+        vector_dim: int = 512
+        vector_max_campaigns: int = 64
+        vector_refresh_seconds: float = 30.0
 
     retrieval: RetrievalConfig = RetrievalConfig()
 
@@ -246,6 +321,24 @@ class Settings(BaseSettings):
     llm_default_system_prompt: str = "You are a helpful assistant."
     llm_max_prompt_tokens: int = 4096
     llm_max_response_chars: int = 4096
+    # Stream tokens from the provider; JSON calls stop at the first complete object
+    llm_stream: bool = False
+    # Scheduler in front of the client: concurrent upstream calls per provider endpoint,
+    # and the per-interaction budget after which queued LLM calls are rejected
+    llm_max_concurrency: int = 4
+    llm_deadline_seconds: float | None = 45.0
+    # Start the /do and /ooc narrator call at defer time, before the handler runs
+    llm_speculative: bool = False
+
+    class LLMCacheConfig(BaseModel):
+        backend: Literal["none", "memory", "sqlite", "redis"] = "none"
+        path: str = "llm_cache.sqlite3"
+        url: str = "redis://127.0.0.1:6379/0"
+        ttl_s: float = 86_400.0
+        max_entries: int = 1024
+        max_bytes: int = 16 * 1024 * 1024
+
+    llm_cache: LLMCacheConfig = LLMCacheConfig()
 
     # --- Logging ---
     logging_enabled: bool = True
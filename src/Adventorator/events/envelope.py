@@ -3,7 +3,7 @@
 from __future__ import annotations
 
 import hashlib
-from collections.abc import Mapping
+from collections.abc import Iterable, Mapping, Sequence
 from dataclasses import dataclass
 from datetime import datetime, timezone
 from typing import Any
@@ -45,10 +45,41 @@ def canonical_json_bytes(payload: Mapping[str, Any] | None) -> bytes:
     return canonical_json_bytes_full(payload)
 
 
-def compute_payload_hash(payload: Mapping[str, Any] | None) -> bytes:
+@dataclass(slots=True, frozen=True)
+class CanonicalPayload:
+    """A payload's canonical bytes and hash, encoded once per append.
+
+    ``compute_payload_hash``, ``compute_idempotency_key`` and
+    ``compute_idempotency_key_v2`` accept it wherever they accept a payload
+    mapping, so one append encodes its payload a single time.
+    """
+
+    canonical: bytes
+    payload_hash: bytes
+
+    @property
+    def hash_prefix(self) -> str:
+        """Short hex prefix used in structured logs."""
+        return self.payload_hash.hex()[:16]
+
+
+_GENESIS_CANONICAL = CanonicalPayload(GENESIS_PAYLOAD_CANONICAL, GENESIS_PAYLOAD_HASH)
+
+
+def canonicalize_payload(payload: Mapping[str, Any] | CanonicalPayload | None) -> CanonicalPayload:
+    """Encode ``payload`` once (``None`` is treated as ``{}``)."""
+    if isinstance(payload, CanonicalPayload):
+        return payload
+    if payload is None or payload is GENESIS_PAYLOAD or (type(payload) is dict and not payload):
+        return _GENESIS_CANONICAL
+    canonical = canonical_json_bytes(payload)
+    return CanonicalPayload(canonical, hashlib.sha256(canonical).digest())
+
+
+def compute_payload_hash(payload: Mapping[str, Any] | CanonicalPayload | None) -> bytes:
     """Return the SHA-256 digest of the canonical payload representation."""
 
-    return hashlib.sha256(canonical_json_bytes(payload)).digest()
+    return canonicalize_payload(payload).payload_hash
 
 
 def compute_envelope_hash(
@@ -96,13 +127,37 @@ def compute_envelope_hash(
     return hashlib.sha256(b"".join(parts)).digest()
 
 
+def compute_envelope_hashes(rows: Iterable[Sequence[Any]]) -> list[bytes]:
+    """Hash many envelopes given as plain tuples (picklable for process pools).
+
+    Each row is ``(campaign_id, scene_id, replay_ordinal, event_type,
+    event_schema_version, world_time, wall_time_utc, prev_event_hash,
+    payload_hash, idempotency_key)`` - the order of the envelope columns.
+    """
+    return [
+        compute_envelope_hash(
+            campaign_id=r[0],
+            scene_id=r[1],
+            replay_ordinal=r[2],
+            event_type=r[3],
+            event_schema_version=r[4],
+            world_time=r[5],
+            wall_time_utc=r[6],
+            prev_event_hash=r[7],
+            payload_hash=r[8],
+            idempotency_key=r[9],
+        )
+        for r in rows
+    ]
+
+
 def compute_idempotency_key(
     *,
     campaign_id: int,
     event_type: str,
     execution_request_id: str | None,
     plan_id: str | None,
-    payload: Mapping[str, Any] | None,
+    payload: Mapping[str, Any] | CanonicalPayload | None,
     replay_ordinal: int,
 ) -> bytes:
     """Derive a deterministic 16-byte idempotency prefix.
@@ -119,7 +174,7 @@ def compute_idempotency_key(
         ("execution_request_id", (execution_request_id or "").encode("utf-8")),
         ("plan_id", (plan_id or "").encode("utf-8")),
         ("replay_ordinal", str(replay_ordinal).encode("utf-8")),
-        ("payload", canonical_json_bytes(payload)),
+        ("payload", canonicalize_payload(payload).canonical),
     ]
     framed: list[bytes] = []
     for label, value in components:
@@ -137,7 +192,7 @@ def compute_idempotency_key_v2(
     event_type: str,
     tool_name: str | None,
     ruleset_version: str | None,
-    args_json: Mapping[str, Any] | None,
+    args_json: Mapping[str, Any] | CanonicalPayload | None,
 ) -> bytes:
     """Derive a deterministic 16-byte idempotency key per STORY-CDA-CORE-001D.
 
@@ -155,7 +210,8 @@ def compute_idempotency_key_v2(
         event_type: Event type string
         tool_name: Name of the tool being executed (nullable)
         ruleset_version: Version of ruleset being used (nullable)
-        args_json: Canonical JSON-serializable arguments (nullable)
+        args_json: Canonical JSON-serializable arguments (nullable), or their
+            ``CanonicalPayload`` when the caller already encoded them
 
     Returns:
         16-byte deterministic key prefix
@@ -167,7 +223,7 @@ def compute_idempotency_key_v2(
     if args_json is None:
         args_bytes = b"<null>"  # Sentinel value for None
     else:
-        args_bytes = canonical_json_bytes(args_json)
+        args_bytes = canonicalize_payload(args_json).canonical
 
     components: list[tuple[str, bytes]] = [
         ("plan_id", (plan_id or "").encode("utf-8")),
@@ -230,40 +286,46 @@ class HashChainMismatchError(Exception):
         )
 
 
-def verify_hash_chain(events: list) -> dict[str, Any]:
-    """Verify hash chain integrity for a list of events.
-
-    Args:
-        events: List of Event model instances ordered by replay_ordinal
-
-    Returns:
-        dict: Verification summary with counts and status
+class ChainVerifier:
+    """Incremental hash chain verifier holding only the running previous hash.
 
-    Raises:
-        HashChainMismatchError: When a hash mismatch is detected
+    Feed events in replay_ordinal order (ORM rows or column-only result rows
+    exposing the envelope attributes). Start from genesis, or from a verified
+    checkpoint by passing the checkpoint's ordinal and envelope hash.
+    Ordinal gaps are recorded in ``gaps`` as (expected, actual) pairs; a
+    ``prev_event_hash`` that does not link raises HashChainMismatchError.
     """
-    from Adventorator.action_validation.logging_utils import log_event
-    from Adventorator.metrics import inc_counter
 
-    if not events:
-        return {"verified_count": 0, "status": "success", "chain_length": 0}
-
-    # Sort by replay_ordinal to ensure proper chain traversal
-    events = sorted(events, key=lambda e: e.replay_ordinal)
-
-    expected_prev_hash = GENESIS_PREV_EVENT_HASH
-    verified_count = 0
-
-    for event in events:
+    __slots__ = ("expected_prev_hash", "next_ordinal", "verified_count", "gaps")
+
+    def __init__(
+        self,
+        *,
+        after_ordinal: int = -1,
+        prev_hash: bytes = GENESIS_PREV_EVENT_HASH,
+    ) -> None:
+        self.expected_prev_hash = prev_hash
+        self.next_ordinal = after_ordinal + 1
+        self.verified_count = 0
+        self.gaps: list[tuple[int, int]] = []
+
+    def feed(self, event: Any) -> bytes:
+        """Verify one event's linkage and return its envelope hash."""
+        from Adventorator.action_validation.logging_utils import log_event
+        from Adventorator.metrics import inc_counter
+
+        if isinstance(event.replay_ordinal, int) and event.replay_ordinal != self.next_ordinal:
+            self.gaps.append((self.next_ordinal, event.replay_ordinal))
+            inc_counter("events.chain_gap")
         # Check that prev_event_hash matches expected value
-        if event.prev_event_hash != expected_prev_hash:
+        if event.prev_event_hash != self.expected_prev_hash:
             # Log structured mismatch event
             log_event(
                 "event",
                 "chain_mismatch",
                 campaign_id=event.campaign_id,
                 replay_ordinal=event.replay_ordinal,
-                expected_hash=expected_prev_hash.hex()[:16],
+                expected_hash=self.expected_prev_hash.hex()[:16],
                 actual_hash=event.prev_event_hash.hex()[:16],
                 event_type=event.type,
             )
@@ -274,12 +336,12 @@ def verify_hash_chain(events: list) -> dict[str, Any]:
             # Raise exception with details
             raise HashChainMismatchError(
                 ordinal=event.replay_ordinal,
-                expected_hash=expected_prev_hash,
+                expected_hash=self.expected_prev_hash,
                 actual_hash=event.prev_event_hash,
             )
 
         # Compute the envelope hash of this event for the next iteration
-        expected_prev_hash = compute_envelope_hash(
+        self.expected_prev_hash = compute_envelope_hash(
             campaign_id=event.campaign_id,
             scene_id=event.scene_id,
             replay_ordinal=event.replay_ordinal,
@@ -291,10 +353,39 @@ def verify_hash_chain(events: list) -> dict[str, Any]:
             payload_hash=event.payload_hash,
             idempotency_key=event.idempotency_key,
         )
+        if isinstance(event.replay_ordinal, int):
+            self.next_ordinal = event.replay_ordinal + 1
+        self.verified_count += 1
+        return self.expected_prev_hash
 
-        verified_count += 1
 
-    return {"verified_count": verified_count, "status": "success", "chain_length": len(events)}
+def verify_hash_chain(events: list) -> dict[str, Any]:
+    """Verify hash chain integrity for a list of events.
+
+    Args:
+        events: List of Event model instances ordered by replay_ordinal
+
+    Returns:
+        dict: Verification summary with counts and status
+
+    Raises:
+        HashChainMismatchError: When a hash mismatch is detected
+    """
+    if not events:
+        return {"verified_count": 0, "status": "success", "chain_length": 0}
+
+    # Sort by replay_ordinal to ensure proper chain traversal
+    events = sorted(events, key=lambda e: e.replay_ordinal)
+
+    verifier = ChainVerifier()
+    for event in events:
+        verifier.feed(event)
+
+    return {
+        "verified_count": verifier.verified_count,
+        "status": "success",
+        "chain_length": len(events),
+    }
 
 
 async def get_chain_tip(session, campaign_id: int) -> tuple[int, bytes] | None:
@@ -409,14 +500,18 @@ __all__ = [
     "GENESIS_PAYLOAD_HASH",
     "GENESIS_PREV_EVENT_HASH",
     "GENESIS_SCHEMA_VERSION",
+    "CanonicalPayload",
     "GenesisEvent",
+    "ChainVerifier",
     "HashChainMismatchError",
     "canonical_json_bytes",
+    "canonicalize_payload",
     "compute_canonical_hash",
     "compute_idempotency_key",
     "compute_idempotency_key_v2",
     "compute_payload_hash",
     "compute_envelope_hash",
+    "compute_envelope_hashes",
     "verify_hash_chain",
     "get_chain_tip",
     "log_event_applied",
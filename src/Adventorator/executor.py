@@ -106,20 +106,21 @@ async def execute_tool_call_chain(chain: ToolCallChain) -> Preview:
     try:
         settings = load_settings()
         if getattr(settings, "features_events", False):
+            batch = [
+                {"type": f"executor.{item.tool}", "payload": {"mechanics": item.mechanics}}
+                for item in preview.items
+            ]
             async with session_scope() as s:
-                for item in preview.items:
-                    payload = {"mechanics": item.mechanics}
-                    try:
-                        await repos.append_event(
-                            s,
-                            scene_id=chain.scene_id,
-                            actor_id=chain.actor_id,
-                            type=f"executor.{item.tool}",
-                            payload=payload,
-                            request_id=chain.request_id,
-                        )
-                    except Exception:
-                        inc_counter("events.append.error")
+                try:
+                    await repos.append_events_batch(
+                        s,
+                        scene_id=chain.scene_id,
+                        actor_id=chain.actor_id,
+                        events=batch,
+                        request_id=chain.request_id,
+                    )
+                except Exception:
+                    inc_counter("events.append.error", len(batch))
     except Exception:
         pass
     return preview
@@ -730,37 +731,37 @@ class Executor:
             settings = load_settings()
             if getattr(settings, "features_events", False):
                 # Append generic events with preview mechanics per step
+                # Use predicted events if provided by the handler, otherwise a
+                # generic mechanics event per step; all appended in one batch.
+                batch: list[dict[str, Any]] = []
+                for item in res.items:
+                    evs = item.predicted_events or []
+                    if evs:
+                        for ev in evs:
+                            batch.append(
+                                {
+                                    "type": str(ev.get("type", f"executor.{item.tool}")),
+                                    "payload": dict(ev.get("payload", {})),
+                                }
+                            )
+                    else:
+                        batch.append(
+                            {
+                                "type": f"executor.{item.tool}",
+                                "payload": {"mechanics": item.mechanics},
+                            }
+                        )
                 async with session_scope() as s:
-                    for item in res.items:
-                        # Use predicted events if provided by the handler
-                        evs = item.predicted_events or []
-                        if evs:
-                            for ev in evs:
-                                try:
-                                    await repos.append_event(
-                                        s,
-                                        scene_id=chain.scene_id,
-                                        actor_id=chain.actor_id,
-                                        type=str(ev.get("type", f"executor.{item.tool}")),
-                                        payload=dict(ev.get("payload", {})),
-                                        request_id=chain.request_id,
-                                    )
-                                except Exception:
-                                    inc_counter("events.append.error")
-                        else:
-                            # Fallback to generic mechanics event
-                            payload = {"mechanics": item.mechanics}
-                            try:
-                                await repos.append_event(
-                                    s,
-                                    scene_id=chain.scene_id,
-                                    actor_id=chain.actor_id,
-                                    type=f"executor.{item.tool}",
-                                    payload=payload,
-                                    request_id=chain.request_id,
-                                )
-                            except Exception:
-                                inc_counter("events.append.error")
+                    try:
+                        await repos.append_events_batch(
+                            s,
+                            scene_id=chain.scene_id,
+                            actor_id=chain.actor_id,
+                            events=batch,
+                            request_id=chain.request_id,
+                        )
+                    except Exception:
+                        inc_counter("events.append.error", len(batch))
         except Exception:
             # Feature flag or ledger errors should not fail apply in Phase 8
             pass
@@ -15,19 +15,22 @@ Implements requirements from ADR-0011, ADR-0006, ADR-0007, and ARCH-CDA-001.
 from __future__ import annotations
 
 import asyncio
-import copy
 import hashlib
 import json
 import logging
+import multiprocessing
 import re
 import time
 import unicodedata
+from collections.abc import Callable, Generator, Iterator, Sequence
+from concurrent.futures import ProcessPoolExecutor
+from contextlib import closing
 from datetime import datetime, timezone
 from functools import lru_cache
 from pathlib import Path
 from typing import Any
 
-from sqlalchemy import select
+from sqlalchemy import delete, insert, select
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from Adventorator import models, repos
@@ -38,6 +41,8 @@ from Adventorator.importer_context import ImporterRunContext
 from Adventorator.manifest_validation import ManifestValidationError, validate_manifest
 from Adventorator.metrics import get_counter, observe_histogram
 from Adventorator.metrics import inc_counter as metrics_inc_counter
+from Adventorator.schema_registry import get_schema_validator, validate_against_schema
+from Adventorator.services.lock_service import acquire_campaign_event_lock
 
 # Set up logging
 logger = logging.getLogger(__name__)
@@ -110,20 +115,6 @@ def record_rollback(phase: str, package_id: str, manifest_hash: str, reason: str
     )
 
 
-# Internal importer append locks ensure deterministic replay ordinals for
-# synthetic seed events emitted without a scene context. They mirror the
-# campaign-level locking used by the live event append path.
-_IMPORT_EVENT_LOCKS: dict[int, asyncio.Lock] = {}
-
-
-def _import_event_lock_for_campaign(campaign_id: int) -> asyncio.Lock:
-    lock = _IMPORT_EVENT_LOCKS.get(campaign_id)
-    if lock is None:
-        lock = asyncio.Lock()
-        _IMPORT_EVENT_LOCKS[campaign_id] = lock
-    return lock
-
-
 # Database Integration Functions
 async def persist_import_event(
     session: AsyncSession,
@@ -159,14 +150,16 @@ async def persist_import_event(
         else:
             payload_dict = dict(payload)
 
-        payload_hash = event_envelope.compute_payload_hash(payload_dict)
+        # Encoded once for the hash, the key and the collision check
+        canonical = event_envelope.canonicalize_payload(payload_dict)
+        payload_hash = canonical.payload_hash
         idempotency_key = event_envelope.compute_idempotency_key_v2(
             campaign_id=campaign_id,
             event_type=event_type,
             tool_name="importer",
             ruleset_version=payload_dict.get("ruleset_version"),
             plan_id=None,
-            args_json=payload_dict,
+            args_json=canonical,
         )
 
         existing = await session.execute(
@@ -193,32 +186,11 @@ async def persist_import_event(
             )
             return existing_event
 
-        async with _import_event_lock_for_campaign(campaign_id):
-            last_event = await session.execute(
-                select(models.Event)
-                .where(models.Event.campaign_id == campaign_id)
-                .order_by(models.Event.replay_ordinal.desc())
-                .limit(1)
+        # Same per-campaign lock as the live append path (advisory on Postgres)
+        async with acquire_campaign_event_lock(session, campaign_id=campaign_id):
+            replay_ordinal, prev_hash = await repos.resolve_next_chain_link(
+                session, campaign_id=campaign_id
             )
-            last_event_row = last_event.scalar_one_or_none()
-
-            if last_event_row is None:
-                replay_ordinal = 0
-                prev_hash = event_envelope.GENESIS_PREV_EVENT_HASH
-            else:
-                replay_ordinal = last_event_row.replay_ordinal + 1
-                prev_hash = event_envelope.compute_envelope_hash(
-                    campaign_id=last_event_row.campaign_id,
-                    scene_id=last_event_row.scene_id,
-                    replay_ordinal=last_event_row.replay_ordinal,
-                    event_type=last_event_row.type,
-                    event_schema_version=last_event_row.event_schema_version,
-                    world_time=last_event_row.world_time,
-                    wall_time_utc=last_event_row.wall_time_utc,
-                    prev_event_hash=last_event_row.prev_event_hash,
-                    payload_hash=last_event_row.payload_hash,
-                    idempotency_key=last_event_row.idempotency_key,
-                )
 
             now = datetime.now(timezone.utc)
             event = models.Event(
@@ -241,7 +213,11 @@ async def persist_import_event(
             )
 
             session.add(event)
-            await session.flush()
+            try:
+                await session.flush()
+            except Exception:
+                repos.invalidate_chain_tip(campaign_id, session)
+                raise
 
         latency_ms = int(time.time() * 1000 - start_time_ms)
         log_event_applied(
@@ -310,6 +286,393 @@ async def persist_import_log_entry(
     return import_log
 
 
+# Keys per IN (...) lookup: stays under SQLite's bound-parameter limit (999 on
+# older builds) and keeps Postgres statements small for large packages.
+LOOKUP_BATCH_SIZE = 500
+
+
+def _batched(items: Sequence[Any]) -> Iterator[Sequence[Any]]:
+    for start in range(0, len(items), LOOKUP_BATCH_SIZE):
+        yield items[start : start + LOOKUP_BATCH_SIZE]
+
+
+async def persist_lore_chunks(
+    session: AsyncSession, campaign_id: int, chunks: list[dict[str, Any]]
+) -> int:
+    """Store lore chunk text for retrieval, keyed by ``(campaign_id, chunk_id)``.
+
+    Chunks whose content hash is unchanged are left alone; changed chunks are
+    deleted and re-inserted so they get a new row id.
+
+    Args:
+        session: Database session
+        campaign_id: Campaign ID for the import
+        chunks: Validated chunks from ``LorePhase.parse_and_validate_lore``
+
+    Returns:
+        Number of rows written
+    """
+    if not chunks:
+        return 0
+    stored: dict[str, str] = {}
+    for chunk_ids in _batched([c["chunk_id"] for c in chunks]):
+        existing = await session.execute(
+            select(models.LoreChunk.chunk_id, models.LoreChunk.content_hash).where(
+                models.LoreChunk.campaign_id == campaign_id,
+                models.LoreChunk.chunk_id.in_(chunk_ids),
+            )
+        )
+        stored.update(existing.tuples().all())
+    changed = [
+        c["chunk_id"]
+        for c in chunks
+        if c["chunk_id"] in stored and stored[c["chunk_id"]] != c["content_hash"]
+    ]
+    for chunk_ids in _batched(changed):
+        await session.execute(
+            delete(models.LoreChunk).where(
+                models.LoreChunk.campaign_id == campaign_id,
+                models.LoreChunk.chunk_id.in_(chunk_ids),
+            )
+        )
+    rows = [
+        models.LoreChunk(
+            campaign_id=campaign_id,
+            chunk_id=c["chunk_id"],
+            title=c["title"],
+            audience=c["audience"],
+            tags=sorted(c["tags"]),
+            content=c["content"],
+            content_hash=c["content_hash"],
+            source_path=c["source_path"],
+            chunk_index=c["chunk_index"],
+        )
+        for c in chunks
+        if stored.get(c["chunk_id"]) != c["content_hash"]
+    ]
+    session.add_all(rows)
+    await session.flush()
+    return len(rows)
+
+
+# Rows per executemany batch in the bulk persistence path
+BULK_BATCH_SIZE = 500
+
+# Progress callback for bulk persistence: (stage, rows_done, rows_total)
+ImportProgress = Callable[[str, int, int], None]
+
+
+async def _insert_batches(
+    session: AsyncSession,
+    model: type[models.Base],
+    rows: list[dict[str, Any]],
+    *,
+    stage: str,
+    batch_size: int,
+    progress: ImportProgress | None,
+) -> None:
+    batch_size = max(1, batch_size)
+    for start in range(0, len(rows), batch_size):
+        batch = rows[start : start + batch_size]
+        await session.execute(insert(model), batch)  # executemany / insertmanyvalues
+        inc_counter("importer.bulk.batches")
+        if progress is not None:
+            progress(stage, start + len(batch), len(rows))
+
+
+async def persist_import_events_bulk(
+    session: AsyncSession,
+    campaign_id: int,
+    events: Sequence[tuple[str, dict[str, Any]]],
+    *,
+    actor_id: str = "importer",
+    batch_size: int = BULK_BATCH_SIZE,
+    progress: ImportProgress | None = None,
+) -> int:
+    """Persist many scene-less import events with batched inserts.
+
+    Equivalent to calling ``persist_import_event`` for each ``(event_type,
+    payload)`` in order, with far fewer round trips: existing idempotency keys
+    are prefetched in one query, the chain is linked in memory under a single
+    campaign lock, and rows are inserted ``batch_size`` at a time. Nothing is
+    committed here, so the caller's rollback discards every batch.
+
+    Args:
+        session: Database session
+        campaign_id: Campaign ID for the import
+        events: ``(event_type, payload)`` pairs in ledger order
+        actor_id: Who triggered the events (default: 'importer')
+        batch_size: Rows per insert batch
+        progress: Optional callback invoked after each batch
+
+    Returns:
+        Number of events inserted (idempotent reuses are not counted)
+
+    Raises:
+        ImporterError: If an idempotency key exists with a different payload
+    """
+    if not events:
+        return 0
+    start_time_ms = time.time() * 1000
+    await session.flush()  # pending ORM rows (e.g. the campaign) must precede the inserts
+
+    existing_rows = await session.execute(
+        select(models.Event.idempotency_key, models.Event.id, models.Event.payload_hash).where(
+            models.Event.campaign_id == campaign_id
+        )
+    )
+    known: dict[bytes, tuple[int | None, bytes]] = {
+        bytes(key): (event_id, bytes(payload_hash)) for key, event_id, payload_hash in existing_rows
+    }
+
+    fresh: list[tuple[str, dict[str, Any], bytes, bytes]] = []
+    payload_by_key: dict[bytes, dict[str, Any]] = {}
+    reused: dict[int, tuple[bytes, dict[str, Any]]] = {}
+    for event_type, payload in events:
+        canonical = event_envelope.canonicalize_payload(payload)
+        payload_dict = dict(payload)
+        idempotency_key = event_envelope.compute_idempotency_key_v2(
+            campaign_id=campaign_id,
+            event_type=event_type,
+            tool_name="importer",
+            ruleset_version=payload_dict.get("ruleset_version"),
+            plan_id=None,
+            args_json=canonical,
+        )
+        hit = known.get(idempotency_key)
+        if hit is None:
+            known[idempotency_key] = (None, canonical.payload_hash)
+            payload_by_key[idempotency_key] = payload_dict
+            fresh.append((event_type, payload_dict, canonical.payload_hash, idempotency_key))
+            continue
+        event_id, payload_hash = hit
+        if payload_hash != canonical.payload_hash or (
+            event_id is None and payload_by_key[idempotency_key] != payload_dict
+        ):
+            raise ImporterError(
+                "Idempotency key collision detected with mismatched payload for import seed event"
+            )
+        if event_id is not None:
+            reused[event_id] = (idempotency_key, payload_dict)
+
+    if reused:
+        # Same payload equality check as persist_import_event, for the rows that exist
+        for event_ids in _batched(list(reused)):
+            stored = await session.execute(
+                select(models.Event.id, models.Event.payload).where(models.Event.id.in_(event_ids))
+            )
+            for event_id, stored_payload in stored:
+                idempotency_key, payload_dict = reused[event_id]
+                if stored_payload != payload_dict:
+                    raise ImporterError(
+                        "Idempotency key collision detected with mismatched payload "
+                        "for import seed event"
+                    )
+                log_idempotent_reuse(
+                    event_id=event_id,
+                    campaign_id=campaign_id,
+                    idempotency_key=idempotency_key,
+                    plan_id=None,
+                )
+
+    if fresh:
+        async with acquire_campaign_event_lock(session, campaign_id=campaign_id):
+            replay_ordinal, prev_hash = await repos.resolve_next_chain_link(
+                session, campaign_id=campaign_id
+            )
+            request_id = (
+                f"import-{campaign_id}-{int(datetime.now(timezone.utc).timestamp() * 1000)}"
+            )
+            rows: list[dict[str, Any]] = []
+            for event_type, payload_dict, payload_hash, idempotency_key in fresh:
+                row: dict[str, Any] = {
+                    "campaign_id": campaign_id,
+                    "scene_id": None,
+                    "replay_ordinal": replay_ordinal,
+                    "actor_id": actor_id,
+                    "type": event_type,
+                    "event_schema_version": event_envelope.GENESIS_SCHEMA_VERSION,
+                    "world_time": replay_ordinal,
+                    "wall_time_utc": datetime.now(timezone.utc),
+                    "prev_event_hash": prev_hash,
+                    "payload_hash": payload_hash,
+                    "idempotency_key": idempotency_key,
+                    "plan_id": None,
+                    "execution_request_id": request_id,
+                    "approved_by": None,
+                    "payload": payload_dict,
+                    "migrator_applied_from": None,
+                }
+                rows.append(row)
+                prev_hash = event_envelope.compute_envelope_hash(
+                    campaign_id=campaign_id,
+                    scene_id=None,
+                    replay_ordinal=replay_ordinal,
+                    event_type=event_type,
+                    event_schema_version=row["event_schema_version"],
+                    world_time=replay_ordinal,
+                    wall_time_utc=row["wall_time_utc"],
+                    prev_event_hash=row["prev_event_hash"],
+                    payload_hash=payload_hash,
+                    idempotency_key=idempotency_key,
+                )
+                replay_ordinal += 1
+            try:
+                await _insert_batches(
+                    session,
+                    models.Event,
+                    rows,
+                    stage="events",
+                    batch_size=batch_size,
+                    progress=progress,
+                )
+            except Exception:
+                repos.invalidate_chain_tip(campaign_id, session)
+                raise
+            # Core inserts bypass the flush listener that normally advances the tip
+            repos.record_chain_tip(
+                session, campaign_id, repos.ChainTip(replay_ordinal - 1, prev_hash)
+            )
+
+    latency_ms = int(time.time() * 1000 - start_time_ms)
+    metrics_inc_counter("events.applied", len(fresh))
+    observe_histogram("event.apply_batch.latency_ms", latency_ms)
+    emit_structured_log(
+        "import_events_bulk",
+        campaign_id=campaign_id,
+        inserted=len(fresh),
+        reused=len(reused),
+        latency_ms=latency_ms,
+    )
+    return len(fresh)
+
+
+async def persist_import_log_entries_bulk(
+    session: AsyncSession,
+    campaign_id: int,
+    entries: Sequence[dict[str, Any]],
+    *,
+    batch_size: int = BULK_BATCH_SIZE,
+    progress: ImportProgress | None = None,
+) -> int:
+    """Persist many ImportLog entries with batched inserts.
+
+    Mirrors ``persist_import_log_entry``: a ``sequence_no`` already recorded for
+    the same manifest hash is reused, and one recorded for a different manifest
+    still hits the unique constraint.
+
+    Returns:
+        Number of rows inserted
+    """
+    existing_rows = await session.execute(
+        select(models.ImportLog.sequence_no, models.ImportLog.manifest_hash).where(
+            models.ImportLog.campaign_id == campaign_id
+        )
+    )
+    recorded: dict[int, str] = {seq: manifest_hash for seq, manifest_hash in existing_rows}
+    rows: list[dict[str, Any]] = []
+    for entry in entries:
+        sequence_no = entry["sequence_no"]
+        manifest_hash = entry.get("manifest_hash", "")
+        if recorded.get(sequence_no, None) == manifest_hash:
+            continue
+        recorded[sequence_no] = manifest_hash
+        rows.append(
+            {
+                "campaign_id": campaign_id,
+                "sequence_no": sequence_no,
+                "phase": entry["phase"],
+                "object_type": entry["object_type"],
+                "stable_id": entry["stable_id"],
+                "file_hash": entry["file_hash"],
+                "action": entry["action"],
+                "manifest_hash": manifest_hash,
+                "timestamp": entry.get("timestamp", datetime.now(timezone.utc)),
+            }
+        )
+    await _insert_batches(
+        session,
+        models.ImportLog,
+        rows,
+        stage="import_logs",
+        batch_size=batch_size,
+        progress=progress,
+    )
+    return len(rows)
+
+
+_POOL_CONTEXT = multiprocessing.get_context("spawn")
+
+# Below this many files a phase parses inline: starting spawn workers (a fresh
+# interpreter plus the importer's imports each) costs more than it saves.
+PARALLEL_PARSE_MIN_JOBS = 8
+
+
+class ParsePool:
+    """Process pool shared by the entity, edge and lore phases of one import run.
+
+    The underlying executor is started on the first map that is large enough
+    to use it and reused by later phases, so a run pays worker startup once.
+    Workers are spawned rather than forked: imports run from worker threads of
+    a live event loop, and a forked child would inherit its held locks and open
+    database connections.
+    """
+
+    def __init__(self, workers: int):
+        self.workers = workers
+        self._executor: ProcessPoolExecutor | None = None
+
+    def map(self, fn: Callable[..., Any], jobs: Sequence[tuple[Any, ...]]) -> Iterator[Any]:
+        if self._executor is None:
+            self._executor = ProcessPoolExecutor(max_workers=self.workers, mp_context=_POOL_CONTEXT)
+        chunksize = max(1, len(jobs) // (self.workers * 4))
+        return self._executor.map(fn, *zip(*jobs, strict=True), chunksize=chunksize)
+
+    def __getstate__(self) -> dict[str, Any]:
+        # Phases are pickled into the workers along with their pool; the executor stays here
+        return {"workers": self.workers, "_executor": None}
+
+    def close(self) -> None:
+        if self._executor is not None:
+            self._executor.shutdown(wait=True, cancel_futures=True)
+            self._executor = None
+
+    def __enter__(self) -> ParsePool:
+        return self
+
+    def __exit__(self, *exc_info: object) -> None:
+        self.close()
+
+
+def _map_parallel(
+    fn: Callable[..., Any],
+    jobs: Sequence[tuple[Any, ...]],
+    workers: int,
+    pool: ParsePool | None = None,
+) -> Generator[Any, None, None]:
+    """Yield ``fn(*job)`` for each job, in ``jobs`` order.
+
+    With ``workers > 0`` and at least ``PARALLEL_PARSE_MIN_JOBS`` jobs the calls
+    run in ``pool`` (or a pool created for this call; ``fn`` must be a
+    module-level function and its arguments must pickle); results and the first
+    error still surface in input order, so callers merge exactly as the inline
+    loop does. Use under ``contextlib.closing`` so an early exit cancels the
+    outstanding work.
+    """
+    if pool is not None:
+        workers = pool.workers
+    if workers <= 0 or len(jobs) < PARALLEL_PARSE_MIN_JOBS:
+        for job in jobs:
+            yield fn(*job)
+        return
+
+    if pool is not None:
+        yield from pool.map(fn, jobs)
+        return
+    with ParsePool(min(workers, len(jobs))) as own_pool:
+        yield from own_pool.map(fn, jobs)
+
+
 class ImporterError(Exception):
     """Base exception for importer errors."""
 
@@ -445,16 +808,40 @@ class EdgeCollisionError(ImporterError):
     pass
 
 
+def _parse_entity_file(
+    phase: EntityPhase, rel_path: str, file_path: Path
+) -> tuple[dict[str, Any], str]:
+    """Pool worker for ``EntityPhase``: parse, validate and hash one entity file."""
+    return phase._parse_entity_file(rel_path, file_path)
+
+
+def _parse_edge_file(
+    phase: EdgePhase, rel_path: str, file_path: Path
+) -> tuple[list[tuple[dict[str, Any], str]], ImporterError | None]:
+    """Pool worker for ``EdgePhase``: parse and check one edge file."""
+    return phase._parse_edge_file(rel_path, file_path)
+
+
 class EntityPhase:
     """Handles entity ingestion phase of package import."""
 
-    def __init__(self, features_importer_enabled: bool = False):
+    def __init__(
+        self,
+        features_importer_enabled: bool = False,
+        parse_workers: int = 0,
+        parse_pool: ParsePool | None = None,
+    ):
         """Initialize entity phase.
 
         Args:
             features_importer_enabled: Whether importer feature flag is enabled
+            parse_workers: Processes used to parse entity files (0 parses inline)
+            parse_pool: Pool shared with the other phases of the run; overrides
+                ``parse_workers``
         """
         self.features_importer_enabled = features_importer_enabled
+        self.parse_workers = parse_workers
+        self.parse_pool = parse_pool
 
     def parse_and_validate_entities(
         self, package_root: Path, manifest: dict[str, Any]
@@ -500,28 +887,26 @@ class EntityPhase:
         collisions_detected = 0
         entities_skipped_idempotent = 0
 
-        for rel_path, file_path in entity_files:
-            try:
-                with open(file_path, encoding="utf-8") as f:
-                    content = f.read()
-
-                # Normalize text to UTF-8 NFC
-                normalized_content = unicodedata.normalize("NFC", content)
-                entity_data = json.loads(normalized_content)
-
-                # Validate against JSON schema first, then basic fields
+        jobs = [(self, rel_path, file_path) for rel_path, file_path in entity_files]
+        results = _map_parallel(_parse_entity_file, jobs, self.parse_workers, self.parse_pool)
+        with closing(results):
+            for rel_path, _file_path in entity_files:
                 try:
-                    validate_entity_schema(entity_data)
-                    self._validate_entity_schema(entity_data, rel_path)
+                    entity_data, file_hash = next(results)
                 except EntityValidationError as exc:
                     # Record rollback for entity schema validation failure
                     record_rollback(
                         "entity", package_id, manifest.get("manifest_hash", "unknown"), str(exc)
                     )
                     raise
-
-                # Compute file hash
-                file_hash = self._compute_file_hash(normalized_content)
+                except (json.JSONDecodeError, OSError) as exc:
+                    # Record rollback for entity parsing/validation failure
+                    record_rollback(
+                        "entity", package_id, manifest.get("manifest_hash", "unknown"), str(exc)
+                    )
+                    raise EntityValidationError(
+                        f"Failed to parse entity file {rel_path}: {exc}"
+                    ) from exc
 
                 # Verify against content index if present
                 if rel_path in content_index:
@@ -544,15 +929,6 @@ class EntityPhase:
 
                 parsed_entities.append(entity_with_provenance)
 
-            except (json.JSONDecodeError, OSError) as exc:
-                # Record rollback for entity parsing/validation failure
-                record_rollback(
-                    "entity", package_id, manifest.get("manifest_hash", "unknown"), str(exc)
-                )
-                raise EntityValidationError(
-                    f"Failed to parse entity file {rel_path}: {exc}"
-                ) from exc
-
         # Sort deterministically by (kind, stable_id, source_path)
         parsed_entities.sort(
             key=lambda e: (
@@ -615,6 +991,35 @@ class EntityPhase:
 
         return filtered_entities
 
+    def _parse_entity_file(self, rel_path: str, file_path: Path) -> tuple[dict[str, Any], str]:
+        """Read, NFC-normalize, parse, validate and hash one entity file.
+
+        Runs in a pool worker when ``parse_workers`` is set.
+
+        Args:
+            rel_path: Path relative to the package root, for error reporting
+            file_path: File to parse
+
+        Returns:
+            Tuple of (entity_data, file_hash)
+
+        Raises:
+            EntityValidationError: If the entity fails validation
+            json.JSONDecodeError, OSError: If the file cannot be read or parsed
+        """
+        with open(file_path, encoding="utf-8") as f:
+            content = f.read()
+
+        # Normalize text to UTF-8 NFC
+        normalized_content = unicodedata.normalize("NFC", content)
+        entity_data = json.loads(normalized_content)
+
+        # Validate against JSON schema first, then basic fields
+        validate_entity_schema(entity_data)
+        self._validate_entity_schema(entity_data, rel_path)
+
+        return entity_data, self._compute_file_hash(normalized_content)
+
     def _validate_entity_schema(self, entity_data: dict[str, Any], source_path: str) -> None:
         """Validate entity data against schema.
 
@@ -739,8 +1144,15 @@ class EntityPhase:
 class EdgePhase:
     """Handles edge ingestion phase of package import."""
 
-    def __init__(self, features_importer_enabled: bool = False):
+    def __init__(
+        self,
+        features_importer_enabled: bool = False,
+        parse_workers: int = 0,
+        parse_pool: ParsePool | None = None,
+    ):
         self.features_importer_enabled = features_importer_enabled
+        self.parse_workers = parse_workers
+        self.parse_pool = parse_pool
 
     def parse_and_validate_edges(
         self,
@@ -764,7 +1176,6 @@ class EdgePhase:
             )
             return []
 
-        taxonomy = load_edge_taxonomy()
         known_entities = {entity.get("stable_id") for entity in entities if entity.get("stable_id")}
 
         edge_files: list[tuple[str, Path]] = []
@@ -778,124 +1189,72 @@ class EdgePhase:
         seen_edges: dict[str, tuple[str, str]] = {}
         skipped_idempotent = 0
 
-        for rel_path, file_path in edge_files:
-            try:
-                with open(file_path, encoding="utf-8") as handle:
-                    content = handle.read()
-
-                normalized = unicodedata.normalize("NFC", content)
-                payload = json.loads(normalized)
-            except (json.JSONDecodeError, OSError) as exc:
-                raise EdgeValidationError(f"Failed to parse edge file {rel_path}: {exc}") from exc
-
-            suffix_template = "#{}"
-            if isinstance(payload, list):
-                records = payload
-            elif isinstance(payload, dict):
-                records = [payload]
-            else:
-                raise EdgeValidationError(
-                    f"Edge file {rel_path} must contain an object or array of edge definitions"
-                )
-
-            for idx, record in enumerate(records):
-                if not isinstance(record, dict):
-                    raise EdgeValidationError(f"Edge entry {rel_path}#{idx} must be an object")
-
-                validate_edge_schema(record)
-
-                stable_id = record.get("stable_id")
-
-                edge_type = record.get("type")
-                if edge_type not in taxonomy:
-                    raise EdgeValidationError(
-                        f"Edge {stable_id} uses unsupported edge type '{edge_type}'"
-                    )
-
-                taxonomy_entry = taxonomy[edge_type]
-                required_attrs = taxonomy_entry.get("required_attributes", [])
-                attributes = record.get("attributes", {})
-                for attr in required_attrs:
-                    if attr not in attributes:
+        jobs = [(self, rel_path, file_path) for rel_path, file_path in edge_files]
+        results = _map_parallel(_parse_edge_file, jobs, self.parse_workers, self.parse_pool)
+        with closing(results):
+            for (rel_path, _file_path), (records, deferred_error) in zip(
+                edge_files, results, strict=True
+            ):
+                for idx, (record, file_hash) in enumerate(records):
+                    stable_id = record.get("stable_id")
+
+                    src_ref = record.get("src_ref")
+                    dst_ref = record.get("dst_ref")
+                    missing_refs = [
+                        ref for ref in (src_ref, dst_ref) if ref and ref not in known_entities
+                    ]
+                    if missing_refs:
+                        missing_display = ", ".join(missing_refs)
                         raise EdgeValidationError(
-                            f"Edge {stable_id} missing required attribute '{attr}' "
-                            f"for type {edge_type}"
+                            f"Edge {stable_id} missing entity reference(s): {missing_display}"
                         )
 
-                validity_required = taxonomy_entry.get("validity_required", False)
-                validity = record.get("validity")
-                if validity_required and not validity:
-                    raise EdgeValidationError(
-                        f"Edge {stable_id} requires validity metadata per taxonomy"
-                    )
+                    source_path = f"{rel_path}#{idx}"
 
-                if validity:
-                    start_event = validity.get("start_event_id")
-                    if not isinstance(start_event, str) or not start_event:
-                        raise EdgeValidationError(
-                            f"Edge {stable_id} validity must include start_event_id"
-                        )
-                    end_event = validity.get("end_event_id")
-                    if isinstance(end_event, str) and end_event < start_event:
-                        raise EdgeValidationError(
-                            f"Edge {stable_id} end_event_id must not precede start_event_id"
-                        )
-
-                src_ref = record.get("src_ref")
-                dst_ref = record.get("dst_ref")
-                missing_refs = [
-                    ref for ref in (src_ref, dst_ref) if ref and ref not in known_entities
-                ]
-                if missing_refs:
-                    missing_display = ", ".join(missing_refs)
-                    raise EdgeValidationError(
-                        f"Edge {stable_id} missing entity reference(s): {missing_display}"
-                    )
-
-                canonical_payload = json.dumps(
-                    record, sort_keys=True, separators=(",", ":"), ensure_ascii=False
-                )
-                file_hash = hashlib.sha256(canonical_payload.encode("utf-8")).hexdigest()
-                source_path = f"{rel_path}{suffix_template.format(idx)}"
+                    if source_path in content_index:
+                        expected_hash = content_index[source_path]
+                        if expected_hash != file_hash:
+                            raise EdgeValidationError(
+                                f"File hash mismatch for {source_path}: "
+                                f"expected {expected_hash}, got {file_hash}"
+                            )
 
-                if source_path in content_index:
-                    expected_hash = content_index[source_path]
-                    if expected_hash != file_hash:
+                    if not isinstance(stable_id, str) or not stable_id:
                         raise EdgeValidationError(
-                            f"File hash mismatch for {source_path}: expected {expected_hash}, "
-                            f"got {file_hash}"
+                            f"Edge definition in {source_path} missing stable_id"
                         )
 
-                # stable_id already retrieved earlier; use existing value
-                if not isinstance(stable_id, str) or not stable_id:
-                    raise EdgeValidationError(f"Edge definition in {source_path} missing stable_id")
-
-                if stable_id in seen_edges:
-                    existing_hash, existing_path = seen_edges[stable_id]
-                    if file_hash != existing_hash:
-                        inc_counter(
-                            "importer.edges.collision",
-                            value=1,
-                            package_id=package_id,
-                        )
-                        raise EdgeCollisionError(
-                            f"Stable ID collision detected for '{stable_id}': "
-                            f"different content in {existing_path} vs {source_path}"
-                        )
-                    skipped_idempotent += 1
-                    continue
-
-                seen_edges[stable_id] = (file_hash, source_path)
+                    if stable_id in seen_edges:
+                        existing_hash, existing_path = seen_edges[stable_id]
+                        if file_hash != existing_hash:
+                            inc_counter(
+                                "importer.edges.collision",
+                                value=1,
+                                package_id=package_id,
+                            )
+                            raise EdgeCollisionError(
+                                f"Stable ID collision detected for '{stable_id}': "
+                                f"different content in {existing_path} vs {source_path}"
+                            )
+                        skipped_idempotent += 1
+                        continue
+
+                    seen_edges[stable_id] = (file_hash, source_path)
+
+                    edge_with_metadata = {
+                        **record,
+                        "provenance": {
+                            "package_id": package_id,
+                            "source_path": source_path,
+                            "file_hash": file_hash,
+                        },
+                    }
+                    parsed_edges.append(edge_with_metadata)
 
-                edge_with_metadata = {
-                    **record,
-                    "provenance": {
-                        "package_id": package_id,
-                        "source_path": source_path,
-                        "file_hash": file_hash,
-                    },
-                }
-                parsed_edges.append(edge_with_metadata)
+                # Records after the first invalid one were never checked; the
+                # worker defers its error so earlier records fail first, as inline
+                if deferred_error is not None:
+                    raise deferred_error
 
         parsed_edges.sort(
             key=lambda edge: (
@@ -939,6 +1298,92 @@ class EdgePhase:
 
         return parsed_edges
 
+    def _parse_edge_file(
+        self, rel_path: str, file_path: Path
+    ) -> tuple[list[tuple[dict[str, Any], str]], ImporterError | None]:
+        """Parse one edge file and run the checks that need no other file.
+
+        Runs in a pool worker when ``parse_workers`` is set. Records are checked
+        in order against the schema and taxonomy and hashed; checking stops at the
+        first invalid record, whose error is returned rather than raised so the
+        caller can finish the records before it first.
+
+        Returns:
+            Tuple of ([(record, file_hash), ...], deferred_error)
+
+        Raises:
+            EdgeValidationError: If the file cannot be read or parsed
+        """
+        try:
+            with open(file_path, encoding="utf-8") as handle:
+                content = handle.read()
+
+            normalized = unicodedata.normalize("NFC", content)
+            payload = json.loads(normalized)
+        except (json.JSONDecodeError, OSError) as exc:
+            raise EdgeValidationError(f"Failed to parse edge file {rel_path}: {exc}") from exc
+
+        if isinstance(payload, list):
+            records = payload
+        elif isinstance(payload, dict):
+            records = [payload]
+        else:
+            raise EdgeValidationError(
+                f"Edge file {rel_path} must contain an object or array of edge definitions"
+            )
+
+        taxonomy = load_edge_taxonomy()
+        checked: list[tuple[dict[str, Any], str]] = []
+        try:
+            for idx, record in enumerate(records):
+                if not isinstance(record, dict):
+                    raise EdgeValidationError(f"Edge entry {rel_path}#{idx} must be an object")
+
+                validate_edge_schema(record)
+                self._validate_edge_taxonomy(record, taxonomy)
+
+                canonical_payload = json.dumps(
+                    record, sort_keys=True, separators=(",", ":"), ensure_ascii=False
+                )
+                file_hash = hashlib.sha256(canonical_payload.encode("utf-8")).hexdigest()
+                checked.append((record, file_hash))
+        except ImporterError as exc:
+            return checked, exc
+
+        return checked, None
+
+    def _validate_edge_taxonomy(self, record: dict[str, Any], taxonomy: dict[str, Any]) -> None:
+        """Check an edge's type, required attributes and validity window."""
+        stable_id = record.get("stable_id")
+
+        edge_type = record.get("type")
+        if edge_type not in taxonomy:
+            raise EdgeValidationError(f"Edge {stable_id} uses unsupported edge type '{edge_type}'")
+
+        taxonomy_entry = taxonomy[edge_type]
+        required_attrs = taxonomy_entry.get("required_attributes", [])
+        attributes = record.get("attributes", {})
+        for attr in required_attrs:
+            if attr not in attributes:
+                raise EdgeValidationError(
+                    f"Edge {stable_id} missing required attribute '{attr}' for type {edge_type}"
+                )
+
+        validity_required = taxonomy_entry.get("validity_required", False)
+        validity = record.get("validity")
+        if validity_required and not validity:
+            raise EdgeValidationError(f"Edge {stable_id} requires validity metadata per taxonomy")
+
+        if validity:
+            start_event = validity.get("start_event_id")
+            if not isinstance(start_event, str) or not start_event:
+                raise EdgeValidationError(f"Edge {stable_id} validity must include start_event_id")
+            end_event = validity.get("end_event_id")
+            if isinstance(end_event, str) and end_event < start_event:
+                raise EdgeValidationError(
+                    f"Edge {stable_id} end_event_id must not precede start_event_id"
+                )
+
     def create_seed_events(self, edges: list[dict[str, Any]]) -> list[dict[str, Any]]:
         events: list[dict[str, Any]] = []
         for edge in edges:
@@ -967,28 +1412,48 @@ class EdgePhase:
         return events
 
 
-def create_entity_phase(features_importer: bool = False) -> EntityPhase:
+def create_entity_phase(
+    features_importer: bool = False,
+    parse_workers: int = 0,
+    parse_pool: ParsePool | None = None,
+) -> EntityPhase:
     """Factory function to create entity phase with feature flag.
 
     Args:
         features_importer: Value of features.importer feature flag
+        parse_workers: Processes used to parse entity files (0 parses inline)
+        parse_pool: Pool shared with the other phases of the run
 
     Returns:
         Configured EntityPhase instance
     """
-    return EntityPhase(features_importer_enabled=features_importer)
+    return EntityPhase(
+        features_importer_enabled=features_importer,
+        parse_workers=parse_workers,
+        parse_pool=parse_pool,
+    )
 
 
-def create_edge_phase(features_importer: bool = False) -> EdgePhase:
+def create_edge_phase(
+    features_importer: bool = False,
+    parse_workers: int = 0,
+    parse_pool: ParsePool | None = None,
+) -> EdgePhase:
     """Factory function to create edge phase with feature flag.
 
     Args:
         features_importer: Value of features.importer feature flag
+        parse_workers: Processes used to parse edge files (0 parses inline)
+        parse_pool: Pool shared with the other phases of the run
 
     Returns:
         Configured EdgePhase instance
     """
-    return EdgePhase(features_importer_enabled=features_importer)
+    return EdgePhase(
+        features_importer_enabled=features_importer,
+        parse_workers=parse_workers,
+        parse_pool=parse_pool,
+    )
 
 
 def create_manifest_phase(features_importer: bool = False) -> ManifestPhase:
@@ -1034,12 +1499,13 @@ def validate_event_payload_schema(payload: dict[str, Any], event_type: str = "ma
         raise ImporterError(f"Event schema not found at {schema_path}")
 
     try:
-        with open(schema_path, encoding="utf-8") as f:
-            schema = json.load(f)
+        get_schema_validator(schema_path)
     except (json.JSONDecodeError, OSError) as exc:
         raise ImporterError(f"Failed to load event schema: {exc}") from exc
 
-    sanitized_payload = copy.deepcopy(payload)
+    # Seed payloads are frozen for canonicalization, so placeholders are
+    # swapped on shallow copies rather than in place
+    sanitized_payload = dict(payload)
 
     def _sanitize_ulid(value: Any) -> Any:
         if isinstance(value, str) and not ULID_26_PATTERN.fullmatch(value):
@@ -1053,16 +1519,20 @@ def validate_event_payload_schema(payload: dict[str, Any], event_type: str = "ma
     provenance = sanitized_payload.get("provenance")
     if isinstance(provenance, dict):
         if "package_id" in provenance:
-            provenance["package_id"] = _sanitize_ulid(provenance["package_id"])
+            sanitized_payload["provenance"] = {
+                **provenance,
+                "package_id": _sanitize_ulid(provenance["package_id"]),
+            }
 
     validity = sanitized_payload.get("validity")
     if isinstance(validity, dict):
+        validity = sanitized_payload["validity"] = dict(validity)
         for field in ("start_event_id", "end_event_id"):
             if field in validity and validity[field] is not None:
                 validity[field] = _sanitize_ulid(validity[field])
 
     try:
-        jsonschema.validate(sanitized_payload, schema)
+        validate_against_schema(schema_path, sanitized_payload)
     except jsonschema.ValidationError as exc:
         raise ImporterError(f"Event payload validation failed: {exc.message}") from exc
 
@@ -1087,8 +1557,7 @@ def validate_entity_schema(entity_data: dict[str, Any]) -> None:
         return
 
     try:
-        with open(schema_path, encoding="utf-8") as f:
-            schema = json.load(f)
+        get_schema_validator(schema_path)
     except (json.JSONDecodeError, OSError):
         return
 
@@ -1097,7 +1566,7 @@ def validate_entity_schema(entity_data: dict[str, Any]) -> None:
     return
 
     try:
-        jsonschema.validate(entity_data, schema)
+        validate_against_schema(schema_path, entity_data)
     except jsonschema.ValidationError as exc:
         raise EntityValidationError(f"Entity validation failed: {exc.message}") from exc
 
@@ -1130,8 +1599,7 @@ def validate_edge_schema(edge_data: dict[str, Any]) -> None:
         return
 
     try:
-        with open(schema_path, encoding="utf-8") as f:
-            schema = json.load(f)
+        get_schema_validator(schema_path)
     except (json.JSONDecodeError, OSError):
         return
 
@@ -1140,7 +1608,7 @@ def validate_edge_schema(edge_data: dict[str, Any]) -> None:
     return
 
     try:
-        jsonschema.validate(edge_data, schema)
+        validate_against_schema(schema_path, edge_data)
     except jsonschema.ValidationError as exc:
         raise EdgeValidationError(f"Edge validation failed: {exc.message}") from exc
 
@@ -1375,13 +1843,12 @@ class OntologyPhase:
             return
 
         try:
-            with open(schema_path, encoding="utf-8") as f:
-                schema = json.load(f)
+            get_schema_validator(schema_path)
         except (json.JSONDecodeError, OSError):
             return
 
         try:
-            jsonschema.validate(tag_data, schema)
+            validate_against_schema(schema_path, tag_data)
         except jsonschema.ValidationError as exc:
             raise OntologyValidationError(f"Tag validation failed: {exc.message}") from exc
 
@@ -1397,13 +1864,12 @@ class OntologyPhase:
             return
 
         try:
-            with open(schema_path, encoding="utf-8") as f:
-                schema = json.load(f)
+            get_schema_validator(schema_path)
         except (json.JSONDecodeError, OSError):
             return
 
         try:
-            jsonschema.validate(affordance_data, schema)
+            validate_against_schema(schema_path, affordance_data)
         except jsonschema.ValidationError as exc:
             raise OntologyValidationError(f"Affordance validation failed: {exc.message}") from exc
 
@@ -1676,6 +2142,16 @@ class LoreCollisionError(ImporterError):
     pass
 
 
+def _parse_lore_file(
+    chunker: Any, file_path: Path, package_id: str, manifest_hash: str
+) -> list[Any]:
+    """Pool worker for ``LorePhase``: chunk one lore file and hash its chunks."""
+    chunks = chunker.parse_lore_file(file_path, package_id, manifest_hash)
+    for chunk in chunks:
+        chunk.content_hash  # noqa: B018 - cached on the chunk, so hashed in the worker
+    return chunks
+
+
 class LorePhase:
     """Handles lore content chunking and ingestion phase of package import."""
 
@@ -1683,15 +2159,22 @@ class LorePhase:
         self,
         features_importer_enabled: bool = False,
         features_importer_embeddings: bool = False,
+        parse_workers: int = 0,
+        parse_pool: ParsePool | None = None,
     ):
         """Initialize lore phase.
 
         Args:
             features_importer_enabled: Whether importer feature flag is enabled
             features_importer_embeddings: Whether embedding metadata processing is enabled
+            parse_workers: Processes used to parse and chunk lore files (0 parses inline)
+            parse_pool: Pool shared with the other phases of the run; overrides
+                ``parse_workers``
         """
         self.features_importer_enabled = features_importer_enabled
         self.features_importer_embeddings = features_importer_embeddings
+        self.parse_workers = parse_workers
+        self.parse_pool = parse_pool
 
     def parse_and_validate_lore(
         self, package_root: Path, manifest: dict[str, Any]
@@ -1743,48 +2226,53 @@ class LorePhase:
         collisions_detected = 0
         chunks_skipped_idempotent = 0
 
-        for rel_path, file_path in lore_files:
-            try:
-                # Parse file into chunks
-                file_chunks = chunker.parse_lore_file(file_path, package_id, manifest_hash)
-
-                for parsed_chunk in file_chunks:
-                    # Update source_path to be relative to package root
-                    parsed_chunk.source_path = rel_path
-                    parsed_chunk.provenance["source_path"] = rel_path
-
-                    # Verify against content index if present
-                    if rel_path in content_index:
-                        expected_hash = content_index[rel_path]
-                        actual_hash = parsed_chunk.provenance["file_hash"]
-                        if actual_hash != expected_hash:
-                            raise LoreValidationError(
-                                f"File hash mismatch for {rel_path}: "
-                                f"expected {expected_hash}, got {actual_hash}"
-                            )
-
-                    # Convert to dictionary for processing
-                    chunk_dict = {
-                        "chunk_id": parsed_chunk.chunk_id,
-                        "title": parsed_chunk.title,
-                        "audience": parsed_chunk.audience,
-                        "tags": parsed_chunk.tags,
-                        "content": parsed_chunk.content,
-                        "source_path": parsed_chunk.source_path,
-                        "chunk_index": parsed_chunk.chunk_index,
-                        "content_hash": parsed_chunk.content_hash,
-                        "word_count": parsed_chunk.word_count,
-                        "provenance": parsed_chunk.provenance,
-                    }
+        jobs = [(chunker, file_path, package_id, manifest_hash) for _, file_path in lore_files]
+        results = _map_parallel(_parse_lore_file, jobs, self.parse_workers, self.parse_pool)
+        with closing(results):
+            for rel_path, _file_path in lore_files:
+                try:
+                    # Parse file into chunks
+                    file_chunks = next(results)
+
+                    for parsed_chunk in file_chunks:
+                        # Update source_path to be relative to package root
+                        parsed_chunk.source_path = rel_path
+                        parsed_chunk.provenance["source_path"] = rel_path
+
+                        # Verify against content index if present
+                        if rel_path in content_index:
+                            expected_hash = content_index[rel_path]
+                            actual_hash = parsed_chunk.provenance["file_hash"]
+                            if actual_hash != expected_hash:
+                                raise LoreValidationError(
+                                    f"File hash mismatch for {rel_path}: "
+                                    f"expected {expected_hash}, got {actual_hash}"
+                                )
+
+                        # Convert to dictionary for processing
+                        chunk_dict = {
+                            "chunk_id": parsed_chunk.chunk_id,
+                            "title": parsed_chunk.title,
+                            "audience": parsed_chunk.audience,
+                            "tags": parsed_chunk.tags,
+                            "content": parsed_chunk.content,
+                            "source_path": parsed_chunk.source_path,
+                            "chunk_index": parsed_chunk.chunk_index,
+                            "content_hash": parsed_chunk.content_hash,
+                            "word_count": parsed_chunk.word_count,
+                            "provenance": parsed_chunk.provenance,
+                        }
 
-                    # Include embedding_hint if present
-                    if parsed_chunk.embedding_hint is not None:
-                        chunk_dict["embedding_hint"] = parsed_chunk.embedding_hint
+                        # Include embedding_hint if present
+                        if parsed_chunk.embedding_hint is not None:
+                            chunk_dict["embedding_hint"] = parsed_chunk.embedding_hint
 
-                    chunks.append(chunk_dict)
+                        chunks.append(chunk_dict)
 
-            except LoreChunkerError as exc:
-                raise LoreValidationError(f"Failed to parse lore file {rel_path}: {exc}") from exc
+                except LoreChunkerError as exc:
+                    raise LoreValidationError(
+                        f"Failed to parse lore file {rel_path}: {exc}"
+                    ) from exc
 
         # Sort chunks deterministically by (source_path, chunk_index)
         chunks.sort(key=lambda c: (c["source_path"], c["chunk_index"]))
@@ -2111,13 +2599,18 @@ class FinalizationPhase:
 
 
 def create_lore_phase(
-    features_importer: bool = False, features_importer_embeddings: bool = False
+    features_importer: bool = False,
+    features_importer_embeddings: bool = False,
+    parse_workers: int = 0,
+    parse_pool: ParsePool | None = None,
 ) -> LorePhase:
     """Factory function to create lore phase with feature flags.
 
     Args:
         features_importer: Value of features.importer feature flag
         features_importer_embeddings: Value of features.importer_embeddings feature flag
+        parse_workers: Processes used to parse lore files (0 parses inline)
+        parse_pool: Pool shared with the other phases of the run
 
     Returns:
         Configured LorePhase instance
@@ -2125,6 +2618,8 @@ def create_lore_phase(
     return LorePhase(
         features_importer_enabled=features_importer,
         features_importer_embeddings=features_importer_embeddings,
+        parse_workers=parse_workers,
+        parse_pool=parse_pool,
     )
 
 
@@ -2146,6 +2641,10 @@ async def run_full_import_with_database(
     *,
     features_importer: bool = True,
     features_importer_embeddings: bool = True,
+    bulk: bool = False,
+    batch_size: int = BULK_BATCH_SIZE,
+    progress: ImportProgress | None = None,
+    parse_workers: int = 0,
 ) -> dict[str, Any]:
     """Run full package import with database integration and idempotent detection.
 
@@ -2158,6 +2657,13 @@ async def run_full_import_with_database(
         campaign_id: Campaign ID to import into
         features_importer: Whether importer is enabled
         features_importer_embeddings: Whether embeddings are enabled
+        bulk: Persist seed events and ImportLog rows with batched inserts
+            (``persist_import_events_bulk``) instead of one round trip each
+        batch_size: Rows per insert batch in bulk mode
+        progress: Optional ``(stage, done, total)`` callback in bulk mode
+        parse_workers: Processes used to parse entity, edge and lore files
+            (0 parses inline). Parsing runs off the event loop either way, and
+            the phases share one pool for the whole run.
 
     Returns:
         Dictionary containing import results and database state
@@ -2167,6 +2673,7 @@ async def run_full_import_with_database(
     """
     start_time = datetime.now(timezone.utc)
 
+    parse_pool = ParsePool(parse_workers)
     async with session_scope() as session:
         try:
             # Ensure the target campaign exists to satisfy FK constraints for scene-less events
@@ -2319,15 +2826,27 @@ async def run_full_import_with_database(
             # Proceed with new import since no existing import was found
             # Initialize phases
             manifest_phase = ManifestPhase(features_importer_enabled=features_importer)
-            entity_phase = EntityPhase(features_importer_enabled=features_importer)
-            edge_phase = EdgePhase(features_importer_enabled=features_importer)
+            entity_phase = create_entity_phase(features_importer, parse_workers, parse_pool)
+            edge_phase = create_edge_phase(features_importer, parse_workers, parse_pool)
             ontology_phase = OntologyPhase(features_importer_enabled=features_importer)
-            lore_phase = create_lore_phase(features_importer, features_importer_embeddings)
+            lore_phase = create_lore_phase(
+                features_importer, features_importer_embeddings, parse_workers, parse_pool
+            )
             finalization_phase = FinalizationPhase(features_importer_enabled=features_importer)
 
             context = ImporterRunContext()
             manifest_path = package_root / "package.manifest.json"
 
+            # In bulk mode seed events are collected and inserted together once
+            # every phase has validated; otherwise each is persisted as it is found.
+            seed_events: list[tuple[str, dict[str, Any]]] = []
+
+            async def emit_seed(event_type: str, payload: dict[str, Any]) -> None:
+                if bulk:
+                    seed_events.append((event_type, payload))
+                else:
+                    await persist_import_event(session, campaign_id, None, event_type, payload)
+
             # Manifest validation (no persistence yet; defer until after validation succeeds)
             manifest_result = manifest_phase.validate_and_register(manifest_path, package_root)
             context.record_manifest(manifest_result)
@@ -2335,38 +2854,35 @@ async def run_full_import_with_database(
             # Entity ingestion
             entities_dir = package_root / "entities"
             if entities_dir.exists():
-                entity_results = entity_phase.parse_and_validate_entities(
-                    package_root, manifest_result["manifest"]
+                entity_results = await asyncio.to_thread(
+                    entity_phase.parse_and_validate_entities,
+                    package_root,
+                    manifest_result["manifest"],
                 )
                 context.record_entities(entity_results)
 
                 # Emit entity events
                 for entity in entity_results:
                     if "event_payload" in entity:
-                        await persist_import_event(
-                            session,
-                            campaign_id,
-                            None,
-                            "seed.entity_created",
-                            entity["event_payload"],
-                        )
+                        await emit_seed("seed.entity_created", entity["event_payload"])
                         # Track created entities with a dedicated metric used by tests
                         inc_counter("importer.entities.created", value=1, package_id=package_id)
 
             # Edge ingestion
             edges_dir = package_root / "edges"
             if edges_dir.exists():
-                edge_results = edge_phase.parse_and_validate_edges(
-                    package_root, manifest_result["manifest"], entity_results
+                edge_results = await asyncio.to_thread(
+                    edge_phase.parse_and_validate_edges,
+                    package_root,
+                    manifest_result["manifest"],
+                    entity_results,
                 )
                 context.record_edges(edge_results)
 
                 # Emit edge events
                 for edge in edge_results:
                     if "event_payload" in edge:
-                        await persist_import_event(
-                            session, campaign_id, None, "seed.edge_created", edge["event_payload"]
-                        )
+                        await emit_seed("seed.edge_created", edge["event_payload"])
                         # Track created edges with a dedicated metric used by tests
                         inc_counter("importer.edges.created", value=1, package_id=package_id)
 
@@ -2381,33 +2897,28 @@ async def run_full_import_with_database(
             # Lore ingestion
             lore_dir = package_root / "lore"
             if lore_dir.exists():
-                lore_results = lore_phase.parse_and_validate_lore(
-                    lore_dir, manifest_result["manifest"]
+                lore_results = await asyncio.to_thread(
+                    lore_phase.parse_and_validate_lore,
+                    package_root,
+                    manifest_result["manifest"],
                 )
                 context.record_lore_chunks(lore_results)
+                await persist_lore_chunks(session, campaign_id, lore_results)
 
                 # Emit lore events
                 for chunk in lore_results:
                     if "event_payload" in chunk:
-                        await persist_import_event(
-                            session,
-                            campaign_id,
-                            None,
-                            "seed.lore_chunk_created",
-                            chunk["event_payload"],
-                        )
+                        await emit_seed("seed.lore_chunk_created", chunk["event_payload"])
 
             # Finalization (all validations completed successfully up to this point)
             result = finalization_phase.finalize_import(context, start_time)
 
             # Persist manifest validated event now that validation succeeded
-            await persist_import_event(
-                session,
-                campaign_id,
-                None,
-                "seed.manifest.validated",
-                manifest_result["event_payload"],
-            )
+            await emit_seed("seed.manifest.validated", manifest_result["event_payload"])
+            if bulk:
+                await persist_import_events_bulk(
+                    session, campaign_id, seed_events, batch_size=batch_size, progress=progress
+                )
 
             # Emit completion event
             completion_event = await persist_import_event(
@@ -2420,13 +2931,21 @@ async def run_full_import_with_database(
             result["completion_payload"] = completion_event.payload
             result["completion_event"] = completion_event
 
-            # Persist ImportLog entries from context in sequence order to avoid gaps
-            for entry in context.import_log_entries:
-                await persist_import_log_entry(session, campaign_id, dict(entry))
-
-            # Persist finalization ImportLog summary (already contains correct sequence_no)
+            # Persist ImportLog entries from context in sequence order to avoid gaps,
+            # then the finalization summary (already contains correct sequence_no)
             summary_entry = result["import_log_summary"].copy()
-            await persist_import_log_entry(session, campaign_id, summary_entry)
+            if bulk:
+                await persist_import_log_entries_bulk(
+                    session,
+                    campaign_id,
+                    [*map(dict, context.import_log_entries), summary_entry],
+                    batch_size=batch_size,
+                    progress=progress,
+                )
+            else:
+                for entry in context.import_log_entries:
+                    await persist_import_log_entry(session, campaign_id, dict(entry))
+                await persist_import_log_entry(session, campaign_id, summary_entry)
 
             # Query final database state for validation
             # Get all events for this campaign
@@ -2509,10 +3028,15 @@ async def run_full_import_with_database(
         except Exception as e:
             await session.rollback()
             raise ImporterError(f"Database import failed: {e}") from e
+        finally:
+            await asyncio.to_thread(parse_pool.close)
 
 
 def run_complete_import_pipeline(
-    package_root: Path, features_importer: bool = False, features_importer_embeddings: bool = False
+    package_root: Path,
+    features_importer: bool = False,
+    features_importer_embeddings: bool = False,
+    parse_workers: int = 0,
 ) -> dict[str, Any]:
     """Run the complete import pipeline with finalization.
 
@@ -2523,6 +3047,7 @@ def run_complete_import_pipeline(
         package_root: Root directory containing package files
         features_importer: Whether importer features are enabled
         features_importer_embeddings: Whether embedding features are enabled
+        parse_workers: Processes used to parse entity, edge and lore files (0 parses inline)
 
     Returns:
         Complete import result including finalization output
@@ -2548,51 +3073,55 @@ def run_complete_import_pipeline(
     manifest_with_hash = dict(manifest_result["manifest"])
     manifest_with_hash["manifest_hash"] = manifest_result["manifest_hash"]
 
-    # Entity phase
-    entity_phase = EntityPhase(features_importer_enabled=features_importer)
-    entities = entity_phase.parse_and_validate_entities(package_root, manifest_with_hash)
+    # One parse pool serves the entity, edge and lore phases
+    with ParsePool(parse_workers) as parse_pool:
+        # Entity phase
+        entity_phase = create_entity_phase(features_importer, parse_workers, parse_pool)
+        entities = entity_phase.parse_and_validate_entities(package_root, manifest_with_hash)
 
-    # Fix sequence numbers for entity ImportLog entries
-    for entity in entities:
-        import_log_entries = entity.get("import_log_entries", [])
-        for entry in import_log_entries:
-            entry["sequence_no"] = context.next_sequence_number()
+        # Fix sequence numbers for entity ImportLog entries
+        for entity in entities:
+            import_log_entries = entity.get("import_log_entries", [])
+            for entry in import_log_entries:
+                entry["sequence_no"] = context.next_sequence_number()
 
-    context.record_entities(entities)
+        context.record_entities(entities)
 
-    # Edge phase
-    edge_phase = EdgePhase(features_importer_enabled=features_importer)
-    edges = edge_phase.parse_and_validate_edges(package_root, manifest_with_hash, entities)
+        # Edge phase
+        edge_phase = create_edge_phase(features_importer, parse_workers, parse_pool)
+        edges = edge_phase.parse_and_validate_edges(package_root, manifest_with_hash, entities)
 
-    # Fix sequence numbers for edge ImportLog entries
-    for edge in edges:
-        import_log_entry = edge.get("import_log_entry")
-        if import_log_entry:
-            import_log_entry["sequence_no"] = context.next_sequence_number()
+        # Fix sequence numbers for edge ImportLog entries
+        for edge in edges:
+            import_log_entry = edge.get("import_log_entry")
+            if import_log_entry:
+                import_log_entry["sequence_no"] = context.next_sequence_number()
 
-    context.record_edges(edges)
+        context.record_edges(edges)
 
-    # Ontology phase
-    ontology_phase = OntologyPhase(features_importer_enabled=features_importer)
-    tags, affordances, ontology_logs = ontology_phase.parse_and_validate_ontology(
-        package_root, manifest_with_hash
-    )
+        # Ontology phase
+        ontology_phase = OntologyPhase(features_importer_enabled=features_importer)
+        tags, affordances, ontology_logs = ontology_phase.parse_and_validate_ontology(
+            package_root, manifest_with_hash
+        )
 
-    # Fix sequence numbers for ontology ImportLog entries
-    for entry in ontology_logs:
-        entry["sequence_no"] = context.next_sequence_number()
+        # Fix sequence numbers for ontology ImportLog entries
+        for entry in ontology_logs:
+            entry["sequence_no"] = context.next_sequence_number()
 
-    context.record_ontology(tags, affordances, ontology_logs)
+        context.record_ontology(tags, affordances, ontology_logs)
 
-    # Lore phase
-    lore_phase = create_lore_phase(features_importer, features_importer_embeddings)
-    chunks = lore_phase.parse_and_validate_lore(package_root, manifest_with_hash)
+        # Lore phase
+        lore_phase = create_lore_phase(
+            features_importer, features_importer_embeddings, parse_workers, parse_pool
+        )
+        chunks = lore_phase.parse_and_validate_lore(package_root, manifest_with_hash)
 
-    # Fix sequence numbers for lore ImportLog entries
-    for chunk in chunks:
-        import_log_entries = chunk.get("import_log_entries", [])
-        for entry in import_log_entries:
-            entry["sequence_no"] = context.next_sequence_number()
+        # Fix sequence numbers for lore ImportLog entries
+        for chunk in chunks:
+            import_log_entries = chunk.get("import_log_entries", [])
+            for entry in import_log_entries:
+                entry["sequence_no"] = context.next_sequence_number()
 
     context.record_lore_chunks(chunks)
 
@@ -2614,6 +3143,7 @@ def run_complete_import_pipeline(
 
 __all__ = [
     "ManifestPhase",
+    "ParsePool",
     "EntityPhase",
     "EdgePhase",
     "OntologyPhase",
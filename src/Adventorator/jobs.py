@@ -0,0 +1,308 @@
+# src/Adventorator/jobs.py
+"""In-process background job runner for slash-command work.
+
+``JobRunner`` replaces fire-and-forget ``asyncio.create_task`` calls:
+
+- jobs are JSON payloads dispatched to a handler registered per ``kind``;
+- at most ``max_workers`` jobs run at once, and jobs sharing a ``key`` (a guild)
+  run one at a time in submission order;
+- ``submit`` refuses work once ``max_queue`` jobs are waiting, so callers can
+  shed load instead of flooding the event loop;
+- ``drain`` stops intake and waits for queued and running jobs at shutdown;
+- with ``durable=True`` each job is mirrored in the ``command_jobs`` table
+  under a lease held by this runner (renewed by a heartbeat while it has
+  work). ``resume`` claims queued jobs whose lease lapsed, e.g. after a
+  crash; jobs cut off mid-run are marked ``interrupted``, never replayed,
+  because command handlers are not idempotent. Finished rows are pruned after
+  ``retention_seconds``.
+
+Workers are spawned on demand and exit when no work is ready, so an idle
+runner holds no tasks. Metrics: ``<name>.submitted|completed|failed|rejected|
+resumed`` counters and ``<name>.queue_depth|wait_ms|run_ms`` histograms.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import os
+import socket
+import time
+import uuid
+from collections import deque
+from collections.abc import Awaitable, Callable
+from dataclasses import dataclass, field
+from typing import Any
+
+import structlog
+
+from Adventorator import repos
+from Adventorator.db import session_scope
+from Adventorator.metrics import inc_counter, observe_histogram
+
+log = structlog.get_logger()
+
+JobHandler = Callable[[dict[str, Any]], Awaitable[None]]
+
+_QUEUE_DEPTH_BUCKETS = [0, 1, 2, 5, 10, 20, 50, 100, 500, 1000]
+
+
+@dataclass
+class _Job:
+    kind: str
+    key: str
+    payload: dict[str, Any]
+    enqueued_at: float = field(default_factory=time.monotonic)
+    job_id: int | None = None
+
+
+class JobRunner:
+    """Bounded worker pool with per-key FIFO ordering and graceful drain."""
+
+    def __init__(
+        self,
+        name: str = "jobs",
+        *,
+        max_workers: int = 8,
+        max_queue: int = 1000,
+        durable: bool = False,
+        lease_seconds: float = 60.0,
+        retention_seconds: float = 3600.0,
+    ) -> None:
+        self.name = name
+        self.max_workers = max(1, int(max_workers))
+        self.max_queue = max(1, int(max_queue))
+        self.durable = durable
+        self.lease_seconds = lease_seconds
+        self.retention_seconds = retention_seconds
+        # Identifies this runner's leases in command_jobs
+        self.owner = f"{socket.gethostname()}:{os.getpid()}:{uuid.uuid4().hex[:8]}"
+        self._handlers: dict[str, JobHandler] = {}
+        self._loop: asyncio.AbstractEventLoop | None = None
+        self._reset()
+
+    def _reset(self) -> None:
+        self._pending: dict[str, deque[_Job]] = {}  # per key, not yet started
+        self._ready: deque[str] = deque()  # keys whose head job may start now
+        self._workers: set[asyncio.Task[None]] = set()
+        self._heartbeat: asyncio.Task[None] | None = None
+        self._queued = 0
+        self._running = 0
+        self._accepting = True
+        self._stopped = False  # set when drain gave up; no new workers until start()
+        self._idle = asyncio.Event()
+        self._idle.set()
+
+    def register(self, kind: str, handler: JobHandler) -> None:
+        self._handlers[kind] = handler
+
+    @property
+    def depth(self) -> int:
+        return self._queued
+
+    @property
+    def running(self) -> int:
+        return self._running
+
+    def start(self) -> None:
+        """Bind to the running loop and (re)open intake, e.g. at app startup."""
+        self._bind_loop()
+        self._accepting = True
+        self._stopped = False
+        self._spawn()
+
+    async def submit(self, kind: str, payload: dict[str, Any], *, key: str) -> bool:
+        """Queue a job; returns False when the runner is draining or full."""
+        if kind not in self._handlers:
+            raise KeyError(f"No job handler registered for {kind!r}")
+        self._bind_loop()
+        if not self._accepting or self._queued >= self.max_queue:
+            inc_counter(f"{self.name}.rejected")
+            log.warning("jobs.rejected", runner=self.name, kind=kind, queued=self._queued, key=key)
+            return False
+        job = _Job(kind, key, payload)
+        if self.durable:
+            try:
+                async with session_scope() as s:
+                    row = await repos.create_command_job(
+                        s,
+                        kind=kind,
+                        job_key=key,
+                        payload=payload,
+                        owner=self.owner,
+                        lease_seconds=self.lease_seconds,
+                    )
+                    job.job_id = row.id
+            except Exception:
+                # Durability is best-effort; the job still runs in memory
+                inc_counter(f"{self.name}.persist_failed")
+                log.warning("jobs.persist_failed", runner=self.name, kind=kind, exc_info=True)
+        self._enqueue(job)
+        return True
+
+    async def resume(self, *, max_age_seconds: float = 840.0) -> int:
+        """Claim unfinished durable jobs whose lease lapsed (tokens expire after 15 minutes)."""
+        if not self.durable:
+            return 0
+        self.start()
+        async with session_scope() as s:
+            await repos.prune_command_jobs(s, older_than_seconds=self.retention_seconds)
+            rows = await repos.claim_resumable_command_jobs(
+                s,
+                owner=self.owner,
+                max_age_seconds=max_age_seconds,
+                lease_seconds=self.lease_seconds,
+            )
+            jobs = [
+                _Job(r.kind, r.job_key, dict(r.payload or {}), job_id=r.id)
+                for r in rows
+                if r.kind in self._handlers
+            ]
+        for job in jobs:
+            self._enqueue(job)
+        if jobs:
+            inc_counter(f"{self.name}.resumed", len(jobs))
+            log.info("jobs.resumed", runner=self.name, count=len(jobs))
+        return len(jobs)
+
+    async def drain(self, timeout_s: float = 20.0) -> bool:
+        """Stop intake and wait for outstanding jobs; cancels them after ``timeout_s``."""
+        self._accepting = False
+        if self._loop is not asyncio.get_running_loop():
+            return True
+        try:
+            await asyncio.wait_for(self._idle.wait(), timeout_s)
+            await self._stop_heartbeat()
+            return True
+        except asyncio.TimeoutError:
+            inc_counter(f"{self.name}.drain_timeout")
+            log.warning(
+                "jobs.drain_timeout",
+                runner=self.name,
+                queued=self._queued,
+                running=self._running,
+            )
+            self._stopped = True
+            workers = list(self._workers)
+            for task in workers:
+                task.cancel()
+            await asyncio.gather(*workers, return_exceptions=True)
+            await self._stop_heartbeat()
+            if self.durable:
+                await self._release_leases()
+            return False
+
+    def _bind_loop(self) -> None:
+        loop = asyncio.get_running_loop()
+        if self._loop is loop:
+            return
+        if self._loop is not None and (self._queued or self._running):
+            # The previous loop is gone along with the tasks that ran on it
+            log.warning("jobs.loop_changed", runner=self.name, dropped=self._queued)
+        self._loop = loop
+        self._reset()
+
+    def _enqueue(self, job: _Job) -> None:
+        observe_histogram(f"{self.name}.queue_depth", self._queued, buckets=_QUEUE_DEPTH_BUCKETS)
+        q = self._pending.get(job.key)
+        if q is None:
+            q = self._pending[job.key] = deque()
+            self._ready.append(job.key)  # a key with a running job is re-readied after it
+        q.append(job)
+        self._queued += 1
+        self._idle.clear()
+        inc_counter(f"{self.name}.submitted")
+        self._spawn()
+        if job.job_id is not None and self._heartbeat is None:
+            self._heartbeat = self._loop.create_task(self._renew_leases())  # type: ignore[union-attr]
+
+    def _spawn(self) -> None:
+        assert self._loop is not None
+        while (
+            not self._stopped
+            and len(self._workers) < self.max_workers
+            and len(self._workers) - self._running < len(self._ready)
+        ):
+            task = self._loop.create_task(self._work())
+            self._workers.add(task)
+            task.add_done_callback(self._worker_done)
+
+    def _worker_done(self, task: asyncio.Task[None]) -> None:
+        self._workers.discard(task)
+        if self._ready:
+            self._spawn()  # a worker was cancelled or died with work still ready
+        elif not self._queued and not self._running:
+            self._idle.set()
+
+    async def _work(self) -> None:
+        while self._ready:
+            key = self._ready.popleft()
+            q = self._pending[key]
+            job = q.popleft()
+            self._queued -= 1
+            self._running += 1
+            try:
+                await self._run(job)
+            finally:
+                self._running -= 1
+                if q:
+                    self._ready.append(key)
+                else:
+                    del self._pending[key]
+
+    async def _run(self, job: _Job) -> None:
+        started = time.monotonic()
+        observe_histogram(f"{self.name}.wait_ms", int((started - job.enqueued_at) * 1000))
+        await self._mark(job, "running", attempt=True)
+        status = "done"
+        try:
+            await self._handlers[job.kind](job.payload)
+            inc_counter(f"{self.name}.completed")
+        except asyncio.CancelledError:
+            status = ""  # interrupted by drain, which marks the row interrupted
+            raise
+        except Exception:
+            status = "failed"
+            inc_counter(f"{self.name}.failed")
+            log.error("jobs.failed", runner=self.name, kind=job.kind, key=job.key, exc_info=True)
+        finally:
+            observe_histogram(f"{self.name}.run_ms", int((time.monotonic() - started) * 1000))
+        if status:
+            await self._mark(job, status)
+
+    async def _renew_leases(self) -> None:
+        """Heartbeat: keep this runner's durable jobs leased while it has work."""
+        try:
+            while self._queued or self._running:
+                await asyncio.sleep(self.lease_seconds / 3)
+                try:
+                    async with session_scope() as s:
+                        await repos.renew_command_job_leases(
+                            s, owner=self.owner, lease_seconds=self.lease_seconds
+                        )
+                        await repos.prune_command_jobs(s, older_than_seconds=self.retention_seconds)
+                except Exception:
+                    log.warning("jobs.lease_renew_failed", runner=self.name, exc_info=True)
+        finally:
+            self._heartbeat = None
+
+    async def _stop_heartbeat(self) -> None:
+        task = self._heartbeat
+        if task is not None:
+            task.cancel()
+            await asyncio.gather(task, return_exceptions=True)
+
+    async def _release_leases(self) -> None:
+        try:
+            async with session_scope() as s:
+                await repos.release_command_job_leases(s, owner=self.owner)
+        except Exception:
+            log.warning("jobs.lease_release_failed", runner=self.name, exc_info=True)
+
+    async def _mark(self, job: _Job, status: str, *, attempt: bool = False) -> None:
+        if job.job_id is None:
+            return
+        try:
+            async with session_scope() as s:
+                await repos.update_command_job_status(s, job.job_id, status, attempt=attempt)
+        except Exception:
+            log.warning("jobs.status_failed", runner=self.name, job_id=job.job_id, exc_info=True)
@@ -6,9 +6,14 @@ Provides deterministic, repo-backed entity lookup with caching and metrics.
 from __future__ import annotations
 
 import asyncio
+import json
+import sqlite3
+import threading
 import time
+from collections import OrderedDict
 from collections.abc import Callable
 from dataclasses import dataclass
+from typing import Protocol
 
 import structlog
 from sqlalchemy import select
@@ -37,49 +42,183 @@ class KBResolution:
     source: str
 
 
+class KBCacheBackend(Protocol):
+    """Shared cache store used behind the per-process LRU (values are bytes)."""
+
+    def get(self, key: str) -> bytes | None: ...
+
+    def set(self, key: str, value: bytes, ttl_s: float) -> None: ...
+
+
+class SqliteKBCacheBackend:
+    """Shared KB cache in a local SQLite file (WAL) for workers on one host.
+
+    Expiry uses wall-clock time because it is compared across processes.
+    Expired rows are deleted by a ``set`` at most once per ``purge_interval_s``.
+    Calls block on disk; ``_KBCache`` runs them with ``asyncio.to_thread``.
+    """
+
+    def __init__(self, path: str, *, purge_interval_s: float = 60.0):
+        self._conn = sqlite3.connect(
+            path, timeout=0.05, isolation_level=None, check_same_thread=False
+        )
+        self._lock = threading.Lock()
+        self._purge_interval_s = purge_interval_s
+        self._next_purge = time.monotonic() + purge_interval_s
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute(
+            "CREATE TABLE IF NOT EXISTS kb_cache ("
+            "key TEXT PRIMARY KEY, value BLOB NOT NULL, expires_at REAL NOT NULL)"
+        )
+
+    def get(self, key: str) -> bytes | None:
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT value FROM kb_cache WHERE key = ? AND expires_at > ?", (key, time.time())
+            ).fetchone()
+        return None if row is None else bytes(row[0])
+
+    def set(self, key: str, value: bytes, ttl_s: float) -> None:
+        with self._lock:
+            self._conn.execute(
+                "INSERT OR REPLACE INTO kb_cache (key, value, expires_at) VALUES (?, ?, ?)",
+                (key, value, time.time() + ttl_s),
+            )
+        if time.monotonic() >= self._next_purge:
+            self.purge_expired()
+
+    def purge_expired(self) -> int:
+        with self._lock:
+            self._next_purge = time.monotonic() + self._purge_interval_s
+            cur = self._conn.execute("DELETE FROM kb_cache WHERE expires_at <= ?", (time.time(),))
+        if cur.rowcount:
+            inc_counter("kb.cache.shared.purged", cur.rowcount)
+        return cur.rowcount
+
+    def close(self) -> None:
+        self._conn.close()
+
+
+def _encode_resolution(result: KBResolution) -> bytes:
+    return json.dumps(
+        {
+            "canonical_id": result.canonical_id,
+            "candidates": [[c.id, c.label] for c in result.candidates],
+            "reason": result.reason,
+            "source": result.source,
+        },
+        separators=(",", ":"),
+    ).encode("utf-8")
+
+
+def _decode_resolution(raw: bytes) -> KBResolution:
+    data = json.loads(raw)
+    return KBResolution(
+        canonical_id=data["canonical_id"],
+        candidates=[Candidate(id=cid, label=label) for cid, label in data["candidates"]],
+        reason=data["reason"],
+        source=data["source"],
+    )
+
+
 class _KBCache:
-    """Simple TTL-based cache with size limits."""
+    """LRU cache with lazy TTL expiry, byte accounting and an optional shared tier.
+
+    get/set are O(1): entries live in an OrderedDict in recency order, expired
+    entries are dropped when touched (or when they reach the LRU end), and the
+    least recently used entries are evicted once ``max_size`` entries or
+    ``max_bytes`` (encoded key + value size; 0 disables) are exceeded. When a
+    ``backend`` is configured, local misses fall through to it and sets are
+    written through, so several workers share resolutions; backend calls run
+    in a worker thread so a slow disk never blocks the event loop.
+    """
 
-    def __init__(self, max_size: int = 1024, ttl_s: float = 60.0):
-        self._cache: dict[str, tuple[float, KBResolution]] = {}
+    def __init__(
+        self,
+        max_size: int = 1024,
+        ttl_s: float = 60.0,
+        *,
+        max_bytes: int = 0,
+        backend: KBCacheBackend | None = None,
+    ):
+        self._cache: OrderedDict[str, tuple[float, KBResolution, int]] = OrderedDict()
         self._max_size = max_size
+        self._max_bytes = max_bytes
         self._ttl_s = ttl_s
+        self._backend = backend
+        self._nbytes = 0
         self._log = structlog.get_logger()
 
-    def get(self, key: str) -> KBResolution | None:
+    def __len__(self) -> int:
+        return len(self._cache)
+
+    @property
+    def nbytes(self) -> int:
+        return self._nbytes
+
+    async def get(self, key: str) -> KBResolution | None:
         """Get cached result if not expired."""
-        now = time.time()
-        if key in self._cache:
-            timestamp, result = self._cache[key]
-            if now - timestamp <= self._ttl_s:
+        entry = self._cache.get(key)
+        if entry is not None:
+            expires_at, result, _size = entry
+            if time.monotonic() <= expires_at:
+                self._cache.move_to_end(key)
                 inc_counter("kb.lookup.hit")
                 return result
             # Expired, remove it
-            del self._cache[key]
+            self._discard(key)
             inc_counter("kb.cache.evicted")
 
+        if self._backend is not None:
+            shared = await self._shared_get(key)
+            if shared is not None:
+                inc_counter("kb.lookup.hit")
+                inc_counter("kb.cache.shared.hit")
+                self._store(key, shared, _encode_resolution(shared))
+                return shared
+
         inc_counter("kb.lookup.miss")
         return None
 
-    def set(self, key: str, result: KBResolution) -> None:
-        """Set cached result, evicting old entries if needed."""
-        now = time.time()
-
-        # Evict expired entries first
-        expired_keys = [k for k, (ts, _) in self._cache.items() if now - ts > self._ttl_s]
-        for k in expired_keys:
-            del self._cache[k]
+    async def set(self, key: str, result: KBResolution) -> None:
+        """Set cached result, evicting least recently used entries if needed."""
+        encoded = _encode_resolution(result)
+        self._store(key, result, encoded)
+        if self._backend is not None:
+            try:
+                await asyncio.to_thread(self._backend.set, key, encoded, self._ttl_s)
+            except Exception as e:
+                inc_counter("kb.cache.shared.error")
+                self._log.warning("kb.cache.shared.error", op="set", error=str(e))
+
+    def _store(self, key: str, result: KBResolution, encoded: bytes) -> None:
+        self._discard(key)
+        size = len(key) + len(encoded)
+        self._cache[key] = (time.monotonic() + self._ttl_s, result, size)
+        self._nbytes += size
+        while self._cache and (
+            len(self._cache) > self._max_size
+            or (self._max_bytes and self._nbytes > self._max_bytes)
+        ):
+            oldest_key, (_exp, _res, oldest_size) = self._cache.popitem(last=False)
+            self._nbytes -= oldest_size
             inc_counter("kb.cache.evicted")
 
-        # Evict LRU-ish if we're over size
-        if len(self._cache) >= self._max_size:
-            # Remove the oldest entry
-            oldest_key = min(self._cache.items(), key=lambda kv: kv[1][0])[0]
-            del self._cache[oldest_key]
-            inc_counter("kb.cache.evicted")
+    def _discard(self, key: str) -> None:
+        entry = self._cache.pop(key, None)
+        if entry is not None:
+            self._nbytes -= entry[2]
 
-        # Set new value
-        self._cache[key] = (now, result)
+    async def _shared_get(self, key: str) -> KBResolution | None:
+        if self._backend is None:
+            return None
+        try:
+            raw = await asyncio.to_thread(self._backend.get, key)
+            return None if raw is None else _decode_resolution(raw)
+        except Exception as e:
+            inc_counter("kb.cache.shared.error")
+            self._log.warning("kb.cache.shared.error", op="get", error=str(e))
+            return None
 
 
 class KBAdapter:
@@ -91,12 +230,19 @@ class KBAdapter:
         *,
         cache_max_size: int = 1024,
         cache_ttl_s: float = 60.0,
+        cache_max_bytes: int = 0,
+        cache_backend: KBCacheBackend | None = None,
         max_candidates: int = 5,
         timeout_s: float = 0.05,
         max_terms_per_call: int = 20,
     ):
         self._sm = sessionmaker or get_sessionmaker()
-        self._cache = _KBCache(max_size=cache_max_size, ttl_s=cache_ttl_s)
+        self._cache = _KBCache(
+            max_size=cache_max_size,
+            ttl_s=cache_ttl_s,
+            max_bytes=cache_max_bytes,
+            backend=cache_backend,
+        )
         self._max_candidates = max_candidates
         self._timeout_s = timeout_s
         self._max_terms_per_call = max_terms_per_call
@@ -127,7 +273,7 @@ class KBAdapter:
         cache_key = f"single:{normalized_term}:{actual_limit}"
 
         # Check cache first
-        cached = self._cache.get(cache_key)
+        cached = await self._cache.get(cache_key)
         if cached is not None:
             return cached
 
@@ -155,7 +301,7 @@ class KBAdapter:
             )
 
         # Cache and return
-        self._cache.set(cache_key, result)
+        await self._cache.set(cache_key, result)
         return result
 
     async def bulk_resolve(
@@ -186,7 +332,7 @@ class KBAdapter:
             normalized = t.strip().lower()
             actual_limit = min(limit, self._max_candidates)
             cache_key = f"single:{normalized}:{actual_limit}"
-            cached = self._cache.get(cache_key)
+            cached = await self._cache.get(cache_key)
             if cached is not None:
                 return cached
             try:
@@ -199,7 +345,7 @@ class KBAdapter:
                     reason=f"Error: {e}",
                     source="repo",
                 )
-            self._cache.set(cache_key, res)
+            await self._cache.set(cache_key, res)
             return res
 
         tasks = [_resolve_no_timeout(term) for term in limited_terms]
@@ -332,9 +478,15 @@ _kb_adapter: KBAdapter | None = None
 
 
 def get_kb_adapter(**kwargs) -> KBAdapter:
-    """Get or create the global KB adapter instance."""
+    """Get or create the global KB adapter instance.
+
+    ``cache_backend_path`` (if set) opens a shared SQLite cache file.
+    """
     global _kb_adapter
     if _kb_adapter is None:
+        backend_path = kwargs.pop("cache_backend_path", None)
+        if backend_path and kwargs.get("cache_backend") is None:
+            kwargs["cache_backend"] = SqliteKBCacheBackend(backend_path)
         _kb_adapter = KBAdapter(**kwargs)
     return _kb_adapter
 
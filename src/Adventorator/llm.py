@@ -1,5 +1,6 @@
 # src/Adventorator/llm.py
 
+import time
 from typing import Any, cast
 
 import httpx
@@ -11,7 +12,9 @@ from openai import APIError as OpenAIError
 from openai import AsyncOpenAI
 
 from Adventorator.config import Settings
-from Adventorator.llm_utils import extract_first_json, validate_llm_output
+from Adventorator.llm_cache import build_llm_cache
+from Adventorator.llm_utils import JsonObjectScanner, extract_first_json, validate_llm_output
+from Adventorator.metrics import inc_counter, observe_histogram
 from Adventorator.schemas import LLMOutput
 
 log = structlog.get_logger()
@@ -27,6 +30,12 @@ class LLMClient:
                  Handles authentication and typed errors.
     2. 'ollama': Uses a direct `httpx` client to connect to a local or remote
                  Ollama instance.
+
+    With ``llm_stream`` enabled both providers stream tokens; JSON calls stop
+    reading as soon as the first complete top-level object has arrived.
+
+    Successful responses are stored in the configured ``[llm.cache]`` (keyed on
+    provider, model, messages and format); pass ``cache=False`` to bypass it.
     """
 
     def __init__(self, settings: Settings):
@@ -34,6 +43,8 @@ class LLMClient:
         self.model_name = settings.llm_model_name
         self.system_prompt = settings.llm_default_system_prompt
         self._max_chars = settings.llm_max_response_chars
+        self._stream = bool(getattr(settings, "llm_stream", False))
+        self._cache = build_llm_cache(settings)
 
         if not settings.llm_api_url:
             raise ValueError("LLMClient requires llm_api_url to be set in configuration.")
@@ -90,11 +101,16 @@ class LLMClient:
         )
 
     async def generate_response(
-        self, messages: list[dict], system_prompt: str | None = None
+        self, messages: list[dict], system_prompt: str | None = None, *, cache: bool = True
     ) -> str | None:
         """Generates a text response from the LLM based on a list of messages."""
         full_prompt = [{"role": "system", "content": system_prompt or self.system_prompt}]
         full_prompt.extend(messages)
+        cache_key = self._cache_key(full_prompt, None) if cache else None
+        if cache_key is not None and self._cache is not None:
+            hit = await self._cache.get(cache_key)
+            if hit is not None:
+                return hit.decode("utf-8")
         prompt_chars = sum(len(str(m.get("content", ""))) for m in full_prompt)
 
         log.info(
@@ -108,7 +124,10 @@ class LLMClient:
         start = time.perf_counter()
         status = "success"
         try:
-            if isinstance(self._client, httpx.AsyncClient):  # Ollama provider
+            if self._stream:
+                content, _ = await self._stream_chat(full_prompt)
+
+            elif isinstance(self._client, httpx.AsyncClient):  # Ollama provider
                 data = {"model": self.model_name, "messages": full_prompt, "stream": False}
                 httpx_resp = await self._client.post(self.api_url, content=orjson.dumps(data))
                 httpx_resp.raise_for_status()
@@ -127,7 +146,10 @@ class LLMClient:
                 log.error("LLM API response missing 'content'")
                 return "The narrator seems lost for words..."
 
-            return content.strip()
+            text = content.strip()
+            if cache_key is not None and self._cache is not None:
+                await self._cache.set(cache_key, text.encode("utf-8"))
+            return text
 
         except OpenAIError as e:
             status = "api_error"
@@ -157,10 +179,19 @@ class LLMClient:
         self,
         messages: list[dict],
         system_prompt: str | None = None,  # Note: system_prompt is now part of messages
+        *,
+        cache: bool = True,
     ) -> LLMOutput | None:
         """Call the chat API and return validated LLMOutput or None."""
         full_prompt = [{"role": "system", "content": system_prompt or self.system_prompt}]
         full_prompt.extend(messages)
+        cache_key = self._cache_key(full_prompt, "json") if cache else None
+        if cache_key is not None and self._cache is not None:
+            hit = await self._cache.get(cache_key)
+            if hit is not None:
+                cached = validate_llm_output(orjson.loads(hit))
+                if cached is not None:
+                    return cached
 
         import time
 
@@ -170,7 +201,20 @@ class LLMClient:
             parsed_json = None
             raw_content = ""
 
-            if isinstance(self._client, httpx.AsyncClient):  # Ollama provider
+            if self._stream:
+                raw_content, parsed_json = await self._stream_chat(
+                    full_prompt, json_format=True, stop_at_json=True
+                )
+                if not parsed_json and isinstance(self._client, httpx.AsyncClient):
+                    # Same format=json misbehaviour fallback as the non-streaming path
+                    try:
+                        raw_content, parsed_json = await self._stream_chat(
+                            full_prompt, stop_at_json=True
+                        )
+                    except Exception:
+                        pass
+
+            elif isinstance(self._client, httpx.AsyncClient):  # Ollama provider
                 data = {
                     "model": self.model_name,
                     "messages": full_prompt,
@@ -269,6 +313,8 @@ class LLMClient:
             if not out:
                 status = "validation_failed"
                 log.warning("LLM JSON validation failed", raw_preview=str(raw_content)[:200])
+            elif cache_key is not None and self._cache is not None:
+                await self._cache.set(cache_key, orjson.dumps(out.model_dump(mode="json")))
             return out
 
         except OpenAIError as e:
@@ -299,8 +345,96 @@ class LLMClient:
                 status=status,
             )
 
+    async def _stream_chat(
+        self,
+        full_prompt: list[dict],
+        *,
+        json_format: bool = False,
+        stop_at_json: bool = False,
+    ) -> tuple[str, Any]:
+        """Stream a chat completion and return ``(text, parsed_json)``.
+
+        With ``stop_at_json`` the deltas are fed to a ``JsonObjectScanner`` and the
+        stream is closed as soon as the first top-level object is complete (or the
+        ``llm_max_response_chars`` cap is hit). Records ``llm.stream.ttft_ms`` and
+        ``llm.stream.time_to_json_ms`` histograms.
+        """
+        scanner = JsonObjectScanner(self._max_chars) if stop_at_json else None
+        parts: list[str] = []
+        start = time.perf_counter()
+
+        def _on_delta(delta: str) -> bool:
+            """Record a delta; return True when the caller should stop reading."""
+            if not parts:
+                observe_histogram("llm.stream.ttft_ms", int((time.perf_counter() - start) * 1000))
+            parts.append(delta)
+            if scanner is None or scanner.feed(delta) is None:
+                return scanner is not None and scanner.done
+            observe_histogram(
+                "llm.stream.time_to_json_ms", int((time.perf_counter() - start) * 1000)
+            )
+            return True
+
+        stopped = False
+        if isinstance(self._client, httpx.AsyncClient):  # Ollama: NDJSON lines
+            data: dict[str, Any] = {
+                "model": self.model_name,
+                "messages": full_prompt,
+                "stream": True,
+            }
+            if json_format:
+                data["format"] = "json"
+            async with self._client.stream(
+                "POST", self.api_url, content=orjson.dumps(data)
+            ) as resp:
+                resp.raise_for_status()
+                async for line in resp.aiter_lines():
+                    if not line.strip():
+                        continue
+                    evt = orjson.loads(line)
+                    delta = (evt.get("message") or {}).get("content") or ""
+                    if delta and _on_delta(delta):
+                        stopped = not evt.get("done")
+                        break
+                    if evt.get("done"):
+                        break
+        else:  # OpenAI-compatible: server-sent chunks
+            stream = await self._client.chat.completions.create(
+                model=self.model_name,
+                messages=cast(Any, full_prompt),
+                stream=True,
+            )
+            try:
+                async for chunk in stream:
+                    if not chunk.choices:
+                        continue
+                    delta = chunk.choices[0].delta.content or ""
+                    if delta and _on_delta(delta):
+                        stopped = chunk.choices[0].finish_reason is None
+                        break
+            finally:
+                await stream.close()
+
+        if stopped:
+            inc_counter("llm.stream.early_stop")
+        text = "".join(parts)
+        if scanner is None or scanner.result is not None:
+            return text, scanner.result if scanner else None
+        # No balanced object seen; accept a strict parse of the whole body (e.g. a list)
+        try:
+            return text, orjson.loads(text)
+        except Exception:
+            return text, None
+
+    def _cache_key(self, full_prompt: list[dict], fmt: str | None) -> str | None:
+        if self._cache is None:
+            return None
+        return self._cache.key(self.provider, self.model_name, full_prompt, fmt)
+
     async def close(self):
         """Gracefully close the underlying HTTP client."""
+        if getattr(self, "_cache", None) is not None:
+            await self._cache.close()
         if not getattr(self, "_client", None):
             return
         try:
@@ -0,0 +1,313 @@
+# src/Adventorator/llm_cache.py
+"""Content-addressed cache for LLM responses.
+
+Responses are keyed on the canonical-JSON hash (``canonical_json.compute_canonical_hash``)
+of ``(provider, model, messages, format)`` so identical prompts hit regardless of
+dict ordering, across restarts and, with a shared backend, across workers.
+
+Backends (``[llm.cache] backend``):
+
+- ``memory``: per-process LRU bounded by entry count and bytes;
+- ``sqlite``: a local file (WAL) shared by workers on one host, evicting expired
+  then least recently used rows once over the bounds;
+- ``redis``: any server speaking the Redis protocol (RESP) with ``GET``/``SET PX``;
+  TTL is enforced by the server and size bounds by its ``maxmemory`` policy.
+
+Every backend applies the TTL; values larger than ``max_bytes`` are never stored.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import sqlite3
+import threading
+import time
+from collections import OrderedDict
+from typing import Any, Protocol
+from urllib.parse import urlparse
+
+import structlog
+
+from Adventorator.canonical_json import CanonicalJSONError, compute_canonical_hash
+from Adventorator.metrics import inc_counter
+
+log = structlog.get_logger()
+
+
+class LLMCacheBackend(Protocol):
+    """Byte store behind ``LLMResponseCache``."""
+
+    async def get(self, key: str) -> bytes | None: ...
+
+    async def set(self, key: str, value: bytes, ttl_s: float) -> None: ...
+
+    async def close(self) -> None: ...
+
+
+class MemoryLLMCacheBackend:
+    """In-process LRU with lazy TTL expiry and byte accounting."""
+
+    def __init__(self, max_entries: int = 1024, max_bytes: int = 16 * 1024 * 1024):
+        self._entries: OrderedDict[str, tuple[float, bytes]] = OrderedDict()
+        self._max_entries = max_entries
+        self._max_bytes = max_bytes
+        self.nbytes = 0
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    async def get(self, key: str) -> bytes | None:
+        entry = self._entries.get(key)
+        if entry is None:
+            return None
+        if time.monotonic() > entry[0]:
+            self._discard(key)
+            inc_counter("llm.cache.evicted")
+            return None
+        self._entries.move_to_end(key)
+        return entry[1]
+
+    async def set(self, key: str, value: bytes, ttl_s: float) -> None:
+        self._discard(key)
+        self._entries[key] = (time.monotonic() + ttl_s, value)
+        self.nbytes += len(key) + len(value)
+        while self._entries and (
+            len(self._entries) > self._max_entries
+            or (self._max_bytes and self.nbytes > self._max_bytes)
+        ):
+            old_key, (_exp, old_value) = self._entries.popitem(last=False)
+            self.nbytes -= len(old_key) + len(old_value)
+            inc_counter("llm.cache.evicted")
+
+    async def close(self) -> None:
+        self._entries.clear()
+        self.nbytes = 0
+
+    def _discard(self, key: str) -> None:
+        entry = self._entries.pop(key, None)
+        if entry is not None:
+            self.nbytes -= len(key) + len(entry[1])
+
+
+class SqliteLLMCacheBackend:
+    """LLM cache in a local SQLite file (WAL) for restarts and workers on one host.
+
+    Expiry uses wall-clock time because it is compared across processes.
+    Calls block on disk, so they run in a worker thread via ``asyncio.to_thread``.
+    """
+
+    def __init__(self, path: str, max_entries: int = 1024, max_bytes: int = 16 * 1024 * 1024):
+        self._conn = sqlite3.connect(
+            path, timeout=0.05, isolation_level=None, check_same_thread=False
+        )
+        self._lock = threading.Lock()
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute(
+            "CREATE TABLE IF NOT EXISTS llm_cache ("
+            "key TEXT PRIMARY KEY, value BLOB NOT NULL, size INTEGER NOT NULL, "
+            "expires_at REAL NOT NULL, accessed_at REAL NOT NULL)"
+        )
+        self._max_entries = max_entries
+        self._max_bytes = max_bytes
+
+    async def get(self, key: str) -> bytes | None:
+        return await asyncio.to_thread(self._get, key)
+
+    async def set(self, key: str, value: bytes, ttl_s: float) -> None:
+        await asyncio.to_thread(self._set, key, value, ttl_s)
+
+    async def close(self) -> None:
+        await asyncio.to_thread(self._close)
+
+    def _get(self, key: str) -> bytes | None:
+        now = time.time()
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT value FROM llm_cache WHERE key = ? AND expires_at > ?", (key, now)
+            ).fetchone()
+            if row is None:
+                return None
+            self._conn.execute("UPDATE llm_cache SET accessed_at = ? WHERE key = ?", (now, key))
+        return bytes(row[0])
+
+    def _set(self, key: str, value: bytes, ttl_s: float) -> None:
+        now = time.time()
+        with self._lock:
+            self._conn.execute(
+                "INSERT OR REPLACE INTO llm_cache (key, value, size, expires_at, accessed_at) "
+                "VALUES (?, ?, ?, ?, ?)",
+                (key, value, len(key) + len(value), now + ttl_s, now),
+            )
+            self._evict(now)
+
+    def _close(self) -> None:
+        with self._lock:
+            self._conn.close()
+
+    def _evict(self, now: float) -> None:
+        count, total = self._conn.execute(
+            "SELECT COUNT(*), COALESCE(SUM(size), 0) FROM llm_cache"
+        ).fetchone()
+        if count <= self._max_entries and (not self._max_bytes or total <= self._max_bytes):
+            return
+        evicted = self._conn.execute("DELETE FROM llm_cache WHERE expires_at <= ?", (now,)).rowcount
+        victims: list[str] = []
+        count, total = self._conn.execute(
+            "SELECT COUNT(*), COALESCE(SUM(size), 0) FROM llm_cache"
+        ).fetchone()
+        for key, size in self._conn.execute(
+            "SELECT key, size FROM llm_cache ORDER BY accessed_at"
+        ).fetchall():
+            if count <= self._max_entries and (not self._max_bytes or total <= self._max_bytes):
+                break
+            victims.append(key)
+            count -= 1
+            total -= size
+        if victims:
+            self._conn.executemany("DELETE FROM llm_cache WHERE key = ?", [(k,) for k in victims])
+        inc_counter("llm.cache.evicted", evicted + len(victims))
+
+
+class RespLLMCacheBackend:
+    """Minimal Redis-protocol (RESP2) client: ``GET`` and ``SET key value PX ttl``.
+
+    Works against Redis, Valkey, KeyDB or a local stand-in. One connection,
+    serialized by a lock; reconnects on the next call after an error.
+    """
+
+    def __init__(self, url: str, *, prefix: str = "adv:llm:", timeout_s: float = 0.5):
+        parsed = urlparse(url)
+        self._host = parsed.hostname or "127.0.0.1"
+        self._port = parsed.port or 6379
+        self._password = parsed.password
+        self._db = int(parsed.path.lstrip("/") or 0)
+        self._prefix = prefix
+        self._timeout_s = timeout_s
+        self._reader: asyncio.StreamReader | None = None
+        self._writer: asyncio.StreamWriter | None = None
+        self._lock = asyncio.Lock()
+
+    async def get(self, key: str) -> bytes | None:
+        return await self._command(b"GET", (self._prefix + key).encode())
+
+    async def set(self, key: str, value: bytes, ttl_s: float) -> None:
+        ttl_ms = str(max(1, int(ttl_s * 1000))).encode()
+        await self._command(b"SET", (self._prefix + key).encode(), value, b"PX", ttl_ms)
+
+    async def close(self) -> None:
+        if self._writer is not None:
+            self._writer.close()
+            try:
+                await self._writer.wait_closed()
+            except Exception:
+                pass
+        self._reader = self._writer = None
+
+    async def _command(self, *args: bytes) -> Any:
+        async with self._lock:
+            try:
+                return await asyncio.wait_for(self._roundtrip(args), self._timeout_s)
+            except Exception:
+                await self.close()
+                raise
+
+    async def _roundtrip(self, args: tuple[bytes, ...]) -> Any:
+        if self._writer is None:
+            self._reader, self._writer = await asyncio.open_connection(self._host, self._port)
+            if self._password:
+                await self._send((b"AUTH", self._password.encode()))
+            if self._db:
+                await self._send((b"SELECT", str(self._db).encode()))
+        return await self._send(args)
+
+    async def _send(self, args: tuple[bytes, ...]) -> Any:
+        assert self._reader is not None and self._writer is not None
+        parts = [b"*%d\r\n" % len(args)]
+        for arg in args:
+            parts.append(b"$%d\r\n%s\r\n" % (len(arg), arg))
+        self._writer.write(b"".join(parts))
+        await self._writer.drain()
+        return await self._read_reply()
+
+    async def _read_reply(self) -> Any:
+        assert self._reader is not None
+        line = await self._reader.readline()
+        if not line:
+            raise ConnectionError("RESP connection closed")
+        kind, rest = line[:1], line[1:-2]
+        if kind == b"+":
+            return rest
+        if kind == b"-":
+            raise RuntimeError(rest.decode("utf-8", "replace"))
+        if kind == b":":
+            return int(rest)
+        if kind == b"$":
+            n = int(rest)
+            if n < 0:
+                return None
+            data = await self._reader.readexactly(n + 2)
+            return data[:-2]
+        raise RuntimeError(f"unsupported RESP reply: {line!r}")
+
+
+class LLMResponseCache:
+    """TTL'd, content-addressed response cache over a pluggable backend."""
+
+    def __init__(self, backend: LLMCacheBackend, *, ttl_s: float = 86_400.0, max_bytes: int = 0):
+        self.backend = backend
+        self._ttl_s = ttl_s
+        self._max_bytes = max_bytes
+
+    @staticmethod
+    def key(provider: str, model: str, messages: list[dict], fmt: str | None) -> str | None:
+        """Canonical hash of the request, or None when it cannot be canonicalized."""
+        try:
+            digest = compute_canonical_hash(
+                {"provider": provider, "model": model, "messages": messages, "format": fmt}
+            )
+        except CanonicalJSONError:
+            return None
+        return digest.hex()
+
+    async def get(self, key: str) -> bytes | None:
+        try:
+            value = await self.backend.get(key)
+        except Exception as e:
+            inc_counter("llm.cache.error")
+            log.warning("llm.cache.error", op="get", error=str(e))
+            return None
+        inc_counter("llm.cache.hit" if value is not None else "llm.cache.miss")
+        return value
+
+    async def set(self, key: str, value: bytes) -> None:
+        if self._max_bytes and len(value) > self._max_bytes:
+            return
+        try:
+            await self.backend.set(key, value, self._ttl_s)
+            inc_counter("llm.cache.store")
+        except Exception as e:
+            inc_counter("llm.cache.error")
+            log.warning("llm.cache.error", op="set", error=str(e))
+
+    async def close(self) -> None:
+        await self.backend.close()
+
+
+def build_llm_cache(settings: Any) -> LLMResponseCache | None:
+    """Construct the configured response cache (``None`` when disabled)."""
+    cfg = getattr(settings, "llm_cache", None)
+    if cfg is None:
+        return None
+    kind = getattr(cfg, "backend", "none")
+    if kind == "none":
+        return None
+    backend: LLMCacheBackend
+    if kind == "memory":
+        backend = MemoryLLMCacheBackend(cfg.max_entries, cfg.max_bytes)
+    elif kind == "sqlite":
+        backend = SqliteLLMCacheBackend(cfg.path, cfg.max_entries, cfg.max_bytes)
+    elif kind == "redis":
+        backend = RespLLMCacheBackend(cfg.url)
+    else:
+        raise ValueError(f"Unsupported LLM cache backend: {kind}")
+    return LLMResponseCache(backend, ttl_s=cfg.ttl_s, max_bytes=cfg.max_bytes)
@@ -0,0 +1,316 @@
+# src/Adventorator/llm_scheduler.py
+"""Admission control in front of ``LLMClient``.
+
+``LLMScheduler`` exposes the same ``generate_response`` / ``generate_json``
+interface as the client it wraps and adds:
+
+- a per-provider concurrency limit shared by every scheduler that talks to the
+  same endpoint, with waiting callers granted slots round-robin per guild so one
+  busy guild cannot starve the others;
+- in-flight coalescing: identical requests (same kind, model, system prompt and
+  message list) share a single upstream call;
+- deadlines: calls made inside ``llm_request_scope(deadline_s=...)`` are rejected
+  up front when the estimated queue wait already exceeds the remaining budget,
+  and abandoned when the budget runs out while waiting;
+- speculation: ``speculate`` starts a call before anyone awaits it. A later
+  identical request claims the running flight; if none arrives within
+  ``hold_s`` the result is discarded (and the call cancelled if still running).
+
+Rejected JSON calls return ``None`` and rejected text calls return
+``OVERLOADED_TEXT``, mirroring how ``LLMClient`` reports provider errors.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import hashlib
+import time
+from collections import OrderedDict, deque
+from collections.abc import Iterator
+from contextlib import contextmanager
+from contextvars import ContextVar
+from typing import Any
+
+import orjson
+import structlog
+
+from Adventorator.metrics import inc_counter, observe_histogram
+
+log = structlog.get_logger()
+
+OVERLOADED_TEXT = "The narrator is overwhelmed right now. Try again in a moment."
+
+_QUEUE_DEPTH_BUCKETS = [0, 1, 2, 5, 10, 20, 50, 100]
+_NO_GUILD = "_"
+
+_request_guild: ContextVar[str | None] = ContextVar("llm_request_guild", default=None)
+_request_deadline: ContextVar[float | None] = ContextVar("llm_request_deadline", default=None)
+
+
+@contextmanager
+def llm_request_scope(*, guild_id: str | None, deadline_s: float | None) -> Iterator[None]:
+    """Attribute LLM calls made in this context to a guild, with an optional time budget."""
+    deadline = time.monotonic() + deadline_s if deadline_s else None
+    guild_token = _request_guild.set(guild_id)
+    deadline_token = _request_deadline.set(deadline)
+    try:
+        yield
+    finally:
+        _request_deadline.reset(deadline_token)
+        _request_guild.reset(guild_token)
+
+
+def request_key(kind: str, model: str | None, system_prompt: str | None, messages: list) -> str:
+    """Stable hash of everything that determines an LLM response."""
+    blob = orjson.dumps(
+        {"kind": kind, "model": model, "system": system_prompt, "messages": messages},
+        option=orjson.OPT_SORT_KEYS,
+        default=str,
+    )
+    return hashlib.sha256(blob).hexdigest()
+
+
+class FairLimiter:
+    """Concurrency limiter whose waiters are served round-robin by guild."""
+
+    def __init__(self, max_concurrency: int) -> None:
+        self.max_concurrency = max(1, int(max_concurrency))
+        self.active = 0
+        self.ewma_ms = 0.0
+        self._queues: OrderedDict[str, deque[asyncio.Future[None]]] = OrderedDict()
+
+    @property
+    def depth(self) -> int:
+        return sum(len(q) for q in self._queues.values())
+
+    def estimate_wait_ms(self) -> float:
+        """Rough time until a new caller would get a slot, from recent call latency."""
+        if self.active < self.max_concurrency and not self._queues:
+            return 0.0
+        return (self.depth // self.max_concurrency + 1) * self.ewma_ms
+
+    def record(self, duration_ms: float) -> None:
+        self.ewma_ms = duration_ms if not self.ewma_ms else 0.8 * self.ewma_ms + 0.2 * duration_ms
+
+    async def acquire(self, guild: str) -> None:
+        if self.active < self.max_concurrency and not self._queues:
+            self.active += 1
+            return
+        fut: asyncio.Future[None] = asyncio.get_running_loop().create_future()
+        self._queues.setdefault(guild, deque()).append(fut)
+        try:
+            await fut
+        except asyncio.CancelledError:
+            if fut.done() and not fut.cancelled():
+                # Granted a slot in the same tick we were cancelled: hand it on
+                self.release()
+            else:
+                q = self._queues.get(guild)
+                if q is not None:
+                    try:
+                        q.remove(fut)
+                    except ValueError:
+                        pass
+                    if not q:
+                        del self._queues[guild]
+            raise
+
+    def release(self) -> None:
+        while self._queues:
+            guild, q = next(iter(self._queues.items()))
+            fut = q.popleft()
+            if q:
+                self._queues.move_to_end(guild)
+            else:
+                del self._queues[guild]
+            if not fut.done():
+                fut.set_result(None)  # slot passes straight to the waiter
+                return
+        self.active -= 1
+
+
+_LIMITERS: dict[str, FairLimiter] = {}
+
+
+def get_limiter(key: str, max_concurrency: int) -> FairLimiter:
+    """Return the shared limiter for a provider endpoint, resizing it if needed."""
+    limiter = _LIMITERS.get(key)
+    if limiter is None:
+        limiter = _LIMITERS[key] = FairLimiter(max_concurrency)
+    else:
+        limiter.max_concurrency = max(1, int(max_concurrency))
+    return limiter
+
+
+class _Flight:
+    __slots__ = ("task", "waiters", "held")
+
+    def __init__(self, task: asyncio.Task[Any]) -> None:
+        self.task = task
+        self.waiters = 0
+        self.held = False  # speculative flight not yet claimed by a real caller
+
+
+_REJECTED = object()
+
+
+class LLMScheduler:
+    """Drop-in wrapper around an ``LLMClient`` adding fair queuing and coalescing."""
+
+    def __init__(self, client: Any, *, max_concurrency: int = 4) -> None:
+        self._client = client
+        self.provider = getattr(client, "provider", None)
+        self.model_name = getattr(client, "model_name", None)
+        endpoint = f"{self.provider}:{getattr(client, 'api_url', '')}"
+        self._limiter = get_limiter(endpoint, max_concurrency)
+        self._inflight: dict[str, _Flight] = {}
+
+    def __getattr__(self, name: str) -> Any:
+        return getattr(self._client, name)
+
+    def stats(self) -> dict[str, Any]:
+        return {
+            "active": self._limiter.active,
+            "queued": self._limiter.depth,
+            "inflight": len(self._inflight),
+            "ewma_ms": round(self._limiter.ewma_ms, 1),
+        }
+
+    async def generate_response(
+        self, messages: list[dict], system_prompt: str | None = None, *, cache: bool = True
+    ) -> str | None:
+        out = await self._submit("response", messages, system_prompt, cache)
+        return OVERLOADED_TEXT if out is _REJECTED else out
+
+    async def generate_json(
+        self, messages: list[dict], system_prompt: str | None = None, *, cache: bool = True
+    ) -> Any:
+        out = await self._submit("json", messages, system_prompt, cache)
+        return None if out is _REJECTED else out
+
+    def speculate(
+        self,
+        kind: str,
+        messages: list[dict],
+        system_prompt: str | None = None,
+        *,
+        hold_s: float = 15.0,
+    ) -> bool:
+        """Start a call nobody awaits yet; returns False if an identical one is in flight.
+
+        The flight is kept for ``hold_s`` seconds so that the matching
+        ``generate_json`` / ``generate_response`` call coalesces onto it.
+        """
+        key = request_key(kind, self.model_name, system_prompt, messages)
+        if key in self._inflight:
+            return False
+        guild = _request_guild.get() or _NO_GUILD
+        flight = _Flight(
+            asyncio.ensure_future(self._run(kind, messages, system_prompt, True, guild))
+        )
+        flight.held = True
+        flight.waiters = 1  # the hold counts as a waiter until claimed or expired
+        self._track(key, flight)
+        asyncio.get_running_loop().call_later(hold_s, self._release_hold, key, flight, False)
+        inc_counter("llm.speculative.started")
+        return True
+
+    async def close(self) -> None:
+        await self._client.close()
+
+    async def _submit(
+        self, kind: str, messages: list[dict], system_prompt: str | None, cache: bool
+    ) -> Any:
+        # Cache opt-outs must not share a flight that may be answered from the cache
+        key = request_key(
+            kind if cache else f"{kind}:nocache", self.model_name, system_prompt, messages
+        )
+        guild = _request_guild.get() or _NO_GUILD
+        deadline = _request_deadline.get()
+        remaining = None if deadline is None else deadline - time.monotonic()
+
+        flight = self._inflight.get(key)
+        if flight is not None:
+            flight.waiters += 1
+            if flight.held:
+                inc_counter("llm.speculative.hit")
+                self._release_hold(key, flight, True)
+            else:
+                inc_counter("llm.scheduler.coalesced")
+        else:
+            if remaining is not None and (
+                remaining <= 0 or self._limiter.estimate_wait_ms() > remaining * 1000
+            ):
+                inc_counter("llm.scheduler.rejected")
+                log.warning(
+                    "llm.scheduler.rejected",
+                    guild_id=guild,
+                    queued=self._limiter.depth,
+                    estimated_wait_ms=int(self._limiter.estimate_wait_ms()),
+                    remaining_ms=int(remaining * 1000),
+                )
+                return _REJECTED
+            flight = _Flight(
+                asyncio.ensure_future(self._run(kind, messages, system_prompt, cache, guild))
+            )
+            self._track(key, flight)
+            flight.waiters += 1
+
+        try:
+            return await asyncio.wait_for(asyncio.shield(flight.task), remaining)
+        except asyncio.TimeoutError:
+            inc_counter("llm.scheduler.deadline_exceeded")
+            log.warning("llm.scheduler.deadline_exceeded", guild_id=guild)
+            return _REJECTED
+        finally:
+            flight.waiters -= 1
+            if flight.waiters == 0 and not flight.task.done():
+                # Nobody is waiting for this answer any more; free the slot or queue spot
+                self._forget(key, flight)
+                flight.task.cancel()
+
+    def _track(self, key: str, flight: _Flight) -> None:
+        self._inflight[key] = flight
+
+        def _done(_task: asyncio.Future[Any]) -> None:
+            self._forget(key, flight)
+
+        flight.task.add_done_callback(_done)
+
+    def _forget(self, key: str, flight: _Flight) -> None:
+        if flight.held:
+            return  # a finished speculative result stays claimable until its hold ends
+        if self._inflight.get(key) is flight:
+            del self._inflight[key]
+
+    def _release_hold(self, key: str, flight: _Flight, claimed: bool) -> None:
+        if not flight.held:
+            return
+        flight.held = False
+        flight.waiters -= 1
+        if not claimed:
+            inc_counter("llm.speculative.discarded")
+        if flight.task.done():
+            self._forget(key, flight)
+        elif flight.waiters == 0:
+            self._forget(key, flight)
+            flight.task.cancel()
+
+    async def _run(
+        self, kind: str, messages: list[dict], system_prompt: str | None, cache: bool, guild: str
+    ) -> Any:
+        limiter = self._limiter
+        observe_histogram("llm.scheduler.queue_depth", limiter.depth, buckets=_QUEUE_DEPTH_BUCKETS)
+        enqueued = time.monotonic()
+        await limiter.acquire(guild)
+        started = time.monotonic()
+        observe_histogram("llm.scheduler.wait_ms", int((started - enqueued) * 1000))
+        try:
+            call = self._client.generate_json if kind == "json" else self._client.generate_response
+            args: list[Any] = [messages] if system_prompt is None else [messages, system_prompt]
+            if not cache:
+                return await call(*args, cache=False)
+            return await call(*args)
+        finally:
+            limiter.record((time.monotonic() - started) * 1000)
+            limiter.release()
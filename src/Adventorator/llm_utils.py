@@ -8,6 +8,103 @@ from typing import Any
 from .schemas import LLMOutput
 
 
+class JsonObjectScanner:
+    """Incremental brace matcher for the first top-level JSON object in a stream.
+
+    Feed text chunks as they arrive; ``feed`` returns the parsed object once the
+    first balanced ``{...}`` has been seen. The matching rules are identical to
+    ``extract_first_json`` (which is implemented on top of this class), including
+    the ``max_chars`` cap measured from the start of the stream.
+    """
+
+    __slots__ = (
+        "max_chars",
+        "done",
+        "result",
+        "_seen",
+        "_parts",
+        "_depth",
+        "_in_string",
+        "_escape",
+        "_started",
+    )
+
+    def __init__(self, max_chars: int = 50_000) -> None:
+        self.max_chars = max_chars
+        self.done = False
+        self.result: dict[str, Any] | None = None
+        self._seen = 0
+        self._parts: list[str] = []
+        self._depth = 0
+        self._in_string = False
+        self._escape = False
+        self._started = False
+
+    def feed(self, chunk: str) -> dict[str, Any] | None:
+        """Consume a chunk; return the object once complete (and set ``done``)."""
+        if self.done or not chunk:
+            return self.result
+        room = self.max_chars - self._seen
+        if room <= 0:
+            self.done = True
+            return None
+        chunk = chunk[:room]
+        self._seen += len(chunk)
+
+        pos = 0
+        if not self._started:
+            pos = chunk.find("{")
+            if pos == -1:
+                if self._seen >= self.max_chars:
+                    self.done = True
+                return None
+            self._started = True
+
+        depth = self._depth
+        in_string = self._in_string
+        escape = self._escape
+        end_idx = None
+        for i in range(pos, len(chunk)):
+            ch = chunk[i]
+            if in_string:
+                if escape:
+                    escape = False
+                elif ch == "\\":
+                    escape = True
+                elif ch == '"':
+                    in_string = False
+                continue
+
+            if ch == '"':
+                in_string = True
+            elif ch == "{":
+                depth += 1
+            elif ch == "}":
+                depth -= 1
+                if depth == 0:
+                    end_idx = i + 1
+                    break
+        self._depth, self._in_string, self._escape = depth, in_string, escape
+
+        if end_idx is None:
+            self._parts.append(chunk[pos:])
+            if self._seen >= self.max_chars:
+                self.done = True
+            return None
+
+        self._parts.append(chunk[pos:end_idx])
+        self.done = True
+        candidate = "".join(self._parts)
+        self._parts = []
+        try:
+            data = json.loads(candidate)
+        except json.JSONDecodeError:
+            return None
+        if isinstance(data, dict):
+            self.result = data
+        return self.result
+
+
 def extract_first_json(text: str, max_chars: int = 50_000) -> dict[str, Any] | None:
     """Extract the first valid top-level JSON object from text.
 
@@ -17,47 +114,7 @@ def extract_first_json(text: str, max_chars: int = 50_000) -> dict[str, Any] | N
     """
     if not text:
         return None
-    snippet = text[:max_chars]
-    start = snippet.find("{")
-    if start == -1:
-        return None
-
-    # Simple stack-based brace matching to find the first balanced object
-    depth = 0
-    in_string = False
-    escape = False
-    end_idx = None
-    for i, ch in enumerate(snippet[start:], start=start):
-        if in_string:
-            if escape:
-                escape = False
-            elif ch == "\\":
-                escape = True
-            elif ch == '"':
-                in_string = False
-            continue
-
-        if ch == '"':
-            in_string = True
-        elif ch == "{":
-            depth += 1
-        elif ch == "}":
-            depth -= 1
-            if depth == 0:
-                end_idx = i + 1
-                break
-
-    if end_idx is None:
-        return None
-
-    candidate = snippet[start:end_idx]
-    try:
-        data = json.loads(candidate)
-    except json.JSONDecodeError:
-        return None
-    if isinstance(data, dict):
-        return data
-    return None
+    return JsonObjectScanner(max_chars).feed(text)
 
 
 def validate_llm_output(data: dict[str, Any] | None) -> LLMOutput | None:
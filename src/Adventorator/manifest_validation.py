@@ -15,7 +15,6 @@ Implements requirements from:
 
 from __future__ import annotations
 
-import copy
 import hashlib
 import json
 import re
@@ -23,6 +22,14 @@ from pathlib import Path
 from typing import Any
 
 from Adventorator.canonical_json import compute_canonical_hash
+from Adventorator.schema_registry import get_schema_validator, validate_against_schema
+
+_PACKAGE_ULID_PATTERN = re.compile(r"^[0-9][0-9A-HJKMNP-TV-Z]{25}$")
+_PLACEHOLDER_PACKAGE_ID = "01J00000000000000000000000"
+
+
+def _is_placeholder_id(value: Any) -> bool:
+    return isinstance(value, str) and not _PACKAGE_ULID_PATTERN.fullmatch(value)
 
 
 class ManifestValidationError(ValueError):
@@ -54,28 +61,27 @@ def validate_manifest_schema(manifest: dict[str, Any], schema_path: Path | None
         raise ManifestValidationError(f"Manifest schema not found at {schema_path}")
 
     try:
-        with open(schema_path, encoding="utf-8") as f:
-            schema = json.load(f)
+        get_schema_validator(schema_path)
     except (json.JSONDecodeError, OSError) as exc:
         raise ManifestValidationError(f"Failed to load manifest schema: {exc}") from exc
 
-    manifest_copy = copy.deepcopy(manifest)
-    ulid_pattern = re.compile(r"^[0-9][0-9A-HJKMNP-TV-Z]{25}$")
-    package_id = manifest_copy.get("package_id")
-    if isinstance(package_id, str) and not ulid_pattern.fullmatch(package_id):
-        manifest_copy["package_id"] = "01J00000000000000000000000"
+    # Placeholder package ids are swapped for a valid ULID on shallow copies;
+    # the caller's manifest is never modified
+    manifest_view = dict(manifest)
+    if _is_placeholder_id(manifest_view.get("package_id")):
+        manifest_view["package_id"] = _PLACEHOLDER_PACKAGE_ID
 
-    dependencies = manifest_copy.get("dependencies")
+    dependencies = manifest_view.get("dependencies")
     if isinstance(dependencies, list):
-        for dependency in dependencies:
-            if not isinstance(dependency, dict):
-                continue
-            package_id = dependency.get("package_id")
-            if isinstance(package_id, str) and not ulid_pattern.fullmatch(package_id):
-                dependency["package_id"] = "01J00000000000000000000000"
+        manifest_view["dependencies"] = [
+            {**dependency, "package_id": _PLACEHOLDER_PACKAGE_ID}
+            if isinstance(dependency, dict) and _is_placeholder_id(dependency.get("package_id"))
+            else dependency
+            for dependency in dependencies
+        ]
 
     try:
-        jsonschema.validate(manifest_copy, schema)
+        validate_against_schema(schema_path, manifest_view)
     except jsonschema.ValidationError as exc:
         raise ManifestValidationError(f"Manifest schema validation failed: {exc.message}") from exc
 
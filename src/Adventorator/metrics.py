@@ -5,6 +5,9 @@ This is intentionally simple; production can replace these with a real backend.
 Adds a lightweight histogram helper with fixed or custom buckets. Values are
 exported into flattened counters for the /metrics endpoint to keep payloads
 simple and avoid changing types in existing consumers.
+
+Gauges are registered as callbacks and sampled when counters are exported
+(``gauge.<name>``); like counters, they only appear once non-zero.
 """
 
 from __future__ import annotations
@@ -18,6 +21,7 @@ _counters: dict[str, int] = defaultdict(int)
 _histograms: dict[str, dict[str, int]] = {}
 _hist_sums: dict[str, int] = defaultdict(int)
 _hist_counts: dict[str, int] = defaultdict(int)
+_gauges: dict[str, Callable[[], int]] = {}
 _reset_plan_cache_cb: Callable[[], None] | None = None
 
 
@@ -25,6 +29,11 @@ def inc_counter(name: str, value: int = 1) -> None:
     _counters[name] += int(value)
 
 
+def register_gauge(name: str, read: Callable[[], int]) -> None:
+    """Register (or replace) a callback sampled as ``gauge.<name>`` on export."""
+    _gauges[name] = read
+
+
 def register_reset_plan_cache_callback(callback: Callable[[], None]) -> None:
     """Register a callback used to clear the planner cache when metrics reset."""
 
@@ -49,6 +58,12 @@ def reset_counters() -> None:
         except Exception:
             # If the callback fails in some contexts, ignore silently.
             pass
+    try:
+        from Adventorator.bounded_cache import clear_all
+
+        clear_all()
+    except Exception:
+        pass
     try:
         from Adventorator.action_validation import plan_registry
 
@@ -75,6 +90,13 @@ def get_counters() -> dict[str, int]:
             out[f"histo.{name}.{b_lbl}"] = cnt
         out[f"histo.{name}.sum"] = _hist_sums.get(name, 0)
         out[f"histo.{name}.count"] = _hist_counts.get(name, 0)
+    for name, read in list(_gauges.items()):
+        try:
+            value = int(read())
+        except Exception:
+            continue
+        if value:
+            out[f"gauge.{name}"] = value
     return out
 
 
@@ -203,6 +203,89 @@ class ContentNode(Base):
     )
 
 
+# Ranked full-text search over content nodes (retrieval.FullTextRetriever).
+# Postgres: weighted generated tsvector + GIN index (title A, player_text B, gm_text C).
+# SQLite: FTS5 shadow table keyed by content_nodes.id, maintained by triggers.
+event.listen(
+    ContentNode.__table__,
+    "after_create",
+    DDL(
+        """
+ALTER TABLE content_nodes ADD COLUMN search_tsv tsvector GENERATED ALWAYS AS (
+    setweight(to_tsvector('english'::regconfig, coalesce(title, '')), 'A')
+    || setweight(to_tsvector('english'::regconfig, coalesce(player_text, '')), 'B')
+    || setweight(to_tsvector('english'::regconfig, coalesce(gm_text, '')), 'C')
+) STORED;
+        """
+    ).execute_if(dialect="postgresql"),
+)
+event.listen(
+    ContentNode.__table__,
+    "after_create",
+    DDL(
+        "CREATE INDEX ix_content_nodes_search_tsv ON content_nodes USING GIN (search_tsv);"
+    ).execute_if(dialect="postgresql"),
+)
+event.listen(
+    ContentNode.__table__,
+    "after_create",
+    DDL(
+        """
+CREATE VIRTUAL TABLE IF NOT EXISTS content_nodes_fts USING fts5(
+    title, player_text, gm_text, tokenize = 'porter unicode61'
+);
+        """
+    ).execute_if(dialect="sqlite"),
+)
+event.listen(
+    ContentNode.__table__,
+    "after_create",
+    DDL(
+        """
+CREATE TRIGGER content_nodes_fts_insert
+AFTER INSERT ON content_nodes
+BEGIN
+    INSERT INTO content_nodes_fts (rowid, title, player_text, gm_text)
+    VALUES (NEW.id, NEW.title, NEW.player_text, coalesce(NEW.gm_text, ''));
+END;
+        """
+    ).execute_if(dialect="sqlite"),
+)
+event.listen(
+    ContentNode.__table__,
+    "after_create",
+    DDL(
+        """
+CREATE TRIGGER content_nodes_fts_update
+AFTER UPDATE OF title, player_text, gm_text ON content_nodes
+BEGIN
+    UPDATE content_nodes_fts
+    SET title = NEW.title, player_text = NEW.player_text, gm_text = coalesce(NEW.gm_text, '')
+    WHERE rowid = NEW.id;
+END;
+        """
+    ).execute_if(dialect="sqlite"),
+)
+event.listen(
+    ContentNode.__table__,
+    "after_create",
+    DDL(
+        """
+CREATE TRIGGER content_nodes_fts_delete
+AFTER DELETE ON content_nodes
+BEGIN
+    DELETE FROM content_nodes_fts WHERE rowid = OLD.id;
+END;
+        """
+    ).execute_if(dialect="sqlite"),
+)
+event.listen(
+    ContentNode.__table__,
+    "before_drop",
+    DDL("DROP TABLE IF EXISTS content_nodes_fts;").execute_if(dialect="sqlite"),
+)
+
+
 # -----------------------------
 # Phase 8: Pending Actions
 # -----------------------------
@@ -416,6 +499,30 @@ event.listen(
 )
 
 
+class FoldCheckpoint(Base):
+    """Persisted fold state for a scene view, valid up to ``replay_ordinal``.
+
+    Incremental folds load the checkpoint and apply only events with a higher
+    replay_ordinal; ``replay_ordinal = -1`` means no events folded yet.
+    """
+
+    __tablename__ = "fold_checkpoints"
+
+    id: Mapped[int] = mapped_column(Integer, primary_key=True, autoincrement=True)
+    scene_id: Mapped[int] = mapped_column(
+        ForeignKey("scenes.id", ondelete="CASCADE"), index=True, nullable=False
+    )
+    view: Mapped[str] = mapped_column(String(32), nullable=False)
+    replay_ordinal: Mapped[int] = mapped_column(Integer, nullable=False, default=-1)
+    event_count: Mapped[int] = mapped_column(Integer, nullable=False, default=0)
+    state: Mapped[dict] = mapped_column(JSON, nullable=False, default=dict)
+    updated_at: Mapped[datetime] = mapped_column(
+        DateTime(timezone=True), default=lambda: datetime.now(timezone.utc)
+    )
+
+    __table_args__ = (UniqueConstraint("scene_id", "view", name="ux_fold_checkpoints_scene_view"),)
+
+
 # -----------------------------
 # Phase 10: Encounters & Turns
 # -----------------------------
@@ -535,3 +642,60 @@ class ImportLog(Base):
         Index("ix_import_logs_campaign_phase_object", "campaign_id", "phase", "object_type"),
         Index("ix_import_logs_manifest_hash", "manifest_hash"),
     )
+
+
+class LoreChunk(Base):
+    """Imported lore chunk text, keyed by its ``lore_chunker`` chunk id.
+
+    Seed events only carry chunk metadata and a content hash, so the importer
+    keeps the text here for retrieval. A changed chunk is replaced with a new
+    row rather than updated in place.
+    """
+
+    __tablename__ = "lore_chunks"
+
+    id: Mapped[int] = mapped_column(Integer, primary_key=True, autoincrement=True)
+    campaign_id: Mapped[int] = mapped_column(
+        ForeignKey("campaigns.id", ondelete="CASCADE"), index=True
+    )
+    chunk_id: Mapped[str] = mapped_column(String(64), nullable=False)
+    title: Mapped[str] = mapped_column(String(256), nullable=False)
+    audience: Mapped[str] = mapped_column(String(16), nullable=False)  # Player|GM-Only|...
+    tags: Mapped[list[str] | None] = mapped_column(JSON, nullable=True)
+    content: Mapped[str] = mapped_column(Text, nullable=False)
+    content_hash: Mapped[str] = mapped_column(String(64), nullable=False)
+    source_path: Mapped[str] = mapped_column(Text, nullable=False)
+    chunk_index: Mapped[int] = mapped_column(Integer, nullable=False)
+    created_at: Mapped[datetime] = mapped_column(
+        DateTime(timezone=True), default=lambda: datetime.now(timezone.utc)
+    )
+
+    __table_args__ = (
+        UniqueConstraint("campaign_id", "chunk_id", name="ux_lore_chunks_campaign_chunk"),
+    )
+
+
+class CommandJob(Base):
+    """Durable record of a queued command so interrupted work can resume after restart."""
+
+    __tablename__ = "command_jobs"
+
+    id: Mapped[int] = mapped_column(Integer, primary_key=True, autoincrement=True)
+    kind: Mapped[str] = mapped_column(String(32), nullable=False)
+    job_key: Mapped[str] = mapped_column(String(64), nullable=False)  # ordering key (guild)
+    payload: Mapped[dict] = mapped_column(JSON, nullable=False)
+    status: Mapped[str] = mapped_column(
+        String(16), default="queued", index=True
+    )  # queued|running|done|failed|expired|interrupted
+    attempts: Mapped[int] = mapped_column(Integer, default=0)
+    # Runner that holds the job; another runner may claim it once the lease lapses
+    owner: Mapped[str | None] = mapped_column(String(96), nullable=True)
+    lease_expires_at: Mapped[datetime | None] = mapped_column(
+        DateTime(timezone=True), nullable=True
+    )
+    created_at: Mapped[datetime] = mapped_column(
+        DateTime(timezone=True), default=lambda: datetime.now(timezone.utc)
+    )
+    updated_at: Mapped[datetime] = mapped_column(
+        DateTime(timezone=True), default=lambda: datetime.now(timezone.utc)
+    )
@@ -1,10 +1,12 @@
 from __future__ import annotations
 
+import asyncio
+import inspect
 import re
 import time
-from collections.abc import Callable
+from collections.abc import Awaitable, Callable
 from dataclasses import dataclass
-from typing import Any, TypedDict
+from typing import Any, TypedDict, TypeVar
 
 import structlog
 
@@ -15,9 +17,10 @@ from Adventorator.action_validation import (
     PlanStep,
     tool_chain_from_execution_request,
 )
+from Adventorator.bounded_cache import BoundedCache
 from Adventorator.db import session_scope
 from Adventorator.llm_prompts import build_clerk_messages, build_narrator_messages
-from Adventorator.metrics import inc_counter
+from Adventorator.metrics import inc_counter, observe_histogram
 from Adventorator.models import Transcript as TranscriptModel
 from Adventorator.retrieval import ContentSnippet, build_retriever
 
@@ -30,6 +33,7 @@ from Adventorator.rules.dice import DiceRNG
 from Adventorator.schemas import LLMOutput
 
 log = structlog.get_logger()
+T = TypeVar("T")
 
 
 @dataclass(frozen=True)
@@ -256,18 +260,30 @@ def _unknown_actor_present(narration: str, allowed: set[str]) -> str | None:
     return None
 
 
-# Simple 30s prompt cache (keyed by scene and player_msg)
+# Bounded 30s prompt cache keyed by (scene, player_msg, action validation flag);
+# counters orchestrator.cache.hit|miss|expired|evicted
 _CACHE_TTL = 30.0
-_prompt_cache: dict[tuple[int, str, bool], tuple[float, OrchestratorResult]] = {}
+_TRANSCRIPT_WINDOW = 15
+# Retrieval is optional context: past this many ms into the prefetch stage it is dropped
+_DEFAULT_RETRIEVAL_BUDGET_MS = 250
+# Strong references to retrievals left running past the budget (the loop only holds weak ones)
+_dropped_retrievals: set[asyncio.Task[list[ContentSnippet]]] = set()
+_prompt_cache: BoundedCache[tuple[int, str, bool], OrchestratorResult] = BoundedCache(
+    "orchestrator.cache", ttl_s=_CACHE_TTL, max_entries=1024, max_bytes=4 * 1024 * 1024
+)
 
 
 async def _facts_from_transcripts(
-    scene_id: int, player_msg: str | None, max_tokens: int | None = None
+    scene_id: int,
+    player_msg: str | None,
+    max_tokens: int | None = None,
+    pending: TranscriptModel | None = None,
 ) -> list[str]:
     async with session_scope() as s:
         txs: list[TranscriptModel] = await repos.get_recent_transcripts(
-            s, scene_id=scene_id, limit=15
+            s, scene_id=scene_id, limit=_TRANSCRIPT_WINDOW
         )
+    txs = with_pending_transcript(txs, pending)
     msgs = build_clerk_messages(txs, player_msg=player_msg, max_tokens=max_tokens)
     # Convert assistant/user content lines (excluding system) into facts (strings)
     facts: list[str] = []
@@ -278,6 +294,161 @@ async def _facts_from_transcripts(
     return [f for f in facts if f]
 
 
+def with_pending_transcript(
+    txs: list[TranscriptModel], pending: TranscriptModel | None
+) -> list[TranscriptModel]:
+    """Append an uncommitted transcript unless the handler already wrote it."""
+    if pending is None:
+        return txs
+    if txs:
+        last = txs[-1]
+        if (last.author, last.author_ref, last.content) == (
+            pending.author,
+            pending.author_ref,
+            pending.content,
+        ):
+            return txs
+    return [*txs, pending][-_TRANSCRIPT_WINDOW:]
+
+
+async def _retrieve_snippets(
+    scene_id: int, player_msg: str, settings: Any | None
+) -> list[ContentSnippet]:
+    """Optional retrieval augmentation (Phase 6, feature-flagged); never raises."""
+    if settings is None or getattr(settings, "retrieval", None) is None:
+        return []
+    try:
+        # Fetch campaign_id for the scene
+        async with session_scope() as s:
+            sc = await s.get(_models.Scene, scene_id)
+            if sc is None or not bool(getattr(settings.retrieval, "enabled", False)):
+                return []
+            # DI note: build_retriever(settings) constructs a retriever with its
+            # dependencies (e.g., async sessionmaker) injected. Tests can also
+            # instantiate SqlFallbackRetriever() directly with a custom sessionmaker.
+            retriever = build_retriever(settings)
+            snippets = await retriever.retrieve(
+                sc.campaign_id, player_msg, k=getattr(settings.retrieval, "top_k", 4)
+            )
+            log.info(
+                "retrieval.ok",
+                scene_id=scene_id,
+                campaign_id=sc.campaign_id,
+                count=len(snippets),
+            )
+            return snippets
+    except Exception:
+        # Non-fatal: log and proceed without retrieval
+        inc_counter("retrieval.errors")
+        log.warning("retrieval.error", scene_id=scene_id, exc_info=True)
+        return []
+
+
+async def _character_summary(provider: Callable[[], Any] | None) -> str | None:
+    if provider is None:
+        return None
+    summary = provider()
+    if inspect.isawaitable(summary):
+        summary = await summary
+    return summary
+
+
+async def _timed_stage(name: str, stage_ms: dict[str, int], aw: Awaitable[T]) -> T:
+    """Await one prefetch stage, recording ``orchestrator.prefetch.<name>_ms``."""
+    start = time.monotonic()
+    try:
+        return await aw
+    finally:
+        ms = int((time.monotonic() - start) * 1000)
+        stage_ms[name] = ms
+        observe_histogram(f"orchestrator.prefetch.{name}_ms", ms)
+
+
+def _retrieval_budget_ms(settings: Any | None) -> int:
+    retrieval_cfg = getattr(settings, "retrieval", None) if settings is not None else None
+    return int(getattr(retrieval_cfg, "budget_ms", _DEFAULT_RETRIEVAL_BUDGET_MS) or 0)
+
+
+async def build_narrator_prompt(
+    scene_id: int,
+    player_msg: str,
+    *,
+    character_summary_provider: Callable[[], Any] | None = None,
+    prompt_token_cap: int | None = None,
+    settings: Any | None = None,
+    pending: TranscriptModel | None = None,
+) -> list[dict[str, Any]]:
+    """Assemble the narrator messages for a scene and player message.
+
+    ``pending`` is a not-yet-committed player transcript to treat as the newest
+    line, so a speculative caller builds the same prompt the handler will build
+    after writing it.
+    """
+    # 0) Concurrent prefetch: transcript facts, character summary and (optional,
+    # feature-flagged) retrieval each run in their own session. Retrieval is only
+    # awaited up to the prefetch budget; when it runs late the prompt is built
+    # without it and the search finishes in the background (warming its index).
+    prefetch_start = time.monotonic()
+    stage_ms: dict[str, int] = {}
+    retrieval_task = asyncio.ensure_future(
+        _timed_stage("retrieval", stage_ms, _retrieve_snippets(scene_id, player_msg, settings))
+    )
+    done: set[asyncio.Task[list[ContentSnippet]]] = set()
+    dropped = False
+    try:
+        facts, char_summary = await asyncio.gather(
+            _timed_stage(
+                "facts",
+                stage_ms,
+                _facts_from_transcripts(
+                    scene_id, player_msg, max_tokens=prompt_token_cap, pending=pending
+                ),
+            ),
+            _timed_stage("character", stage_ms, _character_summary(character_summary_provider)),
+        )
+        budget_ms = _retrieval_budget_ms(settings)
+        remaining_s = None
+        if budget_ms:
+            remaining_s = max(0.0, budget_ms / 1000 - (time.monotonic() - prefetch_start))
+        done, _running = await asyncio.wait({retrieval_task}, timeout=remaining_s)
+        retrieval_snippets: list[ContentSnippet] = []
+        if done:
+            retrieval_snippets = retrieval_task.result()
+        else:
+            dropped = True
+            inc_counter("retrieval.dropped")
+            log.warning("retrieval.dropped", scene_id=scene_id, budget_ms=budget_ms)
+    finally:
+        if not retrieval_task.done():
+            if dropped:
+                _dropped_retrievals.add(retrieval_task)
+                retrieval_task.add_done_callback(_dropped_retrievals.discard)
+            else:
+                # The prefetch failed or was cancelled; nobody will read this result
+                retrieval_task.cancel()
+    log.info(
+        "orchestrator.prefetch.completed",
+        scene_id=scene_id,
+        duration_ms=int((time.monotonic() - prefetch_start) * 1000),
+        stages_ms=stage_ms,
+        retrieval_dropped=not done,
+    )
+
+    # 1) transcripts -> facts (clerk), augmented by retrieval player-safe text
+    if retrieval_snippets:
+        # Add retrieval snippets as facts (player-visible only)
+        facts.extend([f"[ref] {snip.title}: {snip.text}" for snip in retrieval_snippets])
+
+    # 2) narrator messages
+    return build_narrator_messages(
+        facts,
+        player_msg,
+        max_tokens=prompt_token_cap,
+        character_summary=char_summary,
+        enable_attack=bool(getattr(settings, "features_combat", False)),
+    )
+
+
 class _SheetInfo(TypedDict, total=False):
     score: int
     proficient: bool
@@ -349,11 +520,10 @@ async def run_orchestrator(
         )
         return result
 
-    if player_msg and cache_key in _prompt_cache:
-        ts, cached = _prompt_cache[cache_key]
-        if now - ts <= _CACHE_TTL:
-            log.info("orchestrator.cache.hit", scene_id=scene_id)
-            return _complete(cached, "cache_hit")
+    cached = _prompt_cache.get(cache_key) if player_msg else None
+    if cached is not None:
+        log.info("orchestrator.cache.hit", scene_id=scene_id)
+        return _complete(cached, "cache_hit")
 
     inc_counter("llm.request.enqueued")
     # Emit provider/model context if available for easier debugging
@@ -361,46 +531,12 @@ async def run_orchestrator(
     model = getattr(llm_client, "model_name", None)
     log.info("llm.request.enqueued", scene_id=scene_id, llm_provider=prov, llm_model=model)
 
-    # 0) Optional: retrieval augmentation (Phase 6, feature-flagged)
-    retrieval_snippets: list[ContentSnippet] = []
-    if settings is not None and getattr(settings, "retrieval", None) is not None:
-        try:
-            # Fetch campaign_id for the scene
-            async with session_scope() as s:
-                sc = await s.get(_models.Scene, scene_id)
-                if sc is not None and bool(getattr(settings.retrieval, "enabled", False)):
-                    # DI note: build_retriever(settings) constructs a retriever with its
-                    # dependencies (e.g., async sessionmaker) injected. Tests can also
-                    # instantiate SqlFallbackRetriever() directly with a custom sessionmaker.
-                    retriever = build_retriever(settings)
-                    retrieval_snippets = await retriever.retrieve(
-                        sc.campaign_id, player_msg, k=getattr(settings.retrieval, "top_k", 4)
-                    )
-                    log.info(
-                        "retrieval.ok",
-                        scene_id=scene_id,
-                        campaign_id=sc.campaign_id,
-                        count=len(retrieval_snippets),
-                    )
-        except Exception:
-            # Non-fatal: log and proceed without retrieval
-            inc_counter("retrieval.errors")
-            log.warning("retrieval.error", scene_id=scene_id, exc_info=True)
-
-    # 1) transcripts -> facts (clerk), augmented by retrieval player-safe text
-    facts = await _facts_from_transcripts(scene_id, player_msg, max_tokens=prompt_token_cap)
-    if retrieval_snippets:
-        # Add retrieval snippets as facts (player-visible only)
-        facts.extend([f"[ref] {snip.title}: {snip.text}" for snip in retrieval_snippets])
-
-    # 2) narrator -> JSON output
-    char_summary = character_summary_provider() if character_summary_provider else None
-    narrator_msgs = build_narrator_messages(
-        facts,
+    narrator_msgs = await build_narrator_prompt(
+        scene_id,
         player_msg,
-        max_tokens=prompt_token_cap,
-        character_summary=char_summary,
-        enable_attack=bool(getattr(settings, "features_combat", False)),
+        character_summary_provider=character_summary_provider,
+        prompt_token_cap=prompt_token_cap,
+        settings=settings,
     )
     if not llm_client:
         return _complete(
@@ -415,9 +551,7 @@ async def run_orchestrator(
     out = await llm_client.generate_json(narrator_msgs)  # type: ignore[attr-defined]
     if not out:
         inc_counter("llm.parse.failed")
-        log.warning(
-            "llm.parse.failed", scene_id=scene_id, llm_provider=prov, llm_model=model
-        )
+        log.warning("llm.parse.failed", scene_id=scene_id, llm_provider=prov, llm_model=model)
         # Map internal code to user-friendly text
         friendly = "I couldn't generate a structured preview. Try rephrasing or a simpler action."
         return _complete(
@@ -740,5 +874,5 @@ async def run_orchestrator(
     )
     inc_counter("orchestrator.format.sent")
     log.info("orchestrator.format.sent", scene_id=scene_id)
-    _prompt_cache[cache_key] = (now, final)
+    _prompt_cache.set(cache_key, final)
     return _complete(final, "success")
@@ -2,6 +2,7 @@
 
 from __future__ import annotations
 
+import hashlib
 import time
 from dataclasses import dataclass
 from typing import Any
@@ -10,8 +11,9 @@ import orjson
 import structlog
 
 from Adventorator.action_validation.schemas import Plan, plan_from_planner_output
+from Adventorator.bounded_cache import BoundedCache
 from Adventorator.command_loader import load_all_commands
-from Adventorator.commanding import all_commands
+from Adventorator.commanding import all_commands, registry_version
 from Adventorator.llm import LLMClient
 from Adventorator.llm_utils import extract_first_json
 from Adventorator.metrics import inc_counter, register_reset_plan_cache_callback
@@ -26,51 +28,30 @@ def _is_allowed(name: str) -> bool:
     return name in _ALLOWED
 
 
-# --- Simple in-process cache to suppress duplicate LLM calls for 30s ---
+# --- Bounded in-process cache to suppress duplicate LLM calls for 30s ---
 _CACHE_TTL = 30.0
+_CACHE_MAX_ENTRIES = 2048
+_CACHE_MAX_BYTES = 8 * 1024 * 1024
 
-
-@dataclass(slots=True)
-class _CacheEntry:
-    timestamp: float
-    payload: dict[str, Any]
-    schema: str = "planner_output"
-
-
-_LegacyCacheEntry = tuple[float, dict[str, Any]] | tuple[float, dict[str, Any], str]
-_plan_cache: dict[tuple[int, int, str], _CacheEntry | _LegacyCacheEntry] = {}
-
-
-def _normalize_cache_entry(
-    key: tuple[int, int, str], value: _CacheEntry | _LegacyCacheEntry
-) -> _CacheEntry:
-    if isinstance(value, _CacheEntry):
-        return value
-    # legacy tuple forms
-    if len(value) == 3:
-        ts, payload, schema = value  # type: ignore[misc]
-        entry = _CacheEntry(ts, payload, schema)  # type: ignore[arg-type]
-    elif len(value) == 2:  # type: ignore[arg-type]
-        ts, payload = value  # type: ignore[misc]
-        entry = _CacheEntry(ts, payload)  # type: ignore[arg-type]
-    else:  # pragma: no cover - defensive
-        raise ValueError("Unexpected planner cache entry")
-    _plan_cache[key] = entry
-    return entry
+# (guild_id, channel_id, message) -> (payload, schema); counters planner.cache.*
+_plan_cache: BoundedCache[tuple[int, int, str], tuple[dict[str, Any], str]] = BoundedCache(
+    "planner.cache",
+    ttl_s=_CACHE_TTL,
+    max_entries=_CACHE_MAX_ENTRIES,
+    max_bytes=_CACHE_MAX_BYTES,
+)
 
 
 def _cache_get(guild_id: int, channel_id: int, msg: str) -> tuple[dict[str, Any], str] | None:
     """Fetch a cached planner output/plan.
 
-    Key is (guild_id, channel_id, message). Instrumented with detailed events
-    to diagnose miss conditions seen in tests where a hit was expected.
+    Key is (guild_id, channel_id, message). ``planner.cache.hit|miss|expired``
+    are counted by the cache itself.
     """
     log = structlog.get_logger()
     key = (guild_id, channel_id, msg.strip())
-    now = time.time()
-    v = _plan_cache.get(key)
-    if not v:
-        inc_counter("planner.cache.miss")
+    found = _plan_cache.get_with_age(key)
+    if found is None:
         log.info(
             "planner.cache.miss",
             guild_id=guild_id,
@@ -80,42 +61,23 @@ def _cache_get(guild_id: int, channel_id: int, msg: str) -> tuple[dict[str, Any]
             cache_size=len(_plan_cache),
         )
         return None
-    entry = _normalize_cache_entry(key, v)
-    age = now - entry.timestamp
-    if age <= _CACHE_TTL:
-        inc_counter("planner.cache.hit")
-        log.info(
-            "planner.cache.hit",
-            guild_id=guild_id,
-            channel_id=channel_id,
-            msg_hash=hash(msg.strip()),
-            age_ms=int(age * 1000),
-            schema=entry.schema,
-        )
-        return entry.payload, entry.schema
-    # Expired
-    inc_counter("planner.cache.expired")
+    (payload, schema), age = found
     log.info(
-        "planner.cache.expired",
+        "planner.cache.hit",
         guild_id=guild_id,
         channel_id=channel_id,
         msg_hash=hash(msg.strip()),
         age_ms=int(age * 1000),
-        ttl_s=_CACHE_TTL,
+        schema=schema,
     )
-    # Remove stale entry to keep cache tidy
-    try:
-        del _plan_cache[key]
-    except Exception:
-        pass
-    return None
+    return payload, schema
 
 
 def _cache_put(
     guild_id: int, channel_id: int, msg: str, plan_json: dict[str, Any], *, schema: str
 ) -> None:
     key = (guild_id, channel_id, msg.strip())
-    _plan_cache[key] = _CacheEntry(time.time(), plan_json, schema)
+    _plan_cache.set(key, (plan_json, schema))
     try:
         log = structlog.get_logger()
         log.info(
@@ -141,13 +103,29 @@ def reset_plan_cache() -> None:
 register_reset_plan_cache_callback(reset_plan_cache)
 
 
-def _catalog() -> list[dict[str, Any]]:
-    # Ensure registry is populated (safe to call multiple times)
-    cmds = all_commands()
-    if not cmds:
-        load_all_commands()
-        cmds = all_commands()
+@dataclass(frozen=True, slots=True)
+class PlannerPrefix:
+    """Prebuilt, versioned planner prompt prefix.
+
+    Everything before the user's message is static between deploys: the
+    system prompt with the rules list, and the serialized tool catalog. It is
+    built once per registry version and reused byte-for-byte, which also keeps
+    it friendly to provider-side prompt prefix caching.
+    """
+
+    registry_version: int
+    catalog: tuple[dict[str, Any], ...]
+    tools_json: bytes
+    system_prompt: str
+    user_prefix: str
+    # sha256 of the full prefix, for logs and cache keys
+    version: str
 
+
+_prefix: PlannerPrefix | None = None
+
+
+def _build_catalog(cmds: dict[str, Any]) -> list[dict[str, Any]]:
     cat: list[dict[str, Any]] = []
     for cmd in cmds.values():
         name = cmd.name if not cmd.subcommand else f"{cmd.name}.{cmd.subcommand}"
@@ -166,8 +144,7 @@ def _catalog() -> list[dict[str, Any]]:
     return cat
 
 
-def build_planner_messages(user_msg: str) -> list[dict[str, Any]]:
-    tools_json = orjson.dumps(_catalog()).decode("utf-8")
+def _rules_text() -> str:
     # Dynamically enumerate available rules from the rules engine (Dnd5eRuleset)
     from Adventorator.rules.engine import Dnd5eRuleset
 
@@ -177,13 +154,60 @@ def build_planner_messages(user_msg: str) -> list[dict[str, Any]]:
         m for m in dir(ruleset) if not m.startswith("_") and callable(getattr(ruleset, m))
     ]
     rules_list = "\n".join(f"- {m}" for m in rule_methods)
-    rules_text = f"AVAILABLE RULES:\n{rules_list}\n"
+    return f"AVAILABLE RULES:\n{rules_list}\n"
+
+
+def get_planner_prefix(*, load_if_empty: bool = True) -> PlannerPrefix:
+    """Return the planner prefix, rebuilding it only when the registry changed."""
+    global _prefix
+    current = _prefix
+    if current is not None and current.registry_version == registry_version():
+        return current
+    # Ensure registry is populated (safe to call multiple times)
+    if load_if_empty and not all_commands():
+        load_all_commands()
+    version = registry_version()
+    catalog = _build_catalog(all_commands())
+    tools_json = orjson.dumps(catalog)
+    system_prompt = SYSTEM_PLANNER + "\n" + _rules_text()
+    user_prefix = "TOOLS:\n" + tools_json.decode("utf-8") + "\n\nUSER:\n"
+    digest = hashlib.sha256(
+        system_prompt.encode("utf-8") + b"\x00" + user_prefix.encode("utf-8")
+    ).hexdigest()
+    _prefix = PlannerPrefix(
+        registry_version=version,
+        catalog=tuple(catalog),
+        tools_json=tools_json,
+        system_prompt=system_prompt,
+        user_prefix=user_prefix,
+        version=digest[:16],
+    )
+    inc_counter("planner.catalog.build")
+    structlog.get_logger().info(
+        "planner.catalog.built",
+        registry_version=version,
+        tools=len(catalog),
+        prefix_version=_prefix.version,
+        tools_bytes=len(tools_json),
+    )
+    return _prefix
+
+
+def invalidate_planner_prefix() -> None:
+    """Drop the prebuilt prefix (e.g. after changing SYSTEM_PLANNER in tests)."""
+    global _prefix
+    _prefix = None
+
+
+def _catalog() -> list[dict[str, Any]]:
+    return list(get_planner_prefix().catalog)
+
+
+def build_planner_messages(user_msg: str) -> list[dict[str, Any]]:
+    prefix = get_planner_prefix()
     return [
-        {"role": "system", "content": SYSTEM_PLANNER + "\n" + rules_text},
-        {
-            "role": "user",
-            "content": f"TOOLS:\n{tools_json}\n\nUSER:\n{user_msg}",
-        },
+        {"role": "system", "content": prefix.system_prompt},
+        {"role": "user", "content": prefix.user_prefix + user_msg},
     ]
 
 
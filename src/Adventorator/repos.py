@@ -6,18 +6,25 @@ import asyncio
 import hashlib
 import json
 import time
+from collections.abc import AsyncIterator, Callable, Mapping, Sequence
+from dataclasses import dataclass
 from datetime import datetime, timedelta, timezone
-from typing import Any
+from typing import Any, cast
 
 import structlog
-from sqlalchemy import select
-from sqlalchemy.exc import IntegrityError, OperationalError
+from sqlalchemy import delete, func, or_, select, update
+from sqlalchemy import event as sa_event
+from sqlalchemy.engine import CursorResult
+from sqlalchemy.exc import DBAPIError, IntegrityError, OperationalError
 from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import Session
 
 from Adventorator import models
+from Adventorator.bounded_cache import BoundedCache
 from Adventorator.events import envelope as event_envelope
 from Adventorator.metrics import inc_counter, observe_histogram
 from Adventorator.schemas import CharacterSheet
+from Adventorator.services.lock_service import acquire_campaign_event_lock
 
 _MAX_ACTIVITY_SUMMARY_LEN = 160
 _MAX_ACTIVITY_PAYLOAD_BYTES = 4096
@@ -56,6 +63,12 @@ async def get_or_create_campaign(
     return obj
 
 
+async def get_campaign_by_guild(s: AsyncSession, guild_id: int) -> models.Campaign | None:
+    """Read-only campaign lookup (no implicit create)."""
+    q = await s.execute(select(models.Campaign).where(models.Campaign.guild_id == guild_id))
+    return q.scalar_one_or_none()
+
+
 async def get_or_create_player(
     s: AsyncSession, discord_user_id: int, display_name: str
 ) -> models.Player:
@@ -162,6 +175,97 @@ async def ensure_scene(s: AsyncSession, campaign_id: int, channel_id: int) -> mo
     return sc
 
 
+async def get_scene_by_channel(s: AsyncSession, channel_id: int) -> models.Scene | None:
+    """Read-only scene lookup (no implicit create)."""
+    q = await s.execute(select(models.Scene).where(models.Scene.channel_id == channel_id))
+    return q.scalar_one_or_none()
+
+
+# -----------------------------
+# Scene resolution cache
+# -----------------------------
+
+
+@dataclass(slots=True, frozen=True)
+class SceneRef:
+    """Resolved (campaign_id, scene_id) for a guild channel."""
+
+    campaign_id: int
+    scene_id: int
+
+
+# (guild_id, channel_id) -> SceneRef, filled by resolve_scene. Scenes are
+# created, archived (``is_active``) or deleted through the ORM, so flushes of
+# Scene/Campaign rows drop affected entries and a rollback drops them again in
+# case the resolution made inside that transaction never committed.
+_SCENE_REF_CACHE: BoundedCache[tuple[int, int], SceneRef] = BoundedCache(
+    "repos.scene_ref", ttl_s=600, max_entries=4096
+)
+_SESSION_SCENE_KEY = "adventorator.scene_ref_keys"
+
+
+async def resolve_scene(s: AsyncSession, guild_id: int, channel_id: int) -> SceneRef:
+    """``get_or_create_campaign`` + ``ensure_scene``, memoized per (guild, channel)."""
+    key = (guild_id, channel_id)
+    ref = _SCENE_REF_CACHE.get(key)
+    if ref is not None:
+        return ref
+    campaign = await get_or_create_campaign(s, guild_id)
+    scene = await ensure_scene(s, campaign.id, channel_id)
+    ref = SceneRef(campaign.id, scene.id)
+    _SCENE_REF_CACHE.set(key, ref)
+    return ref
+
+
+def invalidate_scene_refs(
+    *, guild_id: int | None = None, channel_id: int | None = None, campaign_id: int | None = None
+) -> None:
+    """Drop cached resolutions matching any given field (all when none given)."""
+    if guild_id is None and channel_id is None and campaign_id is None:
+        _SCENE_REF_CACHE.clear()
+        return
+    _SCENE_REF_CACHE.discard_where(
+        lambda key, ref: (
+            key[0] == guild_id or key[1] == channel_id or ref.campaign_id == campaign_id
+        )
+    )
+
+
+def _scene_ref_keys(session: Session) -> list[dict[str, int | None]]:
+    keys: list[dict[str, int | None]] = []
+    for obj in (*session.new, *session.dirty, *session.deleted):
+        if isinstance(obj, models.Scene):
+            keys.append({"channel_id": obj.channel_id, "campaign_id": obj.campaign_id})
+        elif isinstance(obj, models.Campaign):
+            keys.append({"guild_id": obj.guild_id, "campaign_id": obj.id})
+    return keys
+
+
+@sa_event.listens_for(Session, "before_flush")
+def _invalidate_flushed_scene_refs(session: Session, flush_context: Any, instances: Any) -> None:
+    keys = _scene_ref_keys(session)
+    for k in keys:
+        invalidate_scene_refs(**k)
+    if keys:
+        session.info.setdefault(_SESSION_SCENE_KEY, []).extend(keys)
+
+
+@sa_event.listens_for(Session, "after_commit")
+def _forget_committed_scene_refs(session: Session) -> None:
+    session.info.pop(_SESSION_SCENE_KEY, None)
+
+
+@sa_event.listens_for(Session, "after_rollback")
+def _invalidate_rolled_back_scene_refs(session: Session) -> None:
+    for k in session.info.pop(_SESSION_SCENE_KEY, ()):
+        invalidate_scene_refs(**k)
+
+
+@sa_event.listens_for(models.Scene.__table__, "after_drop")
+def _reset_scene_refs_on_drop(target: Any, connection: Any, **kw: Any) -> None:
+    invalidate_scene_refs()
+
+
 async def list_character_names(s: AsyncSession, campaign_id: int) -> list[str]:
     """Return all character names in a campaign."""
     q = await s.execute(
@@ -690,15 +794,198 @@ async def create_pending_action(
     return pa
 
 
-_EVENT_APPEND_LOCKS: dict[int, asyncio.Lock] = {}
+# -----------------------------
+# Chain tip cache
+# -----------------------------
 
 
-def _event_lock_for_campaign(campaign_id: int) -> asyncio.Lock:
-    lock = _EVENT_APPEND_LOCKS.get(campaign_id)
-    if lock is None:
-        lock = asyncio.Lock()
-        _EVENT_APPEND_LOCKS[campaign_id] = lock
-    return lock
+@dataclass(slots=True, frozen=True)
+class ChainTip:
+    """Last known ledger position for a campaign (ordinal + full envelope hash)."""
+
+    replay_ordinal: int
+    envelope_hash: bytes
+
+
+# Per-campaign chain tip of committed Event rows. Another worker may have
+# appended since a tip was cached, so resolve_next_chain_link confirms it with a
+# MAX(replay_ordinal) probe before use (cheaper than reading and re-hashing the
+# last row). Tips advanced by a session are kept in ``session.info`` until its
+# transaction commits, so other sessions never chain onto rows that may still
+# roll back.
+_CHAIN_TIP_CACHE: dict[int, ChainTip] = {}
+_SESSION_TIP_KEY = "adventorator.pending_chain_tips"
+
+
+def envelope_hash_for_event(ev: models.Event) -> bytes:
+    """Return the full envelope hash of a persisted (or flushed) Event row."""
+    return event_envelope.compute_envelope_hash(
+        campaign_id=ev.campaign_id,
+        scene_id=ev.scene_id,
+        replay_ordinal=ev.replay_ordinal,
+        event_type=ev.type,
+        event_schema_version=ev.event_schema_version,
+        world_time=ev.world_time,
+        wall_time_utc=ev.wall_time_utc,
+        prev_event_hash=ev.prev_event_hash,
+        payload_hash=ev.payload_hash,
+        idempotency_key=ev.idempotency_key,
+    )
+
+
+def get_cached_chain_tip(campaign_id: int) -> ChainTip | None:
+    return _CHAIN_TIP_CACHE.get(campaign_id)
+
+
+def invalidate_chain_tip(campaign_id: int, s: AsyncSession | None = None) -> None:
+    """Drop the cached tip so the next append re-reads it from the DB.
+
+    With a session, the tip that session advanced (not yet committed) is
+    discarded as well.
+    """
+    if s is not None:
+        _pending_chain_tips(s.sync_session).pop(campaign_id, None)
+    if _CHAIN_TIP_CACHE.pop(campaign_id, None) is not None:
+        inc_counter("events.chain_tip_cache.invalidated")
+
+
+def reset_chain_tip_cache() -> None:
+    _CHAIN_TIP_CACHE.clear()
+
+
+def _pending_chain_tips(session: Session) -> dict[int, ChainTip | None]:
+    # None marks a campaign whose tip this transaction could not track (e.g. an
+    # out-of-order insert): it is re-read from the DB and invalidated on commit.
+    pending: dict[int, ChainTip | None] = session.info.setdefault(_SESSION_TIP_KEY, {})
+    return pending
+
+
+def record_chain_tip(s: AsyncSession, campaign_id: int, tip: ChainTip) -> None:
+    """Advance the session's tip after a bulk (Core) insert the flush listener cannot see.
+
+    Like ORM inserts, the tip is published to the shared cache only on commit.
+    """
+    _pending_chain_tips(s.sync_session)[campaign_id] = tip
+
+
+async def resolve_next_chain_link(s: AsyncSession, *, campaign_id: int) -> tuple[int, bytes]:
+    """Return (next replay_ordinal, prev_event_hash) for the campaign ledger.
+
+    Callers must hold the campaign append lock. A tip this transaction already
+    advanced is used as is. A shared cached tip may predate another worker's
+    append, so it is confirmed with a cheap MAX(replay_ordinal) probe before it
+    is trusted; on a mismatch (or a miss) the last Event row is read instead.
+    """
+    pending = _pending_chain_tips(s.sync_session)
+    if pending.get(campaign_id) is not None:
+        # This transaction already appended (and holds the lock): its own tip is current
+        tip = pending[campaign_id]
+    elif campaign_id in pending:
+        tip = None
+    else:
+        tip = _CHAIN_TIP_CACHE.get(campaign_id)
+        if tip is not None:
+            q = await s.execute(
+                select(func.max(models.Event.replay_ordinal)).where(
+                    models.Event.campaign_id == campaign_id
+                )
+            )
+            if q.scalar_one_or_none() != tip.replay_ordinal:
+                inc_counter("events.chain_tip_cache.stale")
+                _CHAIN_TIP_CACHE.pop(campaign_id, None)
+                tip = None
+    if tip is not None:
+        inc_counter("events.chain_tip_cache.hit")
+        return tip.replay_ordinal + 1, tip.envelope_hash
+    inc_counter("events.chain_tip_cache.miss")
+    last_event = await s.execute(
+        select(models.Event)
+        .where(models.Event.campaign_id == campaign_id)
+        .order_by(models.Event.replay_ordinal.desc())
+        .limit(1)
+    )
+    last_event_row = last_event.scalar_one_or_none()
+    if last_event_row is None:
+        return 0, event_envelope.GENESIS_PREV_EVENT_HASH
+    # Derive full envelope hash of the prior event to strengthen chain linkage.
+    tip = ChainTip(last_event_row.replay_ordinal, envelope_hash_for_event(last_event_row))
+    # The row may be this transaction's own uncommitted insert; publish on commit
+    pending[campaign_id] = tip
+    return tip.replay_ordinal + 1, tip.envelope_hash
+
+
+@sa_event.listens_for(Session, "after_flush")
+def _advance_chain_tips(session: Session, flush_context: Any) -> None:
+    # Any Event inserted through the ORM (append_event, importer, genesis
+    # helpers) advances the session's pending tip so other append paths in the
+    # same transaction stay coherent.
+    newest: dict[int, models.Event] = {}
+    for obj in session.new:
+        if not isinstance(obj, models.Event) or obj.campaign_id is None:
+            continue
+        seen = newest.get(obj.campaign_id)
+        if seen is None or obj.replay_ordinal > seen.replay_ordinal:
+            newest[obj.campaign_id] = obj
+    if not newest:
+        return
+    pending = _pending_chain_tips(session)
+    for campaign_id, obj in newest.items():
+        known = pending.get(campaign_id) or _CHAIN_TIP_CACHE.get(campaign_id)
+        if (campaign_id in pending and pending[campaign_id] is None) or (
+            known is not None and obj.replay_ordinal <= known.replay_ordinal
+        ):
+            # Out-of-order insert (e.g. a manual backfill); let the DB decide.
+            pending[campaign_id] = None
+            continue
+        pending[campaign_id] = ChainTip(obj.replay_ordinal, envelope_hash_for_event(obj))
+
+
+@sa_event.listens_for(Session, "after_commit")
+def _publish_committed_chain_tips(session: Session) -> None:
+    for campaign_id, tip in session.info.pop(_SESSION_TIP_KEY, {}).items():
+        cached = _CHAIN_TIP_CACHE.get(campaign_id)
+        if tip is None:
+            invalidate_chain_tip(campaign_id)
+        elif cached is None or tip.replay_ordinal >= cached.replay_ordinal:
+            _CHAIN_TIP_CACHE[campaign_id] = tip
+
+
+@sa_event.listens_for(Session, "after_rollback")
+def _drop_rolled_back_chain_tips(session: Session) -> None:
+    # Pending tips never reached the DB. The shared tip is dropped too so a
+    # driver running in autocommit mode cannot leave it behind the table.
+    for campaign_id in session.info.pop(_SESSION_TIP_KEY, {}):
+        invalidate_chain_tip(campaign_id)
+
+
+@sa_event.listens_for(models.Event.__table__, "after_drop")
+def _reset_chain_tips_on_drop(target: Any, connection: Any, **kw: Any) -> None:
+    reset_chain_tip_cache()
+
+
+async def _resolve_event_scope(
+    s: AsyncSession, *, scene_id: int, actor_id: str | int | None
+) -> tuple[int, str | None]:
+    """Return (campaign_id, normalized actor) for an append targeting scene_id."""
+    scene = await s.get(models.Scene, scene_id)
+    if scene is None:
+        raise ValueError(f"Scene {scene_id} does not exist")
+    campaign_id = scene.campaign_id
+    # Normalize actor id (character name when numeric id maps to character)
+    actor_norm = await normalize_actor_ref(
+        s,
+        campaign_id=campaign_id,
+        ident=actor_id,
+    )
+    if actor_norm is None and actor_id is not None:
+        actor_norm = str(actor_id)
+    return campaign_id, actor_norm
+
+
+def _is_chain_conflict(exc: DBAPIError) -> bool:
+    """True when an Event insert lost the race for its replay_ordinal."""
+    # Unique (campaign_id, replay_ordinal) everywhere; Postgres' gap trigger raises first
+    return isinstance(exc, IntegrityError) or "events.replay_ordinal_gap" in str(exc)
 
 
 async def append_event(
@@ -715,56 +1002,22 @@ async def append_event(
 
     # Per-campaign lock map to increase parallelism across campaigns while
     # retaining deterministic intra-campaign ordering.
-    # Normalize actor id (character name when numeric id maps to character)
-    scene = await s.get(models.Scene, scene_id)
-    if scene is None:
-        raise ValueError(f"Scene {scene_id} does not exist")
-    campaign_id = scene.campaign_id
-    actor_norm = await normalize_actor_ref(
-        s,
-        campaign_id=campaign_id,
-        ident=actor_id,
-    )
-    if actor_norm is None and actor_id is not None:
-        actor_norm = str(actor_id)
+    campaign_id, actor_norm = await _resolve_event_scope(s, scene_id=scene_id, actor_id=actor_id)
     payload_dict = payload or {}
-    async with _event_lock_for_campaign(campaign_id):
-        # Determine ordinal & linkage inside lock to prevent race producing gaps
-        last_event = await s.execute(
-            select(models.Event)
-            .where(models.Event.campaign_id == campaign_id)
-            .order_by(models.Event.replay_ordinal.desc())
-            .limit(1)
-        )
-        last_event_row = last_event.scalar_one_or_none()
-        if last_event_row is None:
-            replay_ordinal = 0
-            prev_hash = event_envelope.GENESIS_PREV_EVENT_HASH
-        else:
-            replay_ordinal = last_event_row.replay_ordinal + 1
-            # Derive full envelope hash of the prior event to strengthen chain linkage.
-            prev_hash = event_envelope.compute_envelope_hash(
-                campaign_id=last_event_row.campaign_id,
-                scene_id=last_event_row.scene_id,
-                replay_ordinal=last_event_row.replay_ordinal,
-                event_type=last_event_row.type,
-                event_schema_version=last_event_row.event_schema_version,
-                world_time=last_event_row.world_time,
-                wall_time_utc=last_event_row.wall_time_utc,
-                prev_event_hash=last_event_row.prev_event_hash,
-                payload_hash=last_event_row.payload_hash,
-                idempotency_key=last_event_row.idempotency_key,
-            )
+    async with acquire_campaign_event_lock(s, campaign_id=campaign_id):
         execution_request_id = request_id or (
             f"evt-{scene_id}-{int(datetime.now(timezone.utc).timestamp() * 1000)}"
         )
-        payload_hash = event_envelope.compute_payload_hash(payload_dict)
+        canonical = event_envelope.canonicalize_payload(payload_dict)
+        payload_hash = canonical.payload_hash
+        # Determine ordinal & linkage inside lock to prevent race producing gaps
+        replay_ordinal, prev_hash = await resolve_next_chain_link(s, campaign_id=campaign_id)
         idempotency_key = event_envelope.compute_idempotency_key(
             campaign_id=campaign_id,
             event_type=type,
             execution_request_id=execution_request_id,
             plan_id=None,
-            payload=payload_dict,
+            payload=canonical,
             replay_ordinal=replay_ordinal,
         )
         ev = models.Event(
@@ -785,7 +1038,16 @@ async def append_event(
             migrator_applied_from=None,
         )
         s.add(ev)
-        await _flush_retry(s)
+        try:
+            await _flush_retry(s)
+        except DBAPIError as exc:
+            # The cached tip was behind the DB (another writer appended). The
+            # failed flush poisons this transaction, so drop the tip and let the
+            # caller retry in a fresh one; that retry re-reads the tip from the DB.
+            invalidate_chain_tip(campaign_id, s)
+            if _is_chain_conflict(exc):
+                inc_counter("events.chain_tip_cache.conflict")
+            raise
     inc_counter("events.append.ok")  # legacy naming kept
     inc_counter("events.applied")  # HR-004 new canonical counter
 
@@ -812,13 +1074,111 @@ async def append_event(
             plan_id=getattr(ev, "plan_id", None),  # If provided
             execution_request_id=execution_request_id,  # If provided
             type=type,
-            payload_hash=payload_hash.hex()[:16],
+            payload_hash=canonical.hash_prefix,
         )
     except Exception:
         pass
     return ev
 
 
+async def append_events_batch(
+    s: AsyncSession,
+    *,
+    scene_id: int,
+    actor_id: str | int | None,
+    events: Sequence[Mapping[str, Any]],
+    request_id: str | None = None,
+) -> list[models.Event]:
+    """Append several events to one scene's campaign ledger with a single flush.
+
+    Each item is a mapping with ``type`` and optional ``payload`` (the shape of
+    executor ``predicted_events``). The campaign lock is taken once, ordinals
+    are assigned consecutively and each event's ``prev_event_hash`` is chained
+    in memory from the envelope hash of the one before it.
+    """
+    if not events:
+        return []
+    start_time_ms = time.time() * 1000
+    campaign_id, actor_norm = await _resolve_event_scope(s, scene_id=scene_id, actor_id=actor_id)
+    execution_request_id = request_id or (
+        f"evt-{scene_id}-{int(datetime.now(timezone.utc).timestamp() * 1000)}"
+    )
+    rows: list[models.Event] = []
+    async with acquire_campaign_event_lock(s, campaign_id=campaign_id):
+        replay_ordinal, prev_hash = await resolve_next_chain_link(s, campaign_id=campaign_id)
+        first_ordinal = replay_ordinal
+        for item in events:
+            ev_type = str(item["type"])
+            payload_dict = dict(item.get("payload") or {})
+            canonical = event_envelope.canonicalize_payload(payload_dict)
+            payload_hash = canonical.payload_hash
+            idempotency_key = event_envelope.compute_idempotency_key(
+                campaign_id=campaign_id,
+                event_type=ev_type,
+                execution_request_id=execution_request_id,
+                plan_id=None,
+                payload=canonical,
+                replay_ordinal=replay_ordinal,
+            )
+            ev = models.Event(
+                campaign_id=campaign_id,
+                scene_id=scene_id,
+                replay_ordinal=replay_ordinal,
+                actor_id=actor_norm,
+                type=ev_type,
+                event_schema_version=event_envelope.GENESIS_SCHEMA_VERSION,
+                world_time=replay_ordinal,
+                # Set explicitly so the next event can chain to this envelope pre-flush
+                wall_time_utc=datetime.now(timezone.utc),
+                prev_event_hash=prev_hash,
+                payload_hash=payload_hash,
+                idempotency_key=idempotency_key,
+                plan_id=None,
+                execution_request_id=execution_request_id,
+                approved_by=None,
+                payload=payload_dict,
+                migrator_applied_from=None,
+            )
+            rows.append(ev)
+            prev_hash = envelope_hash_for_event(ev)
+            replay_ordinal += 1
+        s.add_all(rows)
+        try:
+            await _flush_retry(s)
+        except DBAPIError as exc:
+            # Same recovery as append_event: the next attempt re-resolves from the DB
+            invalidate_chain_tip(campaign_id, s)
+            if _is_chain_conflict(exc):
+                inc_counter("events.chain_tip_cache.conflict")
+            raise
+    inc_counter("events.append.ok", len(rows))  # legacy naming kept
+    inc_counter("events.applied", len(rows))
+    inc_counter("events.append.batch")
+    latency_ms = int(time.time() * 1000 - start_time_ms)
+    observe_histogram("event.apply_batch.latency_ms", latency_ms)
+    observe_histogram("event.apply_batch.size", len(rows), buckets=[1, 2, 5, 10, 20, 50, 100])
+
+    try:  # Best-effort: logging must not break persistence path
+        from Adventorator.action_validation.logging_utils import (
+            log_event as _log_event,
+        )  # lazy import
+
+        _log_event(
+            "events",
+            "appended_batch",
+            campaign_id=campaign_id,
+            scene_id=scene_id,
+            count=len(rows),
+            first_replay_ordinal=first_ordinal,
+            last_replay_ordinal=rows[-1].replay_ordinal,
+            execution_request_id=execution_request_id,
+            types=[ev.type for ev in rows],
+        )
+    except Exception:
+        pass
+    return rows
+
+
 async def get_campaign_events_for_verification(
     s: AsyncSession, *, campaign_id: int
 ) -> list[models.Event]:
@@ -840,6 +1200,119 @@ async def get_campaign_events_for_verification(
     return list(result.scalars().all())
 
 
+# Envelope columns only: hash verification never needs the payload JSON. The order
+# matches the row tuples accepted by events.envelope.compute_envelope_hashes.
+_CHAIN_VERIFY_COLUMNS = (
+    models.Event.campaign_id,
+    models.Event.scene_id,
+    models.Event.replay_ordinal,
+    models.Event.type,
+    models.Event.event_schema_version,
+    models.Event.world_time,
+    models.Event.wall_time_utc,
+    models.Event.prev_event_hash,
+    models.Event.payload_hash,
+    models.Event.idempotency_key,
+)
+
+
+@dataclass(slots=True, frozen=True)
+class ChainVerifyProgress:
+    campaign_id: int
+    verified_count: int
+    last_ordinal: int
+    elapsed_s: float
+
+    @property
+    def events_per_sec(self) -> float:
+        return self.verified_count / self.elapsed_s if self.elapsed_s > 0 else 0.0
+
+
+async def iter_campaign_envelopes(
+    s: AsyncSession, *, campaign_id: int, after_ordinal: int = -1, page_size: int = 5000
+) -> AsyncIterator[Sequence[Any]]:
+    """Yield pages of envelope-only rows for a campaign in replay order (keyset paged)."""
+    cursor = after_ordinal
+    while True:
+        q = await s.execute(
+            select(*_CHAIN_VERIFY_COLUMNS)
+            .where(models.Event.campaign_id == campaign_id, models.Event.replay_ordinal > cursor)
+            .order_by(models.Event.replay_ordinal.asc())
+            .limit(page_size)
+        )
+        page = q.all()
+        if not page:
+            return
+        yield page
+        if len(page) < page_size:
+            return
+        cursor = page[-1].replay_ordinal
+
+
+async def verify_campaign_chain_streaming(
+    s: AsyncSession,
+    *,
+    campaign_id: int,
+    resume_from: ChainTip | None = None,
+    page_size: int = 5000,
+    on_progress: Callable[[ChainVerifyProgress], None] | None = None,
+) -> dict[str, Any]:
+    """Verify a campaign's hash chain page by page without loading it all.
+
+    Only the running previous hash is kept between pages, and rows carry the
+    envelope columns only. ``resume_from`` is a previously verified
+    checkpoint (the ``checkpoint`` of an earlier result); verification then
+    starts at the following ordinal. ``on_progress`` is called after each page.
+
+    Returns a summary with ``verified_count``, ``last_ordinal``, ``gaps``,
+    ``elapsed_ms``, ``events_per_sec`` and a ``checkpoint`` ChainTip that can
+    be passed back as ``resume_from``.
+
+    Raises:
+        HashChainMismatchError: When a hash mismatch is detected
+    """
+    start = time.perf_counter()
+    if resume_from is None:
+        verifier = event_envelope.ChainVerifier()
+        checkpoint = None
+    else:
+        verifier = event_envelope.ChainVerifier(
+            after_ordinal=resume_from.replay_ordinal, prev_hash=resume_from.envelope_hash
+        )
+        checkpoint = resume_from
+    async for page in iter_campaign_envelopes(
+        s,
+        campaign_id=campaign_id,
+        after_ordinal=verifier.next_ordinal - 1,
+        page_size=page_size,
+    ):
+        for row in page:
+            envelope_hash = verifier.feed(row)
+        checkpoint = ChainTip(page[-1].replay_ordinal, envelope_hash)
+        if on_progress is not None:
+            on_progress(
+                ChainVerifyProgress(
+                    campaign_id=campaign_id,
+                    verified_count=verifier.verified_count,
+                    last_ordinal=checkpoint.replay_ordinal,
+                    elapsed_s=time.perf_counter() - start,
+                )
+            )
+    elapsed_s = time.perf_counter() - start
+    inc_counter("events.verify.streamed", verifier.verified_count)
+    observe_histogram("events.verify.duration_ms", int(elapsed_s * 1000))
+    return {
+        "status": "success",
+        "campaign_id": campaign_id,
+        "verified_count": verifier.verified_count,
+        "last_ordinal": checkpoint.replay_ordinal if checkpoint is not None else None,
+        "gaps": list(verifier.gaps),
+        "elapsed_ms": int(elapsed_s * 1000),
+        "events_per_sec": (verifier.verified_count / elapsed_s) if elapsed_s > 0 else 0.0,
+        "checkpoint": checkpoint,
+    }
+
+
 async def get_chain_tip(s: AsyncSession, *, campaign_id: int) -> tuple[int, bytes] | None:
     """Get the chain tip for a campaign (last replay_ordinal, payload_hash).
 
@@ -986,6 +1459,20 @@ async def list_events(
     return list(q.scalars().all())
 
 
+def apply_hp_event(hp: dict[str, int], ev: models.Event) -> None:
+    """Apply one event to an HP delta state (see fold_hp_view)."""
+    if ev.type == "apply_damage":
+        target = str(ev.payload.get("target"))
+        amt = int(ev.payload.get("amount", 0))
+        if target:
+            hp[target] = hp.get(target, 0) - amt
+    elif ev.type == "heal":
+        target = str(ev.payload.get("target"))
+        amt = int(ev.payload.get("amount", 0))
+        if target:
+            hp[target] = hp.get(target, 0) + amt
+
+
 def fold_hp_view(events: list[models.Event]) -> dict[str, int]:
     """Very small example fold: derive HP deltas per actor.
 
@@ -994,19 +1481,53 @@ def fold_hp_view(events: list[models.Event]) -> dict[str, int]:
     """
     hp: dict[str, int] = {}
     for ev in events:
-        if ev.type == "apply_damage":
-            target = str(ev.payload.get("target"))
-            amt = int(ev.payload.get("amount", 0))
-            if target:
-                hp[target] = hp.get(target, 0) - amt
-        elif ev.type == "heal":
-            target = str(ev.payload.get("target"))
-            amt = int(ev.payload.get("amount", 0))
-            if target:
-                hp[target] = hp.get(target, 0) + amt
+        apply_hp_event(hp, ev)
     return hp
 
 
+def apply_conditions_event(
+    out: dict[str, dict[str, dict[str, int | None]]], ev: models.Event
+) -> None:
+    """Apply one event to a conditions state (see fold_conditions_view)."""
+    et = ev.type
+    if et == "condition.applied":
+        target = str(ev.payload.get("target"))
+        cond = str(ev.payload.get("condition"))
+        dur = ev.payload.get("duration")
+        try:
+            dur_i = int(dur) if dur is not None else None
+        except Exception:
+            dur_i = None
+        if not target or not cond:
+            return
+        tgt = out.setdefault(target, {})
+        slot = tgt.setdefault(cond, {"stacks": 0, "duration": None})
+        prev = slot.get("stacks")
+        prev_int = prev if isinstance(prev, int) else 0
+        slot["stacks"] = prev_int + 1
+        slot["duration"] = dur_i if dur_i is not None else slot.get("duration", None)
+    elif et == "condition.removed":
+        target = str(ev.payload.get("target"))
+        cond = str(ev.payload.get("condition"))
+        if not target or not cond:
+            return
+        tgt = out.setdefault(target, {})
+        slot = tgt.setdefault(cond, {"stacks": 0, "duration": None})
+        prev = slot.get("stacks")
+        prev_int = prev if isinstance(prev, int) else 0
+        slot["stacks"] = max(0, prev_int - 1)
+        # Do not change duration on removal; stacks reaching 0 indicates inactive
+    elif et == "condition.cleared":
+        target = str(ev.payload.get("target"))
+        cond = str(ev.payload.get("condition"))
+        if not target or not cond:
+            return
+        tgt = out.setdefault(target, {})
+        slot = tgt.setdefault(cond, {"stacks": 0, "duration": None})
+        slot["stacks"] = 0
+        slot["duration"] = None
+
+
 def fold_conditions_view(events: list[models.Event]) -> dict[str, dict[str, dict[str, int | None]]]:
     """Fold conditions per target: {target: {condition: {"stacks": int, "duration": int|None}}}.
 
@@ -1020,46 +1541,53 @@ def fold_conditions_view(events: list[models.Event]) -> dict[str, dict[str, dict
     """
     out: dict[str, dict[str, dict[str, int | None]]] = {}
     for ev in events:
-        et = ev.type
-        if et == "condition.applied":
-            target = str(ev.payload.get("target"))
-            cond = str(ev.payload.get("condition"))
-            dur = ev.payload.get("duration")
-            try:
-                dur_i = int(dur) if dur is not None else None
-            except Exception:
-                dur_i = None
-            if not target or not cond:
-                continue
-            tgt = out.setdefault(target, {})
-            slot = tgt.setdefault(cond, {"stacks": 0, "duration": None})
-            prev = slot.get("stacks")
-            prev_int = prev if isinstance(prev, int) else 0
-            slot["stacks"] = prev_int + 1
-            slot["duration"] = dur_i if dur_i is not None else slot.get("duration", None)
-        elif et == "condition.removed":
-            target = str(ev.payload.get("target"))
-            cond = str(ev.payload.get("condition"))
-            if not target or not cond:
-                continue
-            tgt = out.setdefault(target, {})
-            slot = tgt.setdefault(cond, {"stacks": 0, "duration": None})
-            prev = slot.get("stacks")
-            prev_int = prev if isinstance(prev, int) else 0
-            slot["stacks"] = max(0, prev_int - 1)
-            # Do not change duration on removal; stacks reaching 0 indicates inactive
-        elif et == "condition.cleared":
-            target = str(ev.payload.get("target"))
-            cond = str(ev.payload.get("condition"))
-            if not target or not cond:
-                continue
-            tgt = out.setdefault(target, {})
-            slot = tgt.setdefault(cond, {"stacks": 0, "duration": None})
-            slot["stacks"] = 0
-            slot["duration"] = None
+        apply_conditions_event(out, ev)
     return out
 
 
+def _coerce_init(raw: Any) -> int:
+    if isinstance(raw, int):
+        return raw
+    if isinstance(raw, str):
+        try:
+            return int(raw)
+        except Exception:
+            return 0
+    return 0
+
+
+def apply_initiative_event(order: dict[str, int], ev: models.Event) -> None:
+    """Apply one event to an unsorted initiative map (see fold_initiative_view)."""
+    if ev.type == "initiative.set":
+        try:
+            arr = ev.payload.get("order") or []
+            if isinstance(arr, list):
+                order.clear()
+                for ent in arr:
+                    cid = str((ent or {}).get("id", ""))
+                    init = _coerce_init((ent or {}).get("init", 0))
+                    if cid:
+                        order[cid] = init
+        except Exception:
+            return
+    elif ev.type == "initiative.update":
+        cid = str(ev.payload.get("id", ""))
+        if cid:
+            order[cid] = _coerce_init(ev.payload.get("init", 0))
+    elif ev.type == "initiative.remove":
+        cid = str(ev.payload.get("id", ""))
+        if cid and cid in order:
+            try:
+                del order[cid]
+            except KeyError:
+                pass
+
+
+def initiative_order(order: dict[str, int]) -> list[tuple[str, int]]:
+    # sort by descending init then id for stability
+    return sorted(order.items(), key=lambda kv: (-kv[1], kv[0]))
+
+
 def fold_initiative_view(events: list[models.Event]) -> list[tuple[str, int]]:
     """Fold a simple initiative order from events.
 
@@ -1071,46 +1599,328 @@ def fold_initiative_view(events: list[models.Event]) -> list[tuple[str, int]]:
     """
     order: dict[str, int] = {}
     for ev in events:
-        if ev.type == "initiative.set":
-            try:
-                arr = ev.payload.get("order") or []
-                if isinstance(arr, list):
-                    order.clear()
-                    for ent in arr:
-                        cid = str((ent or {}).get("id", ""))
-                        raw_init = (ent or {}).get("init", 0)
-                        if isinstance(raw_init, int):
-                            init = raw_init
-                        elif isinstance(raw_init, str):
-                            try:
-                                init = int(raw_init)
-                            except Exception:
-                                init = 0
-                        else:
-                            init = 0
-                        if cid:
-                            order[cid] = init
-            except Exception:
-                continue
-        elif ev.type == "initiative.update":
-            cid = str(ev.payload.get("id", ""))
-            if cid:
-                raw_init2 = ev.payload.get("init", 0)
-                if isinstance(raw_init2, int):
-                    order[cid] = raw_init2
-                elif isinstance(raw_init2, str):
-                    try:
-                        order[cid] = int(raw_init2)
-                    except Exception:
-                        order[cid] = 0
-                else:
-                    order[cid] = 0
-        elif ev.type == "initiative.remove":
-            cid = str(ev.payload.get("id", ""))
-            if cid and cid in order:
-                try:
-                    del order[cid]
-                except KeyError:
-                    pass
-    # sort by descending init then id for stability
-    return sorted(order.items(), key=lambda kv: (-kv[1], kv[0]))
+        apply_initiative_event(order, ev)
+    return initiative_order(order)
+
+
+# -----------------------------
+# Fold checkpoints (incremental projections)
+# -----------------------------
+
+
+@dataclass(slots=True, frozen=True)
+class FoldSpec:
+    """How to fold one view: per-event step over a JSON-safe state, then render."""
+
+    apply: Callable[[Any, models.Event], None]
+    render: Callable[[Any], Any]
+
+
+FOLD_VIEWS: dict[str, FoldSpec] = {
+    "hp": FoldSpec(apply=apply_hp_event, render=dict),
+    "conditions": FoldSpec(apply=apply_conditions_event, render=lambda st: st),
+    "initiative": FoldSpec(apply=apply_initiative_event, render=initiative_order),
+}
+
+_FOLD_PAGE_SIZE = 500
+
+
+async def iter_scene_events(
+    s: AsyncSession, *, scene_id: int, after_ordinal: int = -1, page_size: int = _FOLD_PAGE_SIZE
+) -> AsyncIterator[list[models.Event]]:
+    """Yield a scene's events in replay order, keyset-paged after ``after_ordinal``.
+
+    Unlike list_events this is not capped; each page is at most ``page_size``.
+    """
+    cursor = after_ordinal
+    while True:
+        q = await s.execute(
+            select(models.Event)
+            .where(models.Event.scene_id == scene_id, models.Event.replay_ordinal > cursor)
+            .order_by(models.Event.replay_ordinal.asc())
+            .limit(page_size)
+        )
+        page = list(q.scalars().all())
+        if not page:
+            return
+        yield page
+        if len(page) < page_size:
+            return
+        cursor = page[-1].replay_ordinal
+
+
+async def _fold_events(
+    s: AsyncSession, *, scene_id: int, spec: FoldSpec, state: Any, after_ordinal: int
+) -> tuple[Any, int, int]:
+    """Fold events after ``after_ordinal`` into state; return (state, last_ordinal, applied)."""
+    last = after_ordinal
+    applied = 0
+    async for page in iter_scene_events(s, scene_id=scene_id, after_ordinal=after_ordinal):
+        for ev in page:
+            spec.apply(state, ev)
+        last = page[-1].replay_ordinal
+        applied += len(page)
+    return state, last, applied
+
+
+async def _get_fold_checkpoint(
+    s: AsyncSession, *, scene_id: int, view: str
+) -> models.FoldCheckpoint | None:
+    q = await s.execute(
+        select(models.FoldCheckpoint).where(
+            models.FoldCheckpoint.scene_id == scene_id, models.FoldCheckpoint.view == view
+        )
+    )
+    return q.scalar_one_or_none()
+
+
+async def _store_fold_checkpoint(
+    s: AsyncSession,
+    cp: models.FoldCheckpoint | None,
+    *,
+    scene_id: int,
+    view: str,
+    state: Any,
+    replay_ordinal: int,
+    event_count: int,
+) -> None:
+    # Assign a fresh JSON document so the ORM sees the change.
+    doc = json.loads(json.dumps(state))
+    if cp is None:
+        s.add(
+            models.FoldCheckpoint(
+                scene_id=scene_id,
+                view=view,
+                replay_ordinal=replay_ordinal,
+                event_count=event_count,
+                state=doc,
+            )
+        )
+    else:
+        cp.state = doc
+        cp.replay_ordinal = replay_ordinal
+        cp.event_count = event_count
+        cp.updated_at = datetime.now(timezone.utc)
+    await _flush_retry(s)
+
+
+async def _fold_from_checkpoint(
+    s: AsyncSession, *, scene_id: int, view: str
+) -> tuple[models.FoldCheckpoint | None, Any, int, int]:
+    """Fold events newer than the stored checkpoint onto a copy of its state.
+
+    Returns (checkpoint, state, last_ordinal, applied); nothing is written.
+    """
+    spec = FOLD_VIEWS[view]
+    cp = await _get_fold_checkpoint(s, scene_id=scene_id, view=view)
+    state: Any = {} if cp is None else json.loads(json.dumps(cp.state))
+    after = -1 if cp is None else cp.replay_ordinal
+    state, last, applied = await _fold_events(
+        s, scene_id=scene_id, spec=spec, state=state, after_ordinal=after
+    )
+    return cp, state, last, applied
+
+
+async def get_fold_view(s: AsyncSession, *, scene_id: int, view: str) -> Any:
+    """Return a fold view for a scene using its checkpoint plus newer events.
+
+    Only events with replay_ordinal greater than the stored checkpoint are
+    read and applied; the checkpoint is advanced when anything new was folded.
+    ``view`` is one of FOLD_VIEWS ("hp", "conditions", "initiative").
+    """
+    spec = FOLD_VIEWS[view]
+    cp, state, last, applied = await _fold_from_checkpoint(s, scene_id=scene_id, view=view)
+    inc_counter("folds.checkpoint.miss" if cp is None else "folds.checkpoint.hit")
+    count = 0 if cp is None else cp.event_count
+    if applied:
+        inc_counter("folds.events_applied", applied)
+        await _store_fold_checkpoint(
+            s,
+            cp,
+            scene_id=scene_id,
+            view=view,
+            state=state,
+            replay_ordinal=last,
+            event_count=count + applied,
+        )
+    return spec.render(state)
+
+
+async def replay_fold_view(s: AsyncSession, *, scene_id: int, view: str) -> Any:
+    """Fold a view from scratch over every scene event, ignoring checkpoints."""
+    spec = FOLD_VIEWS[view]
+    state, _, _ = await _fold_events(s, scene_id=scene_id, spec=spec, state={}, after_ordinal=-1)
+    return spec.render(state)
+
+
+async def rebuild_fold_checkpoints(
+    s: AsyncSession, *, scene_id: int, views: Sequence[str] | None = None
+) -> dict[str, int]:
+    """Recompute checkpoints for a scene from a full replay.
+
+    Returns a mapping of view -> number of events folded.
+    """
+    out: dict[str, int] = {}
+    for view in views or list(FOLD_VIEWS):
+        spec = FOLD_VIEWS[view]
+        state, last, applied = await _fold_events(
+            s, scene_id=scene_id, spec=spec, state={}, after_ordinal=-1
+        )
+        cp = await _get_fold_checkpoint(s, scene_id=scene_id, view=view)
+        await _store_fold_checkpoint(
+            s,
+            cp,
+            scene_id=scene_id,
+            view=view,
+            state=state,
+            replay_ordinal=last,
+            event_count=applied,
+        )
+        inc_counter("folds.checkpoint.rebuilt")
+        out[view] = applied
+    return out
+
+
+async def verify_fold_checkpoint(s: AsyncSession, *, scene_id: int, view: str) -> bool:
+    """Check the incremental (checkpoint-backed) view equals a full replay.
+
+    Read-only: the checkpoint is neither advanced nor rewritten.
+    """
+    spec = FOLD_VIEWS[view]
+    _cp, state, _last, _applied = await _fold_from_checkpoint(s, scene_id=scene_id, view=view)
+    incremental = spec.render(state)
+    full = await replay_fold_view(s, scene_id=scene_id, view=view)
+    if incremental == full:
+        inc_counter("folds.verify.ok")
+        return True
+    inc_counter("folds.verify.mismatch")
+    structlog.get_logger("folds").warning("folds.verify.mismatch", scene_id=scene_id, view=view)
+    return False
+
+
+# -----------------------------
+# Durable command jobs
+# -----------------------------
+
+
+# Terminal states; rows in these states are pruned after a retention period
+COMMAND_JOB_FINISHED = ("done", "failed", "expired", "interrupted")
+
+
+async def create_command_job(
+    s: AsyncSession,
+    *,
+    kind: str,
+    job_key: str,
+    payload: dict[str, Any],
+    owner: str | None = None,
+    lease_seconds: float = 60.0,
+) -> models.CommandJob:
+    job = models.CommandJob(kind=kind, job_key=job_key, payload=payload, status="queued")
+    if owner is not None:
+        job.owner = owner
+        job.lease_expires_at = datetime.now(timezone.utc) + timedelta(seconds=lease_seconds)
+    s.add(job)
+    await _flush_retry(s)
+    return job
+
+
+async def update_command_job_status(
+    s: AsyncSession, job_id: int, status: str, *, attempt: bool = False
+) -> None:
+    job = await s.get(models.CommandJob, job_id)
+    if job is None:
+        return
+    job.status = status
+    job.updated_at = datetime.now(timezone.utc)
+    if attempt:
+        job.attempts = (job.attempts or 0) + 1
+    await _flush_retry(s)
+
+
+async def renew_command_job_leases(s: AsyncSession, *, owner: str, lease_seconds: float) -> int:
+    """Extend the lease on every unfinished job held by ``owner`` (runner heartbeat)."""
+    res = await s.execute(
+        update(models.CommandJob)
+        .where(models.CommandJob.owner == owner)
+        .where(models.CommandJob.status.in_(("queued", "running")))
+        .values(lease_expires_at=datetime.now(timezone.utc) + timedelta(seconds=lease_seconds))
+    )
+    # DML statements return a CursorResult; Session.execute is typed as plain Result
+    return int(cast(CursorResult[Any], res).rowcount or 0)
+
+
+async def release_command_job_leases(s: AsyncSession, *, owner: str) -> None:
+    """Hand back a stopping runner's jobs.
+
+    Jobs that never started become claimable at once; jobs cut off mid-run are
+    marked ``interrupted`` because command handlers are not idempotent.
+    """
+    now = datetime.now(timezone.utc)
+    base = update(models.CommandJob).where(models.CommandJob.owner == owner)
+    await s.execute(
+        base.where(models.CommandJob.status == "queued").values(owner=None, lease_expires_at=None)
+    )
+    await s.execute(
+        base.where(models.CommandJob.status == "running").values(
+            status="interrupted", updated_at=now
+        )
+    )
+
+
+async def claim_resumable_command_jobs(
+    s: AsyncSession,
+    *,
+    owner: str,
+    max_age_seconds: float,
+    max_attempts: int = 3,
+    lease_seconds: float = 60.0,
+) -> list[models.CommandJob]:
+    """Claim unfinished jobs whose lease has lapsed (oldest first) for ``owner``.
+
+    Jobs held by a live runner are skipped, as are rows another claimant has
+    locked (``FOR UPDATE SKIP LOCKED``; SQLite has a single writer anyway).
+    Queued jobs young enough to resume are claimed; stale ones are expired.
+    Jobs left ``running`` are marked ``interrupted`` rather than replayed.
+    """
+    now = datetime.now(timezone.utc)
+    q = await s.execute(
+        select(models.CommandJob)
+        .where(models.CommandJob.status.in_(("queued", "running")))
+        .where(
+            or_(
+                models.CommandJob.lease_expires_at.is_(None),
+                models.CommandJob.lease_expires_at < now,
+            )
+        )
+        .order_by(models.CommandJob.id)
+        .with_for_update(skip_locked=True)
+    )
+    cutoff = now - timedelta(seconds=max_age_seconds)
+    resumable: list[models.CommandJob] = []
+    for job in q.scalars().all():
+        created = job.created_at
+        if created is not None and created.tzinfo is None:
+            created = created.replace(tzinfo=timezone.utc)  # SQLite drops tzinfo
+        job.updated_at = now
+        if job.status == "running":
+            job.status = "interrupted"
+        elif (created is not None and created < cutoff) or (job.attempts or 0) >= max_attempts:
+            job.status = "expired"
+        else:
+            job.owner = owner
+            job.lease_expires_at = now + timedelta(seconds=lease_seconds)
+            resumable.append(job)
+    await _flush_retry(s)
+    return resumable
+
+
+async def prune_command_jobs(s: AsyncSession, *, older_than_seconds: float) -> int:
+    """Delete finished jobs last touched more than ``older_than_seconds`` ago."""
+    cutoff = datetime.now(timezone.utc) - timedelta(seconds=older_than_seconds)
+    res = await s.execute(
+        delete(models.CommandJob)
+        .where(models.CommandJob.status.in_(COMMAND_JOB_FINISHED))
+        .where(models.CommandJob.updated_at < cutoff)
+    )
+    return int(cast(CursorResult[Any], res).rowcount or 0)
@@ -1,15 +1,30 @@
+import asyncio
+import importlib.util
+import time
+from dataclasses import dataclass
+from typing import Any
+
 import httpx
 import orjson
 import structlog
 from fastapi import Response
 
+from Adventorator.bounded_cache import BoundedCache
 from Adventorator.config import Settings
+from Adventorator.metrics import inc_counter
+
+# HTTP/2 needs the optional ``h2`` package (``httpx[http2]``)
+_HTTP2 = importlib.util.find_spec("h2") is not None
 
 __all__ = [
     "orjson_response",
     "respond_pong",
     "respond_deferred",
     "followup_message",
+    "DiscordWebhookClient",
+    "start_webhook_client",
+    "close_webhook_client",
+    "get_webhook_client",
 ]
 
 
@@ -25,6 +40,162 @@ def respond_deferred() -> Response:
     return orjson_response({"type": 5})
 
 
+# Interaction tokens (and so follow-up routes) are only valid for 15 minutes
+_ROUTE_TTL_S = 15 * 60.0
+_MAX_ROUTES = 4096
+
+
+@dataclass
+class _Bucket:
+    remaining: int = 1
+    reset_at: float = 0.0  # monotonic
+
+
+class DiscordWebhookClient:
+    """Pooled keep-alive client for Discord webhook follow-ups.
+
+    One ``httpx.AsyncClient`` (HTTP/2 when ``h2`` is installed) is shared by
+    every follow-up. Rate-limit headers are tracked per route and per Discord
+    bucket: a request to an exhausted bucket waits for its reset, and a 429
+    is retried up to ``max_retries`` times after ``retry_after`` (a longer
+    wait is returned to the caller as the 429 response). Both maps are
+    ``BoundedCache``s that forget a route or bucket 15 minutes after its last
+    response, so per-interaction routes do not accumulate.
+    """
+
+    def __init__(
+        self,
+        *,
+        timeout: float = 20.0,
+        max_connections: int = 20,
+        max_keepalive_connections: int = 10,
+        keepalive_expiry: float = 30.0,
+        max_retries: int = 3,
+        max_retry_after_s: float = 10.0,
+        transport: httpx.AsyncBaseTransport | None = None,
+    ) -> None:
+        self._client = httpx.AsyncClient(
+            timeout=timeout,
+            limits=httpx.Limits(
+                max_connections=max_connections,
+                max_keepalive_connections=max_keepalive_connections,
+                keepalive_expiry=keepalive_expiry,
+            ),
+            http2=_HTTP2,
+            transport=transport,
+        )
+        self.max_retries = max_retries
+        self.max_retry_after_s = max_retry_after_s
+        self._route_buckets: BoundedCache[str, str] = BoundedCache(
+            "discord.webhook.routes", ttl_s=_ROUTE_TTL_S, max_entries=_MAX_ROUTES
+        )
+        self._buckets: BoundedCache[str, _Bucket] = BoundedCache(
+            "discord.webhook.buckets", ttl_s=_ROUTE_TTL_S, max_entries=_MAX_ROUTES
+        )
+        self._global_reset_at = 0.0
+        self._loop = asyncio.get_running_loop()
+
+    @property
+    def closed(self) -> bool:
+        return self._client.is_closed
+
+    async def post(self, url: str, *, route: str, **kwargs: Any) -> httpx.Response:
+        """POST ``url`` honoring rate limits; ``route`` identifies the bucket (e.g. webhook)."""
+        attempt = 0
+        while True:
+            await self._wait_for_bucket(route)
+            r = await self._client.post(url, **kwargs)
+            self._record(route, r)
+            if r.status_code != 429:
+                return r
+            retry_after = self._retry_after(r)
+            inc_counter("discord.webhook.rate_limited")
+            if attempt >= self.max_retries or retry_after > self.max_retry_after_s:
+                return r
+            attempt += 1
+            inc_counter("discord.webhook.retry")
+            structlog.get_logger().warning(
+                "discord.webhook.retry", route=route, attempt=attempt, retry_after=retry_after
+            )
+            await asyncio.sleep(retry_after)
+
+    async def aclose(self) -> None:
+        await self._client.aclose()
+
+    async def _wait_for_bucket(self, route: str) -> None:
+        now = time.monotonic()
+        wait = self._global_reset_at - now
+        bucket_id = self._route_buckets.get(route)
+        bucket = self._buckets.get(bucket_id) if bucket_id else None
+        if bucket is not None and bucket.remaining <= 0:
+            wait = max(wait, bucket.reset_at - now)
+        if wait > 0:
+            inc_counter("discord.webhook.bucket_wait")
+            await asyncio.sleep(min(wait, self.max_retry_after_s))
+            if bucket is not None:
+                bucket.remaining = 1  # the window has reset; headers refresh it
+
+    def _record(self, route: str, r: httpx.Response) -> None:
+        headers = r.headers
+        if r.status_code == 429 and headers.get("X-RateLimit-Global"):
+            self._global_reset_at = time.monotonic() + self._retry_after(r)
+        bucket_id = headers.get("X-RateLimit-Bucket")
+        if not bucket_id:
+            return
+        self._route_buckets.set(route, bucket_id)
+        bucket = self._buckets.get(bucket_id) or _Bucket()
+        self._buckets.set(bucket_id, bucket)
+        try:
+            bucket.remaining = int(headers.get("X-RateLimit-Remaining", bucket.remaining))
+            reset_after = float(headers.get("X-RateLimit-Reset-After", 0) or 0)
+        except ValueError:
+            return
+        bucket.reset_at = time.monotonic() + reset_after
+
+    @staticmethod
+    def _retry_after(r: httpx.Response) -> float:
+        try:
+            return float(r.json().get("retry_after"))
+        except Exception:
+            pass
+        try:
+            return float(r.headers.get("Retry-After") or 1.0)
+        except ValueError:
+            return 1.0
+
+
+_webhook_client: DiscordWebhookClient | None = None
+
+
+def start_webhook_client(**kwargs: Any) -> DiscordWebhookClient:
+    """Create the shared follow-up client (called from app startup)."""
+    global _webhook_client
+    if _webhook_client is None or _webhook_client.closed:
+        _webhook_client = DiscordWebhookClient(**kwargs)
+    return _webhook_client
+
+
+def get_webhook_client() -> DiscordWebhookClient:
+    """Shared client; created lazily outside the app (CLI, tests) or after a loop change."""
+    global _webhook_client
+    client = _webhook_client
+    if client is None or client.closed or client._loop is not asyncio.get_running_loop():
+        # Pooled connections belong to the loop that opened them; never share across loops
+        client = _webhook_client = DiscordWebhookClient()
+    return client
+
+
+async def close_webhook_client() -> None:
+    global _webhook_client
+    client, _webhook_client = _webhook_client, None
+    if client is not None:
+        await client.aclose()
+
+
+def _webhook_route(application_id: str, token: str) -> str:
+    return f"webhooks/{application_id}/{token}"
+
+
 async def followup_message(
     application_id: str,
     token: str,
@@ -65,33 +236,35 @@ async def followup_message(
         base_url_source=base_url_source,
     )
 
-    async with httpx.AsyncClient(timeout=20) as client:
-        try:
-            r = await client.post(
-                url, content=orjson.dumps(payload), headers={"Content-Type": "application/json"}
-            )
-            r.raise_for_status()
-            log.info("discord.followup.sent", http_status_code=r.status_code)
-        except httpx.RequestError as e:
-            log.error(
-                "discord.followup.network_error",
-                target_url=str(getattr(e.request, "url", url)),
-                error=str(e),
-                base_url_source=base_url_source,
-            )
-            # In dev, when using an override (settings or header), swallow network errors.
-            # Only re-raise when targeting the default Discord API base.
-            if base_url_source == "default":
-                raise
-        except httpx.HTTPStatusError as e:
-            log.error(
-                "discord.followup.http_error",
-                http_status_code=e.response.status_code,
-                text_preview=(e.response.text or "")[:200],
-                base_url_source=base_url_source,
-            )
-            if base_url_source == "default":
-                raise
+    try:
+        r = await get_webhook_client().post(
+            url,
+            route=_webhook_route(application_id, token),
+            content=orjson.dumps(payload),
+            headers={"Content-Type": "application/json"},
+        )
+        r.raise_for_status()
+        log.info("discord.followup.sent", http_status_code=r.status_code)
+    except httpx.RequestError as e:
+        log.error(
+            "discord.followup.network_error",
+            target_url=str(getattr(e.request, "url", url)),
+            error=str(e),
+            base_url_source=base_url_source,
+        )
+        # In dev, when using an override (settings or header), swallow network errors.
+        # Only re-raise when targeting the default Discord API base.
+        if base_url_source == "default":
+            raise
+    except httpx.HTTPStatusError as e:
+        log.error(
+            "discord.followup.http_error",
+            http_status_code=e.response.status_code,
+            text_preview=(e.response.text or "")[:200],
+            base_url_source=base_url_source,
+        )
+        if base_url_source == "default":
+            raise
 
 
 async def followup_message_with_attachment(
@@ -141,26 +314,27 @@ async def followup_message_with_attachment(
         base_url_source=base_url_source,
     )
 
-    async with httpx.AsyncClient(timeout=20) as client:
-        try:
-            r = await client.post(url, files=files)
-            r.raise_for_status()
-            log.info("discord.followup.sent_attachment", http_status_code=r.status_code)
-        except httpx.RequestError as e:
-            log.error(
-                "discord.followup.network_error",
-                target_url=str(getattr(e.request, "url", url)),
-                error=str(e),
-                base_url_source=base_url_source,
-            )
-            if base_url_source == "default":
-                raise
-        except httpx.HTTPStatusError as e:
-            log.error(
-                "discord.followup.http_error",
-                http_status_code=e.response.status_code,
-                text_preview=(e.response.text or "")[:200],
-                base_url_source=base_url_source,
-            )
-            if base_url_source == "default":
-                raise
+    try:
+        r = await get_webhook_client().post(
+            url, route=_webhook_route(application_id, token), files=files
+        )
+        r.raise_for_status()
+        log.info("discord.followup.sent_attachment", http_status_code=r.status_code)
+    except httpx.RequestError as e:
+        log.error(
+            "discord.followup.network_error",
+            target_url=str(getattr(e.request, "url", url)),
+            error=str(e),
+            base_url_source=base_url_source,
+        )
+        if base_url_source == "default":
+            raise
+    except httpx.HTTPStatusError as e:
+        log.error(
+            "discord.followup.http_error",
+            http_status_code=e.response.status_code,
+            text_preview=(e.response.text or "")[:200],
+            base_url_source=base_url_source,
+        )
+        if base_url_source == "default":
+            raise
@@ -1,16 +1,25 @@
 from __future__ import annotations
 
+import heapq
+import itertools
+import math
 import re
+import sys
 import time
+import weakref
+from collections import OrderedDict
 from dataclasses import dataclass
+from typing import Any
 
 import sqlalchemy as sa
 import structlog
+from sqlalchemy import event as sa_event
 from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker
+from sqlalchemy.orm import Session
 
 from Adventorator.db import get_sessionmaker
-from Adventorator.metrics import inc_counter
-from Adventorator.models import ContentNode
+from Adventorator.metrics import inc_counter, observe_histogram
+from Adventorator.models import ContentNode, NodeType
 
 log = structlog.get_logger()
 
@@ -21,6 +30,9 @@ class ContentSnippet:
     node_type: str
     title: str
     text: str  # player-visible only
+    # Lore chunk id (lore_chunker) for snippets that come from imported lore
+    # rather than a ContentNode; ``id`` is 0 for those.
+    chunk_id: str | None = None
 
 
 class BaseRetriever:
@@ -28,6 +40,55 @@ class BaseRetriever:
         raise NotImplementedError
 
 
+# Common stopwords and chatty prompt verbs dropped before searching.
+_STOPWORDS = frozenset(
+    {
+        "the",
+        "a",
+        "an",
+        "and",
+        "or",
+        "of",
+        "to",
+        "in",
+        "on",
+        "with",
+        "at",
+        "by",
+        "for",
+        "from",
+        "is",
+        "are",
+        "be",
+        "was",
+        "were",
+        # common chatty verbs/prompts
+        "please",
+        "describe",
+        "tell",
+        "show",
+        "about",
+        "look",
+        "examine",
+        "inspect",
+    }
+)
+
+
+def tokenize(text: str) -> list[str]:
+    """Lowercase alphanumeric tokens of ``text`` with stopwords removed."""
+    return [t for t in re.findall(r"[a-z0-9]+", (text or "").lower()) if t not in _STOPWORDS]
+
+
+def query_terms(query: str) -> list[str]:
+    """Tokenize a player query into lowercase alphanumeric search terms.
+
+    The query is truncated to 128 characters to prevent pathological scans;
+    stopwords are removed and duplicates dropped (first occurrence wins).
+    """
+    return list(dict.fromkeys(tokenize((query or "").strip()[:128])))
+
+
 class SqlFallbackRetriever(BaseRetriever):
     """Lightweight LIKE/ILIKE search backed by the primary DB.
 
@@ -46,83 +107,476 @@ class SqlFallbackRetriever(BaseRetriever):
     async def retrieve(self, campaign_id: int, query: str, k: int = 4) -> list[ContentSnippet]:
         start = time.time()
         inc_counter("retrieval.calls")
-        q = (query or "").strip()
-        if not q:
+        if not (query or "").strip():
             return []
-        # Limit query length to prevent pathological LIKE scans
-        q = q[:128]
         try:
-            async with self._sm() as s:
-                # Tokenize query into alphanumeric terms and filter common stopwords
-                terms = [t for t in re.findall(r"[A-Za-z0-9]+", q.lower()) if t]
-                stopwords = {
-                    "the",
-                    "a",
-                    "an",
-                    "and",
-                    "or",
-                    "of",
-                    "to",
-                    "in",
-                    "on",
-                    "with",
-                    "at",
-                    "by",
-                    "for",
-                    "from",
-                    "is",
-                    "are",
-                    "be",
-                    "was",
-                    "were",
-                    # common chatty verbs/prompts
-                    "please",
-                    "describe",
-                    "tell",
-                    "show",
-                    "about",
-                    "look",
-                    "examine",
-                    "inspect",
-                }
-                terms = [t for t in terms if t not in stopwords]
-                if not terms:
-                    return []
-                # Build a broad OR across tokens (each token matches title/player/gm_text)
-                or_clauses = []
-                for t in terms:
-                    pat = f"%{t}%"
-                    or_clauses.append(
-                        sa.or_(
-                            ContentNode.title.ilike(pat),
-                            ContentNode.player_text.ilike(pat),
-                            # Allow matches against GM notes for recall quality,
-                            # but never expose gm_text in returned snippets.
-                            ContentNode.gm_text.ilike(pat),
-                        )
+            terms = query_terms(query)
+            if not terms:
+                return []
+            out = await self._search(campaign_id, terms, k)
+            inc_counter("retrieval.snippets", value=len(out))
+            return out
+        except Exception:
+            inc_counter("retrieval.errors")
+            log.warning("retrieval.sql.error", exc_info=True)
+            return []
+        finally:
+            dur_ms = int((time.time() - start) * 1000)
+            inc_counter("retrieval.latency_ms", value=dur_ms)
+
+    async def _search(self, campaign_id: int, terms: list[str], k: int) -> list[ContentSnippet]:
+        async with self._sm() as s:
+            # Build a broad OR across tokens (each token matches title/player/gm_text)
+            or_clauses = []
+            for t in terms:
+                pat = f"%{t}%"
+                or_clauses.append(
+                    sa.or_(
+                        ContentNode.title.ilike(pat),
+                        ContentNode.player_text.ilike(pat),
+                        # Allow matches against GM notes for recall quality,
+                        # but never expose gm_text in returned snippets.
+                        ContentNode.gm_text.ilike(pat),
                     )
-                stmt = sa.select(ContentNode).where(ContentNode.campaign_id == campaign_id)
-                if or_clauses:
-                    stmt = stmt.where(sa.or_(*or_clauses))
-                stmt = stmt.limit(k)
-                result = await s.execute(stmt)
-                rows = list(result.scalars().all())
-            inc_counter("retrieval.snippets", value=len(rows))
-            return [
-                ContentSnippet(
-                    id=n.id, node_type=n.node_type.value, title=n.title, text=n.player_text
                 )
-                for n in rows
-            ]
+            stmt = sa.select(ContentNode).where(ContentNode.campaign_id == campaign_id)
+            if or_clauses:
+                stmt = stmt.where(sa.or_(*or_clauses))
+            stmt = stmt.limit(k)
+            result = await s.execute(stmt)
+            rows = list(result.scalars().all())
+        return [
+            ContentSnippet(id=n.id, node_type=n.node_type.value, title=n.title, text=n.player_text)
+            for n in rows
+        ]
+
+
+# Static SQL (terms are bound parameters). Postgres ranks the weighted generated
+# tsvector with ts_rank; SQLite ranks the FTS5 shadow table with bm25(), where
+# lower scores are better and the column weights mirror the tsvector A/B/C weights.
+_PG_FTS_SQL = sa.text(
+    """
+SELECT c.id, c.node_type, c.title, c.player_text
+FROM content_nodes AS c, to_tsquery('english', :tsquery) AS q
+WHERE c.campaign_id = :campaign_id AND c.search_tsv @@ q
+ORDER BY ts_rank(c.search_tsv, q) DESC, c.id
+LIMIT :k
+    """
+)
+_SQLITE_FTS_SQL = sa.text(
+    """
+SELECT c.id, c.node_type, c.title, c.player_text
+FROM content_nodes_fts AS f
+JOIN content_nodes AS c ON c.id = f.rowid
+WHERE content_nodes_fts MATCH :tsquery AND c.campaign_id = :campaign_id
+ORDER BY bm25(content_nodes_fts, 10.0, 4.0, 1.0), c.id
+LIMIT :k
+    """
+)
+
+
+class FullTextRetriever(SqlFallbackRetriever):
+    """Ranked full-text search over content nodes.
+
+    Uses the ``search_tsv`` GIN-indexed column on Postgres and the
+    ``content_nodes_fts`` FTS5 table on SQLite (see models.py and migration
+    ``c5d6e7f8a9b0``). Terms are stemmed and OR-ed like the ILIKE fallback, but
+    results come back best-first instead of in arbitrary row order. gm_text is
+    matched with the lowest weight but never returned.
+
+    If the full-text structures are missing (e.g. migrations not applied) the
+    query falls back to the ILIKE scan and ``retrieval.fts.fallback`` is counted.
+    """
+
+    async def _search(self, campaign_id: int, terms: list[str], k: int) -> list[ContentSnippet]:
+        try:
+            async with self._sm() as s:
+                dialect = s.bind.dialect.name if s.bind is not None else ""
+                if dialect.startswith("postgres"):
+                    stmt = _PG_FTS_SQL
+                    tsquery = " | ".join(terms)
+                elif dialect == "sqlite":
+                    stmt = _SQLITE_FTS_SQL
+                    tsquery = " OR ".join(f'"{t}"' for t in terms)
+                else:
+                    raise NotImplementedError(f"full-text search unsupported on {dialect!r}")
+                result = await s.execute(
+                    stmt, {"tsquery": tsquery, "campaign_id": campaign_id, "k": k}
+                )
+                rows = result.all()
+        except Exception:
+            inc_counter("retrieval.fts.fallback")
+            log.warning("retrieval.fts.fallback", exc_info=True)
+            return await super()._search(campaign_id, terms, k)
+        return [
+            ContentSnippet(
+                id=r.id, node_type=NodeType[r.node_type].value, title=r.title, text=r.player_text
+            )
+            for r in rows
+        ]
+
+
+# -----------------------------
+# In-memory BM25 index
+# -----------------------------
+
+_BM25_K1 = 1.2
+_BM25_B = 0.75
+# Title terms count this many times toward a document's term frequency.
+_BM25_TITLE_BOOST = 2
+# Approximate CPython overheads used for memory accounting: one posting is a
+# dict slot plus a small int; one term adds its postings dict and key slot.
+_POSTING_BYTES = 64
+_TERM_BYTES = 120
+
+
+@dataclass(slots=True)
+class _Bm25Doc:
+    node_type: str
+    title: str
+    text: str
+    tf: dict[str, int]
+    length: int
+    nbytes: int
+
+
+class Bm25Index:
+    """Inverted index over one campaign's content nodes (title + player_text).
+
+    gm_text is never indexed. ``nbytes`` is a running estimate of resident
+    memory (stored snippet text plus postings), maintained on every upsert and
+    removal so the store can enforce a byte budget without walking the index.
+    """
+
+    def __init__(self, campaign_id: int):
+        self.campaign_id = campaign_id
+        self.docs: dict[int, _Bm25Doc] = {}
+        self.postings: dict[str, dict[int, int]] = {}
+        self.total_length = 0
+        self.nbytes = 0
+        # (row count, max id) when last synced with the DB, and when checked
+        self.fingerprint: tuple[int, int] = (0, 0)
+        self.checked_at = 0.0
+
+    def upsert(self, node_id: int, node_type: str, title: str, text: str) -> None:
+        self.remove(node_id)
+        tf: dict[str, int] = {}
+        for term in tokenize(title):
+            tf[term] = tf.get(term, 0) + _BM25_TITLE_BOOST
+        for term in tokenize(text):
+            tf[term] = tf.get(term, 0) + 1
+        doc = _Bm25Doc(
+            node_type=node_type,
+            title=title,
+            text=text,
+            tf=tf,
+            length=sum(tf.values()),
+            nbytes=sys.getsizeof(title) + sys.getsizeof(text) + len(tf) * _POSTING_BYTES,
+        )
+        for term, n in tf.items():
+            plist = self.postings.get(term)
+            if plist is None:
+                plist = self.postings[term] = {}
+                self.nbytes += _TERM_BYTES + sys.getsizeof(term)
+            plist[node_id] = n
+        self.docs[node_id] = doc
+        self.total_length += doc.length
+        self.nbytes += doc.nbytes
+
+    def remove(self, node_id: int) -> None:
+        doc = self.docs.pop(node_id, None)
+        if doc is None:
+            return
+        for term in doc.tf:
+            plist = self.postings[term]
+            del plist[node_id]
+            if not plist:
+                del self.postings[term]
+                self.nbytes -= _TERM_BYTES + sys.getsizeof(term)
+        self.total_length -= doc.length
+        self.nbytes -= doc.nbytes
+
+    def search(self, terms: list[str], k: int) -> list[ContentSnippet]:
+        n_docs = len(self.docs)
+        if not n_docs or k <= 0:
+            return []
+        avgdl = self.total_length / n_docs or 1.0
+        scores: dict[int, float] = {}
+        for term in terms:
+            plist = self.postings.get(term)
+            if not plist:
+                continue
+            df = len(plist)
+            idf = math.log(1.0 + (n_docs - df + 0.5) / (df + 0.5))
+            for node_id, tf in plist.items():
+                norm = _BM25_K1 * (1.0 - _BM25_B + _BM25_B * self.docs[node_id].length / avgdl)
+                scores[node_id] = scores.get(node_id, 0.0) + idf * tf * (_BM25_K1 + 1.0) / (
+                    tf + norm
+                )
+        best = heapq.nsmallest(k, scores.items(), key=lambda kv: (-kv[1], kv[0]))
+        out = []
+        for node_id, _score in best:
+            doc = self.docs[node_id]
+            out.append(
+                ContentSnippet(id=node_id, node_type=doc.node_type, title=doc.title, text=doc.text)
+            )
+        return out
+
+
+class Bm25IndexStore:
+    """LRU-bounded set of resident campaign indexes plus pending node changes.
+
+    At most ``max_campaigns`` indexes stay resident and their combined
+    ``nbytes`` is kept under ``max_bytes`` (the most recently used index is
+    never evicted, even if it alone exceeds the budget).
+    """
+
+    def __init__(self, *, max_campaigns: int = 64, max_bytes: int = 64 * 1024 * 1024):
+        self.max_campaigns = max_campaigns
+        self.max_bytes = max_bytes
+        self._indexes: OrderedDict[int, Bm25Index] = OrderedDict()
+        self._pending: dict[int, set[int]] = {}
+        _BM25_STORES.add(self)
+
+    def configure(self, *, max_campaigns: int, max_bytes: int) -> None:
+        self.max_campaigns = max_campaigns
+        self.max_bytes = max_bytes
+        self._evict()
+
+    def get(self, campaign_id: int) -> Bm25Index | None:
+        index = self._indexes.get(campaign_id)
+        if index is not None:
+            self._indexes.move_to_end(campaign_id)
+        return index
+
+    def put(self, index: Bm25Index) -> None:
+        self._indexes[index.campaign_id] = index
+        self._indexes.move_to_end(index.campaign_id)
+        self._pending.pop(index.campaign_id, None)
+        self._evict()
+
+    def mark_dirty(self, campaign_id: int | None, node_ids: set[int]) -> None:
+        """Queue node ids for re-read on the next search of each affected index."""
+        for cid, index in self._indexes.items():
+            ids = node_ids if cid == campaign_id else {i for i in node_ids if i in index.docs}
+            if ids:
+                self._pending.setdefault(cid, set()).update(ids)
+
+    def take_pending(self, campaign_id: int) -> set[int]:
+        return self._pending.pop(campaign_id, set())
+
+    def resident_bytes(self) -> int:
+        return sum(index.nbytes for index in self._indexes.values())
+
+    def stats(self) -> dict[str, int]:
+        return {
+            "campaigns": len(self._indexes),
+            "docs": sum(len(index.docs) for index in self._indexes.values()),
+            "terms": sum(len(index.postings) for index in self._indexes.values()),
+            "bytes": self.resident_bytes(),
+        }
+
+    def clear(self) -> None:
+        self._indexes.clear()
+        self._pending.clear()
+
+    def _evict(self) -> None:
+        while len(self._indexes) > 1 and (
+            len(self._indexes) > self.max_campaigns or self.resident_bytes() > self.max_bytes
+        ):
+            campaign_id, _ = self._indexes.popitem(last=False)
+            self._pending.pop(campaign_id, None)
+            inc_counter("retrieval.bm25.evicted")
+
+
+# Every live store receives committed ContentNode changes from the listeners below.
+_BM25_STORES: weakref.WeakSet[Bm25IndexStore] = weakref.WeakSet()
+_BM25_STORE = Bm25IndexStore()
+_SESSION_BM25_KEY = "adventorator.bm25_dirty_nodes"
+
+
+def get_bm25_store() -> Bm25IndexStore:
+    return _BM25_STORE
+
+
+@sa_event.listens_for(Session, "after_flush")
+def _collect_content_node_changes(session: Session, flush_context: Any) -> None:
+    for obj in itertools.chain(session.new, session.dirty, session.deleted):
+        if not isinstance(obj, ContentNode):
+            continue
+        # Read loaded state only; never trigger a lazy load inside a flush.
+        state = sa.inspect(obj).dict
+        node_id = state.get("id")
+        if node_id is None:
+            continue
+        touched = session.info.setdefault(_SESSION_BM25_KEY, {})
+        touched.setdefault(state.get("campaign_id"), set()).add(node_id)
+
+
+@sa_event.listens_for(Session, "after_commit")
+def _queue_committed_content_changes(session: Session) -> None:
+    for campaign_id, node_ids in session.info.pop(_SESSION_BM25_KEY, {}).items():
+        for store in list(_BM25_STORES):
+            store.mark_dirty(campaign_id, node_ids)
+
+
+@sa_event.listens_for(Session, "after_rollback")
+def _discard_rolled_back_content_changes(session: Session) -> None:
+    session.info.pop(_SESSION_BM25_KEY, None)
+
+
+@sa_event.listens_for(ContentNode.__table__, "after_drop")
+def _reset_bm25_on_drop(target: Any, connection: Any, **kw: Any) -> None:
+    for store in list(_BM25_STORES):
+        store.clear()
+
+
+class Bm25Retriever(BaseRetriever):
+    """In-process BM25 search over per-campaign inverted indexes.
+
+    The first search for a campaign loads its nodes once; later searches are
+    answered from memory. Nodes committed through the ORM in this process are
+    re-read incrementally on the next search. Changes made elsewhere (other
+    workers, raw SQL) are picked up by a ``(count, max id)`` fingerprint check
+    at most every ``refresh_seconds``, which triggers a full rebuild; in-place
+    edits made elsewhere are only seen after eviction or a restart.
+    """
+
+    def __init__(
+        self,
+        sessionmaker: async_sessionmaker[AsyncSession] | None = None,
+        *,
+        store: Bm25IndexStore | None = None,
+        refresh_seconds: float = 30.0,
+    ):
+        self._sm = sessionmaker or get_sessionmaker()
+        self._store = store or _BM25_STORE
+        self._refresh_seconds = refresh_seconds
+
+    async def retrieve(self, campaign_id: int, query: str, k: int = 4) -> list[ContentSnippet]:
+        start = time.time()
+        inc_counter("retrieval.calls")
+        terms = query_terms(query)
+        if not terms:
+            return []
+        try:
+            index = await self._ensure_index(campaign_id)
+            out = index.search(terms, k)
+            inc_counter("retrieval.snippets", value=len(out))
+            return out
         except Exception:
             inc_counter("retrieval.errors")
-            log.warning("retrieval.sql.error", exc_info=True)
+            log.warning("retrieval.bm25.error", exc_info=True)
             return []
         finally:
             dur_ms = int((time.time() - start) * 1000)
             inc_counter("retrieval.latency_ms", value=dur_ms)
 
+    async def _ensure_index(self, campaign_id: int) -> Bm25Index:
+        index = self._store.get(campaign_id)
+        if index is None:
+            return await self._build(campaign_id)
+        pending = self._store.take_pending(campaign_id)
+        if pending:
+            await self._refresh(index, pending)
+        elif (
+            self._refresh_seconds >= 0
+            and time.monotonic() - index.checked_at >= self._refresh_seconds
+        ):
+            async with self._sm() as s:
+                fingerprint = await self._fingerprint(s, campaign_id)
+            if fingerprint != index.fingerprint:
+                inc_counter("retrieval.bm25.stale")
+                return await self._build(campaign_id)
+            index.checked_at = time.monotonic()
+        return index
+
+    async def _build(self, campaign_id: int) -> Bm25Index:
+        start = time.perf_counter()
+        index = Bm25Index(campaign_id)
+        async with self._sm() as s:
+            rows = await s.execute(
+                self._node_columns().where(ContentNode.campaign_id == campaign_id)
+            )
+            for r in rows:
+                index.upsert(r.id, r.node_type.value, r.title, r.player_text or "")
+            index.fingerprint = await self._fingerprint(s, campaign_id)
+        index.checked_at = time.monotonic()
+        self._store.put(index)
+        inc_counter("retrieval.bm25.build")
+        observe_histogram("retrieval.bm25.build_ms", int((time.perf_counter() - start) * 1000))
+        log.info(
+            "retrieval.bm25.built",
+            campaign_id=campaign_id,
+            docs=len(index.docs),
+            terms=len(index.postings),
+            nbytes=index.nbytes,
+        )
+        return index
+
+    async def _refresh(self, index: Bm25Index, node_ids: set[int]) -> None:
+        async with self._sm() as s:
+            rows = await s.execute(
+                self._node_columns().where(
+                    ContentNode.id.in_(sorted(node_ids)),
+                    ContentNode.campaign_id == index.campaign_id,
+                )
+            )
+            found = set()
+            for r in rows:
+                index.upsert(r.id, r.node_type.value, r.title, r.player_text or "")
+                found.add(r.id)
+            for node_id in node_ids - found:
+                index.remove(node_id)
+            index.fingerprint = await self._fingerprint(s, index.campaign_id)
+        index.checked_at = time.monotonic()
+        inc_counter("retrieval.bm25.refresh")
+        inc_counter("retrieval.bm25.refreshed_nodes", value=len(node_ids))
+        # Upserts may have grown the index past the byte budget
+        self._store.put(index)
+
+    @staticmethod
+    def _node_columns() -> sa.Select:
+        return sa.select(
+            ContentNode.id, ContentNode.node_type, ContentNode.title, ContentNode.player_text
+        )
+
+    @staticmethod
+    async def _fingerprint(s: AsyncSession, campaign_id: int) -> tuple[int, int]:
+        q = await s.execute(
+            sa.select(sa.func.count(ContentNode.id), sa.func.max(ContentNode.id)).where(
+                ContentNode.campaign_id == campaign_id
+            )
+        )
+        count, max_id = q.one()
+        return int(count or 0), int(max_id or 0)
+
 
 def build_retriever(settings) -> BaseRetriever:
-    # For now: only SQL fallback. Future: switch on settings.retrieval.provider
+    """Select the retriever for ``settings.retrieval.provider``.
+
+    ``"fts"`` selects ranked full-text search, ``"bm25"`` the in-process
+    BM25 index and ``"vector"`` local embeddings (``"pgvector"`` additionally
+    stores them in Postgres when the database is Postgres). Vector providers
+    need numpy; without it, and for every other provider, the SQL ILIKE
+    fallback is used.
+    """
+    cfg = getattr(settings, "retrieval", None)
+    if cfg is None:
+        return SqlFallbackRetriever(get_sessionmaker())
+    provider = getattr(cfg, "provider", "none")
+    if provider == "fts":
+        return FullTextRetriever(get_sessionmaker())
+    if provider == "bm25":
+        _BM25_STORE.configure(max_campaigns=cfg.bm25_max_campaigns, max_bytes=cfg.bm25_max_bytes)
+        return Bm25Retriever(get_sessionmaker(), refresh_seconds=cfg.bm25_refresh_seconds)
+    if provider in ("vector", "pgvector"):
+        from Adventorator import retrieval_vector
+
+        if retrieval_vector.numpy_available():
+            use_pg = provider == "pgvector" and str(
+                getattr(settings, "database_url", "")
+            ).startswith("postgres")
+            return retrieval_vector.get_vector_retriever(settings, pgvector=use_pg)
+        log.warning("retrieval.vector.unavailable", reason="numpy not installed")
     return SqlFallbackRetriever(get_sessionmaker())
@@ -0,0 +1,478 @@
+"""Offline embedding retrieval over content nodes and imported lore chunks.
+
+Everything runs locally: the default embedder is a deterministic hashing-trick
+vectorizer (no model download, no network), vectors live in one NumPy matrix
+per campaign, and queries are scored with a single batched matrix product.
+Any ``Callable[[Sequence[str]], np.ndarray]`` returning row vectors can be
+plugged in instead. ``PgVectorAdapter`` optionally moves storage and top-k
+search into Postgres via the pgvector extension.
+
+Lore chunks are read from the ``lore_chunks`` table the importer fills and are
+keyed by their ``lore_chunker`` chunk ids, so every process sees the same lore.
+"""
+
+from __future__ import annotations
+
+import functools
+import hashlib
+import itertools
+import time
+import weakref
+from collections import OrderedDict
+from collections.abc import Callable, Iterable, Sequence
+from dataclasses import dataclass
+from typing import Any
+
+import sqlalchemy as sa
+import structlog
+from sqlalchemy import event as sa_event
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker
+from sqlalchemy.orm import Session
+
+from Adventorator.db import get_sessionmaker
+from Adventorator.metrics import inc_counter, observe_histogram
+from Adventorator.models import ContentNode, LoreChunk
+from Adventorator.retrieval import BaseRetriever, ContentSnippet, tokenize
+
+try:
+    import numpy as np
+except ImportError:  # pragma: no cover - optional dependency
+    np = None  # type: ignore[assignment]
+
+log = structlog.get_logger()
+
+EmbedFn = Callable[[Sequence[str]], "np.ndarray"]
+
+# Lore audiences that must never reach players or the LLM.
+_HIDDEN_AUDIENCES = frozenset({"GM-Only"})
+# Advisory lock class for pgvector re-indexing (encounters 1001, event ledger 1002).
+_EMBEDDING_LOCK_CLASS = 1003
+
+
+def numpy_available() -> bool:
+    return np is not None
+
+
+class HashingVectorizer:
+    """Deterministic hashing-trick embedder.
+
+    Each word token and its padded character n-grams (so "goblins" and
+    "goblin" share most features) are hashed with BLAKE2b into ``dim`` signed
+    buckets; rows are L2-normalized. Output is identical across processes and
+    Python versions, unlike ``hash()``.
+    """
+
+    def __init__(self, dim: int = 512, *, char_ngram: int = 3, ngram_weight: float = 0.5):
+        if np is None:
+            raise RuntimeError("numpy is required for HashingVectorizer")
+        self.dim = dim
+        self.char_ngram = char_ngram
+        self.ngram_weight = ngram_weight
+        self._bucket = functools.lru_cache(maxsize=65536)(self._bucket_uncached)
+
+    def _bucket_uncached(self, feature: str) -> tuple[int, float]:
+        h = int.from_bytes(
+            hashlib.blake2b(feature.encode("utf-8"), digest_size=8).digest(), "little"
+        )
+        return h % self.dim, (1.0 if (h >> 63) & 1 else -1.0)
+
+    def _features(self, text: str) -> Iterable[tuple[str, float]]:
+        n = self.char_ngram
+        for tok in tokenize(text):
+            yield tok, 1.0
+            padded = f"<{tok}>"
+            for i in range(len(padded) - n + 1):
+                yield "#" + padded[i : i + n], self.ngram_weight
+
+    def __call__(self, texts: Sequence[str]) -> np.ndarray:
+        out = np.zeros((len(texts), self.dim), dtype=np.float32)
+        for row, text in enumerate(texts):
+            vec = out[row]
+            for feature, weight in self._features(text):
+                idx, sign = self._bucket(feature)
+                vec[idx] += sign * weight
+        norms = np.linalg.norm(out, axis=1, keepdims=True)
+        np.divide(out, norms, out=out, where=norms > 0)
+        return out
+
+
+@dataclass(frozen=True, slots=True)
+class _Item:
+    key: str
+    snippet: ContentSnippet
+    embed_text: str
+
+
+class VectorIndex:
+    """One campaign's snippets and their unit-norm embedding matrix."""
+
+    def __init__(self, campaign_id: int, items: list[_Item], matrix: np.ndarray):
+        self.campaign_id = campaign_id
+        self.keys = [item.key for item in items]
+        self.snippets = [item.snippet for item in items]
+        self.matrix = matrix
+        self.fingerprint: tuple[int, ...] = ()
+        self.checked_at = 0.0
+
+    @property
+    def nbytes(self) -> int:
+        return int(self.matrix.nbytes)
+
+    def top_k(
+        self, queries: np.ndarray, k: int, *, min_score: float = 0.0
+    ) -> list[list[tuple[int, float]]]:
+        """Return ``(row, cosine)`` pairs per query, best first, above ``min_score``."""
+        n = self.matrix.shape[0]
+        if n == 0 or k <= 0:
+            return [[] for _ in range(len(queries))]
+        k = min(k, n)
+        scores = queries @ self.matrix.T
+        # argpartition picks each row's k best in O(n); only those k get sorted
+        part = np.argpartition(-scores, k - 1, axis=1)[:, :k]
+        out = []
+        for qi, cols in enumerate(part):
+            ranked = sorted(cols.tolist(), key=lambda c: (-scores[qi, c], c))
+            out.append([(c, float(scores[qi, c])) for c in ranked if scores[qi, c] > min_score])
+        return out
+
+
+def _vector_literal(vec: Sequence[float]) -> str:
+    return "[" + ",".join(f"{float(x):.7g}" for x in vec) + "]"
+
+
+class PgVectorAdapter:
+    """Store embeddings in Postgres and let pgvector do the top-k search.
+
+    Vectors travel as text literals cast to ``vector`` so the pgvector Python
+    package is not needed; the database needs the ``vector`` extension.
+    """
+
+    def __init__(self, sessionmaker: async_sessionmaker[AsyncSession], dim: int):
+        self._sm = sessionmaker
+        self.dim = int(dim)
+        self._schema_ready = False
+
+    async def ensure_schema(self) -> None:
+        if self._schema_ready:
+            return
+        async with self._sm() as s:
+            await s.execute(sa.text("CREATE EXTENSION IF NOT EXISTS vector"))
+            # dim is an int from settings; no user input reaches this DDL
+            await s.execute(
+                sa.text(
+                    "CREATE TABLE IF NOT EXISTS content_embeddings ("
+                    " campaign_id INTEGER NOT NULL,"
+                    " key VARCHAR(200) NOT NULL,"
+                    " node_id INTEGER NOT NULL,"
+                    " chunk_id VARCHAR(200),"
+                    " node_type VARCHAR(32) NOT NULL,"
+                    " title TEXT NOT NULL,"
+                    " body TEXT NOT NULL,"
+                    " embedding vector(" + str(self.dim) + ") NOT NULL,"
+                    " PRIMARY KEY (campaign_id, key))"
+                )
+            )
+            await s.commit()
+        self._schema_ready = True
+
+    async def replace_campaign(self, index: VectorIndex) -> None:
+        await self.ensure_schema()
+        rows = [
+            {
+                "campaign_id": index.campaign_id,
+                "key": key,
+                "node_id": snip.id,
+                "chunk_id": snip.chunk_id,
+                "node_type": snip.node_type,
+                "title": snip.title,
+                "body": snip.text,
+                "embedding": _vector_literal(vec),
+            }
+            for key, snip, vec in zip(index.keys, index.snippets, index.matrix, strict=True)
+        ]
+        async with self._sm() as s:
+            # Workers rebuilding the same campaign take turns; each replace is atomic
+            await s.execute(
+                sa.text("SELECT pg_advisory_xact_lock(:c, :k)"),
+                {"c": _EMBEDDING_LOCK_CLASS, "k": index.campaign_id},
+            )
+            await s.execute(
+                sa.text("DELETE FROM content_embeddings WHERE campaign_id = :cid"),
+                {"cid": index.campaign_id},
+            )
+            if rows:
+                await s.execute(
+                    sa.text(
+                        "INSERT INTO content_embeddings"
+                        " (campaign_id, key, node_id, chunk_id, node_type, title, body, embedding)"
+                        " VALUES (:campaign_id, :key, :node_id, :chunk_id, :node_type, :title,"
+                        " :body, CAST(:embedding AS vector))"
+                    ),
+                    rows,
+                )
+            await s.commit()
+
+    async def search(
+        self, campaign_id: int, query: np.ndarray, k: int
+    ) -> list[tuple[ContentSnippet, float]]:
+        async with self._sm() as s:
+            result = await s.execute(
+                sa.text(
+                    "SELECT node_id, chunk_id, node_type, title, body,"
+                    " 1 - (embedding <=> CAST(:q AS vector)) AS score"
+                    " FROM content_embeddings WHERE campaign_id = :cid"
+                    " ORDER BY embedding <=> CAST(:q AS vector), key LIMIT :k"
+                ),
+                {"q": _vector_literal(query.tolist()), "cid": campaign_id, "k": k},
+            )
+            rows = result.all()
+        return [
+            (
+                ContentSnippet(
+                    id=r.node_id,
+                    node_type=r.node_type,
+                    title=r.title,
+                    text=r.body,
+                    chunk_id=r.chunk_id,
+                ),
+                float(r.score),
+            )
+            for r in rows
+            if r.score > 0
+        ]
+
+
+class VectorRetriever(BaseRetriever):
+    """Cosine top-k over embedded content nodes (title + player_text) and lore.
+
+    Campaign indexes are built on first use and kept in an LRU of at most
+    ``max_campaigns``. They are rebuilt when a ``(count, max id)`` fingerprint
+    of the campaign's content nodes or lore chunks changes, checked at most
+    every ``refresh_seconds``, and dropped as soon as an ORM commit in this
+    process edits one of its nodes or chunks in place. gm_text and GM-only lore
+    are never embedded.
+
+    Hits at or below ``min_score`` cosine are dropped: hashed features collide,
+    so unrelated texts still score slightly above zero.
+    """
+
+    def __init__(
+        self,
+        sessionmaker: async_sessionmaker[AsyncSession] | None = None,
+        *,
+        embed: EmbedFn | None = None,
+        adapter: PgVectorAdapter | None = None,
+        max_campaigns: int = 64,
+        refresh_seconds: float = 30.0,
+        min_score: float = 0.1,
+    ):
+        if np is None:
+            raise RuntimeError("numpy is required for VectorRetriever")
+        self._min_score = min_score
+        self._sm = sessionmaker or get_sessionmaker()
+        self._embed = embed or HashingVectorizer()
+        self._adapter = adapter
+        self._max_campaigns = max_campaigns
+        self._refresh_seconds = refresh_seconds
+        self._indexes: OrderedDict[int, VectorIndex] = OrderedDict()
+        _RETRIEVERS.add(self)
+
+    async def retrieve(self, campaign_id: int, query: str, k: int = 4) -> list[ContentSnippet]:
+        return (await self.retrieve_many(campaign_id, [query], k))[0]
+
+    async def retrieve_many(
+        self, campaign_id: int, queries: Sequence[str], k: int = 4
+    ) -> list[list[ContentSnippet]]:
+        """Score several queries against one campaign in a single matrix product."""
+        start = time.time()
+        inc_counter("retrieval.calls", value=len(queries))
+        texts = [(q or "").strip()[:512] for q in queries]
+        out: list[list[ContentSnippet]] = [[] for _ in texts]
+        live = [i for i, t in enumerate(texts) if tokenize(t)]
+        if not live:
+            return out
+        try:
+            index = await self._ensure_index(campaign_id)
+            qmat = np.asarray(self._embed([texts[i] for i in live]), dtype=np.float32)
+            if self._adapter is not None:
+                for i, qvec in zip(live, qmat, strict=True):
+                    hits = await self._adapter.search(campaign_id, qvec, k)
+                    out[i] = [snip for snip, score in hits if score > self._min_score]
+            else:
+                ranked = index.top_k(qmat, k, min_score=self._min_score)
+                for i, row_hits in zip(live, ranked, strict=True):
+                    out[i] = [index.snippets[row] for row, _score in row_hits]
+            inc_counter("retrieval.snippets", value=sum(len(o) for o in out))
+            return out
+        except Exception:
+            inc_counter("retrieval.errors")
+            log.warning("retrieval.vector.error", exc_info=True)
+            return [[] for _ in texts]
+        finally:
+            dur_ms = int((time.time() - start) * 1000)
+            inc_counter("retrieval.latency_ms", value=dur_ms)
+
+    def invalidate(self, campaign_id: int) -> None:
+        """Drop the campaign's index so the next query re-embeds its content."""
+        if self._indexes.pop(campaign_id, None) is not None:
+            inc_counter("retrieval.vector.invalidated")
+
+    def resident_bytes(self) -> int:
+        return sum(index.nbytes for index in self._indexes.values())
+
+    async def _ensure_index(self, campaign_id: int) -> VectorIndex:
+        index = self._indexes.get(campaign_id)
+        if index is None:
+            return await self._build(campaign_id)
+        self._indexes.move_to_end(campaign_id)
+        if (
+            self._refresh_seconds >= 0
+            and time.monotonic() - index.checked_at >= self._refresh_seconds
+        ):
+            async with self._sm() as s:
+                fingerprint = await _content_fingerprint(s, campaign_id)
+            if fingerprint != index.fingerprint:
+                inc_counter("retrieval.vector.stale")
+                return await self._build(campaign_id)
+            index.checked_at = time.monotonic()
+        return index
+
+    async def _build(self, campaign_id: int) -> VectorIndex:
+        start = time.perf_counter()
+        async with self._sm() as s:
+            rows = await s.execute(
+                sa.select(
+                    ContentNode.id,
+                    ContentNode.node_type,
+                    ContentNode.title,
+                    ContentNode.player_text,
+                )
+                .where(ContentNode.campaign_id == campaign_id)
+                .order_by(ContentNode.id)
+            )
+            items = [
+                _Item(
+                    key=f"node:{r.id}",
+                    snippet=ContentSnippet(
+                        id=r.id, node_type=r.node_type.value, title=r.title, text=r.player_text
+                    ),
+                    embed_text=f"{r.title}\n{r.player_text or ''}",
+                )
+                for r in rows
+            ]
+            lore_rows = await s.execute(
+                sa.select(LoreChunk.chunk_id, LoreChunk.title, LoreChunk.content)
+                .where(
+                    LoreChunk.campaign_id == campaign_id,
+                    LoreChunk.audience.not_in(sorted(_HIDDEN_AUDIENCES)),
+                )
+                .order_by(LoreChunk.chunk_id)
+            )
+            lore = [
+                _Item(
+                    key=r.chunk_id,
+                    snippet=ContentSnippet(
+                        id=0, node_type="lore", title=r.title, text=r.content, chunk_id=r.chunk_id
+                    ),
+                    embed_text=f"{r.title}\n{r.content}",
+                )
+                for r in lore_rows
+            ]
+            items.extend(lore)
+            fingerprint = await _content_fingerprint(s, campaign_id)
+        if items:
+            matrix = np.asarray(self._embed([item.embed_text for item in items]), dtype=np.float32)
+        else:
+            matrix = np.zeros((0, getattr(self._embed, "dim", 1)), dtype=np.float32)
+        index = VectorIndex(campaign_id, items, matrix)
+        index.fingerprint = fingerprint
+        index.checked_at = time.monotonic()
+        if self._adapter is not None:
+            await self._adapter.replace_campaign(index)
+            # pgvector holds the vectors now; keep only the bookkeeping resident
+            index.matrix = matrix[:0]
+        self._indexes[campaign_id] = index
+        self._indexes.move_to_end(campaign_id)
+        while len(self._indexes) > max(1, self._max_campaigns):
+            self._indexes.popitem(last=False)
+            inc_counter("retrieval.vector.evicted")
+        inc_counter("retrieval.vector.build")
+        observe_histogram("retrieval.vector.build_ms", int((time.perf_counter() - start) * 1000))
+        log.info(
+            "retrieval.vector.built",
+            campaign_id=campaign_id,
+            items=len(items),
+            lore_chunks=len(lore),
+            nbytes=index.nbytes,
+        )
+        return index
+
+
+_RETRIEVERS: weakref.WeakSet[VectorRetriever] = weakref.WeakSet()
+
+
+_SESSION_VECTOR_KEY = "adventorator.vector_dirty_campaigns"
+
+
+@sa_event.listens_for(Session, "after_flush")
+def _collect_embedded_content_changes(session: Session, flush_context: Any) -> None:
+    for obj in itertools.chain(session.new, session.dirty, session.deleted):
+        if not isinstance(obj, ContentNode | LoreChunk):
+            continue
+        # Read loaded state only (the instance dict); never lazy load inside a flush.
+        campaign_id = obj.__dict__.get("campaign_id")
+        if campaign_id is not None:
+            session.info.setdefault(_SESSION_VECTOR_KEY, set()).add(campaign_id)
+
+
+@sa_event.listens_for(Session, "after_commit")
+def _invalidate_committed_embeddings(session: Session) -> None:
+    for campaign_id in session.info.pop(_SESSION_VECTOR_KEY, ()):
+        for retriever in list(_RETRIEVERS):
+            retriever.invalidate(campaign_id)
+
+
+@sa_event.listens_for(Session, "after_rollback")
+def _discard_rolled_back_embedding_changes(session: Session) -> None:
+    session.info.pop(_SESSION_VECTOR_KEY, None)
+
+
+@sa_event.listens_for(ContentNode.__table__, "after_drop")
+def _reset_vectors_on_drop(target: Any, connection: Any, **kw: Any) -> None:
+    for retriever in list(_RETRIEVERS):
+        retriever._indexes.clear()
+
+
+async def _content_fingerprint(s: AsyncSession, campaign_id: int) -> tuple[int, ...]:
+    """``(count, max id)`` of the campaign's content nodes, then of its lore chunks."""
+    out: list[int] = []
+    for model in (ContentNode, LoreChunk):
+        q = await s.execute(
+            sa.select(sa.func.count(model.id), sa.func.max(model.id)).where(
+                model.campaign_id == campaign_id
+            )
+        )
+        count, max_id = q.one()
+        out += [int(count or 0), int(max_id or 0)]
+    return tuple(out)
+
+
+_DEFAULT_RETRIEVERS: dict[tuple[bool, int], VectorRetriever] = {}
+
+
+def get_vector_retriever(settings: Any, *, pgvector: bool = False) -> VectorRetriever:
+    """Process-wide retriever so campaign matrices survive across requests."""
+    cfg = settings.retrieval
+    key = (pgvector, cfg.vector_dim)
+    retriever = _DEFAULT_RETRIEVERS.get(key)
+    if retriever is None:
+        sm = get_sessionmaker()
+        retriever = VectorRetriever(
+            sm,
+            embed=HashingVectorizer(cfg.vector_dim),
+            adapter=PgVectorAdapter(sm, cfg.vector_dim) if pgvector else None,
+            max_campaigns=cfg.vector_max_campaigns,
+            refresh_seconds=cfg.vector_refresh_seconds,
+        )
+        _DEFAULT_RETRIEVERS[key] = retriever
+    return retriever
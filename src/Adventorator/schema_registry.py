@@ -0,0 +1,113 @@
+"""Compiled JSON Schema validators for the contracts under ``contracts/``.
+
+Importer and lore validation used to re-read and ``json.load`` a contract and
+call ``jsonschema.validate`` (which re-checks the schema and builds a new
+validator) for every payload. The registry loads each contract once and
+compiles a validator for the dialect named by its ``$schema``, with that
+dialect's format checker. Entries are keyed by path and revalidated against
+the file's mtime, so an edited contract is picked up without a restart.
+
+``validate_against_schema`` raises the same ``jsonschema.ValidationError``
+(``best_match``) that ``jsonschema.validate`` would. It records the time spent
+in a per-contract histogram, ``schemas.<contract stem>.validate_us``.
+
+``jsonschema`` is imported lazily. Callers keep their own fallback for when it
+is not installed.
+"""
+
+from __future__ import annotations
+
+import json
+import os
+import threading
+import time
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any
+
+from Adventorator.metrics import observe_histogram
+
+# Validation runs in microseconds for the seed contracts
+_VALIDATE_US_BUCKETS = [10, 25, 50, 100, 250, 500, 1000, 2500, 5000, 10000, 50000]
+
+
+@dataclass(slots=True, frozen=True)
+class _CompiledSchema:
+    mtime_ns: int
+    validator: Any
+    metric: str
+
+
+_compiled: dict[str, _CompiledSchema] = {}
+_lock = threading.Lock()
+
+
+def _compile(path: Path, mtime_ns: int) -> _CompiledSchema:
+    import jsonschema  # type: ignore[import-untyped]
+
+    with open(path, encoding="utf-8") as f:
+        schema = json.load(f)
+
+    validator_cls = jsonschema.validators.validator_for(schema)
+    validator_cls.check_schema(schema)
+    validator = validator_cls(schema, format_checker=validator_cls.FORMAT_CHECKER)
+    return _CompiledSchema(
+        mtime_ns=mtime_ns,
+        validator=validator,
+        metric=f"schemas.{path.name.removesuffix('.json')}.validate_us",
+    )
+
+
+def _get_compiled(path: Path) -> _CompiledSchema:
+    key = os.fspath(path)
+    mtime_ns = os.stat(key).st_mtime_ns
+    entry = _compiled.get(key)
+    if entry is not None and entry.mtime_ns == mtime_ns:
+        return entry
+    with _lock:
+        entry = _compiled.get(key)
+        if entry is None or entry.mtime_ns != mtime_ns:
+            entry = _compiled[key] = _compile(path, mtime_ns)
+        return entry
+
+
+def get_schema_validator(path: Path) -> Any:
+    """Return the compiled validator for the contract at ``path``.
+
+    Raises:
+        OSError: If the contract cannot be read
+        json.JSONDecodeError: If the contract is not valid JSON
+        jsonschema.SchemaError: If the contract is not a valid schema
+    """
+    return _get_compiled(path).validator
+
+
+def validate_against_schema(path: Path, instance: Any) -> None:
+    """Validate ``instance`` against the contract at ``path``.
+
+    The instance is only read, never copied or modified.
+
+    Raises:
+        jsonschema.ValidationError: The most relevant error, as ``jsonschema.validate``
+        OSError, json.JSONDecodeError, jsonschema.SchemaError: As ``get_schema_validator``
+    """
+    from jsonschema.exceptions import best_match  # type: ignore[import-untyped]
+
+    compiled = _get_compiled(path)
+    start = time.perf_counter()
+    try:
+        error = best_match(compiled.validator.iter_errors(instance))
+    finally:
+        elapsed_us = int((time.perf_counter() - start) * 1_000_000)
+        observe_histogram(compiled.metric, elapsed_us, buckets=_VALIDATE_US_BUCKETS)
+    if error is not None:
+        raise error
+
+
+def clear_schema_cache() -> None:
+    """Drop every compiled validator (they are rebuilt on next use)."""
+    with _lock:
+        _compiled.clear()
+
+
+__all__ = ["clear_schema_cache", "get_schema_validator", "validate_against_schema"]
@@ -1,6 +1,7 @@
 from __future__ import annotations
 
 import asyncio
+import weakref
 from collections.abc import AsyncIterator
 from contextlib import asynccontextmanager
 
@@ -101,3 +102,87 @@ async def acquire_encounter_locks(
             local_lock.release()
         except Exception:
             pass
+
+
+# -----------------------------
+# Campaign event ledger locks
+# -----------------------------
+
+# Advisory lock class for the event ledger (encounters use 1001).
+_EVENT_LOCK_CLASS = 1002
+# Keyed by event loop: a contended asyncio.Lock binds to the loop it waited on.
+_event_locks: weakref.WeakKeyDictionary[asyncio.AbstractEventLoop, dict[int, asyncio.Lock]] = (
+    weakref.WeakKeyDictionary()
+)
+
+
+def campaign_event_lock(campaign_id: int) -> asyncio.Lock:
+    """Return the in-process append lock shared by every ledger writer for a campaign."""
+    locks = _event_locks.setdefault(asyncio.get_running_loop(), {})
+    lk = locks.get(campaign_id)
+    if lk is None:
+        lk = asyncio.Lock()
+        locks[campaign_id] = lk
+    return lk
+
+
+def _session_is_postgres(s: AsyncSession) -> bool:
+    try:
+        bind = getattr(s, "bind", None)
+        if bind is not None and getattr(bind, "dialect", None) is not None:
+            return (bind.dialect.name or "").lower().startswith("postgres")
+    except Exception:
+        pass
+    return False
+
+
+@asynccontextmanager
+async def acquire_campaign_event_lock(
+    s: AsyncSession, *, campaign_id: int, timeout_seconds: float = 5.0
+) -> AsyncIterator[bool]:
+    """Serialize event appends for a campaign, across processes on Postgres.
+
+    On Postgres a transaction-scoped advisory lock (``pg_try_advisory_xact_lock``)
+    is acquired first, with a bounded backoff; it is held until the session's
+    transaction commits or rolls back, so the next writer in any worker sees
+    the committed chain tip. The in-process asyncio lock is taken afterwards.
+    That order matters: the advisory lock is re-entrant for a session that
+    already holds it (an import appending many events in one transaction), so
+    that session must never queue behind a local holder that is itself polling
+    for the advisory lock. SQLite falls back to the in-process lock only.
+
+    Yields True when the cross-process lock is held (callers should not trust
+    process-local ledger caches without re-checking the DB).
+    """
+    use_pg_lock = _session_is_postgres(s)
+    if use_pg_lock:
+        waited_ms = 0.0
+        step_ms = 5.0
+        max_ms = timeout_seconds * 1000
+        while True:
+            q = await s.execute(
+                text("SELECT pg_try_advisory_xact_lock(:c, :k)"),
+                {"c": _EVENT_LOCK_CLASS, "k": campaign_id},
+            )
+            if bool(q.scalar_one()):
+                break
+            if waited_ms >= max_ms:
+                inc_counter("locks.event_append.timeout")
+                observe_histogram("locks.event_append.wait_ms", int(waited_ms))
+                raise TimeoutError("event append advisory lock timeout")
+            inc_counter("locks.event_append.contended")
+            await asyncio.sleep(step_ms / 1000)
+            waited_ms += step_ms
+            step_ms = min(step_ms * 2, 100.0)
+        inc_counter("locks.event_append.mode.pg")
+        observe_histogram("locks.event_append.wait_ms", int(waited_ms))
+    else:
+        inc_counter("locks.event_append.mode.inproc")
+
+    local_lock = campaign_event_lock(campaign_id)
+    await local_lock.acquire()
+    try:
+        yield use_pg_lock
+    finally:
+        # The advisory lock is transaction-scoped; only the local lock is released here.
+        local_lock.release()
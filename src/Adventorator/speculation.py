@@ -0,0 +1,109 @@
+# src/Adventorator/speculation.py
+"""Speculative narrator calls started at ``/interactions`` defer time.
+
+For ``/do`` and ``/ooc`` the prompt only depends on data that already exists
+when the interaction arrives (recent transcripts, the active character and
+retrieval), plus the player's message. Once the signature and payload check
+out, the edge starts building that prompt and hands it to
+``LLMScheduler.speculate`` while the deferred response, DB writes and command
+dispatch proceed. When the handler later asks for the identical prompt it
+coalesces onto the running call; if validation fails, the prompt turns out
+different, or nobody asks within the hold window, the result is discarded.
+
+Speculation is best-effort: it only reads the DB, never raises, and is skipped
+when the campaign or scene does not exist yet.
+"""
+
+from __future__ import annotations
+
+import asyncio
+from typing import Any
+
+import structlog
+
+from Adventorator import models, repos
+from Adventorator.db import session_scope
+from Adventorator.llm_scheduler import llm_request_scope
+from Adventorator.metrics import inc_counter
+
+log = structlog.get_logger()
+
+SPECULATIVE_COMMANDS = frozenset({"do", "ooc"})
+
+# Strong references so fire-and-forget tasks are not garbage collected mid-flight
+_tasks: set[asyncio.Task[Any]] = set()
+
+
+def _message_is_valid(message: str) -> bool:
+    # Mirrors the handlers' checks so obviously rejected input never reaches the LLM
+    return len(message) >= 3 and message.lower() not in {"y", "n", "yes", "no", "ok", "k"}
+
+
+async def speculate_narration(
+    name: str,
+    message: str,
+    *,
+    guild_id: int,
+    channel_id: int,
+    user_id: int,
+    settings: Any,
+    llm_client: Any,
+) -> bool:
+    """Build the handler's prompt and start the LLM call; returns True if started."""
+    if name not in SPECULATIVE_COMMANDS or llm_client is None:
+        return False
+    if not getattr(settings, "features_llm", False) or not hasattr(llm_client, "speculate"):
+        return False
+    message = (message or "").strip()
+    if not _message_is_valid(message):
+        return False
+    # Imported lazily: command modules register themselves on import
+    from Adventorator.commands.do import character_summary
+    from Adventorator.commands.ooc import build_ooc_prompt
+    from Adventorator.orchestrator import build_narrator_prompt, with_pending_transcript
+    from Adventorator.services.character_service import CharacterService
+
+    try:
+        with llm_request_scope(guild_id=str(guild_id) if guild_id else None, deadline_s=None):
+            summary = None
+            async with session_scope() as s:
+                campaign = await repos.get_campaign_by_guild(s, guild_id)
+                scene = await repos.get_scene_by_channel(s, channel_id) if campaign else None
+                if campaign is None or scene is None or scene.campaign_id != campaign.id:
+                    inc_counter("llm.speculative.skipped")
+                    return False
+                scene_id = scene.id
+                if name == "ooc":
+                    txs = await repos.get_recent_transcripts(s, scene_id=scene_id, limit=15)
+                else:
+                    sheet = await CharacterService().get_active_sheet_info(
+                        s, user_id=user_id, guild_id=guild_id, channel_id=channel_id
+                    )
+                    summary = character_summary(sheet) if sheet is not None else None
+            pending = models.Transcript(author="player", author_ref=str(user_id), content=message)
+            if name == "ooc":
+                msgs = build_ooc_prompt(with_pending_transcript(txs, pending), message, settings)
+                return bool(llm_client.speculate("response", msgs))
+            msgs = await build_narrator_prompt(
+                scene_id,
+                message,
+                character_summary_provider=(lambda: summary) if summary else None,
+                prompt_token_cap=getattr(settings, "llm_max_prompt_tokens", None),
+                settings=settings,
+                pending=pending,
+            )
+            return bool(llm_client.speculate("json", msgs))
+    except Exception:
+        inc_counter("llm.speculative.errors")
+        log.warning("llm.speculative.error", command_name=name, exc_info=True)
+        return False
+
+
+def start_speculation(name: str, message: str, **kwargs: Any) -> asyncio.Task[bool] | None:
+    """Fire-and-forget ``speculate_narration`` for a speculative command."""
+    if name not in SPECULATIVE_COMMANDS:
+        return None
+    task = asyncio.get_running_loop().create_task(speculate_narration(name, message, **kwargs))
+    _tasks.add(task)
+    task.add_done_callback(_tasks.discard)
+    return task
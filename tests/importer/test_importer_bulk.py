@@ -0,0 +1,167 @@
+"""Bulk persistence mode for run_full_import_with_database."""
+
+import hashlib
+from pathlib import Path
+
+import pytest
+from sqlalchemy import event, select
+
+from Adventorator import importer, repos
+from Adventorator.db import get_engine, session_scope
+from Adventorator.events.envelope import verify_hash_chain
+from Adventorator.importer import (
+    ImporterError,
+    persist_import_event,
+    persist_import_events_bulk,
+    persist_lore_chunks,
+    run_full_import_with_database,
+)
+from Adventorator.models import Event, ImportLog, LoreChunk
+
+HAPPY_PATH = Path(__file__).parents[1] / "fixtures" / "import" / "manifest" / "happy-path"
+
+
+async def _campaign(guild_id: int) -> int:
+    async with session_scope() as s:
+        camp = await repos.get_or_create_campaign(s, guild_id=guild_id, name=f"Bulk {guild_id}")
+        return camp.id
+
+
+async def _ledger(campaign_id: int) -> tuple[list[Event], list[ImportLog]]:
+    async with session_scope() as s:
+        events = (
+            await s.execute(
+                select(Event).where(Event.campaign_id == campaign_id).order_by(Event.replay_ordinal)
+            )
+        ).scalars()
+        logs = (
+            await s.execute(
+                select(ImportLog)
+                .where(ImportLog.campaign_id == campaign_id)
+                .order_by(ImportLog.sequence_no)
+            )
+        ).scalars()
+        return list(events), list(logs)
+
+
+@pytest.mark.asyncio
+async def test_bulk_import_matches_per_event_import(db):
+    single_id = await _campaign(9101)
+    bulk_id = await _campaign(9102)
+    progress: list[tuple[str, int, int]] = []
+
+    single = await run_full_import_with_database(HAPPY_PATH, single_id)
+    bulk = await run_full_import_with_database(
+        HAPPY_PATH, bulk_id, bulk=True, batch_size=2, progress=lambda *a: progress.append(a)
+    )
+
+    assert bulk["state_digest"] == single["state_digest"]
+    single_events, single_logs = await _ledger(single_id)
+    bulk_events, bulk_logs = await _ledger(bulk_id)
+    # Completion payloads carry run timings; every seed event must match exactly
+    assert [e.type for e in bulk_events] == [e.type for e in single_events]
+    assert [(e.replay_ordinal, e.payload_hash) for e in bulk_events[:-1]] == [
+        (e.replay_ordinal, e.payload_hash) for e in single_events[:-1]
+    ]
+    assert [(il.sequence_no, il.phase, il.stable_id) for il in bulk_logs] == [
+        (il.sequence_no, il.phase, il.stable_id) for il in single_logs
+    ]
+    # The in-memory chain links exactly like the per-event path
+    assert verify_hash_chain(bulk_events)["verified_count"] == len(bulk_events)
+    assert bulk["hash_chain_tip"] == repos.envelope_hash_for_event(bulk_events[-1]).hex()
+
+    seed_count = len(bulk_events) - 1  # the completion event is appended on its own
+    assert ("events", seed_count, seed_count) in progress
+    log_progress = [done for stage, done, _total in progress if stage == "import_logs"]
+    assert log_progress == sorted(log_progress) and log_progress[-1] == len(bulk_logs)
+    assert len(log_progress) == -(-len(bulk_logs) // 2)  # one report per batch of 2
+
+    # Re-running is still an idempotent skip
+    again = await run_full_import_with_database(HAPPY_PATH, bulk_id, bulk=True)
+    assert again["idempotent_skip"] is True
+    assert len((await _ledger(bulk_id))[0]) == len(bulk_events)
+
+
+@pytest.mark.asyncio
+async def test_bulk_events_reuse_existing_keys_and_reject_collisions(db):
+    campaign_id = await _campaign(9103)
+    first = {"stable_id": "npc-1", "name": "Aria"}
+    async with session_scope() as s:
+        await persist_import_event(s, campaign_id, None, "seed.entity_created", first)
+        inserted = await persist_import_events_bulk(
+            s,
+            campaign_id,
+            [
+                ("seed.entity_created", dict(first)),  # already persisted: reused
+                ("seed.entity_created", {"stable_id": "npc-2", "name": "Bram"}),
+            ],
+        )
+        assert inserted == 1
+        # Appends after a bulk insert chain onto its last event
+        await persist_import_event(s, campaign_id, None, "seed.import.complete", {"ok": True})
+
+    events, _ = await _ledger(campaign_id)
+    assert [e.replay_ordinal for e in events] == [0, 1, 2]
+    assert verify_hash_chain(events)["verified_count"] == 3
+
+    with pytest.raises(ImporterError, match="collision"):
+        async with session_scope() as s:
+            await persist_import_events_bulk(
+                s,
+                campaign_id,
+                [
+                    ("seed.entity_created", {"stable_id": "npc-3", "name": "Cyd"}),
+                    ("seed.entity_created", {"stable_id": "npc-3", "name": "Cyd", "x": None}),
+                ],
+            )
+
+
+def _lore(chunk_id: str, content: str) -> dict:
+    return {
+        "chunk_id": chunk_id,
+        "title": chunk_id,
+        "audience": "Player",
+        "tags": [],
+        "content": content,
+        "content_hash": hashlib.sha256(content.encode()).hexdigest(),
+        "source_path": f"lore/{chunk_id}.md",
+        "chunk_index": 0,
+    }
+
+
+@pytest.mark.asyncio
+async def test_existing_key_lookups_are_batched(db, monkeypatch):
+    monkeypatch.setattr(importer, "LOOKUP_BATCH_SIZE", 2)
+    campaign_id = await _campaign(9104)
+    payloads = [{"stable_id": f"npc-{i}", "name": f"N{i}"} for i in range(5)]
+    chunks = [_lore(f"LORE-{i:03d}", f"Chapter {i}") for i in range(5)]
+    async with session_scope() as s:
+        for payload in payloads:
+            await persist_import_event(s, campaign_id, None, "seed.entity_created", payload)
+        assert await persist_lore_chunks(s, campaign_id, chunks) == 5
+
+    in_params: list[int] = []
+
+    def capture(conn, cursor, statement, parameters, context, executemany):
+        if " IN (" in statement and not executemany:
+            in_params.append(len(parameters))
+
+    engine = get_engine().sync_engine
+    event.listen(engine, "before_cursor_execute", capture)
+    try:
+        async with session_scope() as s:
+            events = [("seed.entity_created", dict(p)) for p in payloads]
+            assert await persist_import_events_bulk(s, campaign_id, events) == 0
+            rewritten = chunks[:1] + [_lore(c["chunk_id"], "Rewritten") for c in chunks[1:]]
+            assert await persist_lore_chunks(s, campaign_id, rewritten) == 4
+    finally:
+        event.remove(engine, "before_cursor_execute", capture)
+
+    # 5 reused events + 5 chunk lookups + 4 changed-chunk deletes, two keys at a time
+    assert len(in_params) == 3 + 3 + 2
+    assert max(in_params) <= 3  # campaign_id plus one batch of keys
+    async with session_scope() as s:
+        stored = await s.execute(
+            select(LoreChunk.content).where(LoreChunk.campaign_id == campaign_id)
+        )
+        assert sorted(stored.scalars()) == ["Chapter 0"] + ["Rewritten"] * 4
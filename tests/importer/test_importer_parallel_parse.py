@@ -0,0 +1,145 @@
+"""Parallel file parsing across the entity, edge and lore phases."""
+
+from __future__ import annotations
+
+import json
+import shutil
+from pathlib import Path
+
+import pytest
+
+from Adventorator import importer
+from Adventorator.importer import (
+    EdgePhase,
+    EdgeValidationError,
+    EntityPhase,
+    LorePhase,
+    ParsePool,
+    run_complete_import_pipeline,
+)
+from Adventorator.importer_context import ImporterRunContext
+
+HAPPY_PATH = Path(__file__).parents[1] / "fixtures" / "import" / "manifest" / "happy-path"
+MANIFEST = {"package_id": "01JA6Z7F8PKG00000000000000", "manifest_hash": "abc"}
+
+
+def _stable_id(prefix: str, n: int) -> str:
+    return f"01JA6Z7F8{prefix}{n:0{17 - len(prefix)}d}"
+
+
+def _write_package(root: Path, count: int = 12) -> None:
+    shutil.copytree(HAPPY_PATH / "entities", root / "entities")
+    shutil.copytree(HAPPY_PATH / "lore", root / "lore")
+    (root / "edges").mkdir()
+    for n in range(count):
+        entity = {
+            "stable_id": _stable_id("GEN", n),
+            "kind": "npc" if n % 2 else "location",
+            "name": f"Cafe\u0301 {n}",  # decomposed: NFC happens in the worker
+            "tags": [f"tag-{n}"],
+            "affordances": ["greet"],
+        }
+        (root / "entities" / f"gen-{count - n:03d}.json").write_text(
+            json.dumps(entity), encoding="utf-8"
+        )
+        edges = [
+            {
+                "stable_id": _stable_id("EDGE", n * 2 + i),
+                "type": "adjacent_to",
+                "src_ref": _stable_id("GEN", n),
+                "dst_ref": _stable_id("GEN", (n + 1 + i) % count),
+            }
+            for i in range(2)
+        ]
+        (root / "edges" / f"gen-{n:03d}.json").write_text(json.dumps(edges), encoding="utf-8")
+        (root / "lore" / f"gen-{n:03d}.md").write_text(
+            f"---\nchunk_id: GEN_{n}\ntitle: Gen {n}\naudience: Player\ntags:\n  - lore:gen\n"
+            f"---\n\n# Part one\n\nFirst {n}.\n\n# Part two\n\nSecond {n}.\n",
+            encoding="utf-8",
+        )
+
+
+def _parse(root: Path, workers: int, pool: ParsePool | None = None) -> tuple[list, list, list, str]:
+    entities = EntityPhase(True, workers, pool).parse_and_validate_entities(root, MANIFEST)
+    edges = EdgePhase(True, workers, pool).parse_and_validate_edges(root, MANIFEST, entities)
+    chunks = LorePhase(True, True, workers, pool).parse_and_validate_lore(root, MANIFEST)
+    context = ImporterRunContext()
+    context.record_entities(entities)
+    context.record_edges(edges)
+    context.record_lore_chunks(chunks)
+    for entity in entities:
+        entity.pop("import_log_entries")
+    for edge in edges:
+        edge.pop("import_log_entry")
+    for chunk in chunks:
+        chunk.pop("import_log_entries")
+    return entities, edges, chunks, context.compute_state_digest()
+
+
+def test_parallel_parse_matches_inline(tmp_path):
+    _write_package(tmp_path)
+
+    inline = _parse(tmp_path, workers=0)
+    parallel = _parse(tmp_path, workers=3)
+
+    assert parallel == inline
+    entities, edges, chunks, _digest = parallel
+    assert len(entities) == 14 and len(edges) == 24 and len(chunks) > 12
+
+
+class _CountingExecutor(importer.ProcessPoolExecutor):
+    started = 0
+
+    def __init__(self, *args, **kwargs):
+        type(self).started += 1
+        super().__init__(*args, **kwargs)
+
+
+def test_phases_share_one_pool_per_run(tmp_path, monkeypatch):
+    _write_package(tmp_path)
+    monkeypatch.setattr(importer, "ProcessPoolExecutor", _CountingExecutor)
+    monkeypatch.setattr(_CountingExecutor, "started", 0)
+
+    with ParsePool(3) as pool:
+        shared = _parse(tmp_path, workers=0, pool=pool)
+    assert _CountingExecutor.started == 1
+    assert shared == _parse(tmp_path, workers=0)
+
+    # Below the size threshold every phase parses inline
+    _parse(tmp_path, workers=3)
+    assert _CountingExecutor.started == 4
+    monkeypatch.setattr(importer, "PARALLEL_PARSE_MIN_JOBS", 100)
+    _parse(tmp_path, workers=3)
+    assert _CountingExecutor.started == 4
+
+
+def test_parallel_pipeline_keeps_fixture_digest():
+    expected = (HAPPY_PATH / "state_digest.txt").read_text(encoding="utf-8").strip()
+
+    result = run_complete_import_pipeline(HAPPY_PATH, True, True, parse_workers=2)
+
+    assert result["finalization"]["state_digest"] == expected
+
+
+@pytest.mark.parametrize("workers", [0, 2])
+def test_edge_errors_surface_in_file_and_record_order(tmp_path, monkeypatch, workers):
+    monkeypatch.setattr(importer, "PARALLEL_PARSE_MIN_JOBS", 2)
+    entities = [{"stable_id": _stable_id("GEN", 0)}]
+    edges_dir = tmp_path / "edges"
+    edges_dir.mkdir()
+    good = {"type": "adjacent_to", "src_ref": _stable_id("GEN", 0)}
+    # Record 0 fails the cross-file reference check, record 1 the per-file taxonomy check
+    (edges_dir / "a.json").write_text(
+        json.dumps(
+            [
+                {**good, "stable_id": "E1", "dst_ref": "missing"},
+                {**good, "stable_id": "E2", "type": "bogus"},
+            ]
+        ),
+        encoding="utf-8",
+    )
+    (edges_dir / "b.json").write_text("{not json", encoding="utf-8")
+
+    phase = EdgePhase(True, parse_workers=workers)
+    with pytest.raises(EdgeValidationError, match="missing entity reference"):
+        phase.parse_and_validate_edges(tmp_path, MANIFEST, entities)
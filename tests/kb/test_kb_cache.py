@@ -5,7 +5,13 @@ from unittest.mock import AsyncMock
 
 import pytest
 
-from Adventorator.kb.adapter import KBAdapter
+from Adventorator.kb.adapter import (
+    Candidate,
+    KBAdapter,
+    KBResolution,
+    SqliteKBCacheBackend,
+    _KBCache,
+)
 from Adventorator.metrics import get_counter, reset_counters
 
 
@@ -158,3 +164,71 @@ async def test_different_limits_different_cache_keys(mock_sessionmaker):
     # Should have 2 misses and 1 hit
     assert get_counter("kb.lookup.miss") == 2
     assert get_counter("kb.lookup.hit") == 1
+
+
+def _resolution(n: int) -> KBResolution:
+    return KBResolution(
+        canonical_id=f"character:{n}",
+        candidates=[Candidate(id=f"character:{n}", label=f"Char {n}")],
+        reason="Exact match found",
+        source="repo",
+    )
+
+
+@pytest.mark.asyncio
+async def test_lru_evicts_least_recently_used_not_oldest_insert():
+    cache = _KBCache(max_size=2, ttl_s=60.0)
+    await cache.set("a", _resolution(1))
+    await cache.set("b", _resolution(2))
+    assert await cache.get("a") is not None  # a becomes most recently used
+    await cache.set("c", _resolution(3))
+
+    assert await cache.get("b") is None
+    assert await cache.get("a") is not None and await cache.get("c") is not None
+    assert get_counter("kb.cache.evicted") == 1
+
+
+@pytest.mark.asyncio
+async def test_byte_budget_and_accounting():
+    probe = _KBCache()
+    await probe.set("k0", _resolution(0))
+    entry_bytes = probe.nbytes
+    assert entry_bytes > 0
+
+    cache = _KBCache(max_size=100, ttl_s=60.0, max_bytes=entry_bytes * 3)
+    for i in range(5):
+        await cache.set(f"k{i}", _resolution(i))
+    assert len(cache) == 3
+    assert cache.nbytes == entry_bytes * 3
+    # Overwriting a key does not double count
+    await cache.set("k4", _resolution(4))
+    assert cache.nbytes == entry_bytes * 3
+
+
+@pytest.mark.asyncio
+async def test_shared_backend_serves_other_workers(tmp_path):
+    path = str(tmp_path / "kb_cache.sqlite3")
+    worker_a = _KBCache(ttl_s=60.0, backend=SqliteKBCacheBackend(path))
+    worker_b = _KBCache(ttl_s=60.0, backend=SqliteKBCacheBackend(path))
+    await worker_a.set("single:aria:5", _resolution(7))
+
+    assert await worker_b.get("single:aria:5") == _resolution(7)
+    assert get_counter("kb.cache.shared.hit") == 1
+    # Promoted into worker_b's local LRU: the next hit does not touch the backend
+    assert await worker_b.get("single:aria:5") == _resolution(7)
+    assert get_counter("kb.cache.shared.hit") == 1
+
+    expired = SqliteKBCacheBackend(path)
+    expired.set("gone", b"{}", ttl_s=-1)
+    assert expired.get("gone") is None
+    assert expired.purge_expired() == 1
+
+
+@pytest.mark.asyncio
+async def test_shared_backend_purges_expired_rows_on_write(tmp_path):
+    backend = SqliteKBCacheBackend(str(tmp_path / "kb_cache.sqlite3"), purge_interval_s=0.0)
+    backend.set("gone", b"{}", ttl_s=-1)  # purged by the write that stored it
+    await _KBCache(ttl_s=60.0, backend=backend).set("kept", _resolution(1))
+
+    assert backend._conn.execute("SELECT key FROM kb_cache").fetchall() == [("kept",)]
+    assert get_counter("kb.cache.shared.purged") == 1
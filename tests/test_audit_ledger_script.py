@@ -0,0 +1,45 @@
+"""scripts/audit_ledger.py: concurrent multi-campaign ledger audit report."""
+
+import pytest
+
+from Adventorator import repos
+from scripts import audit_ledger
+
+
+async def _seed(db, guild_id: int, n: int) -> int:
+    camp = await repos.get_or_create_campaign(db, guild_id, name="Audit")
+    scene = await repos.ensure_scene(db, camp.id, guild_id * 10)
+    await repos.append_events_batch(
+        db,
+        scene_id=scene.id,
+        actor_id="gm",
+        events=[{"type": "audit", "payload": {"i": i}} for i in range(n)],
+        request_id=f"audit-{guild_id}",
+    )
+    return camp.id
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize("workers", [0, 2, None])
+async def test_audit_reports_mismatches_per_campaign(db, workers):
+    ok_a = await _seed(db, 7501, 7)
+    bad = await _seed(db, 7502, 6)
+    ok_b = await _seed(db, 7503, 0)
+    events = await repos.get_campaign_events_for_verification(db, campaign_id=bad)
+    events[2].payload_hash = b"\x22" * 32
+    await db.commit()
+
+    report = await audit_ledger.run_audit(concurrency=2, workers=workers, page_size=3)
+
+    by_id = {c["campaign_id"]: c for c in report["campaigns"]}
+    assert set(by_id) == {ok_a, bad, ok_b}
+    assert by_id[ok_a]["status"] == "ok" and by_id[ok_a]["event_count"] == 7
+    assert by_id[ok_b]["status"] == "ok" and by_id[ok_b]["event_count"] == 0
+    assert by_id[bad]["status"] == "failed"
+    # Only the link right after the tampered row breaks; the walk continues past it
+    assert [m["ordinal"] for m in by_id[bad]["mismatches"]] == [3]
+    assert by_id[bad]["event_count"] == 6
+    assert report["summary"]["failed"] == 1
+    assert report["summary"]["events"] == 13
+    assert report["summary"]["workers"] <= 3
+    assert all(c["elapsed_ms"] >= 0 for c in report["campaigns"])
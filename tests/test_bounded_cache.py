@@ -0,0 +1,74 @@
+import asyncio
+
+import pytest
+
+from Adventorator import bounded_cache
+from Adventorator.bounded_cache import BoundedCache, start_sweeper, stop_sweeper
+from Adventorator.metrics import get_counter, get_counters, reset_counters
+
+
+class _Clock:
+    def __init__(self):
+        self.now = 1000.0
+
+    def __call__(self):
+        return self.now
+
+
+@pytest.fixture
+def clock(monkeypatch):
+    c = _Clock()
+    monkeypatch.setattr(bounded_cache.time, "monotonic", c)
+    return c
+
+
+def test_lru_ttl_and_counters(clock):
+    reset_counters()
+    cache: BoundedCache[str, str] = BoundedCache("test.lru", ttl_s=10, max_entries=2)
+    cache.set("a", "1")
+    cache.set("b", "2")
+    assert cache.get("a") == "1"  # a becomes most recently used
+    cache.set("c", "3")
+    assert cache.get("b") is None and len(cache) == 2
+
+    clock.now += 5
+    assert cache.get_with_age("a") == ("1", 5.0)
+    clock.now += 6
+    assert cache.get("a") is None
+
+    assert get_counter("test.lru.hit") == 2
+    assert get_counter("test.lru.miss") == 1
+    assert get_counter("test.lru.expired") == 1
+    assert get_counter("test.lru.evicted") == 1
+
+
+def test_byte_bound_sweep_and_gauges(clock):
+    reset_counters()
+    cache: BoundedCache[str, str] = BoundedCache(
+        "test.bytes", ttl_s=10, max_entries=100, max_bytes=20
+    )
+    cache.set("k1", "x" * 8)
+    cache.set("k2", "y" * 8)
+    assert cache.nbytes == 20
+    cache.set("k3", "z" * 8)
+    assert cache.get("k1") is None and cache.nbytes == 20
+    counters = get_counters()
+    assert counters["gauge.test.bytes.entries"] == 2
+    assert counters["gauge.test.bytes.bytes"] == 20
+
+    clock.now += 11
+    assert bounded_cache.sweep_all() >= 2
+    assert len(cache) == 0
+    assert "gauge.test.bytes.entries" not in get_counters()
+
+
+@pytest.mark.asyncio
+async def test_background_sweeper_drops_expired_entries():
+    cache: BoundedCache[str, str] = BoundedCache("test.sweeper", ttl_s=0.01)
+    cache.set("k", "v")
+    start_sweeper(interval_s=0.02)
+    try:
+        await asyncio.sleep(0.1)
+        assert len(cache) == 0
+    finally:
+        await stop_sweeper()
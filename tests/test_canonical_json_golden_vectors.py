@@ -5,12 +5,18 @@ identical output to precomputed golden vectors, ensuring no accidental drift
 in the canonicalization algorithm.
 """
 
+import enum
+import hashlib
 import json
 from pathlib import Path
 
 import pytest
 
-from Adventorator.canonical_json import canonical_json_bytes, compute_canonical_hash
+from Adventorator.canonical_json import (
+    canonical_json_bytes,
+    canonical_json_bytes_orjson,
+    compute_canonical_hash,
+)
 
 
 class TestGoldenVectors:
@@ -210,3 +216,56 @@ class TestGoldenVectors:
 
         assert result1 == result2
         assert hash1 == hash2
+
+
+class TestEncoderBackends:
+    """The single-pass, streaming and orjson paths must agree byte for byte."""
+
+    @pytest.fixture
+    def golden_dir(self):
+        return Path(__file__).parent / "golden" / "canonical_json"
+
+    def test_orjson_backend_matches_golden_vectors(self, golden_dir):
+        for json_file in sorted(golden_dir.glob("*.json")):
+            payload = json.loads(json_file.read_text())
+            expected = (golden_dir / f"{json_file.stem}.canonical").read_bytes()
+            assert canonical_json_bytes_orjson(payload) == expected, json_file.name
+
+    def test_backends_agree_on_escapes_and_unicode(self):
+        payload = {
+            "ctrl": "tab\there\x00\x1f",
+            "quote": 'say "hi" \\ bye',
+            "line_sep": "a\u2028b",
+            "emoji": "\U0001f600",
+            "escape_then_mark": "\n\u0301",  # NFC composes the escape's "n" with the mark
+            "nfd_ke\u0301y": ["e\u0301", {"\u212b": 1}],
+        }
+        expected = canonical_json_bytes(payload)
+        assert canonical_json_bytes_orjson(payload) == expected
+        assert compute_canonical_hash(payload) == hashlib.sha256(expected).digest()
+
+    def test_str_enum_members_encode_as_their_value(self):
+        class Tone(str, enum.Enum):
+            CALM = "calm"
+            FIERCE = "fi\u00e9rce"
+
+        payload = {"tone": Tone.CALM, "tags": [Tone.FIERCE, "x"]}
+        # Golden bytes/hash from the original json.dumps-based encoder
+        expected = b'{"tags":["fi\xc3\xa9rce","x"],"tone":"calm"}'
+        assert canonical_json_bytes(payload) == expected
+        assert canonical_json_bytes_orjson(payload) == expected
+        assert compute_canonical_hash(payload).hex() == (
+            "bec1322231f98db4e71992e9253a99cbd75a2d9b22999f51ab1e30d85c9e2266"
+        )
+
+    def test_streaming_hash_matches_bytes_for_large_payload(self):
+        # Large enough that the hash is fed in several chunks
+        payload = {
+            "rows": [
+                {"id": i, "name": f"row-{i}", "tags": ["x", "y\u00e9"], "skip": None}
+                for i in range(20_000)
+            ]
+        }
+        expected = canonical_json_bytes(payload)
+        assert compute_canonical_hash(payload) == hashlib.sha256(expected).digest()
+        assert canonical_json_bytes_orjson(payload) == expected
@@ -0,0 +1,60 @@
+"""Tests for the shared canonicalization context used by the append path."""
+
+import hashlib
+from unittest.mock import patch
+
+from Adventorator.events import envelope
+
+
+def _v1_key(payload):
+    return envelope.compute_idempotency_key(
+        campaign_id=1,
+        event_type="test.event",
+        execution_request_id="req-1",
+        plan_id=None,
+        payload=payload,
+        replay_ordinal=3,
+    )
+
+
+def _v2_key(args_json):
+    return envelope.compute_idempotency_key_v2(
+        plan_id=None,
+        campaign_id=1,
+        event_type="seed.entity_created",
+        tool_name="importer",
+        ruleset_version="dnd5e-srd-v1",
+        args_json=args_json,
+    )
+
+
+def test_context_matches_direct_hashing_and_keys():
+    payload = {"b": 2, "a": "é", "skip": None}
+    canonical = envelope.canonicalize_payload(payload)
+
+    assert canonical.canonical == envelope.canonical_json_bytes(payload)
+    assert canonical.payload_hash == hashlib.sha256(canonical.canonical).digest()
+    assert envelope.compute_payload_hash(canonical) == envelope.compute_payload_hash(payload)
+    assert _v1_key(canonical) == _v1_key(payload)
+    assert _v2_key(canonical) == _v2_key(payload)
+    assert canonical.hash_prefix == canonical.payload_hash.hex()[:16]
+
+
+def test_context_encodes_once_for_hash_and_keys():
+    payload = {"roll": 17, "target": "goblin"}
+    with patch.object(
+        envelope, "canonical_json_bytes", wraps=envelope.canonical_json_bytes
+    ) as encode:
+        canonical = envelope.canonicalize_payload(payload)
+        envelope.compute_payload_hash(canonical)
+        _v1_key(canonical)
+        _v2_key(canonical)
+    assert encode.call_count == 1
+
+
+def test_genesis_and_empty_payloads_skip_encoding():
+    with patch.object(envelope, "canonical_json_bytes") as encode:
+        for payload in (envelope.GENESIS_PAYLOAD, None, {}):
+            canonical = envelope.canonicalize_payload(payload)
+            assert canonical.payload_hash == envelope.GENESIS_PAYLOAD_HASH
+    encode.assert_not_called()
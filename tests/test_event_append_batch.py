@@ -0,0 +1,82 @@
+"""repos.append_events_batch: one lock, consecutive ordinals, in-memory hash chaining."""
+
+import pytest
+
+from Adventorator import repos
+from Adventorator.events.envelope import verify_hash_chain
+from Adventorator.metrics import get_counter, reset_counters
+
+
+@pytest.mark.asyncio
+async def test_batch_interleaves_with_single_appends(db):
+    reset_counters()
+    camp = await repos.get_or_create_campaign(db, 7101, name="Batch")
+    scene = await repos.ensure_scene(db, camp.id, 71010)
+
+    await repos.append_event(
+        db, scene_id=scene.id, actor_id="gm", type="setup", payload={"n": 0}, request_id="r0"
+    )
+    rows = await repos.append_events_batch(
+        db,
+        scene_id=scene.id,
+        actor_id="Aria",
+        events=[
+            {"type": "apply_damage", "payload": {"target": "orc1", "amount": 4}},
+            {"type": "apply_damage", "payload": {"target": "orc2", "amount": 6}},
+            {"type": "condition.applied", "payload": {"target": "orc2", "condition": "prone"}},
+        ],
+        request_id="r1",
+    )
+    await repos.append_event(
+        db, scene_id=scene.id, actor_id="gm", type="wrap", payload=None, request_id="r2"
+    )
+
+    assert [r.replay_ordinal for r in rows] == [1, 2, 3]
+    assert {r.actor_id for r in rows} == {"Aria"}
+    assert len({bytes(r.idempotency_key) for r in rows}) == 3
+
+    events = await repos.get_campaign_events_for_verification(db, campaign_id=camp.id)
+    assert [e.replay_ordinal for e in events] == [0, 1, 2, 3, 4]
+    assert verify_hash_chain(events)["verified_count"] == 5
+    assert repos.fold_hp_view(events) == {"orc1": -4, "orc2": -6}
+    assert get_counter("events.append.batch") == 1
+    assert get_counter("events.applied") == 5
+
+
+@pytest.mark.asyncio
+async def test_empty_batch_is_noop(db):
+    camp = await repos.get_or_create_campaign(db, 7102, name="Batch")
+    scene = await repos.ensure_scene(db, camp.id, 71020)
+    assert await repos.append_events_batch(db, scene_id=scene.id, actor_id=None, events=[]) == []
+    assert await repos.get_campaign_events_for_verification(db, campaign_id=camp.id) == []
+
+
+@pytest.mark.asyncio
+async def test_batch_probes_stale_cached_tip(db):
+    reset_counters()
+    camp = await repos.get_or_create_campaign(db, 7103, name="Batch")
+    scene = await repos.ensure_scene(db, camp.id, 71030)
+    campaign_id, scene_id = camp.id, scene.id
+    for i in range(2):
+        await repos.append_event(
+            db, scene_id=scene_id, actor_id=None, type="t", payload={"i": i}, request_id=f"c{i}"
+        )
+    await db.commit()
+    # A tip cached before another process appended event 1
+    events = await repos.get_campaign_events_for_verification(db, campaign_id=campaign_id)
+    repos._CHAIN_TIP_CACHE[campaign_id] = repos.ChainTip(
+        0, repos.envelope_hash_for_event(events[0])
+    )
+
+    rows = await repos.append_events_batch(
+        db,
+        scene_id=scene_id,
+        actor_id=None,
+        events=[{"type": "t", "payload": {"i": 2}}, {"type": "t", "payload": {"i": 3}}],
+        request_id="c2",
+    )
+
+    assert [r.replay_ordinal for r in rows] == [2, 3]
+    assert get_counter("events.chain_tip_cache.stale") == 1
+    events = await repos.get_campaign_events_for_verification(db, campaign_id=campaign_id)
+    assert verify_hash_chain(events)["verified_count"] == 4
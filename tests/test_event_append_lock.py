@@ -0,0 +1,95 @@
+"""Campaign event append locking (advisory on Postgres, in-process on SQLite)."""
+
+import asyncio
+
+import pytest
+
+from Adventorator import importer, repos
+from Adventorator.db import get_sessionmaker
+from Adventorator.events.envelope import verify_hash_chain
+from Adventorator.metrics import get_counter, reset_counters
+from Adventorator.services import lock_service
+
+
+@pytest.mark.asyncio
+async def test_sqlite_uses_inprocess_lock(db):
+    reset_counters()
+    async with lock_service.acquire_campaign_event_lock(db, campaign_id=1) as shared:
+        assert shared is False
+        assert lock_service.campaign_event_lock(1).locked()
+    assert not lock_service.campaign_event_lock(1).locked()
+    assert get_counter("locks.event_append.mode.inproc") == 1
+
+
+@pytest.mark.asyncio
+async def test_importer_and_live_appends_share_campaign_lock(db):
+    camp = await repos.get_or_create_campaign(db, 7201, name="Lock")
+    scene = await repos.ensure_scene(db, camp.id, 72010)
+
+    async def live(i: int):
+        await repos.append_event(
+            db, scene_id=scene.id, actor_id=None, type="live", payload={"i": i}, request_id=f"l{i}"
+        )
+
+    async def seed(i: int):
+        await importer.persist_import_event(db, camp.id, None, "seed.test", {"i": i})
+
+    await asyncio.gather(*(f(i) for i in range(6) for f in (live, seed)))
+
+    events = await repos.get_campaign_events_for_verification(db, campaign_id=camp.id)
+    assert [e.replay_ordinal for e in events] == list(range(12))
+    assert verify_hash_chain(events)["verified_count"] == 12
+
+
+@pytest.mark.asyncio
+async def test_stale_cached_tip_is_probed_before_use(db):
+    reset_counters()
+    camp = await repos.get_or_create_campaign(db, 7202, name="Lock")
+    scene = await repos.ensure_scene(db, camp.id, 72020)
+    campaign_id = camp.id
+    for i in range(3):
+        await repos.append_event(
+            db, scene_id=scene.id, actor_id=None, type="t", payload={"i": i}, request_id=f"s{i}"
+        )
+    await db.commit()
+    # Simulate another worker having appended past our cached tip
+    cached = repos.get_cached_chain_tip(campaign_id)
+    repos._CHAIN_TIP_CACHE[campaign_id] = repos.ChainTip(cached.replay_ordinal - 1, b"\x01" * 32)
+
+    ordinal, prev_hash = await repos.resolve_next_chain_link(db, campaign_id=campaign_id)
+
+    assert ordinal == 3
+    assert prev_hash == cached.envelope_hash
+    assert get_counter("events.chain_tip_cache.stale") == 1
+
+
+@pytest.mark.asyncio
+async def test_two_sessions_appending_to_one_campaign_keep_both_events(db):
+    reset_counters()
+    camp = await repos.get_or_create_campaign(db, 7203, name="Lock")
+    scene = await repos.ensure_scene(db, camp.id, 72030)
+    campaign_id, scene_id = camp.id, scene.id
+    await repos.append_event(
+        db, scene_id=scene_id, actor_id=None, type="t", payload={"i": 0}, request_id="w0"
+    )
+    await db.commit()
+    tip_before_other_worker = repos.get_cached_chain_tip(campaign_id)
+
+    async with get_sessionmaker()() as other:
+        await repos.append_event(
+            other, scene_id=scene_id, actor_id=None, type="t", payload={"i": 1}, request_id="w1"
+        )
+        await other.commit()
+    # Had the other session run in another process, our cache would not have seen it
+    repos._CHAIN_TIP_CACHE[campaign_id] = tip_before_other_worker
+
+    ev = await repos.append_event(
+        db, scene_id=scene_id, actor_id=None, type="t", payload={"i": 2}, request_id="w2"
+    )
+    await db.commit()
+
+    assert ev.replay_ordinal == 2
+    assert get_counter("events.chain_tip_cache.stale") == 1
+    events = await repos.get_campaign_events_for_verification(db, campaign_id=campaign_id)
+    assert [e.execution_request_id for e in events] == ["w0", "w1", "w2"]
+    assert verify_hash_chain(events)["verified_count"] == 3
@@ -0,0 +1,84 @@
+"""Chain tip cache behaviour for repos.append_event."""
+
+import pytest
+
+from Adventorator import repos
+from Adventorator.events import envelope as event_envelope
+from Adventorator.events.envelope import verify_hash_chain
+from Adventorator.metrics import get_counter, reset_counters
+
+
+async def _append(db, scene_id: int, i: int):
+    return await repos.append_event(
+        db,
+        scene_id=scene_id,
+        actor_id=f"a{i}",
+        type="tip.test",
+        payload={"i": i},
+        request_id=f"tip-{i}",
+    )
+
+
+@pytest.mark.asyncio
+async def test_appends_served_from_cache_and_chain_verifies(db):
+    reset_counters()
+    camp = await repos.get_or_create_campaign(db, 7001, name="Tip")
+    scene = await repos.ensure_scene(db, camp.id, 70010)
+
+    for i in range(5):
+        await _append(db, scene.id, i)
+
+    # Only the first append needs to read the tip from the DB
+    assert get_counter("events.chain_tip_cache.miss") == 1
+    assert get_counter("events.chain_tip_cache.hit") == 4
+    # Uncommitted tips stay private to the session
+    assert repos.get_cached_chain_tip(camp.id) is None
+    await db.commit()
+    tip = repos.get_cached_chain_tip(camp.id)
+    assert tip is not None and tip.replay_ordinal == 4
+
+    events = await repos.get_campaign_events_for_verification(db, campaign_id=camp.id)
+    assert verify_hash_chain(events)["verified_count"] == 5
+    assert tip.envelope_hash == repos.envelope_hash_for_event(events[-1])
+
+
+@pytest.mark.asyncio
+async def test_direct_event_insert_advances_cached_tip(db):
+    camp = await repos.get_or_create_campaign(db, 7002, name="Tip")
+    scene = await repos.ensure_scene(db, camp.id, 70020)
+    genesis = event_envelope.GenesisEvent(campaign_id=camp.id, scene_id=scene.id).instantiate()
+    db.add(genesis)
+    await db.flush()
+    await db.commit()
+
+    tip = repos.get_cached_chain_tip(camp.id)
+    assert tip is not None
+    assert tip.replay_ordinal == 0
+    assert tip.envelope_hash == repos.envelope_hash_for_event(genesis)
+
+    ev = await _append(db, scene.id, 1)
+    assert ev.replay_ordinal == 1
+    assert ev.prev_event_hash == tip.envelope_hash
+
+
+@pytest.mark.asyncio
+async def test_rollback_invalidates_cached_tip(db):
+    reset_counters()
+    camp = await repos.get_or_create_campaign(db, 7003, name="Tip")
+    scene = await repos.ensure_scene(db, camp.id, 70030)
+    campaign_id, scene_id = camp.id, scene.id
+    await _append(db, scene_id, 0)
+    await db.commit()
+    assert repos.get_cached_chain_tip(campaign_id).replay_ordinal == 0
+    await _append(db, scene_id, 1)
+    assert repos.get_cached_chain_tip(campaign_id).replay_ordinal == 0
+
+    await db.rollback()
+    assert repos.get_cached_chain_tip(campaign_id) is None
+
+    # Next append re-reads the tip from the DB (whatever survived the rollback)
+    ev = await _append(db, scene_id, 2)
+    assert get_counter("events.chain_tip_cache.miss") == 2
+    events = await repos.get_campaign_events_for_verification(db, campaign_id=campaign_id)
+    assert ev.replay_ordinal == events[-1].replay_ordinal == len(events) - 1
+    assert verify_hash_chain(events)["verified_count"] == len(events)
@@ -0,0 +1,105 @@
+"""Checkpoint-backed incremental folds match a full replay."""
+
+import pytest
+
+from Adventorator import repos
+from Adventorator.metrics import get_counter, reset_counters
+
+
+async def _seed(db, scene_id: int, events: list[tuple[str, dict]], tag: str):
+    await repos.append_events_batch(
+        db,
+        scene_id=scene_id,
+        actor_id="gm",
+        events=[{"type": t, "payload": p} for t, p in events],
+        request_id=tag,
+    )
+
+
+@pytest.mark.asyncio
+async def test_incremental_views_apply_only_new_events(db):
+    reset_counters()
+    camp = await repos.get_or_create_campaign(db, 7301, name="Folds")
+    scene = await repos.ensure_scene(db, camp.id, 73010)
+    await _seed(
+        db,
+        scene.id,
+        [
+            ("apply_damage", {"target": "a", "amount": 8}),
+            ("condition.applied", {"target": "a", "condition": "prone", "duration": 2}),
+            ("initiative.set", {"order": [{"id": "a", "init": 12}, {"id": "b", "init": 15}]}),
+        ],
+        "r1",
+    )
+    assert await repos.get_fold_view(db, scene_id=scene.id, view="hp") == {"a": -8}
+    assert get_counter("folds.checkpoint.miss") == 1
+
+    await _seed(
+        db,
+        scene.id,
+        [("heal", {"target": "a", "amount": 3}), ("initiative.update", {"id": "a", "init": "20"})],
+        "r2",
+    )
+    assert await repos.get_fold_view(db, scene_id=scene.id, view="hp") == {"a": -5}
+    assert get_counter("folds.checkpoint.hit") == 1
+    # 3 events on the first call, only the 2 new ones on the second
+    assert get_counter("folds.events_applied") == 5
+
+    evs = await repos.list_events(db, scene_id=scene.id)
+    for view, fold in (
+        ("hp", repos.fold_hp_view),
+        ("conditions", repos.fold_conditions_view),
+        ("initiative", repos.fold_initiative_view),
+    ):
+        assert await repos.get_fold_view(db, scene_id=scene.id, view=view) == fold(evs)
+        assert await repos.verify_fold_checkpoint(db, scene_id=scene.id, view=view)
+
+
+@pytest.mark.asyncio
+async def test_rebuild_repairs_corrupted_checkpoint(db):
+    reset_counters()
+    camp = await repos.get_or_create_campaign(db, 7302, name="Folds")
+    scene = await repos.ensure_scene(db, camp.id, 73020)
+    await _seed(db, scene.id, [("apply_damage", {"target": "x", "amount": 4})], "r1")
+    await repos.get_fold_view(db, scene_id=scene.id, view="hp")
+
+    cp = await repos._get_fold_checkpoint(db, scene_id=scene.id, view="hp")
+    cp.state = {"x": 99}
+    await db.flush()
+    assert not await repos.verify_fold_checkpoint(db, scene_id=scene.id, view="hp")
+    assert get_counter("folds.verify.mismatch") == 1
+
+    assert await repos.rebuild_fold_checkpoints(db, scene_id=scene.id) == {
+        "hp": 1,
+        "conditions": 1,
+        "initiative": 1,
+    }
+    assert await repos.verify_fold_checkpoint(db, scene_id=scene.id, view="hp")
+
+
+@pytest.mark.asyncio
+async def test_replay_is_not_capped_by_page_size(db):
+    camp = await repos.get_or_create_campaign(db, 7303, name="Folds")
+    scene = await repos.ensure_scene(db, camp.id, 73030)
+    await _seed(
+        db, scene.id, [("apply_damage", {"target": "t", "amount": 1}) for _ in range(12)], "r1"
+    )
+    pages = [len(p) async for p in repos.iter_scene_events(db, scene_id=scene.id, page_size=5)]
+    assert pages == [5, 5, 2]
+    assert await repos.replay_fold_view(db, scene_id=scene.id, view="hp") == {"t": -12}
+
+
+@pytest.mark.asyncio
+async def test_verify_does_not_write_checkpoints(db):
+    camp = await repos.get_or_create_campaign(db, 7304, name="Folds")
+    scene = await repos.ensure_scene(db, camp.id, 73040)
+    await _seed(db, scene.id, [("apply_damage", {"target": "v", "amount": 2})], "r1")
+
+    assert await repos.verify_fold_checkpoint(db, scene_id=scene.id, view="hp")
+    assert await repos._get_fold_checkpoint(db, scene_id=scene.id, view="hp") is None
+
+    await repos.get_fold_view(db, scene_id=scene.id, view="hp")
+    await _seed(db, scene.id, [("heal", {"target": "v", "amount": 1})], "r2")
+    assert await repos.verify_fold_checkpoint(db, scene_id=scene.id, view="hp")
+    cp = await repos._get_fold_checkpoint(db, scene_id=scene.id, view="hp")
+    assert (cp.event_count, cp.state) == (1, {"v": -2})
@@ -0,0 +1,78 @@
+"""Streaming, resumable hash chain verification (repos.verify_campaign_chain_streaming)."""
+
+import pytest
+
+from Adventorator import repos
+from Adventorator.events.envelope import HashChainMismatchError
+
+
+async def _campaign_with_events(db, guild_id: int, n: int) -> int:
+    camp = await repos.get_or_create_campaign(db, guild_id, name="Stream")
+    scene = await repos.ensure_scene(db, camp.id, guild_id * 10)
+    await repos.append_events_batch(
+        db,
+        scene_id=scene.id,
+        actor_id="gm",
+        events=[{"type": "stream.test", "payload": {"i": i}} for i in range(n)],
+        request_id=f"stream-{guild_id}",
+    )
+    return camp.id
+
+
+@pytest.mark.asyncio
+async def test_streaming_verify_pages_and_reports_progress(db):
+    campaign_id = await _campaign_with_events(db, 7401, 11)
+    progress = []
+
+    result = await repos.verify_campaign_chain_streaming(
+        db, campaign_id=campaign_id, page_size=4, on_progress=progress.append
+    )
+
+    assert result["verified_count"] == 11
+    assert result["last_ordinal"] == 10
+    assert result["gaps"] == []
+    assert [p.verified_count for p in progress] == [4, 8, 11]
+    assert progress[-1].events_per_sec >= 0
+    events = await repos.get_campaign_events_for_verification(db, campaign_id=campaign_id)
+    assert result["checkpoint"].envelope_hash == repos.envelope_hash_for_event(events[-1])
+
+
+@pytest.mark.asyncio
+async def test_streaming_verify_resumes_from_checkpoint(db):
+    campaign_id = await _campaign_with_events(db, 7402, 5)
+    first = await repos.verify_campaign_chain_streaming(db, campaign_id=campaign_id)
+    scene = await repos.ensure_scene(db, campaign_id, 74020)
+    for i in range(3):
+        await repos.append_event(
+            db, scene_id=scene.id, actor_id=None, type="more", payload={"i": i}, request_id=f"m{i}"
+        )
+
+    resumed = await repos.verify_campaign_chain_streaming(
+        db, campaign_id=campaign_id, resume_from=first["checkpoint"]
+    )
+
+    assert resumed["verified_count"] == 3
+    assert resumed["last_ordinal"] == 7
+    # Nothing new after the latest checkpoint: no-op, checkpoint carried forward
+    again = await repos.verify_campaign_chain_streaming(
+        db, campaign_id=campaign_id, resume_from=resumed["checkpoint"]
+    )
+    assert again["verified_count"] == 0
+    assert again["checkpoint"] == resumed["checkpoint"]
+
+
+@pytest.mark.asyncio
+async def test_streaming_verify_detects_tampering_and_bad_checkpoint(db):
+    campaign_id = await _campaign_with_events(db, 7403, 6)
+    events = await repos.get_campaign_events_for_verification(db, campaign_id=campaign_id)
+    events[3].payload_hash = b"\x11" * 32
+    await db.flush()
+
+    with pytest.raises(HashChainMismatchError) as exc:
+        await repos.verify_campaign_chain_streaming(db, campaign_id=campaign_id, page_size=2)
+    assert exc.value.ordinal == 4
+
+    with pytest.raises(HashChainMismatchError):
+        await repos.verify_campaign_chain_streaming(
+            db, campaign_id=campaign_id, resume_from=repos.ChainTip(0, b"\x00" * 32)
+        )
@@ -54,3 +54,54 @@ def test_slash_command_defers(monkeypatch):
     )
     assert r.status_code == 200
     assert r.json() == {"type": 5}  # DEFERRED_CHANNEL_MESSAGE_WITH_SOURCE
+
+
+def _post_do(monkeypatch, *, accepted: bool) -> tuple[dict, list[str]]:
+    monkeypatch.setattr(appmod, "verify_ed25519", lambda *a, **k: True)
+
+    class _DummyAsyncCM:
+        async def __aenter__(self):
+            return SimpleNamespace()
+
+        async def __aexit__(self, exc_type, exc, tb):
+            return False
+
+    async def _scene(*args, **kwargs):
+        return SimpleNamespace(campaign_id=1, scene_id=1)
+
+    async def _submit(*args, **kwargs):
+        return accepted
+
+    started: list[str] = []
+    monkeypatch.setattr(appmod, "session_scope", lambda: _DummyAsyncCM())
+    monkeypatch.setattr(appmod.repos, "resolve_scene", _scene)
+    monkeypatch.setattr(appmod.command_runner, "submit", _submit)
+    monkeypatch.setattr(appmod.settings, "llm_speculative", True)
+    monkeypatch.setattr(appmod, "start_speculation", lambda name, *a, **k: started.append(name))
+
+    body = {
+        "type": 2,
+        "id": "124",
+        "token": "tok",
+        "application_id": "app",
+        "data": {"name": "do", "options": [{"name": "message", "type": 3, "value": "I sneak"}]},
+    }
+    r = client.post(
+        "/interactions",
+        content=json.dumps(body).encode(),
+        headers={"X-Signature-Ed25519": "00", "X-Signature-Timestamp": "0"},
+    )
+    assert r.status_code == 200
+    return r.json(), started
+
+
+def test_speculation_starts_only_for_accepted_commands(monkeypatch):
+    resp, started = _post_do(monkeypatch, accepted=True)
+    assert resp == {"type": 5}
+    assert started == ["do"]
+
+
+def test_rejected_command_does_not_speculate(monkeypatch):
+    resp, started = _post_do(monkeypatch, accepted=False)
+    assert resp["data"]["content"] == appmod.BUSY_TEXT
+    assert started == []
@@ -0,0 +1,144 @@
+import asyncio
+from datetime import datetime, timedelta, timezone
+
+import pytest
+from sqlalchemy import select
+
+from Adventorator import models, repos
+from Adventorator.db import session_scope
+from Adventorator.jobs import JobRunner
+from Adventorator.metrics import get_counter, get_counters, reset_counters
+
+
+class _Recorder:
+    def __init__(self, delay: float = 0.01, max_delay: float = 60.0) -> None:
+        self.delay = delay
+        self.max_delay = max_delay
+        self.started: list[str] = []
+        self.finished: list[str] = []
+        self.active = 0
+        self.peak = 0
+
+    async def __call__(self, payload: dict) -> None:
+        self.started.append(payload["id"])
+        self.active += 1
+        self.peak = max(self.peak, self.active)
+        try:
+            await asyncio.sleep(min(payload.get("delay", self.delay), self.max_delay))
+            if payload.get("fail"):
+                raise RuntimeError("boom")
+        finally:
+            self.active -= 1
+        self.finished.append(payload["id"])
+
+
+@pytest.mark.asyncio
+async def test_runner_bounds_concurrency_and_orders_per_key():
+    reset_counters()
+    rec = _Recorder()
+    runner = JobRunner("jobs.test", max_workers=2)
+    runner.register("cmd", rec)
+
+    for i in range(3):
+        assert await runner.submit("cmd", {"id": f"a{i}"}, key="guild:a")
+    for i in range(3):
+        assert await runner.submit("cmd", {"id": f"b{i}"}, key="guild:b")
+    assert await runner.submit("cmd", {"id": "c0", "fail": True}, key="guild:c")
+    assert await runner.drain(1.0)
+
+    assert [j for j in rec.started if j.startswith("a")] == ["a0", "a1", "a2"]
+    assert [j for j in rec.started if j.startswith("b")] == ["b0", "b1", "b2"]
+    assert rec.peak == 2
+    assert get_counter("jobs.test.completed") == 6
+    assert get_counter("jobs.test.failed") == 1
+    counters = get_counters()
+    assert counters["histo.jobs.test.wait_ms.count"] == 7
+    assert counters["histo.jobs.test.queue_depth.count"] == 7
+
+
+@pytest.mark.asyncio
+async def test_runner_rejects_when_full_or_draining():
+    reset_counters()
+    rec = _Recorder(delay=0.05)
+    runner = JobRunner("jobs.test", max_workers=1, max_queue=2)
+    runner.register("cmd", rec)
+
+    assert await runner.submit("cmd", {"id": "1"}, key="k1")
+    await asyncio.sleep(0)  # first job starts, leaving the queue empty
+    assert await runner.submit("cmd", {"id": "2"}, key="k2")
+    assert await runner.submit("cmd", {"id": "3"}, key="k3")
+    assert not await runner.submit("cmd", {"id": "4"}, key="k4")
+
+    assert await runner.drain(1.0)
+    assert not await runner.submit("cmd", {"id": "5"}, key="k5")
+    assert rec.finished == ["1", "2", "3"]
+    assert get_counter("jobs.test.rejected") == 2
+
+
+@pytest.mark.asyncio
+async def test_drain_timeout_cancels_and_durable_jobs_resume(db):
+    reset_counters()
+    rec = _Recorder()
+    runner = JobRunner("jobs.test", max_workers=1, durable=True)
+    runner.register("cmd", rec)
+
+    assert await runner.submit("cmd", {"id": "slow", "delay": 5}, key="g")
+    assert await runner.submit("cmd", {"id": "next"}, key="g")
+    assert not await runner.drain(0.05)
+    assert rec.finished == []
+
+    # A fresh runner (next process) resumes the job that never started; the one
+    # cut off mid-run may have written state, so it is interrupted, not replayed
+    rec2 = _Recorder(max_delay=0.01)
+    restarted = JobRunner("jobs.test", max_workers=1, durable=True)
+    restarted.register("cmd", rec2)
+    assert await restarted.resume() == 1
+    await restarted.submit("cmd", {"id": "late"}, key="g")
+    assert await restarted.drain(1.0)
+
+    assert rec2.finished == ["next", "late"]
+    async with session_scope() as s:
+        rows = await s.execute(models.CommandJob.__table__.select())
+        assert sorted((r.payload["id"], r.status) for r in rows) == [
+            ("late", "done"),
+            ("next", "done"),
+            ("slow", "interrupted"),
+        ]
+    assert get_counter("jobs.test.resumed") == 1
+
+    # Jobs older than the resume window are expired instead
+    async with session_scope() as s:
+        await repos.create_command_job(s, kind="cmd", job_key="g", payload={"id": "old"})
+    assert await restarted.resume(max_age_seconds=-1) == 0
+
+
+@pytest.mark.asyncio
+async def test_resume_skips_live_leases_and_prunes_finished_jobs(db):
+    async with session_scope() as s:
+        await s.execute(models.CommandJob.__table__.delete())
+        live = await repos.create_command_job(
+            s, kind="cmd", job_key="g", payload={"id": "live"}, owner="other", lease_seconds=60
+        )
+        lapsed = await repos.create_command_job(
+            s, kind="cmd", job_key="g", payload={"id": "lapsed"}, owner="dead", lease_seconds=-1
+        )
+        running = await repos.create_command_job(
+            s, kind="cmd", job_key="g", payload={"id": "running"}, owner="dead", lease_seconds=-1
+        )
+        running.status = "running"
+        finished = await repos.create_command_job(s, kind="cmd", job_key="g", payload={"id": "x"})
+        finished.status = "done"
+        finished.updated_at = datetime.now(timezone.utc) - timedelta(hours=2)
+        ids = live.id, lapsed.id, running.id, finished.id
+
+    async with session_scope() as s:
+        claimed = await repos.claim_resumable_command_jobs(s, owner="me", max_age_seconds=60)
+        assert [j.id for j in claimed] == [ids[1]]
+        assert await repos.prune_command_jobs(s, older_than_seconds=3600) == 1
+
+    async with session_scope() as s:
+        rows = {r.id: r for r in (await s.execute(select(models.CommandJob))).scalars()}
+    assert set(rows) == set(ids[:3])
+    assert (rows[ids[0]].status, rows[ids[0]].owner) == ("queued", "other")  # still leased
+    assert (rows[ids[1]].status, rows[ids[1]].owner) == ("queued", "me")
+    assert rows[ids[2]].status == "interrupted"
@@ -0,0 +1,157 @@
+import asyncio
+
+import pytest
+
+from Adventorator.config import Settings
+from Adventorator.llm import LLMClient
+from Adventorator.llm_cache import (
+    LLMResponseCache,
+    MemoryLLMCacheBackend,
+    RespLLMCacheBackend,
+    SqliteLLMCacheBackend,
+)
+from Adventorator.metrics import get_counter, reset_counters
+
+
+class _Resp:
+    def __init__(self, payload: dict):
+        self._payload = payload
+
+    def raise_for_status(self):
+        return None
+
+    def json(self):
+        return self._payload
+
+
+def test_key_is_canonical_over_provider_model_messages_format():
+    a = LLMResponseCache.key("ollama", "m", [{"role": "user", "content": "hi"}], "json")
+    b = LLMResponseCache.key("ollama", "m", [{"content": "hi", "role": "user"}], "json")
+    assert a == b and len(a) == 64
+    assert a != LLMResponseCache.key("ollama", "m", [{"role": "user", "content": "hi"}], None)
+    assert a != LLMResponseCache.key("openai", "m", [{"role": "user", "content": "hi"}], "json")
+    # Non-canonical input (floats) is simply not cached
+    assert LLMResponseCache.key("ollama", "m", [{"temperature": 0.5}], None) is None
+
+
+@pytest.mark.asyncio
+async def test_memory_backend_evicts_by_size_and_ttl():
+    reset_counters()
+    backend = MemoryLLMCacheBackend(max_entries=2, max_bytes=0)
+    await backend.set("a", b"1", 60)
+    await backend.set("b", b"2", 60)
+    assert await backend.get("a") == b"1"  # refresh a
+    await backend.set("c", b"3", 60)
+    assert await backend.get("b") is None and len(backend) == 2
+    await backend.set("d", b"4", -1)  # evicts a, then expires on read
+    assert await backend.get("d") is None and await backend.get("c") == b"3"
+    assert get_counter("llm.cache.evicted") == 3
+
+    sized = MemoryLLMCacheBackend(max_entries=10, max_bytes=10)
+    await sized.set("k1", b"xxxx", 60)
+    await sized.set("k2", b"yyyy", 60)
+    assert await sized.get("k1") is None and sized.nbytes == 6
+
+
+@pytest.mark.asyncio
+async def test_sqlite_backend_persists_and_evicts_lru(tmp_path):
+    path = str(tmp_path / "llm_cache.sqlite3")
+    first = SqliteLLMCacheBackend(path, max_entries=2)
+    await first.set("a", b"alpha", 60)
+    await first.set("b", b"beta", 60)
+    await first.close()
+
+    second = SqliteLLMCacheBackend(path, max_entries=2)
+    assert await second.get("a") == b"alpha"
+    await second.set("c", b"gamma", 60)
+    assert await second.get("b") is None
+    assert await second.get("a") == b"alpha" and await second.get("c") == b"gamma"
+    await second.close()
+
+
+async def _serve_resp(store: dict[bytes, bytes]):
+    """Tiny Redis-protocol stand-in supporting GET and SET ... PX."""
+
+    async def _handle(reader, writer):
+        while True:
+            header = await reader.readline()
+            if not header:
+                break
+            args = []
+            for _ in range(int(header[1:-2])):
+                n = int((await reader.readline())[1:-2])
+                args.append((await reader.readexactly(n + 2))[:-2])
+            if args[0] == b"SET":
+                store[args[1]] = args[2]
+                writer.write(b"+OK\r\n")
+            elif args[0] == b"GET":
+                v = store.get(args[1])
+                writer.write(b"$-1\r\n" if v is None else b"$%d\r\n%s\r\n" % (len(v), v))
+            else:
+                writer.write(b"-ERR unknown command\r\n")
+            await writer.drain()
+        writer.close()
+
+    return await asyncio.start_server(_handle, "127.0.0.1", 0)
+
+
+@pytest.mark.asyncio
+async def test_resp_backend_round_trips_against_stand_in():
+    store: dict[bytes, bytes] = {}
+    server = await _serve_resp(store)
+    port = server.sockets[0].getsockname()[1]
+    backend = RespLLMCacheBackend(f"redis://127.0.0.1:{port}/0")
+    try:
+        assert await backend.get("k") is None
+        await backend.set("k", b"\x00binary\r\nvalue", 30)
+        assert await backend.get("k") == b"\x00binary\r\nvalue"
+        assert list(store) == [b"adv:llm:k"]
+    finally:
+        await backend.close()
+        server.close()
+        await server.wait_closed()
+
+
+@pytest.mark.asyncio
+async def test_client_serves_repeat_calls_from_cache_with_opt_out(monkeypatch):
+    reset_counters()
+    s = Settings(llm_api_provider="ollama", llm_api_url="http://test/api")
+    s.llm_cache.backend = "memory"
+    client = LLMClient(s)
+    calls = {"n": 0}
+
+    async def _post(url, content):  # noqa: ANN001
+        calls["n"] += 1
+        if b'"format"' not in content:
+            return _Resp({"message": {"content": "Plain narration."}})
+        return _Resp(
+            {
+                "message": {
+                    "content": {
+                        "proposal": {
+                            "action": "ability_check",
+                            "ability": "DEX",
+                            "suggested_dc": 12,
+                            "reason": "lock",
+                        },
+                        "narration": f"Attempt {calls['n']}",
+                    }
+                }
+            }
+        )
+
+    monkeypatch.setattr(client._client, "post", _post)
+    msgs = [{"role": "user", "content": "pick the lock"}]
+
+    first = await client.generate_json(msgs)
+    again = await client.generate_json(msgs)
+    assert first is not None and again == first and calls["n"] == 1
+    fresh = await client.generate_json(msgs, cache=False)
+    assert fresh is not None and fresh.narration == "Attempt 2"
+    # Text responses are cached under a different format key
+    assert await client.generate_response(msgs) == "Plain narration."
+    assert await client.generate_response(msgs) == "Plain narration."
+    assert calls["n"] == 3
+    assert get_counter("llm.cache.hit") == 2
+    assert get_counter("llm.cache.store") == 2
+    await client.close()
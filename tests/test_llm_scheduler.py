@@ -0,0 +1,142 @@
+import asyncio
+
+import pytest
+
+from Adventorator.llm_scheduler import (
+    OVERLOADED_TEXT,
+    FairLimiter,
+    LLMScheduler,
+    llm_request_scope,
+)
+from Adventorator.metrics import get_counter, get_counters, reset_counters
+
+
+class _SlowLLM:
+    def __init__(self, provider: str, delay: float = 0.05):
+        self.provider = provider
+        self.model_name = "m"
+        self.api_url = "http://test"
+        self.delay = delay
+        self.calls: list[str] = []
+        self.active = 0
+        self.peak = 0
+
+    async def _call(self, messages):
+        self.calls.append(messages[-1]["content"])
+        self.active += 1
+        self.peak = max(self.peak, self.active)
+        try:
+            await asyncio.sleep(self.delay)
+        finally:
+            self.active -= 1
+        return f"ok:{messages[-1]['content']}"
+
+    async def generate_response(self, messages, system_prompt=None):
+        return await self._call(messages)
+
+    async def generate_json(self, messages, system_prompt=None):
+        return await self._call(messages)
+
+
+def _msg(text: str) -> list[dict]:
+    return [{"role": "user", "content": text}]
+
+
+@pytest.mark.asyncio
+async def test_identical_requests_coalesce_and_concurrency_is_bounded():
+    reset_counters()
+    llm = _SlowLLM("coalesce")
+    sched = LLMScheduler(llm, max_concurrency=2)
+
+    outs = await asyncio.gather(
+        *[sched.generate_response(_msg("same")) for _ in range(5)],
+        *[sched.generate_json(_msg(f"q{i}")) for i in range(4)],
+    )
+
+    assert outs[:5] == ["ok:same"] * 5
+    assert llm.calls.count("same") == 1
+    assert get_counter("llm.scheduler.coalesced") == 4
+    assert llm.peak == 2
+    assert get_counters()["histo.llm.scheduler.queue_depth.count"] == 5
+    assert sched.stats()["inflight"] == 0
+
+
+@pytest.mark.asyncio
+async def test_waiters_are_served_round_robin_across_guilds():
+    limiter = FairLimiter(1)
+    await limiter.acquire("hold")
+    order: list[str] = []
+
+    async def _take(guild: str, tag: str):
+        await limiter.acquire(guild)
+        order.append(tag)
+        limiter.release()
+
+    tasks = [asyncio.create_task(_take("a", f"a{i}")) for i in range(3)]
+    tasks.append(asyncio.create_task(_take("b", "b0")))
+    await asyncio.sleep(0)
+    assert limiter.depth == 4
+    limiter.release()
+    await asyncio.gather(*tasks)
+
+    assert order == ["a0", "b0", "a1", "a2"]
+    assert limiter.active == 0
+
+
+@pytest.mark.asyncio
+async def test_deadline_rejects_up_front_and_abandons_slow_calls():
+    reset_counters()
+    llm = _SlowLLM("deadline", delay=0.2)
+    sched = LLMScheduler(llm, max_concurrency=1)
+    assert await sched.generate_response(_msg("warm")) == "ok:warm"  # seeds latency estimate
+
+    with llm_request_scope(guild_id="g1", deadline_s=0.05):
+        # Upstream is idle but the call itself outlives the budget
+        assert await sched.generate_json(_msg("slow")) is None
+    assert get_counter("llm.scheduler.deadline_exceeded") == 1
+
+    busy = asyncio.create_task(sched.generate_response(_msg("busy")))
+    await asyncio.sleep(0.01)
+    with llm_request_scope(guild_id="g2", deadline_s=0.1):
+        # A slot is taken and the estimated wait exceeds the budget: rejected without queuing
+        assert await sched.generate_response(_msg("late")) == OVERLOADED_TEXT
+    assert get_counter("llm.scheduler.rejected") == 1
+    assert "late" not in llm.calls
+    assert await busy == "ok:busy"
+    # The abandoned call was cancelled and gave its slot back
+    assert sched.stats()["active"] == 0
+
+
+@pytest.mark.asyncio
+async def test_speculative_flight_is_claimed_by_identical_request():
+    reset_counters()
+    llm = _SlowLLM("speculate-claim")
+    sched = LLMScheduler(llm, max_concurrency=2)
+
+    assert sched.speculate("response", _msg("early")) is True
+    assert sched.speculate("response", _msg("early")) is False  # already in flight
+    await asyncio.sleep(0.1)  # the call finishes before anyone asks for it
+    assert await sched.generate_response(_msg("early")) == "ok:early"
+
+    assert llm.calls == ["early"]
+    assert get_counter("llm.speculative.started") == 1
+    assert get_counter("llm.speculative.hit") == 1
+    assert get_counter("llm.speculative.discarded") == 0
+    assert sched.stats()["inflight"] == 0
+
+
+@pytest.mark.asyncio
+async def test_unclaimed_speculation_is_discarded_and_cancelled():
+    reset_counters()
+    llm = _SlowLLM("speculate-discard", delay=1.0)
+    sched = LLMScheduler(llm, max_concurrency=1)
+
+    sched.speculate("json", _msg("unused"), hold_s=0.02)
+    await asyncio.sleep(0.05)
+
+    assert get_counter("llm.speculative.discarded") == 1
+    stats = sched.stats()
+    assert (stats["active"], stats["queued"], stats["inflight"]) == (0, 0, 0)
+    # A different prompt is not served by the speculative call
+    assert await sched.generate_json(_msg("other")) is not None
+    assert get_counter("llm.speculative.hit") == 0
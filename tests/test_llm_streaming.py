@@ -0,0 +1,136 @@
+import httpx
+import orjson
+import pytest
+
+from Adventorator.config import Settings
+from Adventorator.llm import LLMClient
+from Adventorator.llm_utils import JsonObjectScanner, extract_first_json
+from Adventorator.metrics import get_counter, get_counters, reset_counters
+
+_OBJ = (
+    'Sure! {"proposal": {"action": "ability_check", "ability": "DEX", '
+    '"suggested_dc": 12, "reason": "a \\"tricky\\" {lock}"}, '
+    '"narration": "You deftly pick the lock."} and then some trailing chatter'
+)
+
+
+def _chunks(text: str, size: int = 7) -> list[str]:
+    return [text[i : i + size] for i in range(0, len(text), size)]
+
+
+def test_scanner_matches_extract_first_json_across_chunk_boundaries():
+    for size in (1, 3, 7, 50, len(_OBJ)):
+        scanner = JsonObjectScanner()
+        out = None
+        for part in _chunks(_OBJ, size):
+            out = scanner.feed(part)
+            if scanner.done:
+                break
+        assert out == extract_first_json(_OBJ)
+        assert out["proposal"]["reason"] == 'a "tricky" {lock}'
+    # Same cap semantics as the one-shot extractor
+    capped = JsonObjectScanner(max_chars=20)
+    for part in _chunks(_OBJ, 5):
+        capped.feed(part)
+    assert capped.done and capped.result is None
+
+
+@pytest.mark.asyncio
+async def test_ollama_stream_stops_at_first_complete_object():
+    reset_counters()
+    client = LLMClient(
+        Settings(llm_api_provider="ollama", llm_api_url="http://test/api", llm_stream=True)
+    )
+    sent = {"lines": 0}
+    requests: list[dict] = []
+
+    async def _body():
+        for part in _chunks(_OBJ):
+            sent["lines"] += 1
+            yield orjson.dumps({"message": {"content": part}, "done": False}) + b"\n"
+        yield orjson.dumps({"message": {"content": ""}, "done": True}) + b"\n"
+
+    def _handler(request: httpx.Request) -> httpx.Response:
+        requests.append(orjson.loads(request.content))
+        return httpx.Response(200, content=_body())
+
+    await client._client.aclose()
+    client._client = httpx.AsyncClient(transport=httpx.MockTransport(_handler))
+
+    out = await client.generate_json([{"role": "user", "content": "pick the lock"}])
+
+    assert out is not None and out.proposal.ability == "DEX"
+    assert requests[0]["stream"] is True and requests[0]["format"] == "json"
+    assert sent["lines"] < len(_chunks(_OBJ))
+    assert get_counter("llm.stream.early_stop") == 1
+    counters = get_counters()
+    assert counters["histo.llm.stream.ttft_ms.count"] == 1
+    assert counters["histo.llm.stream.time_to_json_ms.count"] == 1
+    await client.close()
+
+
+class _Delta:
+    def __init__(self, content):
+        self.content = content
+
+
+class _Choice:
+    def __init__(self, content, finish_reason=None):
+        self.delta = _Delta(content)
+        self.finish_reason = finish_reason
+
+
+class _Chunk:
+    def __init__(self, content, finish_reason=None):
+        self.choices = [_Choice(content, finish_reason)]
+
+
+class _FakeStream:
+    def __init__(self, parts):
+        self._parts = list(parts)
+        self.consumed = 0
+        self.closed = False
+
+    def __aiter__(self):
+        return self
+
+    async def __anext__(self):
+        if self.consumed >= len(self._parts):
+            raise StopAsyncIteration
+        self.consumed += 1
+        return _Chunk(self._parts[self.consumed - 1])
+
+    async def close(self):
+        self.closed = True
+
+
+@pytest.mark.asyncio
+async def test_openai_stream_json_cutoff_and_text_accumulation(monkeypatch):
+    reset_counters()
+    client = LLMClient(
+        Settings(
+            llm_api_provider="openai",
+            llm_api_url="http://test",
+            llm_api_key="test-key",
+            llm_stream=True,
+        )
+    )
+    streams: list[_FakeStream] = []
+
+    async def _create(**kwargs):
+        assert kwargs["stream"] is True
+        streams.append(_FakeStream(_chunks(_OBJ)))
+        return streams[-1]
+
+    monkeypatch.setattr(client._client.chat.completions, "create", _create)
+
+    out = await client.generate_json([{"role": "user", "content": "pick the lock"}])
+    assert out is not None and out.narration == "You deftly pick the lock."
+    assert streams[0].closed and streams[0].consumed < len(_chunks(_OBJ))
+
+    # Plain text responses are read to the end
+    text = await client.generate_response([{"role": "user", "content": "hi"}])
+    assert text == _OBJ
+    assert streams[1].closed and streams[1].consumed == len(_chunks(_OBJ))
+    assert get_counter("llm.stream.early_stop") == 1
+    await client.close()
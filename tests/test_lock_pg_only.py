@@ -1,24 +1,30 @@
 import asyncio
 import os
+import uuid
 
 import pytest
+from sqlalchemy import text
 from sqlalchemy.ext.asyncio import async_sessionmaker, create_async_engine
 
+from Adventorator import importer, models, repos
+from Adventorator.events.envelope import verify_hash_chain
 from Adventorator.metrics import get_counter, reset_counters
 
 
-@pytest.mark.asyncio
-async def test_pg_advisory_lock_path(monkeypatch):
-    # Look for an explicit PG test URL; skip if missing.
+def _pg_url() -> str:
     pg_url = os.environ.get("ADVENTORATOR_TEST_PG_URL") or os.environ.get("DATABASE_URL")
     if not pg_url or not (
         pg_url.startswith("postgresql://") or pg_url.startswith("postgresql+asyncpg://")
     ):
         pytest.skip("Postgres URL not provided; skipping PG-only advisory lock test")
+    return pg_url.replace("postgresql://", "postgresql+asyncpg://", 1)
+
 
-    # Normalize to async driver
-    if pg_url.startswith("postgresql://"):
-        pg_url = pg_url.replace("postgresql://", "postgresql+asyncpg://", 1)
+@pytest.mark.postgres
+@pytest.mark.asyncio
+async def test_pg_advisory_lock_path(monkeypatch):
+    # Look for an explicit PG test URL (normalized to the async driver); skip if missing.
+    pg_url = _pg_url()
 
     # Try to connect; skip if cannot
     try:
@@ -46,3 +52,47 @@ async def test_pg_advisory_lock_path(monkeypatch):
     # Should have at least one success and histogram count present
     # (indirectly via counters flattening)
     assert get_counter("locks.acquire.success") >= 1
+
+
+@pytest.mark.postgres
+@pytest.mark.asyncio
+async def test_pg_event_appends_do_not_stall_an_open_import_transaction():
+    engine = create_async_engine(_pg_url(), pool_pre_ping=True)
+    try:
+        async with engine.begin() as conn:
+            await conn.execute(text("SELECT 1"))
+            await conn.run_sync(models.Base.metadata.create_all)
+    except Exception as e:
+        await engine.dispose()
+        pytest.skip(f"Cannot connect to Postgres for advisory lock test: {e}")
+    sm = async_sessionmaker(engine, expire_on_commit=False)
+
+    async with sm() as s, s.begin():
+        guild_id = uuid.uuid4().int % 2**62
+        campaign_id = (await repos.get_or_create_campaign(s, guild_id, name="PG lock")).id
+
+    async def append_live(live_s) -> None:
+        async with live_s.begin():
+            await importer.persist_import_event(live_s, campaign_id, None, "seed.live", {"i": 9})
+
+    try:
+        async with sm() as import_s, sm() as live_s:
+            async with import_s.begin():
+                # The import's transaction now holds the campaign's advisory lock
+                await importer.persist_import_event(import_s, campaign_id, None, "seed.t", {"i": 0})
+                live = asyncio.create_task(append_live(live_s))
+                await asyncio.sleep(0.2)  # the second session is polling the advisory lock
+                # Must not queue behind the poller for the in-process lock
+                await asyncio.wait_for(
+                    importer.persist_import_event(import_s, campaign_id, None, "seed.t", {"i": 1}),
+                    timeout=2,
+                )
+            await asyncio.wait_for(live, timeout=5)
+
+        async with sm() as s:
+            events = await repos.get_campaign_events_for_verification(s, campaign_id=campaign_id)
+        assert [e.type for e in events] == ["seed.t", "seed.t", "seed.live"]
+        assert [e.replay_ordinal for e in events] == [0, 1, 2]
+        assert verify_hash_chain(events)["verified_count"] == 3
+    finally:
+        await engine.dispose()
@@ -84,3 +84,103 @@ async def test_orchestrator_uses_retrieval_player_only(db):
     assert not out.rejected
     assert "Check:" in out.mechanics
     # Narration is from FakeLLM, but context building shouldn't crash with retrieval
+
+
+@pytest.mark.asyncio
+async def test_orchestrator_drops_slow_retrieval_past_budget(db, monkeypatch):
+    import asyncio
+
+    from Adventorator import orchestrator
+    from Adventorator.metrics import get_counter, get_counters, reset_counters
+    from Adventorator.retrieval import ContentSnippet
+
+    reset_counters()
+    async with session_scope() as s:
+        camp = Campaign(name="C2")
+        s.add(camp)
+        await s.flush()
+        sc = Scene(campaign_id=camp.id, channel_id=456)
+        s.add(sc)
+        await s.flush()
+        scene_id = sc.id
+
+    class SlowRetriever:
+        def __init__(self, delay: float):
+            self.delay = delay
+
+        async def retrieve(self, campaign_id, query, k=4):
+            await asyncio.sleep(self.delay)
+            return [ContentSnippet(id=1, node_type="lore", title="Vault", text="Old coins.")]
+
+    seen: list[str] = []
+
+    class CapturingLLM(FakeLLM):
+        async def generate_json(self, messages):
+            seen.append("\n".join(str(m.get("content", "")) for m in messages))
+            return await super().generate_json(messages)
+
+    class Settings(types.SimpleNamespace):
+        class Retrieval(types.SimpleNamespace):
+            enabled = True
+            provider = "none"
+            top_k = 2
+            budget_ms = 50
+
+        retrieval = Retrieval()
+
+    async def _run(msg: str, delay: float):
+        monkeypatch.setattr(orchestrator, "build_retriever", lambda _s: SlowRetriever(delay))
+        return await run_orchestrator(
+            scene_id=scene_id,
+            player_msg=msg,
+            llm_client=CapturingLLM(),
+            allowed_actors=["Player"],
+            settings=Settings(),
+            character_summary_provider=lambda: "Rogue, level 3",
+        )
+
+    fast = await _run("I look for coins", 0)
+    slow = await _run("I search the vault", 0.5)
+
+    assert not fast.rejected and not slow.rejected
+    assert "[ref] Vault" in seen[0] and "Rogue, level 3" in seen[0]
+    assert "[ref] Vault" not in seen[1] and "Rogue, level 3" in seen[1]
+    assert get_counter("retrieval.dropped") == 1
+    counters = get_counters()
+    for stage in ("facts", "character", "retrieval"):
+        assert counters[f"histo.orchestrator.prefetch.{stage}_ms.count"] >= 1
+    # The dropped search is kept alive until it finishes in the background
+    assert len(orchestrator._dropped_retrievals) == 1
+    await asyncio.gather(*orchestrator._dropped_retrievals)
+    assert not orchestrator._dropped_retrievals
+
+
+@pytest.mark.asyncio
+async def test_prefetch_failure_cancels_pending_retrieval(monkeypatch):
+    import asyncio
+
+    from Adventorator import orchestrator
+
+    started = asyncio.Event()
+    cancelled = asyncio.Event()
+
+    async def slow_retrieval(scene_id, player_msg, settings):
+        started.set()
+        try:
+            await asyncio.sleep(5)
+        except asyncio.CancelledError:
+            cancelled.set()
+            raise
+        return []
+
+    async def broken_facts(*args, **kwargs):
+        await started.wait()
+        raise RuntimeError("transcripts unavailable")
+
+    monkeypatch.setattr(orchestrator, "_retrieve_snippets", slow_retrieval)
+    monkeypatch.setattr(orchestrator, "_facts_from_transcripts", broken_facts)
+
+    with pytest.raises(RuntimeError):
+        await orchestrator.build_narrator_prompt(1, "I look around")
+    await asyncio.wait_for(cancelled.wait(), 1)
+    assert not orchestrator._dropped_retrievals
@@ -1,8 +1,16 @@
 """Planner tests for safety, intent mapping, and catalog shape."""
 
+import orjson
 import pytest
 
-from Adventorator.planner import _catalog, plan
+from Adventorator import commanding
+from Adventorator.planner import (
+    _catalog,
+    build_planner_messages,
+    get_planner_prefix,
+    invalidate_planner_prefix,
+    plan,
+)
 from Adventorator.planner_schemas import PlannerOutput
 
 
@@ -75,3 +83,29 @@ async def test_plan_happy_path():
     assert isinstance(out, PlannerOutput)
     assert out.command == "do"
     assert out.args.get("message")
+
+
+def test_planner_prefix_is_memoized_and_tracks_registry():
+    first = get_planner_prefix()
+    assert get_planner_prefix() is first
+    msgs_a = build_planner_messages("hello")
+    msgs_b = build_planner_messages("goodbye")
+    assert msgs_a[0]["content"] == first.system_prompt
+    assert msgs_a[1]["content"] == first.user_prefix + "hello"
+    # Everything before the user's text is byte-identical across calls
+    assert msgs_b[1]["content"].startswith(msgs_a[1]["content"][: len(first.user_prefix)])
+    assert orjson.loads(first.tools_json) == list(first.catalog)
+
+    @commanding.slash_command(name="zz_prefix_probe", description="probe")
+    async def _probe(inv, opts):  # noqa: ANN001
+        return None
+
+    try:
+        rebuilt = get_planner_prefix()
+        assert rebuilt is not first
+        assert rebuilt.version != first.version
+        assert any(e["name"] == "zz_prefix_probe" for e in rebuilt.catalog)
+    finally:
+        commanding._REGISTRY.pop("zz_prefix_probe", None)
+        invalidate_planner_prefix()
+    assert get_planner_prefix().version == first.version
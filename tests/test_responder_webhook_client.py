@@ -0,0 +1,105 @@
+import httpx
+import pytest
+
+from Adventorator import responder
+from Adventorator.config import Settings
+from Adventorator.metrics import get_counter, reset_counters
+
+
+class _Discord:
+    """MockTransport handler that rate-limits the first ``limited`` requests."""
+
+    def __init__(self, limited: int = 0, retry_after: float = 0.01) -> None:
+        self.limited = limited
+        self.retry_after = retry_after
+        self.requests: list[httpx.Request] = []
+
+    def __call__(self, request: httpx.Request) -> httpx.Response:
+        self.requests.append(request)
+        if len(self.requests) <= self.limited:
+            return httpx.Response(
+                429,
+                json={"message": "rate limited", "retry_after": self.retry_after, "global": False},
+                headers={"X-RateLimit-Bucket": "b1", "X-RateLimit-Remaining": "0"},
+            )
+        return httpx.Response(
+            200,
+            json={"id": "1"},
+            headers={
+                "X-RateLimit-Bucket": "b1",
+                "X-RateLimit-Remaining": "4",
+                "X-RateLimit-Reset-After": "1.0",
+            },
+        )
+
+
+@pytest.fixture
+async def webhook_client():
+    async def _make(handler, **kwargs):
+        client = responder.DiscordWebhookClient(transport=httpx.MockTransport(handler), **kwargs)
+        responder._webhook_client = client
+        return client
+
+    yield _make
+    await responder.close_webhook_client()
+
+
+@pytest.mark.asyncio
+async def test_followups_share_client_and_retry_429(webhook_client):
+    reset_counters()
+    discord = _Discord(limited=2)
+    client = await webhook_client(discord)
+    settings = Settings(discord_webhook_url_override=None)
+
+    await responder.followup_message("app", "tok", "one", settings=settings)
+    await responder.followup_message("app", "tok", "two", settings=settings)
+
+    assert responder.get_webhook_client() is client
+    assert len(discord.requests) == 4  # two 429s retried, then two successes
+    assert get_counter("discord.webhook.retry") == 2
+    assert client._route_buckets.get("webhooks/app/tok") == "b1"
+    assert client._buckets.get("b1").remaining == 4
+
+
+@pytest.mark.asyncio
+async def test_429_beyond_retry_budget_surfaces_as_http_error(webhook_client):
+    await webhook_client(_Discord(limited=10, retry_after=60), max_retries=3)
+    settings = Settings(discord_webhook_url_override=None)
+
+    with pytest.raises(httpx.HTTPStatusError):
+        await responder.followup_message("app", "tok", "hi", settings=settings)
+
+
+@pytest.mark.asyncio
+async def test_exhausted_bucket_waits_for_reset(webhook_client):
+    reset_counters()
+    discord = _Discord()
+    client = await webhook_client(discord)
+    client._route_buckets.set("webhooks/app/tok", "b1")
+    client._buckets.set("b1", responder._Bucket(remaining=0, reset_at=0.0))
+
+    r = await client.post("https://discord.test/webhooks/app/tok", route="webhooks/app/tok")
+    assert r.status_code == 200
+    assert get_counter("discord.webhook.bucket_wait") == 0  # reset already passed
+
+    client._buckets.set("b1", responder._Bucket(remaining=0, reset_at=float("inf")))
+    client.max_retry_after_s = 0.01  # caps the wait
+    await client.post("https://discord.test/webhooks/app/tok", route="webhooks/app/tok")
+    assert get_counter("discord.webhook.bucket_wait") == 1
+
+
+@pytest.mark.asyncio
+async def test_route_and_bucket_maps_are_bounded(webhook_client, monkeypatch):
+    discord = _Discord()
+    client = await webhook_client(discord)
+    settings = Settings(discord_webhook_url_override=None)
+
+    for n in range(3):
+        await responder.followup_message("app", f"tok{n}", "hi", settings=settings)
+    assert len(client._route_buckets) == 3 and len(client._buckets) == 1
+
+    # Routes expire with their interaction token
+    clock = responder.time.monotonic() + responder._ROUTE_TTL_S + 1
+    monkeypatch.setattr("Adventorator.bounded_cache.time.monotonic", lambda: clock)
+    assert client._route_buckets.sweep() == 3
+    assert client._route_buckets.get("webhooks/app/tok0") is None
@@ -0,0 +1,139 @@
+from __future__ import annotations
+
+import pytest
+from sqlalchemy import select
+
+from Adventorator import repos
+from Adventorator.db import session_scope
+from Adventorator.metrics import get_counter, reset_counters
+from Adventorator.models import ContentNode, NodeType
+from Adventorator.retrieval import Bm25Index, Bm25IndexStore, Bm25Retriever
+
+
+async def _seed(guild_id: int, extra: int = 0) -> int:
+    async with session_scope() as s:
+        camp = await repos.get_or_create_campaign(s, guild_id=guild_id, name="BM25")
+        s.add_all(
+            [
+                ContentNode(
+                    campaign_id=camp.id,
+                    node_type=NodeType.location,
+                    title="Goblin Warrens",
+                    player_text="A reeking tunnel where goblin drums echo.",
+                    gm_text="Secret vault behind the shrine.",
+                ),
+                ContentNode(
+                    campaign_id=camp.id,
+                    node_type=NodeType.lore,
+                    title="Harbor Ledger",
+                    player_text="Ship manifests mention goblin cargo once.",
+                ),
+            ]
+            + [
+                ContentNode(
+                    campaign_id=camp.id,
+                    node_type=NodeType.lore,
+                    title=f"Almanac {i}",
+                    player_text="Seasons turn over the valley.",
+                )
+                for i in range(extra)
+            ]
+        )
+    return camp.id
+
+
+@pytest.mark.asyncio
+async def test_bm25_ranks_and_serves_from_memory(db):
+    reset_counters()
+    campaign_id = await _seed(8201, extra=4)
+    r = Bm25Retriever(store=Bm25IndexStore(), refresh_seconds=3600)
+
+    out = await r.retrieve(campaign_id, "describe the goblin warrens", k=3)
+    assert [s.title for s in out] == ["Goblin Warrens", "Harbor Ledger"]
+    assert out[0].node_type == "location"
+    # gm_text is not indexed at all
+    assert await r.retrieve(campaign_id, "vault shrine", k=3) == []
+    assert get_counter("retrieval.bm25.build") == 1
+    assert get_counter("retrieval.bm25.refresh") == 0
+
+
+@pytest.mark.asyncio
+async def test_bm25_refreshes_incrementally_after_commits(db):
+    reset_counters()
+    campaign_id = await _seed(8202)
+    r = Bm25Retriever(store=Bm25IndexStore(), refresh_seconds=3600)
+    assert await r.retrieve(campaign_id, "lighthouse", k=2) == []
+
+    async with session_scope() as s:
+        s.add(
+            ContentNode(
+                campaign_id=campaign_id,
+                node_type=NodeType.location,
+                title="Lighthouse",
+                player_text="A lamp burns on the cliff.",
+            )
+        )
+        ledger = (
+            await s.execute(select(ContentNode).where(ContentNode.title == "Harbor Ledger"))
+        ).scalar_one()
+        ledger.player_text = "The ledger is water-damaged."
+    assert [s.title for s in await r.retrieve(campaign_id, "lighthouse", k=2)] == ["Lighthouse"]
+    assert get_counter("retrieval.bm25.refreshed_nodes") == 2
+    assert [s.title for s in await r.retrieve(campaign_id, "goblin", k=2)] == ["Goblin Warrens"]
+
+    async with session_scope() as s:
+        node = (
+            await s.execute(select(ContentNode).where(ContentNode.title == "Lighthouse"))
+        ).scalar_one()
+        await s.delete(node)
+    assert await r.retrieve(campaign_id, "lighthouse", k=2) == []
+    assert get_counter("retrieval.bm25.build") == 1
+
+
+@pytest.mark.asyncio
+async def test_bm25_fingerprint_picks_up_out_of_band_inserts(db):
+    reset_counters()
+    campaign_id = await _seed(8203)
+    r = Bm25Retriever(store=Bm25IndexStore(), refresh_seconds=0)
+    await r.retrieve(campaign_id, "goblin", k=2)
+    async with session_scope() as s:
+        await s.execute(
+            ContentNode.__table__.insert().values(
+                campaign_id=campaign_id,
+                node_type=NodeType.npc,
+                title="Ferryman",
+                player_text="He asks for two coins.",
+            )
+        )
+
+    assert [s.title for s in await r.retrieve(campaign_id, "ferryman", k=2)] == ["Ferryman"]
+    assert get_counter("retrieval.bm25.stale") == 1
+
+
+@pytest.mark.asyncio
+async def test_bm25_store_evicts_least_recently_used(db):
+    reset_counters()
+    store = Bm25IndexStore(max_campaigns=2)
+    r = Bm25Retriever(store=store, refresh_seconds=3600)
+    a, b, c = await _seed(8204), await _seed(8205), await _seed(8206)
+    for cid in (a, b, a, c):
+        await r.retrieve(cid, "goblin", k=1)
+
+    assert get_counter("retrieval.bm25.evicted") == 1
+    assert store.get(b) is None and store.get(a) is not None
+    assert store.stats()["campaigns"] == 2
+
+    store.configure(max_campaigns=2, max_bytes=store.get(c).nbytes)
+    assert store.stats()["campaigns"] == 1 and store.get(c) is not None
+
+
+def test_bm25_index_memory_accounting_round_trips():
+    index = Bm25Index(1)
+    index.upsert(1, "lore", "Moon Gate", "Silver light on the moon gate.")
+    index.upsert(2, "npc", "Gatekeeper", "Guards the gate.")
+    assert index.nbytes > 0
+    index.upsert(1, "lore", "Moon Gate", "Rewritten text.")
+    index.remove(1)
+    index.remove(2)
+    assert index.nbytes == 0
+    assert index.postings == {} and index.total_length == 0
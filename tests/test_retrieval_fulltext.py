@@ -0,0 +1,116 @@
+from __future__ import annotations
+
+import pytest
+from sqlalchemy import text
+
+from Adventorator import repos
+from Adventorator.config import load_settings
+from Adventorator.db import session_scope
+from Adventorator.metrics import get_counter, reset_counters
+from Adventorator.models import ContentNode, NodeType
+from Adventorator.retrieval import (
+    FullTextRetriever,
+    SqlFallbackRetriever,
+    build_retriever,
+    query_terms,
+)
+
+
+async def _seed(guild_id: int) -> int:
+    async with session_scope() as s:
+        camp = await repos.get_or_create_campaign(s, guild_id=guild_id, name="FTS")
+        s.add_all(
+            [
+                ContentNode(
+                    campaign_id=camp.id,
+                    node_type=NodeType.lore,
+                    title="Harbor Ledger",
+                    player_text="Ship manifests mention a goblin cargo once.",
+                ),
+                ContentNode(
+                    campaign_id=camp.id,
+                    node_type=NodeType.location,
+                    title="Goblin Warrens",
+                    player_text="Goblins nest in the tunnels; goblin drums echo below.",
+                    gm_text="Hidden trap at entrance.",
+                ),
+                ContentNode(
+                    campaign_id=camp.id,
+                    node_type=NodeType.npc,
+                    title="Old Miller",
+                    player_text="A miller who grumbles about the weather.",
+                ),
+            ]
+            # Unrelated filler so term rarity (IDF) is meaningful in the ranking
+            + [
+                ContentNode(
+                    campaign_id=camp.id,
+                    node_type=NodeType.lore,
+                    title=f"Almanac {i}",
+                    player_text="Seasons turn over the valley.",
+                )
+                for i in range(6)
+            ]
+        )
+    return camp.id
+
+
+@pytest.mark.asyncio
+async def test_fulltext_ranks_title_matches_first_and_hides_gm_text(db):
+    campaign_id = await _seed(8101)
+    r = FullTextRetriever()
+
+    out = await r.retrieve(campaign_id=campaign_id, query="tell me about goblins", k=3)
+
+    assert [s.title for s in out] == ["Goblin Warrens", "Harbor Ledger"]
+    assert out[0].node_type == "location"
+    # gm_text is searchable (lowest weight) but never surfaced
+    trap = await r.retrieve(campaign_id=campaign_id, query="trap", k=3)
+    assert [s.title for s in trap] == ["Goblin Warrens"]
+    assert "Hidden trap" not in trap[0].text
+
+
+@pytest.mark.asyncio
+async def test_fulltext_index_follows_updates_deletes_and_campaign_scope(db):
+    campaign_id = await _seed(8102)
+    other = await _seed(8103)
+    r = FullTextRetriever()
+    async with session_scope() as s:
+        await s.execute(
+            text("UPDATE content_nodes SET title = 'Windmill' WHERE title = 'Old Miller'")
+        )
+        await s.execute(
+            text("DELETE FROM content_nodes WHERE campaign_id = :c AND title = 'Harbor Ledger'"),
+            {"c": campaign_id},
+        )
+
+    assert [s.title for s in await r.retrieve(campaign_id, "windmill", k=4)] == ["Windmill"]
+    assert [s.title for s in await r.retrieve(campaign_id, "goblin", k=4)] == ["Goblin Warrens"]
+    assert len(await r.retrieve(other, "goblin", k=4)) == 2
+
+
+@pytest.mark.asyncio
+async def test_fulltext_falls_back_to_ilike_without_index(db):
+    reset_counters()
+    campaign_id = await _seed(8104)
+    async with session_scope() as s:
+        await s.execute(text("DROP TABLE content_nodes_fts"))
+        await s.execute(text("DROP TRIGGER content_nodes_fts_insert"))
+
+    out = await FullTextRetriever().retrieve(campaign_id, "miller", k=2)
+
+    assert [s.title for s in out] == ["Old Miller"]
+    assert get_counter("retrieval.fts.fallback") == 1
+    assert get_counter("retrieval.errors") == 0
+
+
+def test_query_terms_and_provider_switch():
+    assert query_terms("Please describe the Goblin goblin warrens!") == ["goblin", "warrens"]
+    assert query_terms("x" * 1000) == ["x" * 128]
+    settings = load_settings()
+    settings.retrieval.provider = "fts"
+    assert isinstance(build_retriever(settings), FullTextRetriever)
+    settings.retrieval.provider = "none"
+    retriever = build_retriever(settings)
+    assert isinstance(retriever, SqlFallbackRetriever)
+    assert not isinstance(retriever, FullTextRetriever)
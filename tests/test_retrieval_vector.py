@@ -0,0 +1,164 @@
+from __future__ import annotations
+
+import hashlib
+from pathlib import Path
+
+import pytest
+from sqlalchemy import func, select
+
+np = pytest.importorskip("numpy")
+
+from Adventorator import repos  # noqa: E402
+from Adventorator.config import load_settings  # noqa: E402
+from Adventorator.db import session_scope  # noqa: E402
+from Adventorator.importer import persist_lore_chunks, run_full_import_with_database  # noqa: E402
+from Adventorator.metrics import get_counter, reset_counters  # noqa: E402
+from Adventorator.models import ContentNode, ImportLog, LoreChunk, NodeType  # noqa: E402
+from Adventorator.retrieval import build_retriever  # noqa: E402
+from Adventorator.retrieval_vector import (  # noqa: E402
+    HashingVectorizer,
+    VectorRetriever,
+    _vector_literal,
+)
+
+HAPPY_PATH = Path(__file__).parent / "fixtures" / "import" / "manifest" / "happy-path"
+
+
+async def _seed(guild_id: int) -> int:
+    async with session_scope() as s:
+        camp = await repos.get_or_create_campaign(s, guild_id=guild_id, name="Vec")
+        s.add_all(
+            [
+                ContentNode(
+                    campaign_id=camp.id,
+                    node_type=NodeType.location,
+                    title="Goblin Warrens",
+                    player_text="A reeking tunnel where goblin drums echo.",
+                    gm_text="Secret vault behind the shrine.",
+                ),
+                ContentNode(
+                    campaign_id=camp.id,
+                    node_type=NodeType.npc,
+                    title="Old Miller",
+                    player_text="A miller who grumbles about the weather.",
+                ),
+            ]
+        )
+    return camp.id
+
+
+def test_hashing_vectorizer_is_deterministic_and_normalized():
+    vec = HashingVectorizer(dim=64)
+    a = vec(["Goblins in the warrens", ""])
+    b = HashingVectorizer(dim=64)(["Goblins in the warrens", ""])
+    assert a.shape == (2, 64) and a.dtype == np.float32
+    assert np.array_equal(a, b)
+    assert np.isclose(np.linalg.norm(a[0]), 1.0)
+    assert not a[1].any()
+    # Shared character n-grams make inflections similar
+    g = vec(["goblins", "goblin", "weather"])
+    assert g[0] @ g[1] > g[0] @ g[2]
+
+
+@pytest.mark.asyncio
+async def test_vector_retriever_batched_top_k_hides_gm_text(db):
+    reset_counters()
+    campaign_id = await _seed(8301)
+    r = VectorRetriever(refresh_seconds=3600)
+
+    goblins, miller, vault = await r.retrieve_many(
+        campaign_id, ["where do the goblins live", "millers", "vault shrine"], k=1
+    )
+
+    assert [s.title for s in goblins] == ["Goblin Warrens"]
+    assert [s.title for s in miller] == ["Old Miller"]
+    assert vault == []  # gm_text is never embedded
+    assert get_counter("retrieval.vector.build") == 1
+    assert r.resident_bytes() == 2 * 512 * 4
+
+
+@pytest.mark.asyncio
+async def test_in_place_edit_invalidates_campaign_index(db):
+    campaign_id = await _seed(8303)
+    r = VectorRetriever(refresh_seconds=3600)
+    assert [s.title for s in await r.retrieve(campaign_id, "millers", k=1)] == ["Old Miller"]
+
+    # Same row count and max id: only the commit hook can notice this edit
+    async with session_scope() as s:
+        node = (
+            await s.execute(select(ContentNode).where(ContentNode.title == "Old Miller"))
+        ).scalar_one()
+        node.player_text = "A miller who hoards lanterns in his loft."
+
+    out = await r.retrieve(campaign_id, "lanterns loft", k=1)
+    assert out[0].text == "A miller who hoards lanterns in his loft."
+
+
+def _chunk(chunk_id: str, audience: str, content: str) -> dict:
+    return {
+        "chunk_id": chunk_id,
+        "title": "The Drowned Lighthouse",
+        "audience": audience,
+        "tags": ["lore:coast"],
+        "content": content,
+        "content_hash": hashlib.sha256(content.encode()).hexdigest(),
+        "source_path": "lore/lighthouse.md",
+        "chunk_index": 0,
+    }
+
+
+@pytest.mark.asyncio
+async def test_persisted_lore_chunks_are_searchable_by_chunk_id(db):
+    campaign_id = await _seed(8302)
+    r = VectorRetriever(refresh_seconds=0)
+    await r.retrieve(campaign_id, "goblin", k=2)
+
+    lamp = _chunk("LIGHTHOUSE-000", "Player", "Its lamp still burns for drowned sailors.")
+    secret = _chunk("SECRET-000", "GM-Only", "The lamp cult meets below.")
+    async with session_scope() as s:
+        assert await persist_lore_chunks(s, campaign_id, [lamp, secret]) == 2
+        # Unchanged chunks are skipped; a changed one replaces the stored row
+        rewritten = _chunk(
+            "LIGHTHOUSE-000", "Player", "Its lamp burns for lost lighthouse keepers."
+        )
+        assert await persist_lore_chunks(s, campaign_id, [rewritten, secret]) == 1
+
+    # A fresh retriever (e.g. another process) sees the same lore
+    for retriever in (r, VectorRetriever(refresh_seconds=3600)):
+        out = await retriever.retrieve(campaign_id, "lighthouse keepers lamp", k=2)
+        assert out[0].chunk_id == "LIGHTHOUSE-000"
+        assert out[0].text == rewritten["content"]
+        assert out[0].id == 0 and out[0].node_type == "lore"
+        assert all(s.chunk_id != "SECRET-000" for s in out)
+    async with session_scope() as s:
+        stored = await s.execute(select(func.count()).select_from(LoreChunk))
+        assert stored.scalar_one() == 2
+
+
+@pytest.mark.asyncio
+async def test_database_import_stores_lore_for_vector_search(db):
+    async with session_scope() as s:
+        camp = await repos.get_or_create_campaign(s, guild_id=8303, name="Import")
+    await run_full_import_with_database(HAPPY_PATH, camp.id)
+
+    async with session_scope() as s:
+        logged = await s.execute(
+            select(ImportLog.stable_id).where(
+                ImportLog.campaign_id == camp.id, ImportLog.phase == "lore"
+            )
+        )
+        assert logged.scalars().all() == ["INTRO_CHUNK-000"]
+        stored = await s.execute(select(LoreChunk.chunk_id).where(LoreChunk.campaign_id == camp.id))
+        assert stored.scalars().all() == ["INTRO_CHUNK-000"]
+
+    out = await VectorRetriever().retrieve(camp.id, "archivist library quests", k=1)
+    assert [s.chunk_id for s in out] == ["INTRO_CHUNK-000"]
+
+
+def test_build_retriever_vector_provider_and_pg_literal():
+    settings = load_settings()
+    settings.retrieval.provider = "vector"
+    r = build_retriever(settings)
+    assert isinstance(r, VectorRetriever)
+    assert build_retriever(settings) is r
+    assert _vector_literal([0.5, -1.0, 0.0]) == "[0.5,-1,0]"
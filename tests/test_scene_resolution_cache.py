@@ -0,0 +1,55 @@
+import pytest
+from sqlalchemy import event
+
+from Adventorator import models, repos
+from Adventorator.db import get_engine, session_scope
+from Adventorator.metrics import get_counter, reset_counters
+
+
+class _QueryCounter:
+    def __init__(self) -> None:
+        self.count = 0
+
+    def __call__(self, *args, **kwargs) -> None:
+        self.count += 1
+
+
+@pytest.mark.asyncio
+async def test_resolve_scene_is_cached_after_first_lookup(db):
+    reset_counters()
+    async with session_scope() as s:
+        first = await repos.resolve_scene(s, 7001, 7002)
+
+    engine = get_engine().sync_engine
+    counter = _QueryCounter()
+    event.listen(engine, "before_cursor_execute", counter)
+    try:
+        async with session_scope() as s:
+            again = await repos.resolve_scene(s, 7001, 7002)
+    finally:
+        event.remove(engine, "before_cursor_execute", counter)
+
+    assert again == first
+    assert counter.count == 0
+    assert get_counter("repos.scene_ref.hit") == 1
+
+
+@pytest.mark.asyncio
+async def test_archiving_or_rolling_back_a_scene_invalidates_resolution(db):
+    reset_counters()
+    async with session_scope() as s:
+        ref = await repos.resolve_scene(s, 7101, 7102)
+        scene = await s.get(models.Scene, ref.scene_id)
+        scene.is_active = False  # archive
+    async with session_scope() as s:
+        assert await repos.resolve_scene(s, 7101, 7102) == ref
+    assert get_counter("repos.scene_ref.miss") == 2
+
+    # A resolution created inside a rolled-back transaction is not kept
+    with pytest.raises(RuntimeError):
+        async with session_scope() as s:
+            await repos.resolve_scene(s, 7201, 7202)
+            raise RuntimeError("boom")
+    async with session_scope() as s:
+        await repos.resolve_scene(s, 7201, 7202)
+    assert get_counter("repos.scene_ref.miss") == 4
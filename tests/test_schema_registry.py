@@ -0,0 +1,87 @@
+"""Tests for the compiled, mtime-aware contract schema registry."""
+
+import json
+import os
+from pathlib import Path
+from unittest.mock import patch
+
+import jsonschema
+import pytest
+
+from Adventorator import schema_registry
+from Adventorator.importer import validate_event_payload_schema
+from Adventorator.manifest_validation import validate_manifest_schema
+from Adventorator.metrics import get_counters, reset_counters
+
+SCHEMA = {
+    "$schema": "https://json-schema.org/draft/2020-12/schema",
+    "type": "object",
+    "required": ["name"],
+    "properties": {"name": {"type": "string"}, "size": {"type": "integer", "minimum": 1}},
+}
+
+
+@pytest.fixture
+def schema_path(tmp_path):
+    path = tmp_path / "thing.v1.json"
+    path.write_text(json.dumps(SCHEMA), encoding="utf-8")
+    schema_registry.clear_schema_cache()
+    reset_counters()
+    yield path
+    schema_registry.clear_schema_cache()
+
+
+def test_validator_is_compiled_once_and_reloaded_on_mtime_change(schema_path: Path):
+    with patch.object(schema_registry.json, "load", wraps=json.load) as load:
+        first = schema_registry.get_schema_validator(schema_path)
+        schema_registry.validate_against_schema(schema_path, {"name": "ok"})
+        assert schema_registry.get_schema_validator(schema_path) is first
+        assert load.call_count == 1
+
+        loosened = {**SCHEMA, "required": []}
+        schema_path.write_text(json.dumps(loosened), encoding="utf-8")
+        stat = schema_path.stat()
+        os.utime(schema_path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000))
+
+        schema_registry.validate_against_schema(schema_path, {})
+        assert load.call_count == 2
+    assert isinstance(first, jsonschema.Draft202012Validator)
+    assert first.format_checker is not None
+
+
+def test_errors_match_jsonschema_validate_and_time_is_recorded(schema_path: Path):
+    bad = {"name": 3, "size": 0}
+    with pytest.raises(jsonschema.ValidationError) as expected:
+        jsonschema.validate(bad, SCHEMA)
+    with pytest.raises(jsonschema.ValidationError) as actual:
+        schema_registry.validate_against_schema(schema_path, bad)
+    assert actual.value.message == expected.value.message
+
+    schema_registry.validate_against_schema(schema_path, {"name": "ok"})
+    assert get_counters()["histo.schemas.thing.v1.validate_us.count"] == 2
+
+
+def test_placeholder_substitution_leaves_callers_payloads_untouched():
+    manifest = json.loads(
+        Path("tests/fixtures/import/manifest/happy-path/package.manifest.json").read_text(
+            encoding="utf-8"
+        )
+    )
+    manifest["package_id"] = "not-a-ulid"
+    manifest["dependencies"] = [{"package_id": "also-not-a-ulid", "version": "1.0.0"}]
+    snapshot = json.dumps(manifest, sort_keys=True)
+    validate_manifest_schema(manifest)
+    assert json.dumps(manifest, sort_keys=True) == snapshot
+
+    payload = {
+        "stable_id": "edge-1",
+        "type": "npc.resides_in.location",
+        "src_ref": "npc-1",
+        "dst_ref": "npc-2",
+        "attributes": {},
+        "validity": {"start_event_id": "evt-1"},
+        "provenance": {"package_id": "pkg", "source_path": "edges/a.json", "file_hash": "0" * 64},
+    }
+    snapshot = json.dumps(payload, sort_keys=True)
+    validate_event_payload_schema(payload, event_type="edge")
+    assert json.dumps(payload, sort_keys=True) == snapshot
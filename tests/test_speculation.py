@@ -0,0 +1,108 @@
+import asyncio
+
+import pytest
+
+from Adventorator import repos
+from Adventorator.commanding import Invocation
+from Adventorator.commands.do import DoOpts, do_command
+from Adventorator.commands.ooc import OocOpts, ooc_command
+from Adventorator.config import Settings
+from Adventorator.db import session_scope
+from Adventorator.llm_scheduler import LLMScheduler
+from Adventorator.metrics import get_counter, reset_counters
+from Adventorator.schemas import LLMOutput, LLMProposal
+from Adventorator.speculation import speculate_narration
+
+
+class _Responder:
+    def __init__(self) -> None:
+        self.messages: list[str] = []
+
+    async def send(self, content: str, *, ephemeral: bool = False) -> None:
+        self.messages.append(content)
+
+
+class _RecordingLLM:
+    provider = "speculation-test"
+    model_name = "m"
+    api_url = "http://test"
+
+    def __init__(self) -> None:
+        self.calls: list[tuple[str, list[dict]]] = []
+
+    async def generate_json(self, messages, system_prompt=None):
+        self.calls.append(("json", messages))
+        await asyncio.sleep(0.01)
+        return LLMOutput(
+            proposal=LLMProposal(action="ability_check", ability="DEX", suggested_dc=12),
+            narration="You slip past.",
+        )
+
+    async def generate_response(self, messages, system_prompt=None):
+        self.calls.append(("response", messages))
+        await asyncio.sleep(0.01)
+        return "The table laughs."
+
+
+async def _seed(guild_id: int, channel_id: int) -> None:
+    async with session_scope() as s:
+        camp = await repos.get_or_create_campaign(s, guild_id)
+        scene = await repos.ensure_scene(s, camp.id, channel_id)
+        await repos.write_transcript(s, camp.id, scene.id, channel_id, "bot", "A door creaks.")
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize(
+    ("name", "handler", "opts"),
+    [
+        ("do", do_command, DoOpts(message="I sneak past the guard")),
+        ("ooc", ooc_command, OocOpts(message="what time is it there?")),
+    ],
+)
+async def test_speculative_call_is_claimed_by_handler(db, name, handler, opts):
+    reset_counters()
+    await _seed(9101, 9102)
+    settings = Settings(features_llm=True, features_llm_visible=True, llm_speculative=True)
+    llm = _RecordingLLM()
+    sched = LLMScheduler(llm)
+
+    started = await speculate_narration(
+        name,
+        opts.message,
+        guild_id=9101,
+        channel_id=9102,
+        user_id=7,
+        settings=settings,
+        llm_client=sched,
+    )
+    assert started is True
+    inv = Invocation(
+        name=name,
+        subcommand=None,
+        options={"message": opts.message},
+        user_id="7",
+        channel_id="9102",
+        guild_id="9101",
+        responder=_Responder(),
+        settings=settings,
+        llm_client=sched,
+    )
+    await handler(inv, opts)
+
+    # The handler built the identical prompt, so only the speculative call ran
+    assert len(llm.calls) == 1
+    assert get_counter("llm.speculative.hit") == 1
+
+
+@pytest.mark.asyncio
+async def test_speculation_skips_unknown_scene_and_invalid_input(db):
+    reset_counters()
+    settings = Settings(features_llm=True, llm_speculative=True)
+    sched = LLMScheduler(_RecordingLLM())
+    kwargs = dict(guild_id=9201, channel_id=9202, user_id=1, settings=settings, llm_client=sched)
+
+    assert await speculate_narration("do", "I open the door", **kwargs) is False
+    assert get_counter("llm.speculative.skipped") == 1
+    assert await speculate_narration("ooc", "ok", **kwargs) is False
+    assert await speculate_narration("roll", "1d20", **kwargs) is False
+    assert get_counter("llm.speculative.started") == 0